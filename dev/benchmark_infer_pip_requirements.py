@@ -0,0 +1,51 @@
+"""
+Compare the time `mlflow.sklearn.log_model` takes to infer the pip requirements of a model when
+the imported modules are captured in a new python interpreter process, in a process forked from
+a fork server, and when the captured modules are cached.
+
+Usage:
+    python dev/benchmark_infer_pip_requirements.py --repeat 5
+"""
+import argparse
+import functools
+import os
+import timeit
+
+from sklearn.linear_model import LogisticRegression
+
+import mlflow
+import mlflow.sklearn
+from mlflow.utils import requirements_utils
+
+
+def _log_model(model, cached):
+    if not cached:
+        requirements_utils._CAPTURED_MODULES_CACHE.clear()
+    with mlflow.start_run():
+        mlflow.sklearn.log_model(model, artifact_path="model")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    model = LogisticRegression().fit([[0], [1]], [0, 1])
+    for name, fork_server, cached in [
+        ("subprocess", False, False),
+        ("fork server", True, False),
+        ("cached", False, True),
+    ]:
+        os.environ[requirements_utils.MLFLOW_CAPTURE_MODULES_FORK_SERVER] = str(fork_server)
+        # Warm up the fork server and the cache
+        _log_model(model, cached)
+        seconds = min(
+            timeit.repeat(
+                functools.partial(_log_model, model, cached), number=1, repeat=args.repeat
+            )
+        )
+        print(f"{name}: {seconds * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Compare the time the pyfunc scoring server takes to parse split-oriented JSON payloads with the
+single-pass parser and with pandas.
+
+Usage:
+    python dev/benchmark_scoring_server_parsing.py --rows 100000
+"""
+import argparse
+import json
+import os
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from mlflow.pyfunc.scoring_server import infer_and_parse_json_input
+from mlflow.types import ColSpec, Schema
+from mlflow.utils.proto_json_utils import NumpyEncoder, _dataframe_from_json
+
+
+def _legacy_parse(json_str, schema):
+    json.loads(json_str)
+    return _dataframe_from_json(json_str, pandas_orient="split", schema=schema)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    df = pd.DataFrame(
+        {
+            "long": np.arange(args.rows),
+            "double": np.random.rand(args.rows),
+            "string": np.random.choice(["a", "b", "c"], args.rows),
+            "binary": [os.urandom(32) for _ in range(args.rows)],
+        }
+    )
+    schema = Schema([ColSpec(c, c) for c in df.columns])
+    json_str = json.dumps(df.to_dict(orient="split"), cls=NumpyEncoder)
+
+    for name, parse in [
+        ("pandas", lambda: _legacy_parse(json_str, schema)),
+        ("single-pass", lambda: infer_and_parse_json_input(json_str, schema)),
+    ]:
+        seconds = min(timeit.repeat(parse, number=1, repeat=args.repeat))
+        print(f"{name}: {seconds * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
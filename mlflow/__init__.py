@@ -149,6 +149,7 @@ set_experiment = mlflow.tracking.fluent.set_experiment
 log_params = mlflow.tracking.fluent.log_params
 log_metrics = mlflow.tracking.fluent.log_metrics
 set_tags = mlflow.tracking.fluent.set_tags
+flush_async_logging = mlflow.tracking.fluent.flush_async_logging
 delete_experiment = mlflow.tracking.fluent.delete_experiment
 delete_run = mlflow.tracking.fluent.delete_run
 register_model = mlflow.tracking._model_registry.fluent.register_model
@@ -165,6 +166,7 @@ __all__ = [
     "log_metrics",
     "set_tag",
     "set_tags",
+    "flush_async_logging",
     "delete_tag",
     "log_artifacts",
     "log_artifact",
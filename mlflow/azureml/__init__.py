@@ -659,7 +659,8 @@ import pandas as pd
 
 from azureml.core.model import Model
 from mlflow.pyfunc import load_model
-from mlflow.pyfunc.scoring_server import parse_json_input, _get_jsonable_obj
+from mlflow.pyfunc.scoring_server import parse_json_input
+from mlflow.utils.proto_json_utils import _get_jsonable_obj
 
 
 def init():
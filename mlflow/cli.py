@@ -13,6 +13,7 @@ import mlflow.projects as projects
 import mlflow.runs
 import mlflow.store.artifact.cli
 from mlflow import tracking
+from mlflow.store.db.db_types import DATABASE_ENGINES
 from mlflow.store.tracking import DEFAULT_LOCAL_FILE_AND_ARTIFACT_PATH, DEFAULT_ARTIFACTS_URI
 from mlflow.store.artifact.artifact_repository_registry import get_artifact_repository
 from mlflow.tracking import _get_store
@@ -20,7 +21,7 @@ from mlflow.utils import cli_args
 from mlflow.utils.annotations import experimental
 from mlflow.utils.logging_utils import eprint
 from mlflow.utils.process import ShellCommandException
-from mlflow.utils.uri import resolve_default_artifact_root
+from mlflow.utils.uri import get_uri_scheme, resolve_default_artifact_root
 from mlflow.entities.lifecycle_stage import LifecycleStage
 from mlflow.exceptions import MlflowException
 
@@ -372,6 +373,43 @@ def _validate_static_prefix(ctx, param, value):  # pylint: disable=unused-argume
     "doesn't exist, it will be created. "
     "Activate prometheus exporter to expose metrics on /metrics endpoint.",
 )
+@click.option(
+    "--write-behind-interval-ms",
+    type=click.IntRange(min=0),
+    default=None,
+    help="If specified, the metrics, params and tags logged to runs are queued by each server "
+    "worker and committed to the backend store in groups, with a single database transaction "
+    "every INTEGER milliseconds, instead of one transaction per request. Requests are answered "
+    "once their data is committed. This reduces contention when many clients log to the same "
+    "runs concurrently. Requires a database backend store. Since writes are only grouped if a "
+    "worker handles several requests at once, gunicorn workers are run with 16 threads each, "
+    "unless --gunicorn-opts sets --threads or a concurrent --worker-class.",
+)
+@click.option(
+    "--response-cache-ttl-seconds",
+    type=click.IntRange(min=1),
+    default=None,
+    help="If specified, the responses of the endpoints that get runs, experiments and metric "
+    "histories and search runs are cached for up to INTEGER seconds. Cached responses are "
+    "invalidated by the requests that write the data they depend on.",
+)
+@click.option(
+    "--response-cache-backend",
+    type=click.Choice(["memory", "shared-memory"]),
+    default="memory",
+    help="Where responses are cached if --response-cache-ttl-seconds is specified. 'memory' "
+    "caches responses in the memory of each server worker, so that writes only invalidate the "
+    "responses cached by the worker that handles them. 'shared-memory' caches responses in "
+    "shared memory files that are shared by all the server workers. Default: memory",
+)
+@click.option(
+    "--response-cache-max-entries",
+    type=click.IntRange(min=1),
+    default=1000,
+    help="The maximum number of responses cached by each server worker with the 'memory' "
+    "response cache backend, or by all the server workers with the 'shared-memory' backend. "
+    "Default: 1000",
+)
 def server(
     backend_store_uri,
     default_artifact_root,
@@ -385,6 +423,10 @@ def server(
     gunicorn_opts,
     waitress_opts,
     expose_prometheus,
+    write_behind_interval_ms,
+    response_cache_ttl_seconds,
+    response_cache_backend,
+    response_cache_max_entries,
 ):
     """
     Run the MLflow tracking server.
@@ -403,6 +445,12 @@ def server(
     if not backend_store_uri:
         backend_store_uri = DEFAULT_LOCAL_FILE_AND_ARTIFACT_PATH
 
+    if (
+        write_behind_interval_ms is not None
+        and get_uri_scheme(backend_store_uri) not in DATABASE_ENGINES
+    ):
+        raise UsageError("--write-behind-interval-ms requires a database --backend-store-uri.")
+
     default_artifact_root = resolve_default_artifact_root(
         serve_artifacts, default_artifact_root, backend_store_uri
     )
@@ -428,6 +476,10 @@ def server(
             gunicorn_opts,
             waitress_opts,
             expose_prometheus,
+            write_behind_interval_ms,
+            response_cache_ttl_seconds,
+            response_cache_backend,
+            response_cache_max_entries,
         )
     except ShellCommandException:
         eprint("Running the mlflow server failed. Please see the logs above for details.")
@@ -1,9 +1,8 @@
 import click
 import sys
-import json
 from mlflow.utils import cli_args
 from mlflow.deployments import interface
-from mlflow.utils.proto_json_utils import NumpyEncoder, _get_jsonable_obj
+from mlflow.utils.proto_json_utils import _dumps_jsonable_obj
 
 
 def _user_args_to_dict(user_list):
@@ -235,8 +234,7 @@ def run_local(flavor, model_uri, target, name, config):
 
 
 def predictions_to_json(raw_predictions, output):
-    predictions = _get_jsonable_obj(raw_predictions, pandas_orient="records")
-    json.dump(predictions, output, cls=NumpyEncoder)
+    output.write(_dumps_jsonable_obj(raw_predictions, pandas_orient="records"))
 
 
 @commands.command("predict")
@@ -22421,6 +22421,4484 @@ public final class Service {
 
   }
 
+  public interface CreateRunsOrBuilder extends
+      // @@protoc_insertion_point(interface_extends:mlflow.CreateRuns)
+      com.google.protobuf.MessageOrBuilder {
+
+    /**
+     * <pre>
+     * ID of the associated experiment.
+     * </pre>
+     *
+     * <code>optional string experiment_id = 1;</code>
+     */
+    boolean hasExperimentId();
+    /**
+     * <pre>
+     * ID of the associated experiment.
+     * </pre>
+     *
+     * <code>optional string experiment_id = 1;</code>
+     */
+    java.lang.String getExperimentId();
+    /**
+     * <pre>
+     * ID of the associated experiment.
+     * </pre>
+     *
+     * <code>optional string experiment_id = 1;</code>
+     */
+    com.google.protobuf.ByteString
+        getExperimentIdBytes();
+
+    /**
+     * <pre>
+     * Runs to create.
+     * </pre>
+     *
+     * <code>repeated .mlflow.CreateRuns.RunSpec runs = 2;</code>
+     */
+    java.util.List<org.mlflow.api.proto.Service.CreateRuns.RunSpec> 
+        getRunsList();
+    /**
+     * <pre>
+     * Runs to create.
+     * </pre>
+     *
+     * <code>repeated .mlflow.CreateRuns.RunSpec runs = 2;</code>
+     */
+    org.mlflow.api.proto.Service.CreateRuns.RunSpec getRuns(int index);
+    /**
+     * <pre>
+     * Runs to create.
+     * </pre>
+     *
+     * <code>repeated .mlflow.CreateRuns.RunSpec runs = 2;</code>
+     */
+    int getRunsCount();
+    /**
+     * <pre>
+     * Runs to create.
+     * </pre>
+     *
+     * <code>repeated .mlflow.CreateRuns.RunSpec runs = 2;</code>
+     */
+    java.util.List<? extends org.mlflow.api.proto.Service.CreateRuns.RunSpecOrBuilder> 
+        getRunsOrBuilderList();
+    /**
+     * <pre>
+     * Runs to create.
+     * </pre>
+     *
+     * <code>repeated .mlflow.CreateRuns.RunSpec runs = 2;</code>
+     */
+    org.mlflow.api.proto.Service.CreateRuns.RunSpecOrBuilder getRunsOrBuilder(
+        int index);
+  }
+  /**
+   * Protobuf type {@code mlflow.CreateRuns}
+   */
+  public  static final class CreateRuns extends
+      com.google.protobuf.GeneratedMessageV3 implements
+      // @@protoc_insertion_point(message_implements:mlflow.CreateRuns)
+      CreateRunsOrBuilder {
+  private static final long serialVersionUID = 0L;
+    // Use CreateRuns.newBuilder() to construct.
+    private CreateRuns(com.google.protobuf.GeneratedMessageV3.Builder<?> builder) {
+      super(builder);
+    }
+    private CreateRuns() {
+      experimentId_ = "";
+      runs_ = java.util.Collections.emptyList();
+    }
+
+    @java.lang.Override
+    public final com.google.protobuf.UnknownFieldSet
+    getUnknownFields() {
+      return this.unknownFields;
+    }
+    private CreateRuns(
+        com.google.protobuf.CodedInputStream input,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      this();
+      if (extensionRegistry == null) {
+        throw new java.lang.NullPointerException();
+      }
+      int mutable_bitField0_ = 0;
+      com.google.protobuf.UnknownFieldSet.Builder unknownFields =
+          com.google.protobuf.UnknownFieldSet.newBuilder();
+      try {
+        boolean done = false;
+        while (!done) {
+          int tag = input.readTag();
+          switch (tag) {
+            case 0:
+              done = true;
+              break;
+            case 10: {
+              com.google.protobuf.ByteString bs = input.readBytes();
+              bitField0_ |= 0x00000001;
+              experimentId_ = bs;
+              break;
+            }
+            case 18: {
+              if (!((mutable_bitField0_ & 0x00000002) == 0x00000002)) {
+                runs_ = new java.util.ArrayList<org.mlflow.api.proto.Service.CreateRuns.RunSpec>();
+                mutable_bitField0_ |= 0x00000002;
+              }
+              runs_.add(
+                  input.readMessage(org.mlflow.api.proto.Service.CreateRuns.RunSpec.PARSER, extensionRegistry));
+              break;
+            }
+            default: {
+              if (!parseUnknownField(
+                  input, unknownFields, extensionRegistry, tag)) {
+                done = true;
+              }
+              break;
+            }
+          }
+        }
+      } catch (com.google.protobuf.InvalidProtocolBufferException e) {
+        throw e.setUnfinishedMessage(this);
+      } catch (java.io.IOException e) {
+        throw new com.google.protobuf.InvalidProtocolBufferException(
+            e).setUnfinishedMessage(this);
+      } finally {
+        if (((mutable_bitField0_ & 0x00000002) == 0x00000002)) {
+          runs_ = java.util.Collections.unmodifiableList(runs_);
+        }
+        this.unknownFields = unknownFields.build();
+        makeExtensionsImmutable();
+      }
+    }
+    public static final com.google.protobuf.Descriptors.Descriptor
+        getDescriptor() {
+      return org.mlflow.api.proto.Service.internal_static_mlflow_CreateRuns_descriptor;
+    }
+
+    @java.lang.Override
+    protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
+        internalGetFieldAccessorTable() {
+      return org.mlflow.api.proto.Service.internal_static_mlflow_CreateRuns_fieldAccessorTable
+          .ensureFieldAccessorsInitialized(
+              org.mlflow.api.proto.Service.CreateRuns.class, org.mlflow.api.proto.Service.CreateRuns.Builder.class);
+    }
+
+    public interface RunSpecOrBuilder extends
+        // @@protoc_insertion_point(interface_extends:mlflow.CreateRuns.RunSpec)
+        com.google.protobuf.MessageOrBuilder {
+
+      /**
+       * <pre>
+       * ID of the user executing the run.
+       * This field is deprecated as of MLflow 1.0, and will be removed in a future
+       * MLflow release. Use 'mlflow.user' tag instead.
+       * </pre>
+       *
+       * <code>optional string user_id = 1;</code>
+       */
+      boolean hasUserId();
+      /**
+       * <pre>
+       * ID of the user executing the run.
+       * This field is deprecated as of MLflow 1.0, and will be removed in a future
+       * MLflow release. Use 'mlflow.user' tag instead.
+       * </pre>
+       *
+       * <code>optional string user_id = 1;</code>
+       */
+      java.lang.String getUserId();
+      /**
+       * <pre>
+       * ID of the user executing the run.
+       * This field is deprecated as of MLflow 1.0, and will be removed in a future
+       * MLflow release. Use 'mlflow.user' tag instead.
+       * </pre>
+       *
+       * <code>optional string user_id = 1;</code>
+       */
+      com.google.protobuf.ByteString
+          getUserIdBytes();
+
+      /**
+       * <pre>
+       * Unix timestamp in milliseconds of when the run started.
+       * </pre>
+       *
+       * <code>optional int64 start_time = 2;</code>
+       */
+      boolean hasStartTime();
+      /**
+       * <pre>
+       * Unix timestamp in milliseconds of when the run started.
+       * </pre>
+       *
+       * <code>optional int64 start_time = 2;</code>
+       */
+      long getStartTime();
+
+      /**
+       * <pre>
+       * Unix timestamp in milliseconds of when the run ended, if it is already terminated.
+       * </pre>
+       *
+       * <code>optional int64 end_time = 3;</code>
+       */
+      boolean hasEndTime();
+      /**
+       * <pre>
+       * Unix timestamp in milliseconds of when the run ended, if it is already terminated.
+       * </pre>
+       *
+       * <code>optional int64 end_time = 3;</code>
+       */
+      long getEndTime();
+
+      /**
+       * <pre>
+       * Status of the run. Defaults to ``RUNNING``.
+       * </pre>
+       *
+       * <code>optional .mlflow.RunStatus status = 4;</code>
+       */
+      boolean hasStatus();
+      /**
+       * <pre>
+       * Status of the run. Defaults to ``RUNNING``.
+       * </pre>
+       *
+       * <code>optional .mlflow.RunStatus status = 4;</code>
+       */
+      org.mlflow.api.proto.Service.RunStatus getStatus();
+
+      /**
+       * <pre>
+       * Additional metadata for run.
+       * </pre>
+       *
+       * <code>repeated .mlflow.RunTag tags = 5;</code>
+       */
+      java.util.List<org.mlflow.api.proto.Service.RunTag> 
+          getTagsList();
+      /**
+       * <pre>
+       * Additional metadata for run.
+       * </pre>
+       *
+       * <code>repeated .mlflow.RunTag tags = 5;</code>
+       */
+      org.mlflow.api.proto.Service.RunTag getTags(int index);
+      /**
+       * <pre>
+       * Additional metadata for run.
+       * </pre>
+       *
+       * <code>repeated .mlflow.RunTag tags = 5;</code>
+       */
+      int getTagsCount();
+      /**
+       * <pre>
+       * Additional metadata for run.
+       * </pre>
+       *
+       * <code>repeated .mlflow.RunTag tags = 5;</code>
+       */
+      java.util.List<? extends org.mlflow.api.proto.Service.RunTagOrBuilder> 
+          getTagsOrBuilderList();
+      /**
+       * <pre>
+       * Additional metadata for run.
+       * </pre>
+       *
+       * <code>repeated .mlflow.RunTag tags = 5;</code>
+       */
+      org.mlflow.api.proto.Service.RunTagOrBuilder getTagsOrBuilder(
+          int index);
+
+      /**
+       * <pre>
+       * Params to log.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Param params = 6;</code>
+       */
+      java.util.List<org.mlflow.api.proto.Service.Param> 
+          getParamsList();
+      /**
+       * <pre>
+       * Params to log.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Param params = 6;</code>
+       */
+      org.mlflow.api.proto.Service.Param getParams(int index);
+      /**
+       * <pre>
+       * Params to log.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Param params = 6;</code>
+       */
+      int getParamsCount();
+      /**
+       * <pre>
+       * Params to log.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Param params = 6;</code>
+       */
+      java.util.List<? extends org.mlflow.api.proto.Service.ParamOrBuilder> 
+          getParamsOrBuilderList();
+      /**
+       * <pre>
+       * Params to log.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Param params = 6;</code>
+       */
+      org.mlflow.api.proto.Service.ParamOrBuilder getParamsOrBuilder(
+          int index);
+
+      /**
+       * <pre>
+       * Metrics to log.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Metric metrics = 7;</code>
+       */
+      java.util.List<org.mlflow.api.proto.Service.Metric> 
+          getMetricsList();
+      /**
+       * <pre>
+       * Metrics to log.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Metric metrics = 7;</code>
+       */
+      org.mlflow.api.proto.Service.Metric getMetrics(int index);
+      /**
+       * <pre>
+       * Metrics to log.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Metric metrics = 7;</code>
+       */
+      int getMetricsCount();
+      /**
+       * <pre>
+       * Metrics to log.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Metric metrics = 7;</code>
+       */
+      java.util.List<? extends org.mlflow.api.proto.Service.MetricOrBuilder> 
+          getMetricsOrBuilderList();
+      /**
+       * <pre>
+       * Metrics to log.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Metric metrics = 7;</code>
+       */
+      org.mlflow.api.proto.Service.MetricOrBuilder getMetricsOrBuilder(
+          int index);
+    }
+    /**
+     * <pre>
+     * Attributes, and initial metrics, params, and tags, of a run to create with
+     * :ref:`mlflowMlflowServicecreateRuns`.
+     * </pre>
+     *
+     * Protobuf type {@code mlflow.CreateRuns.RunSpec}
+     */
+    public  static final class RunSpec extends
+        com.google.protobuf.GeneratedMessageV3 implements
+        // @@protoc_insertion_point(message_implements:mlflow.CreateRuns.RunSpec)
+        RunSpecOrBuilder {
+    private static final long serialVersionUID = 0L;
+      // Use RunSpec.newBuilder() to construct.
+      private RunSpec(com.google.protobuf.GeneratedMessageV3.Builder<?> builder) {
+        super(builder);
+      }
+      private RunSpec() {
+        userId_ = "";
+        startTime_ = 0L;
+        endTime_ = 0L;
+        status_ = 1;
+        tags_ = java.util.Collections.emptyList();
+        params_ = java.util.Collections.emptyList();
+        metrics_ = java.util.Collections.emptyList();
+      }
+
+      @java.lang.Override
+      public final com.google.protobuf.UnknownFieldSet
+      getUnknownFields() {
+        return this.unknownFields;
+      }
+      private RunSpec(
+          com.google.protobuf.CodedInputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        this();
+        if (extensionRegistry == null) {
+          throw new java.lang.NullPointerException();
+        }
+        int mutable_bitField0_ = 0;
+        com.google.protobuf.UnknownFieldSet.Builder unknownFields =
+            com.google.protobuf.UnknownFieldSet.newBuilder();
+        try {
+          boolean done = false;
+          while (!done) {
+            int tag = input.readTag();
+            switch (tag) {
+              case 0:
+                done = true;
+                break;
+              case 10: {
+                com.google.protobuf.ByteString bs = input.readBytes();
+                bitField0_ |= 0x00000001;
+                userId_ = bs;
+                break;
+              }
+              case 16: {
+                bitField0_ |= 0x00000002;
+                startTime_ = input.readInt64();
+                break;
+              }
+              case 24: {
+                bitField0_ |= 0x00000004;
+                endTime_ = input.readInt64();
+                break;
+              }
+              case 32: {
+                int rawValue = input.readEnum();
+                  @SuppressWarnings("deprecation")
+                org.mlflow.api.proto.Service.RunStatus value = org.mlflow.api.proto.Service.RunStatus.valueOf(rawValue);
+                if (value == null) {
+                  unknownFields.mergeVarintField(4, rawValue);
+                } else {
+                  bitField0_ |= 0x00000008;
+                  status_ = rawValue;
+                }
+                break;
+              }
+              case 42: {
+                if (!((mutable_bitField0_ & 0x00000010) == 0x00000010)) {
+                  tags_ = new java.util.ArrayList<org.mlflow.api.proto.Service.RunTag>();
+                  mutable_bitField0_ |= 0x00000010;
+                }
+                tags_.add(
+                    input.readMessage(org.mlflow.api.proto.Service.RunTag.PARSER, extensionRegistry));
+                break;
+              }
+              case 50: {
+                if (!((mutable_bitField0_ & 0x00000020) == 0x00000020)) {
+                  params_ = new java.util.ArrayList<org.mlflow.api.proto.Service.Param>();
+                  mutable_bitField0_ |= 0x00000020;
+                }
+                params_.add(
+                    input.readMessage(org.mlflow.api.proto.Service.Param.PARSER, extensionRegistry));
+                break;
+              }
+              case 58: {
+                if (!((mutable_bitField0_ & 0x00000040) == 0x00000040)) {
+                  metrics_ = new java.util.ArrayList<org.mlflow.api.proto.Service.Metric>();
+                  mutable_bitField0_ |= 0x00000040;
+                }
+                metrics_.add(
+                    input.readMessage(org.mlflow.api.proto.Service.Metric.PARSER, extensionRegistry));
+                break;
+              }
+              default: {
+                if (!parseUnknownField(
+                    input, unknownFields, extensionRegistry, tag)) {
+                  done = true;
+                }
+                break;
+              }
+            }
+          }
+        } catch (com.google.protobuf.InvalidProtocolBufferException e) {
+          throw e.setUnfinishedMessage(this);
+        } catch (java.io.IOException e) {
+          throw new com.google.protobuf.InvalidProtocolBufferException(
+              e).setUnfinishedMessage(this);
+        } finally {
+          if (((mutable_bitField0_ & 0x00000010) == 0x00000010)) {
+            tags_ = java.util.Collections.unmodifiableList(tags_);
+          }
+          if (((mutable_bitField0_ & 0x00000020) == 0x00000020)) {
+            params_ = java.util.Collections.unmodifiableList(params_);
+          }
+          if (((mutable_bitField0_ & 0x00000040) == 0x00000040)) {
+            metrics_ = java.util.Collections.unmodifiableList(metrics_);
+          }
+          this.unknownFields = unknownFields.build();
+          makeExtensionsImmutable();
+        }
+      }
+      public static final com.google.protobuf.Descriptors.Descriptor
+          getDescriptor() {
+        return org.mlflow.api.proto.Service.internal_static_mlflow_CreateRuns_RunSpec_descriptor;
+      }
+
+      @java.lang.Override
+      protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
+          internalGetFieldAccessorTable() {
+        return org.mlflow.api.proto.Service.internal_static_mlflow_CreateRuns_RunSpec_fieldAccessorTable
+            .ensureFieldAccessorsInitialized(
+                org.mlflow.api.proto.Service.CreateRuns.RunSpec.class, org.mlflow.api.proto.Service.CreateRuns.RunSpec.Builder.class);
+      }
+
+      private int bitField0_;
+      public static final int USER_ID_FIELD_NUMBER = 1;
+      private volatile java.lang.Object userId_;
+      /**
+       * <pre>
+       * ID of the user executing the run.
+       * This field is deprecated as of MLflow 1.0, and will be removed in a future
+       * MLflow release. Use 'mlflow.user' tag instead.
+       * </pre>
+       *
+       * <code>optional string user_id = 1;</code>
+       */
+      public boolean hasUserId() {
+        return ((bitField0_ & 0x00000001) == 0x00000001);
+      }
+      /**
+       * <pre>
+       * ID of the user executing the run.
+       * This field is deprecated as of MLflow 1.0, and will be removed in a future
+       * MLflow release. Use 'mlflow.user' tag instead.
+       * </pre>
+       *
+       * <code>optional string user_id = 1;</code>
+       */
+      public java.lang.String getUserId() {
+        java.lang.Object ref = userId_;
+        if (ref instanceof java.lang.String) {
+          return (java.lang.String) ref;
+        } else {
+          com.google.protobuf.ByteString bs = 
+              (com.google.protobuf.ByteString) ref;
+          java.lang.String s = bs.toStringUtf8();
+          if (bs.isValidUtf8()) {
+            userId_ = s;
+          }
+          return s;
+        }
+      }
+      /**
+       * <pre>
+       * ID of the user executing the run.
+       * This field is deprecated as of MLflow 1.0, and will be removed in a future
+       * MLflow release. Use 'mlflow.user' tag instead.
+       * </pre>
+       *
+       * <code>optional string user_id = 1;</code>
+       */
+      public com.google.protobuf.ByteString
+          getUserIdBytes() {
+        java.lang.Object ref = userId_;
+        if (ref instanceof java.lang.String) {
+          com.google.protobuf.ByteString b = 
+              com.google.protobuf.ByteString.copyFromUtf8(
+                  (java.lang.String) ref);
+          userId_ = b;
+          return b;
+        } else {
+          return (com.google.protobuf.ByteString) ref;
+        }
+      }
+
+      public static final int START_TIME_FIELD_NUMBER = 2;
+      private long startTime_;
+      /**
+       * <pre>
+       * Unix timestamp in milliseconds of when the run started.
+       * </pre>
+       *
+       * <code>optional int64 start_time = 2;</code>
+       */
+      public boolean hasStartTime() {
+        return ((bitField0_ & 0x00000002) == 0x00000002);
+      }
+      /**
+       * <pre>
+       * Unix timestamp in milliseconds of when the run started.
+       * </pre>
+       *
+       * <code>optional int64 start_time = 2;</code>
+       */
+      public long getStartTime() {
+        return startTime_;
+      }
+
+      public static final int END_TIME_FIELD_NUMBER = 3;
+      private long endTime_;
+      /**
+       * <pre>
+       * Unix timestamp in milliseconds of when the run ended, if it is already terminated.
+       * </pre>
+       *
+       * <code>optional int64 end_time = 3;</code>
+       */
+      public boolean hasEndTime() {
+        return ((bitField0_ & 0x00000004) == 0x00000004);
+      }
+      /**
+       * <pre>
+       * Unix timestamp in milliseconds of when the run ended, if it is already terminated.
+       * </pre>
+       *
+       * <code>optional int64 end_time = 3;</code>
+       */
+      public long getEndTime() {
+        return endTime_;
+      }
+
+      public static final int STATUS_FIELD_NUMBER = 4;
+      private int status_;
+      /**
+       * <pre>
+       * Status of the run. Defaults to ``RUNNING``.
+       * </pre>
+       *
+       * <code>optional .mlflow.RunStatus status = 4;</code>
+       */
+      public boolean hasStatus() {
+        return ((bitField0_ & 0x00000008) == 0x00000008);
+      }
+      /**
+       * <pre>
+       * Status of the run. Defaults to ``RUNNING``.
+       * </pre>
+       *
+       * <code>optional .mlflow.RunStatus status = 4;</code>
+       */
+      public org.mlflow.api.proto.Service.RunStatus getStatus() {
+        @SuppressWarnings("deprecation")
+        org.mlflow.api.proto.Service.RunStatus result = org.mlflow.api.proto.Service.RunStatus.valueOf(status_);
+        return result == null ? org.mlflow.api.proto.Service.RunStatus.RUNNING : result;
+      }
+
+      public static final int TAGS_FIELD_NUMBER = 5;
+      private java.util.List<org.mlflow.api.proto.Service.RunTag> tags_;
+      /**
+       * <pre>
+       * Additional metadata for run.
+       * </pre>
+       *
+       * <code>repeated .mlflow.RunTag tags = 5;</code>
+       */
+      public java.util.List<org.mlflow.api.proto.Service.RunTag> getTagsList() {
+        return tags_;
+      }
+      /**
+       * <pre>
+       * Additional metadata for run.
+       * </pre>
+       *
+       * <code>repeated .mlflow.RunTag tags = 5;</code>
+       */
+      public java.util.List<? extends org.mlflow.api.proto.Service.RunTagOrBuilder> 
+          getTagsOrBuilderList() {
+        return tags_;
+      }
+      /**
+       * <pre>
+       * Additional metadata for run.
+       * </pre>
+       *
+       * <code>repeated .mlflow.RunTag tags = 5;</code>
+       */
+      public int getTagsCount() {
+        return tags_.size();
+      }
+      /**
+       * <pre>
+       * Additional metadata for run.
+       * </pre>
+       *
+       * <code>repeated .mlflow.RunTag tags = 5;</code>
+       */
+      public org.mlflow.api.proto.Service.RunTag getTags(int index) {
+        return tags_.get(index);
+      }
+      /**
+       * <pre>
+       * Additional metadata for run.
+       * </pre>
+       *
+       * <code>repeated .mlflow.RunTag tags = 5;</code>
+       */
+      public org.mlflow.api.proto.Service.RunTagOrBuilder getTagsOrBuilder(
+          int index) {
+        return tags_.get(index);
+      }
+
+      public static final int PARAMS_FIELD_NUMBER = 6;
+      private java.util.List<org.mlflow.api.proto.Service.Param> params_;
+      /**
+       * <pre>
+       * Params to log.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Param params = 6;</code>
+       */
+      public java.util.List<org.mlflow.api.proto.Service.Param> getParamsList() {
+        return params_;
+      }
+      /**
+       * <pre>
+       * Params to log.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Param params = 6;</code>
+       */
+      public java.util.List<? extends org.mlflow.api.proto.Service.ParamOrBuilder> 
+          getParamsOrBuilderList() {
+        return params_;
+      }
+      /**
+       * <pre>
+       * Params to log.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Param params = 6;</code>
+       */
+      public int getParamsCount() {
+        return params_.size();
+      }
+      /**
+       * <pre>
+       * Params to log.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Param params = 6;</code>
+       */
+      public org.mlflow.api.proto.Service.Param getParams(int index) {
+        return params_.get(index);
+      }
+      /**
+       * <pre>
+       * Params to log.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Param params = 6;</code>
+       */
+      public org.mlflow.api.proto.Service.ParamOrBuilder getParamsOrBuilder(
+          int index) {
+        return params_.get(index);
+      }
+
+      public static final int METRICS_FIELD_NUMBER = 7;
+      private java.util.List<org.mlflow.api.proto.Service.Metric> metrics_;
+      /**
+       * <pre>
+       * Metrics to log.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Metric metrics = 7;</code>
+       */
+      public java.util.List<org.mlflow.api.proto.Service.Metric> getMetricsList() {
+        return metrics_;
+      }
+      /**
+       * <pre>
+       * Metrics to log.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Metric metrics = 7;</code>
+       */
+      public java.util.List<? extends org.mlflow.api.proto.Service.MetricOrBuilder> 
+          getMetricsOrBuilderList() {
+        return metrics_;
+      }
+      /**
+       * <pre>
+       * Metrics to log.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Metric metrics = 7;</code>
+       */
+      public int getMetricsCount() {
+        return metrics_.size();
+      }
+      /**
+       * <pre>
+       * Metrics to log.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Metric metrics = 7;</code>
+       */
+      public org.mlflow.api.proto.Service.Metric getMetrics(int index) {
+        return metrics_.get(index);
+      }
+      /**
+       * <pre>
+       * Metrics to log.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Metric metrics = 7;</code>
+       */
+      public org.mlflow.api.proto.Service.MetricOrBuilder getMetricsOrBuilder(
+          int index) {
+        return metrics_.get(index);
+      }
+
+      private byte memoizedIsInitialized = -1;
+      @java.lang.Override
+      public final boolean isInitialized() {
+        byte isInitialized = memoizedIsInitialized;
+        if (isInitialized == 1) return true;
+        if (isInitialized == 0) return false;
+
+        memoizedIsInitialized = 1;
+        return true;
+      }
+
+      @java.lang.Override
+      public void writeTo(com.google.protobuf.CodedOutputStream output)
+                          throws java.io.IOException {
+        if (((bitField0_ & 0x00000001) == 0x00000001)) {
+          com.google.protobuf.GeneratedMessageV3.writeString(output, 1, userId_);
+        }
+        if (((bitField0_ & 0x00000002) == 0x00000002)) {
+          output.writeInt64(2, startTime_);
+        }
+        if (((bitField0_ & 0x00000004) == 0x00000004)) {
+          output.writeInt64(3, endTime_);
+        }
+        if (((bitField0_ & 0x00000008) == 0x00000008)) {
+          output.writeEnum(4, status_);
+        }
+        for (int i = 0; i < tags_.size(); i++) {
+          output.writeMessage(5, tags_.get(i));
+        }
+        for (int i = 0; i < params_.size(); i++) {
+          output.writeMessage(6, params_.get(i));
+        }
+        for (int i = 0; i < metrics_.size(); i++) {
+          output.writeMessage(7, metrics_.get(i));
+        }
+        unknownFields.writeTo(output);
+      }
+
+      @java.lang.Override
+      public int getSerializedSize() {
+        int size = memoizedSize;
+        if (size != -1) return size;
+
+        size = 0;
+        if (((bitField0_ & 0x00000001) == 0x00000001)) {
+          size += com.google.protobuf.GeneratedMessageV3.computeStringSize(1, userId_);
+        }
+        if (((bitField0_ & 0x00000002) == 0x00000002)) {
+          size += com.google.protobuf.CodedOutputStream
+            .computeInt64Size(2, startTime_);
+        }
+        if (((bitField0_ & 0x00000004) == 0x00000004)) {
+          size += com.google.protobuf.CodedOutputStream
+            .computeInt64Size(3, endTime_);
+        }
+        if (((bitField0_ & 0x00000008) == 0x00000008)) {
+          size += com.google.protobuf.CodedOutputStream
+            .computeEnumSize(4, status_);
+        }
+        for (int i = 0; i < tags_.size(); i++) {
+          size += com.google.protobuf.CodedOutputStream
+            .computeMessageSize(5, tags_.get(i));
+        }
+        for (int i = 0; i < params_.size(); i++) {
+          size += com.google.protobuf.CodedOutputStream
+            .computeMessageSize(6, params_.get(i));
+        }
+        for (int i = 0; i < metrics_.size(); i++) {
+          size += com.google.protobuf.CodedOutputStream
+            .computeMessageSize(7, metrics_.get(i));
+        }
+        size += unknownFields.getSerializedSize();
+        memoizedSize = size;
+        return size;
+      }
+
+      @java.lang.Override
+      public boolean equals(final java.lang.Object obj) {
+        if (obj == this) {
+         return true;
+        }
+        if (!(obj instanceof org.mlflow.api.proto.Service.CreateRuns.RunSpec)) {
+          return super.equals(obj);
+        }
+        org.mlflow.api.proto.Service.CreateRuns.RunSpec other = (org.mlflow.api.proto.Service.CreateRuns.RunSpec) obj;
+
+        boolean result = true;
+        result = result && (hasUserId() == other.hasUserId());
+        if (hasUserId()) {
+          result = result && getUserId()
+              .equals(other.getUserId());
+        }
+        result = result && (hasStartTime() == other.hasStartTime());
+        if (hasStartTime()) {
+          result = result && (getStartTime()
+              == other.getStartTime());
+        }
+        result = result && (hasEndTime() == other.hasEndTime());
+        if (hasEndTime()) {
+          result = result && (getEndTime()
+              == other.getEndTime());
+        }
+        result = result && (hasStatus() == other.hasStatus());
+        if (hasStatus()) {
+          result = result && status_ == other.status_;
+        }
+        result = result && getTagsList()
+            .equals(other.getTagsList());
+        result = result && getParamsList()
+            .equals(other.getParamsList());
+        result = result && getMetricsList()
+            .equals(other.getMetricsList());
+        result = result && unknownFields.equals(other.unknownFields);
+        return result;
+      }
+
+      @java.lang.Override
+      public int hashCode() {
+        if (memoizedHashCode != 0) {
+          return memoizedHashCode;
+        }
+        int hash = 41;
+        hash = (19 * hash) + getDescriptor().hashCode();
+        if (hasUserId()) {
+          hash = (37 * hash) + USER_ID_FIELD_NUMBER;
+          hash = (53 * hash) + getUserId().hashCode();
+        }
+        if (hasStartTime()) {
+          hash = (37 * hash) + START_TIME_FIELD_NUMBER;
+          hash = (53 * hash) + com.google.protobuf.Internal.hashLong(
+              getStartTime());
+        }
+        if (hasEndTime()) {
+          hash = (37 * hash) + END_TIME_FIELD_NUMBER;
+          hash = (53 * hash) + com.google.protobuf.Internal.hashLong(
+              getEndTime());
+        }
+        if (hasStatus()) {
+          hash = (37 * hash) + STATUS_FIELD_NUMBER;
+          hash = (53 * hash) + status_;
+        }
+        if (getTagsCount() > 0) {
+          hash = (37 * hash) + TAGS_FIELD_NUMBER;
+          hash = (53 * hash) + getTagsList().hashCode();
+        }
+        if (getParamsCount() > 0) {
+          hash = (37 * hash) + PARAMS_FIELD_NUMBER;
+          hash = (53 * hash) + getParamsList().hashCode();
+        }
+        if (getMetricsCount() > 0) {
+          hash = (37 * hash) + METRICS_FIELD_NUMBER;
+          hash = (53 * hash) + getMetricsList().hashCode();
+        }
+        hash = (29 * hash) + unknownFields.hashCode();
+        memoizedHashCode = hash;
+        return hash;
+      }
+
+      public static org.mlflow.api.proto.Service.CreateRuns.RunSpec parseFrom(
+          java.nio.ByteBuffer data)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data);
+      }
+      public static org.mlflow.api.proto.Service.CreateRuns.RunSpec parseFrom(
+          java.nio.ByteBuffer data,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data, extensionRegistry);
+      }
+      public static org.mlflow.api.proto.Service.CreateRuns.RunSpec parseFrom(
+          com.google.protobuf.ByteString data)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data);
+      }
+      public static org.mlflow.api.proto.Service.CreateRuns.RunSpec parseFrom(
+          com.google.protobuf.ByteString data,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data, extensionRegistry);
+      }
+      public static org.mlflow.api.proto.Service.CreateRuns.RunSpec parseFrom(byte[] data)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data);
+      }
+      public static org.mlflow.api.proto.Service.CreateRuns.RunSpec parseFrom(
+          byte[] data,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data, extensionRegistry);
+      }
+      public static org.mlflow.api.proto.Service.CreateRuns.RunSpec parseFrom(java.io.InputStream input)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseWithIOException(PARSER, input);
+      }
+      public static org.mlflow.api.proto.Service.CreateRuns.RunSpec parseFrom(
+          java.io.InputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseWithIOException(PARSER, input, extensionRegistry);
+      }
+      public static org.mlflow.api.proto.Service.CreateRuns.RunSpec parseDelimitedFrom(java.io.InputStream input)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseDelimitedWithIOException(PARSER, input);
+      }
+      public static org.mlflow.api.proto.Service.CreateRuns.RunSpec parseDelimitedFrom(
+          java.io.InputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseDelimitedWithIOException(PARSER, input, extensionRegistry);
+      }
+      public static org.mlflow.api.proto.Service.CreateRuns.RunSpec parseFrom(
+          com.google.protobuf.CodedInputStream input)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseWithIOException(PARSER, input);
+      }
+      public static org.mlflow.api.proto.Service.CreateRuns.RunSpec parseFrom(
+          com.google.protobuf.CodedInputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseWithIOException(PARSER, input, extensionRegistry);
+      }
+
+      @java.lang.Override
+      public Builder newBuilderForType() { return newBuilder(); }
+      public static Builder newBuilder() {
+        return DEFAULT_INSTANCE.toBuilder();
+      }
+      public static Builder newBuilder(org.mlflow.api.proto.Service.CreateRuns.RunSpec prototype) {
+        return DEFAULT_INSTANCE.toBuilder().mergeFrom(prototype);
+      }
+      @java.lang.Override
+      public Builder toBuilder() {
+        return this == DEFAULT_INSTANCE
+            ? new Builder() : new Builder().mergeFrom(this);
+      }
+
+      @java.lang.Override
+      protected Builder newBuilderForType(
+          com.google.protobuf.GeneratedMessageV3.BuilderParent parent) {
+        Builder builder = new Builder(parent);
+        return builder;
+      }
+      /**
+       * <pre>
+       * Attributes, and initial metrics, params, and tags, of a run to create with
+       * :ref:`mlflowMlflowServicecreateRuns`.
+       * </pre>
+       *
+       * Protobuf type {@code mlflow.CreateRuns.RunSpec}
+       */
+      public static final class Builder extends
+          com.google.protobuf.GeneratedMessageV3.Builder<Builder> implements
+          // @@protoc_insertion_point(builder_implements:mlflow.CreateRuns.RunSpec)
+          org.mlflow.api.proto.Service.CreateRuns.RunSpecOrBuilder {
+        public static final com.google.protobuf.Descriptors.Descriptor
+            getDescriptor() {
+          return org.mlflow.api.proto.Service.internal_static_mlflow_CreateRuns_RunSpec_descriptor;
+        }
+
+        @java.lang.Override
+        protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
+            internalGetFieldAccessorTable() {
+          return org.mlflow.api.proto.Service.internal_static_mlflow_CreateRuns_RunSpec_fieldAccessorTable
+              .ensureFieldAccessorsInitialized(
+                  org.mlflow.api.proto.Service.CreateRuns.RunSpec.class, org.mlflow.api.proto.Service.CreateRuns.RunSpec.Builder.class);
+        }
+
+        // Construct using org.mlflow.api.proto.Service.CreateRuns.RunSpec.newBuilder()
+        private Builder() {
+          maybeForceBuilderInitialization();
+        }
+
+        private Builder(
+            com.google.protobuf.GeneratedMessageV3.BuilderParent parent) {
+          super(parent);
+          maybeForceBuilderInitialization();
+        }
+        private void maybeForceBuilderInitialization() {
+          if (com.google.protobuf.GeneratedMessageV3
+                  .alwaysUseFieldBuilders) {
+            getTagsFieldBuilder();
+            getParamsFieldBuilder();
+            getMetricsFieldBuilder();
+          }
+        }
+        @java.lang.Override
+        public Builder clear() {
+          super.clear();
+          userId_ = "";
+          bitField0_ = (bitField0_ & ~0x00000001);
+          startTime_ = 0L;
+          bitField0_ = (bitField0_ & ~0x00000002);
+          endTime_ = 0L;
+          bitField0_ = (bitField0_ & ~0x00000004);
+          status_ = 1;
+          bitField0_ = (bitField0_ & ~0x00000008);
+          if (tagsBuilder_ == null) {
+            tags_ = java.util.Collections.emptyList();
+            bitField0_ = (bitField0_ & ~0x00000010);
+          } else {
+            tagsBuilder_.clear();
+          }
+          if (paramsBuilder_ == null) {
+            params_ = java.util.Collections.emptyList();
+            bitField0_ = (bitField0_ & ~0x00000020);
+          } else {
+            paramsBuilder_.clear();
+          }
+          if (metricsBuilder_ == null) {
+            metrics_ = java.util.Collections.emptyList();
+            bitField0_ = (bitField0_ & ~0x00000040);
+          } else {
+            metricsBuilder_.clear();
+          }
+          return this;
+        }
+
+        @java.lang.Override
+        public com.google.protobuf.Descriptors.Descriptor
+            getDescriptorForType() {
+          return org.mlflow.api.proto.Service.internal_static_mlflow_CreateRuns_RunSpec_descriptor;
+        }
+
+        @java.lang.Override
+        public org.mlflow.api.proto.Service.CreateRuns.RunSpec getDefaultInstanceForType() {
+          return org.mlflow.api.proto.Service.CreateRuns.RunSpec.getDefaultInstance();
+        }
+
+        @java.lang.Override
+        public org.mlflow.api.proto.Service.CreateRuns.RunSpec build() {
+          org.mlflow.api.proto.Service.CreateRuns.RunSpec result = buildPartial();
+          if (!result.isInitialized()) {
+            throw newUninitializedMessageException(result);
+          }
+          return result;
+        }
+
+        @java.lang.Override
+        public org.mlflow.api.proto.Service.CreateRuns.RunSpec buildPartial() {
+          org.mlflow.api.proto.Service.CreateRuns.RunSpec result = new org.mlflow.api.proto.Service.CreateRuns.RunSpec(this);
+          int from_bitField0_ = bitField0_;
+          int to_bitField0_ = 0;
+          if (((from_bitField0_ & 0x00000001) == 0x00000001)) {
+            to_bitField0_ |= 0x00000001;
+          }
+          result.userId_ = userId_;
+          if (((from_bitField0_ & 0x00000002) == 0x00000002)) {
+            to_bitField0_ |= 0x00000002;
+          }
+          result.startTime_ = startTime_;
+          if (((from_bitField0_ & 0x00000004) == 0x00000004)) {
+            to_bitField0_ |= 0x00000004;
+          }
+          result.endTime_ = endTime_;
+          if (((from_bitField0_ & 0x00000008) == 0x00000008)) {
+            to_bitField0_ |= 0x00000008;
+          }
+          result.status_ = status_;
+          if (tagsBuilder_ == null) {
+            if (((bitField0_ & 0x00000010) == 0x00000010)) {
+              tags_ = java.util.Collections.unmodifiableList(tags_);
+              bitField0_ = (bitField0_ & ~0x00000010);
+            }
+            result.tags_ = tags_;
+          } else {
+            result.tags_ = tagsBuilder_.build();
+          }
+          if (paramsBuilder_ == null) {
+            if (((bitField0_ & 0x00000020) == 0x00000020)) {
+              params_ = java.util.Collections.unmodifiableList(params_);
+              bitField0_ = (bitField0_ & ~0x00000020);
+            }
+            result.params_ = params_;
+          } else {
+            result.params_ = paramsBuilder_.build();
+          }
+          if (metricsBuilder_ == null) {
+            if (((bitField0_ & 0x00000040) == 0x00000040)) {
+              metrics_ = java.util.Collections.unmodifiableList(metrics_);
+              bitField0_ = (bitField0_ & ~0x00000040);
+            }
+            result.metrics_ = metrics_;
+          } else {
+            result.metrics_ = metricsBuilder_.build();
+          }
+          result.bitField0_ = to_bitField0_;
+          onBuilt();
+          return result;
+        }
+
+        @java.lang.Override
+        public Builder clone() {
+          return (Builder) super.clone();
+        }
+        @java.lang.Override
+        public Builder setField(
+            com.google.protobuf.Descriptors.FieldDescriptor field,
+            java.lang.Object value) {
+          return (Builder) super.setField(field, value);
+        }
+        @java.lang.Override
+        public Builder clearField(
+            com.google.protobuf.Descriptors.FieldDescriptor field) {
+          return (Builder) super.clearField(field);
+        }
+        @java.lang.Override
+        public Builder clearOneof(
+            com.google.protobuf.Descriptors.OneofDescriptor oneof) {
+          return (Builder) super.clearOneof(oneof);
+        }
+        @java.lang.Override
+        public Builder setRepeatedField(
+            com.google.protobuf.Descriptors.FieldDescriptor field,
+            int index, java.lang.Object value) {
+          return (Builder) super.setRepeatedField(field, index, value);
+        }
+        @java.lang.Override
+        public Builder addRepeatedField(
+            com.google.protobuf.Descriptors.FieldDescriptor field,
+            java.lang.Object value) {
+          return (Builder) super.addRepeatedField(field, value);
+        }
+        @java.lang.Override
+        public Builder mergeFrom(com.google.protobuf.Message other) {
+          if (other instanceof org.mlflow.api.proto.Service.CreateRuns.RunSpec) {
+            return mergeFrom((org.mlflow.api.proto.Service.CreateRuns.RunSpec)other);
+          } else {
+            super.mergeFrom(other);
+            return this;
+          }
+        }
+
+        public Builder mergeFrom(org.mlflow.api.proto.Service.CreateRuns.RunSpec other) {
+          if (other == org.mlflow.api.proto.Service.CreateRuns.RunSpec.getDefaultInstance()) return this;
+          if (other.hasUserId()) {
+            bitField0_ |= 0x00000001;
+            userId_ = other.userId_;
+            onChanged();
+          }
+          if (other.hasStartTime()) {
+            setStartTime(other.getStartTime());
+          }
+          if (other.hasEndTime()) {
+            setEndTime(other.getEndTime());
+          }
+          if (other.hasStatus()) {
+            setStatus(other.getStatus());
+          }
+          if (tagsBuilder_ == null) {
+            if (!other.tags_.isEmpty()) {
+              if (tags_.isEmpty()) {
+                tags_ = other.tags_;
+                bitField0_ = (bitField0_ & ~0x00000010);
+              } else {
+                ensureTagsIsMutable();
+                tags_.addAll(other.tags_);
+              }
+              onChanged();
+            }
+          } else {
+            if (!other.tags_.isEmpty()) {
+              if (tagsBuilder_.isEmpty()) {
+                tagsBuilder_.dispose();
+                tagsBuilder_ = null;
+                tags_ = other.tags_;
+                bitField0_ = (bitField0_ & ~0x00000010);
+                tagsBuilder_ = 
+                  com.google.protobuf.GeneratedMessageV3.alwaysUseFieldBuilders ?
+                     getTagsFieldBuilder() : null;
+              } else {
+                tagsBuilder_.addAllMessages(other.tags_);
+              }
+            }
+          }
+          if (paramsBuilder_ == null) {
+            if (!other.params_.isEmpty()) {
+              if (params_.isEmpty()) {
+                params_ = other.params_;
+                bitField0_ = (bitField0_ & ~0x00000020);
+              } else {
+                ensureParamsIsMutable();
+                params_.addAll(other.params_);
+              }
+              onChanged();
+            }
+          } else {
+            if (!other.params_.isEmpty()) {
+              if (paramsBuilder_.isEmpty()) {
+                paramsBuilder_.dispose();
+                paramsBuilder_ = null;
+                params_ = other.params_;
+                bitField0_ = (bitField0_ & ~0x00000020);
+                paramsBuilder_ = 
+                  com.google.protobuf.GeneratedMessageV3.alwaysUseFieldBuilders ?
+                     getParamsFieldBuilder() : null;
+              } else {
+                paramsBuilder_.addAllMessages(other.params_);
+              }
+            }
+          }
+          if (metricsBuilder_ == null) {
+            if (!other.metrics_.isEmpty()) {
+              if (metrics_.isEmpty()) {
+                metrics_ = other.metrics_;
+                bitField0_ = (bitField0_ & ~0x00000040);
+              } else {
+                ensureMetricsIsMutable();
+                metrics_.addAll(other.metrics_);
+              }
+              onChanged();
+            }
+          } else {
+            if (!other.metrics_.isEmpty()) {
+              if (metricsBuilder_.isEmpty()) {
+                metricsBuilder_.dispose();
+                metricsBuilder_ = null;
+                metrics_ = other.metrics_;
+                bitField0_ = (bitField0_ & ~0x00000040);
+                metricsBuilder_ = 
+                  com.google.protobuf.GeneratedMessageV3.alwaysUseFieldBuilders ?
+                     getMetricsFieldBuilder() : null;
+              } else {
+                metricsBuilder_.addAllMessages(other.metrics_);
+              }
+            }
+          }
+          this.mergeUnknownFields(other.unknownFields);
+          onChanged();
+          return this;
+        }
+
+        @java.lang.Override
+        public final boolean isInitialized() {
+          return true;
+        }
+
+        @java.lang.Override
+        public Builder mergeFrom(
+            com.google.protobuf.CodedInputStream input,
+            com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+            throws java.io.IOException {
+          org.mlflow.api.proto.Service.CreateRuns.RunSpec parsedMessage = null;
+          try {
+            parsedMessage = PARSER.parsePartialFrom(input, extensionRegistry);
+          } catch (com.google.protobuf.InvalidProtocolBufferException e) {
+            parsedMessage = (org.mlflow.api.proto.Service.CreateRuns.RunSpec) e.getUnfinishedMessage();
+            throw e.unwrapIOException();
+          } finally {
+            if (parsedMessage != null) {
+              mergeFrom(parsedMessage);
+            }
+          }
+          return this;
+        }
+        private int bitField0_;
+
+        private java.lang.Object userId_ = "";
+        /**
+         * <pre>
+         * ID of the user executing the run.
+         * This field is deprecated as of MLflow 1.0, and will be removed in a future
+         * MLflow release. Use 'mlflow.user' tag instead.
+         * </pre>
+         *
+         * <code>optional string user_id = 1;</code>
+         */
+        public boolean hasUserId() {
+          return ((bitField0_ & 0x00000001) == 0x00000001);
+        }
+        /**
+         * <pre>
+         * ID of the user executing the run.
+         * This field is deprecated as of MLflow 1.0, and will be removed in a future
+         * MLflow release. Use 'mlflow.user' tag instead.
+         * </pre>
+         *
+         * <code>optional string user_id = 1;</code>
+         */
+        public java.lang.String getUserId() {
+          java.lang.Object ref = userId_;
+          if (!(ref instanceof java.lang.String)) {
+            com.google.protobuf.ByteString bs =
+                (com.google.protobuf.ByteString) ref;
+            java.lang.String s = bs.toStringUtf8();
+            if (bs.isValidUtf8()) {
+              userId_ = s;
+            }
+            return s;
+          } else {
+            return (java.lang.String) ref;
+          }
+        }
+        /**
+         * <pre>
+         * ID of the user executing the run.
+         * This field is deprecated as of MLflow 1.0, and will be removed in a future
+         * MLflow release. Use 'mlflow.user' tag instead.
+         * </pre>
+         *
+         * <code>optional string user_id = 1;</code>
+         */
+        public com.google.protobuf.ByteString
+            getUserIdBytes() {
+          java.lang.Object ref = userId_;
+          if (ref instanceof String) {
+            com.google.protobuf.ByteString b = 
+                com.google.protobuf.ByteString.copyFromUtf8(
+                    (java.lang.String) ref);
+            userId_ = b;
+            return b;
+          } else {
+            return (com.google.protobuf.ByteString) ref;
+          }
+        }
+        /**
+         * <pre>
+         * ID of the user executing the run.
+         * This field is deprecated as of MLflow 1.0, and will be removed in a future
+         * MLflow release. Use 'mlflow.user' tag instead.
+         * </pre>
+         *
+         * <code>optional string user_id = 1;</code>
+         */
+        public Builder setUserId(
+            java.lang.String value) {
+          if (value == null) {
+    throw new NullPointerException();
+  }
+  bitField0_ |= 0x00000001;
+          userId_ = value;
+          onChanged();
+          return this;
+        }
+        /**
+         * <pre>
+         * ID of the user executing the run.
+         * This field is deprecated as of MLflow 1.0, and will be removed in a future
+         * MLflow release. Use 'mlflow.user' tag instead.
+         * </pre>
+         *
+         * <code>optional string user_id = 1;</code>
+         */
+        public Builder clearUserId() {
+          bitField0_ = (bitField0_ & ~0x00000001);
+          userId_ = getDefaultInstance().getUserId();
+          onChanged();
+          return this;
+        }
+        /**
+         * <pre>
+         * ID of the user executing the run.
+         * This field is deprecated as of MLflow 1.0, and will be removed in a future
+         * MLflow release. Use 'mlflow.user' tag instead.
+         * </pre>
+         *
+         * <code>optional string user_id = 1;</code>
+         */
+        public Builder setUserIdBytes(
+            com.google.protobuf.ByteString value) {
+          if (value == null) {
+    throw new NullPointerException();
+  }
+  bitField0_ |= 0x00000001;
+          userId_ = value;
+          onChanged();
+          return this;
+        }
+
+        private long startTime_ ;
+        /**
+         * <pre>
+         * Unix timestamp in milliseconds of when the run started.
+         * </pre>
+         *
+         * <code>optional int64 start_time = 2;</code>
+         */
+        public boolean hasStartTime() {
+          return ((bitField0_ & 0x00000002) == 0x00000002);
+        }
+        /**
+         * <pre>
+         * Unix timestamp in milliseconds of when the run started.
+         * </pre>
+         *
+         * <code>optional int64 start_time = 2;</code>
+         */
+        public long getStartTime() {
+          return startTime_;
+        }
+        /**
+         * <pre>
+         * Unix timestamp in milliseconds of when the run started.
+         * </pre>
+         *
+         * <code>optional int64 start_time = 2;</code>
+         */
+        public Builder setStartTime(long value) {
+          bitField0_ |= 0x00000002;
+          startTime_ = value;
+          onChanged();
+          return this;
+        }
+        /**
+         * <pre>
+         * Unix timestamp in milliseconds of when the run started.
+         * </pre>
+         *
+         * <code>optional int64 start_time = 2;</code>
+         */
+        public Builder clearStartTime() {
+          bitField0_ = (bitField0_ & ~0x00000002);
+          startTime_ = 0L;
+          onChanged();
+          return this;
+        }
+
+        private long endTime_ ;
+        /**
+         * <pre>
+         * Unix timestamp in milliseconds of when the run ended, if it is already terminated.
+         * </pre>
+         *
+         * <code>optional int64 end_time = 3;</code>
+         */
+        public boolean hasEndTime() {
+          return ((bitField0_ & 0x00000004) == 0x00000004);
+        }
+        /**
+         * <pre>
+         * Unix timestamp in milliseconds of when the run ended, if it is already terminated.
+         * </pre>
+         *
+         * <code>optional int64 end_time = 3;</code>
+         */
+        public long getEndTime() {
+          return endTime_;
+        }
+        /**
+         * <pre>
+         * Unix timestamp in milliseconds of when the run ended, if it is already terminated.
+         * </pre>
+         *
+         * <code>optional int64 end_time = 3;</code>
+         */
+        public Builder setEndTime(long value) {
+          bitField0_ |= 0x00000004;
+          endTime_ = value;
+          onChanged();
+          return this;
+        }
+        /**
+         * <pre>
+         * Unix timestamp in milliseconds of when the run ended, if it is already terminated.
+         * </pre>
+         *
+         * <code>optional int64 end_time = 3;</code>
+         */
+        public Builder clearEndTime() {
+          bitField0_ = (bitField0_ & ~0x00000004);
+          endTime_ = 0L;
+          onChanged();
+          return this;
+        }
+
+        private int status_ = 1;
+        /**
+         * <pre>
+         * Status of the run. Defaults to ``RUNNING``.
+         * </pre>
+         *
+         * <code>optional .mlflow.RunStatus status = 4;</code>
+         */
+        public boolean hasStatus() {
+          return ((bitField0_ & 0x00000008) == 0x00000008);
+        }
+        /**
+         * <pre>
+         * Status of the run. Defaults to ``RUNNING``.
+         * </pre>
+         *
+         * <code>optional .mlflow.RunStatus status = 4;</code>
+         */
+        public org.mlflow.api.proto.Service.RunStatus getStatus() {
+          @SuppressWarnings("deprecation")
+          org.mlflow.api.proto.Service.RunStatus result = org.mlflow.api.proto.Service.RunStatus.valueOf(status_);
+          return result == null ? org.mlflow.api.proto.Service.RunStatus.RUNNING : result;
+        }
+        /**
+         * <pre>
+         * Status of the run. Defaults to ``RUNNING``.
+         * </pre>
+         *
+         * <code>optional .mlflow.RunStatus status = 4;</code>
+         */
+        public Builder setStatus(org.mlflow.api.proto.Service.RunStatus value) {
+          if (value == null) {
+            throw new NullPointerException();
+          }
+          bitField0_ |= 0x00000008;
+          status_ = value.getNumber();
+          onChanged();
+          return this;
+        }
+        /**
+         * <pre>
+         * Status of the run. Defaults to ``RUNNING``.
+         * </pre>
+         *
+         * <code>optional .mlflow.RunStatus status = 4;</code>
+         */
+        public Builder clearStatus() {
+          bitField0_ = (bitField0_ & ~0x00000008);
+          status_ = 1;
+          onChanged();
+          return this;
+        }
+
+        private java.util.List<org.mlflow.api.proto.Service.RunTag> tags_ =
+          java.util.Collections.emptyList();
+        private void ensureTagsIsMutable() {
+          if (!((bitField0_ & 0x00000010) == 0x00000010)) {
+            tags_ = new java.util.ArrayList<org.mlflow.api.proto.Service.RunTag>(tags_);
+            bitField0_ |= 0x00000010;
+           }
+        }
+
+        private com.google.protobuf.RepeatedFieldBuilderV3<
+            org.mlflow.api.proto.Service.RunTag, org.mlflow.api.proto.Service.RunTag.Builder, org.mlflow.api.proto.Service.RunTagOrBuilder> tagsBuilder_;
+
+        /**
+         * <pre>
+         * Additional metadata for run.
+         * </pre>
+         *
+         * <code>repeated .mlflow.RunTag tags = 5;</code>
+         */
+        public java.util.List<org.mlflow.api.proto.Service.RunTag> getTagsList() {
+          if (tagsBuilder_ == null) {
+            return java.util.Collections.unmodifiableList(tags_);
+          } else {
+            return tagsBuilder_.getMessageList();
+          }
+        }
+        /**
+         * <pre>
+         * Additional metadata for run.
+         * </pre>
+         *
+         * <code>repeated .mlflow.RunTag tags = 5;</code>
+         */
+        public int getTagsCount() {
+          if (tagsBuilder_ == null) {
+            return tags_.size();
+          } else {
+            return tagsBuilder_.getCount();
+          }
+        }
+        /**
+         * <pre>
+         * Additional metadata for run.
+         * </pre>
+         *
+         * <code>repeated .mlflow.RunTag tags = 5;</code>
+         */
+        public org.mlflow.api.proto.Service.RunTag getTags(int index) {
+          if (tagsBuilder_ == null) {
+            return tags_.get(index);
+          } else {
+            return tagsBuilder_.getMessage(index);
+          }
+        }
+        /**
+         * <pre>
+         * Additional metadata for run.
+         * </pre>
+         *
+         * <code>repeated .mlflow.RunTag tags = 5;</code>
+         */
+        public Builder setTags(
+            int index, org.mlflow.api.proto.Service.RunTag value) {
+          if (tagsBuilder_ == null) {
+            if (value == null) {
+              throw new NullPointerException();
+            }
+            ensureTagsIsMutable();
+            tags_.set(index, value);
+            onChanged();
+          } else {
+            tagsBuilder_.setMessage(index, value);
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * Additional metadata for run.
+         * </pre>
+         *
+         * <code>repeated .mlflow.RunTag tags = 5;</code>
+         */
+        public Builder setTags(
+            int index, org.mlflow.api.proto.Service.RunTag.Builder builderForValue) {
+          if (tagsBuilder_ == null) {
+            ensureTagsIsMutable();
+            tags_.set(index, builderForValue.build());
+            onChanged();
+          } else {
+            tagsBuilder_.setMessage(index, builderForValue.build());
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * Additional metadata for run.
+         * </pre>
+         *
+         * <code>repeated .mlflow.RunTag tags = 5;</code>
+         */
+        public Builder addTags(org.mlflow.api.proto.Service.RunTag value) {
+          if (tagsBuilder_ == null) {
+            if (value == null) {
+              throw new NullPointerException();
+            }
+            ensureTagsIsMutable();
+            tags_.add(value);
+            onChanged();
+          } else {
+            tagsBuilder_.addMessage(value);
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * Additional metadata for run.
+         * </pre>
+         *
+         * <code>repeated .mlflow.RunTag tags = 5;</code>
+         */
+        public Builder addTags(
+            int index, org.mlflow.api.proto.Service.RunTag value) {
+          if (tagsBuilder_ == null) {
+            if (value == null) {
+              throw new NullPointerException();
+            }
+            ensureTagsIsMutable();
+            tags_.add(index, value);
+            onChanged();
+          } else {
+            tagsBuilder_.addMessage(index, value);
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * Additional metadata for run.
+         * </pre>
+         *
+         * <code>repeated .mlflow.RunTag tags = 5;</code>
+         */
+        public Builder addTags(
+            org.mlflow.api.proto.Service.RunTag.Builder builderForValue) {
+          if (tagsBuilder_ == null) {
+            ensureTagsIsMutable();
+            tags_.add(builderForValue.build());
+            onChanged();
+          } else {
+            tagsBuilder_.addMessage(builderForValue.build());
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * Additional metadata for run.
+         * </pre>
+         *
+         * <code>repeated .mlflow.RunTag tags = 5;</code>
+         */
+        public Builder addTags(
+            int index, org.mlflow.api.proto.Service.RunTag.Builder builderForValue) {
+          if (tagsBuilder_ == null) {
+            ensureTagsIsMutable();
+            tags_.add(index, builderForValue.build());
+            onChanged();
+          } else {
+            tagsBuilder_.addMessage(index, builderForValue.build());
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * Additional metadata for run.
+         * </pre>
+         *
+         * <code>repeated .mlflow.RunTag tags = 5;</code>
+         */
+        public Builder addAllTags(
+            java.lang.Iterable<? extends org.mlflow.api.proto.Service.RunTag> values) {
+          if (tagsBuilder_ == null) {
+            ensureTagsIsMutable();
+            com.google.protobuf.AbstractMessageLite.Builder.addAll(
+                values, tags_);
+            onChanged();
+          } else {
+            tagsBuilder_.addAllMessages(values);
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * Additional metadata for run.
+         * </pre>
+         *
+         * <code>repeated .mlflow.RunTag tags = 5;</code>
+         */
+        public Builder clearTags() {
+          if (tagsBuilder_ == null) {
+            tags_ = java.util.Collections.emptyList();
+            bitField0_ = (bitField0_ & ~0x00000010);
+            onChanged();
+          } else {
+            tagsBuilder_.clear();
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * Additional metadata for run.
+         * </pre>
+         *
+         * <code>repeated .mlflow.RunTag tags = 5;</code>
+         */
+        public Builder removeTags(int index) {
+          if (tagsBuilder_ == null) {
+            ensureTagsIsMutable();
+            tags_.remove(index);
+            onChanged();
+          } else {
+            tagsBuilder_.remove(index);
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * Additional metadata for run.
+         * </pre>
+         *
+         * <code>repeated .mlflow.RunTag tags = 5;</code>
+         */
+        public org.mlflow.api.proto.Service.RunTag.Builder getTagsBuilder(
+            int index) {
+          return getTagsFieldBuilder().getBuilder(index);
+        }
+        /**
+         * <pre>
+         * Additional metadata for run.
+         * </pre>
+         *
+         * <code>repeated .mlflow.RunTag tags = 5;</code>
+         */
+        public org.mlflow.api.proto.Service.RunTagOrBuilder getTagsOrBuilder(
+            int index) {
+          if (tagsBuilder_ == null) {
+            return tags_.get(index);  } else {
+            return tagsBuilder_.getMessageOrBuilder(index);
+          }
+        }
+        /**
+         * <pre>
+         * Additional metadata for run.
+         * </pre>
+         *
+         * <code>repeated .mlflow.RunTag tags = 5;</code>
+         */
+        public java.util.List<? extends org.mlflow.api.proto.Service.RunTagOrBuilder> 
+             getTagsOrBuilderList() {
+          if (tagsBuilder_ != null) {
+            return tagsBuilder_.getMessageOrBuilderList();
+          } else {
+            return java.util.Collections.unmodifiableList(tags_);
+          }
+        }
+        /**
+         * <pre>
+         * Additional metadata for run.
+         * </pre>
+         *
+         * <code>repeated .mlflow.RunTag tags = 5;</code>
+         */
+        public org.mlflow.api.proto.Service.RunTag.Builder addTagsBuilder() {
+          return getTagsFieldBuilder().addBuilder(
+              org.mlflow.api.proto.Service.RunTag.getDefaultInstance());
+        }
+        /**
+         * <pre>
+         * Additional metadata for run.
+         * </pre>
+         *
+         * <code>repeated .mlflow.RunTag tags = 5;</code>
+         */
+        public org.mlflow.api.proto.Service.RunTag.Builder addTagsBuilder(
+            int index) {
+          return getTagsFieldBuilder().addBuilder(
+              index, org.mlflow.api.proto.Service.RunTag.getDefaultInstance());
+        }
+        /**
+         * <pre>
+         * Additional metadata for run.
+         * </pre>
+         *
+         * <code>repeated .mlflow.RunTag tags = 5;</code>
+         */
+        public java.util.List<org.mlflow.api.proto.Service.RunTag.Builder> 
+             getTagsBuilderList() {
+          return getTagsFieldBuilder().getBuilderList();
+        }
+        private com.google.protobuf.RepeatedFieldBuilderV3<
+            org.mlflow.api.proto.Service.RunTag, org.mlflow.api.proto.Service.RunTag.Builder, org.mlflow.api.proto.Service.RunTagOrBuilder> 
+            getTagsFieldBuilder() {
+          if (tagsBuilder_ == null) {
+            tagsBuilder_ = new com.google.protobuf.RepeatedFieldBuilderV3<
+                org.mlflow.api.proto.Service.RunTag, org.mlflow.api.proto.Service.RunTag.Builder, org.mlflow.api.proto.Service.RunTagOrBuilder>(
+                    tags_,
+                    ((bitField0_ & 0x00000010) == 0x00000010),
+                    getParentForChildren(),
+                    isClean());
+            tags_ = null;
+          }
+          return tagsBuilder_;
+        }
+
+        private java.util.List<org.mlflow.api.proto.Service.Param> params_ =
+          java.util.Collections.emptyList();
+        private void ensureParamsIsMutable() {
+          if (!((bitField0_ & 0x00000020) == 0x00000020)) {
+            params_ = new java.util.ArrayList<org.mlflow.api.proto.Service.Param>(params_);
+            bitField0_ |= 0x00000020;
+           }
+        }
+
+        private com.google.protobuf.RepeatedFieldBuilderV3<
+            org.mlflow.api.proto.Service.Param, org.mlflow.api.proto.Service.Param.Builder, org.mlflow.api.proto.Service.ParamOrBuilder> paramsBuilder_;
+
+        /**
+         * <pre>
+         * Params to log.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Param params = 6;</code>
+         */
+        public java.util.List<org.mlflow.api.proto.Service.Param> getParamsList() {
+          if (paramsBuilder_ == null) {
+            return java.util.Collections.unmodifiableList(params_);
+          } else {
+            return paramsBuilder_.getMessageList();
+          }
+        }
+        /**
+         * <pre>
+         * Params to log.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Param params = 6;</code>
+         */
+        public int getParamsCount() {
+          if (paramsBuilder_ == null) {
+            return params_.size();
+          } else {
+            return paramsBuilder_.getCount();
+          }
+        }
+        /**
+         * <pre>
+         * Params to log.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Param params = 6;</code>
+         */
+        public org.mlflow.api.proto.Service.Param getParams(int index) {
+          if (paramsBuilder_ == null) {
+            return params_.get(index);
+          } else {
+            return paramsBuilder_.getMessage(index);
+          }
+        }
+        /**
+         * <pre>
+         * Params to log.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Param params = 6;</code>
+         */
+        public Builder setParams(
+            int index, org.mlflow.api.proto.Service.Param value) {
+          if (paramsBuilder_ == null) {
+            if (value == null) {
+              throw new NullPointerException();
+            }
+            ensureParamsIsMutable();
+            params_.set(index, value);
+            onChanged();
+          } else {
+            paramsBuilder_.setMessage(index, value);
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * Params to log.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Param params = 6;</code>
+         */
+        public Builder setParams(
+            int index, org.mlflow.api.proto.Service.Param.Builder builderForValue) {
+          if (paramsBuilder_ == null) {
+            ensureParamsIsMutable();
+            params_.set(index, builderForValue.build());
+            onChanged();
+          } else {
+            paramsBuilder_.setMessage(index, builderForValue.build());
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * Params to log.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Param params = 6;</code>
+         */
+        public Builder addParams(org.mlflow.api.proto.Service.Param value) {
+          if (paramsBuilder_ == null) {
+            if (value == null) {
+              throw new NullPointerException();
+            }
+            ensureParamsIsMutable();
+            params_.add(value);
+            onChanged();
+          } else {
+            paramsBuilder_.addMessage(value);
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * Params to log.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Param params = 6;</code>
+         */
+        public Builder addParams(
+            int index, org.mlflow.api.proto.Service.Param value) {
+          if (paramsBuilder_ == null) {
+            if (value == null) {
+              throw new NullPointerException();
+            }
+            ensureParamsIsMutable();
+            params_.add(index, value);
+            onChanged();
+          } else {
+            paramsBuilder_.addMessage(index, value);
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * Params to log.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Param params = 6;</code>
+         */
+        public Builder addParams(
+            org.mlflow.api.proto.Service.Param.Builder builderForValue) {
+          if (paramsBuilder_ == null) {
+            ensureParamsIsMutable();
+            params_.add(builderForValue.build());
+            onChanged();
+          } else {
+            paramsBuilder_.addMessage(builderForValue.build());
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * Params to log.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Param params = 6;</code>
+         */
+        public Builder addParams(
+            int index, org.mlflow.api.proto.Service.Param.Builder builderForValue) {
+          if (paramsBuilder_ == null) {
+            ensureParamsIsMutable();
+            params_.add(index, builderForValue.build());
+            onChanged();
+          } else {
+            paramsBuilder_.addMessage(index, builderForValue.build());
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * Params to log.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Param params = 6;</code>
+         */
+        public Builder addAllParams(
+            java.lang.Iterable<? extends org.mlflow.api.proto.Service.Param> values) {
+          if (paramsBuilder_ == null) {
+            ensureParamsIsMutable();
+            com.google.protobuf.AbstractMessageLite.Builder.addAll(
+                values, params_);
+            onChanged();
+          } else {
+            paramsBuilder_.addAllMessages(values);
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * Params to log.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Param params = 6;</code>
+         */
+        public Builder clearParams() {
+          if (paramsBuilder_ == null) {
+            params_ = java.util.Collections.emptyList();
+            bitField0_ = (bitField0_ & ~0x00000020);
+            onChanged();
+          } else {
+            paramsBuilder_.clear();
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * Params to log.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Param params = 6;</code>
+         */
+        public Builder removeParams(int index) {
+          if (paramsBuilder_ == null) {
+            ensureParamsIsMutable();
+            params_.remove(index);
+            onChanged();
+          } else {
+            paramsBuilder_.remove(index);
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * Params to log.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Param params = 6;</code>
+         */
+        public org.mlflow.api.proto.Service.Param.Builder getParamsBuilder(
+            int index) {
+          return getParamsFieldBuilder().getBuilder(index);
+        }
+        /**
+         * <pre>
+         * Params to log.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Param params = 6;</code>
+         */
+        public org.mlflow.api.proto.Service.ParamOrBuilder getParamsOrBuilder(
+            int index) {
+          if (paramsBuilder_ == null) {
+            return params_.get(index);  } else {
+            return paramsBuilder_.getMessageOrBuilder(index);
+          }
+        }
+        /**
+         * <pre>
+         * Params to log.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Param params = 6;</code>
+         */
+        public java.util.List<? extends org.mlflow.api.proto.Service.ParamOrBuilder> 
+             getParamsOrBuilderList() {
+          if (paramsBuilder_ != null) {
+            return paramsBuilder_.getMessageOrBuilderList();
+          } else {
+            return java.util.Collections.unmodifiableList(params_);
+          }
+        }
+        /**
+         * <pre>
+         * Params to log.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Param params = 6;</code>
+         */
+        public org.mlflow.api.proto.Service.Param.Builder addParamsBuilder() {
+          return getParamsFieldBuilder().addBuilder(
+              org.mlflow.api.proto.Service.Param.getDefaultInstance());
+        }
+        /**
+         * <pre>
+         * Params to log.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Param params = 6;</code>
+         */
+        public org.mlflow.api.proto.Service.Param.Builder addParamsBuilder(
+            int index) {
+          return getParamsFieldBuilder().addBuilder(
+              index, org.mlflow.api.proto.Service.Param.getDefaultInstance());
+        }
+        /**
+         * <pre>
+         * Params to log.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Param params = 6;</code>
+         */
+        public java.util.List<org.mlflow.api.proto.Service.Param.Builder> 
+             getParamsBuilderList() {
+          return getParamsFieldBuilder().getBuilderList();
+        }
+        private com.google.protobuf.RepeatedFieldBuilderV3<
+            org.mlflow.api.proto.Service.Param, org.mlflow.api.proto.Service.Param.Builder, org.mlflow.api.proto.Service.ParamOrBuilder> 
+            getParamsFieldBuilder() {
+          if (paramsBuilder_ == null) {
+            paramsBuilder_ = new com.google.protobuf.RepeatedFieldBuilderV3<
+                org.mlflow.api.proto.Service.Param, org.mlflow.api.proto.Service.Param.Builder, org.mlflow.api.proto.Service.ParamOrBuilder>(
+                    params_,
+                    ((bitField0_ & 0x00000020) == 0x00000020),
+                    getParentForChildren(),
+                    isClean());
+            params_ = null;
+          }
+          return paramsBuilder_;
+        }
+
+        private java.util.List<org.mlflow.api.proto.Service.Metric> metrics_ =
+          java.util.Collections.emptyList();
+        private void ensureMetricsIsMutable() {
+          if (!((bitField0_ & 0x00000040) == 0x00000040)) {
+            metrics_ = new java.util.ArrayList<org.mlflow.api.proto.Service.Metric>(metrics_);
+            bitField0_ |= 0x00000040;
+           }
+        }
+
+        private com.google.protobuf.RepeatedFieldBuilderV3<
+            org.mlflow.api.proto.Service.Metric, org.mlflow.api.proto.Service.Metric.Builder, org.mlflow.api.proto.Service.MetricOrBuilder> metricsBuilder_;
+
+        /**
+         * <pre>
+         * Metrics to log.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Metric metrics = 7;</code>
+         */
+        public java.util.List<org.mlflow.api.proto.Service.Metric> getMetricsList() {
+          if (metricsBuilder_ == null) {
+            return java.util.Collections.unmodifiableList(metrics_);
+          } else {
+            return metricsBuilder_.getMessageList();
+          }
+        }
+        /**
+         * <pre>
+         * Metrics to log.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Metric metrics = 7;</code>
+         */
+        public int getMetricsCount() {
+          if (metricsBuilder_ == null) {
+            return metrics_.size();
+          } else {
+            return metricsBuilder_.getCount();
+          }
+        }
+        /**
+         * <pre>
+         * Metrics to log.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Metric metrics = 7;</code>
+         */
+        public org.mlflow.api.proto.Service.Metric getMetrics(int index) {
+          if (metricsBuilder_ == null) {
+            return metrics_.get(index);
+          } else {
+            return metricsBuilder_.getMessage(index);
+          }
+        }
+        /**
+         * <pre>
+         * Metrics to log.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Metric metrics = 7;</code>
+         */
+        public Builder setMetrics(
+            int index, org.mlflow.api.proto.Service.Metric value) {
+          if (metricsBuilder_ == null) {
+            if (value == null) {
+              throw new NullPointerException();
+            }
+            ensureMetricsIsMutable();
+            metrics_.set(index, value);
+            onChanged();
+          } else {
+            metricsBuilder_.setMessage(index, value);
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * Metrics to log.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Metric metrics = 7;</code>
+         */
+        public Builder setMetrics(
+            int index, org.mlflow.api.proto.Service.Metric.Builder builderForValue) {
+          if (metricsBuilder_ == null) {
+            ensureMetricsIsMutable();
+            metrics_.set(index, builderForValue.build());
+            onChanged();
+          } else {
+            metricsBuilder_.setMessage(index, builderForValue.build());
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * Metrics to log.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Metric metrics = 7;</code>
+         */
+        public Builder addMetrics(org.mlflow.api.proto.Service.Metric value) {
+          if (metricsBuilder_ == null) {
+            if (value == null) {
+              throw new NullPointerException();
+            }
+            ensureMetricsIsMutable();
+            metrics_.add(value);
+            onChanged();
+          } else {
+            metricsBuilder_.addMessage(value);
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * Metrics to log.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Metric metrics = 7;</code>
+         */
+        public Builder addMetrics(
+            int index, org.mlflow.api.proto.Service.Metric value) {
+          if (metricsBuilder_ == null) {
+            if (value == null) {
+              throw new NullPointerException();
+            }
+            ensureMetricsIsMutable();
+            metrics_.add(index, value);
+            onChanged();
+          } else {
+            metricsBuilder_.addMessage(index, value);
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * Metrics to log.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Metric metrics = 7;</code>
+         */
+        public Builder addMetrics(
+            org.mlflow.api.proto.Service.Metric.Builder builderForValue) {
+          if (metricsBuilder_ == null) {
+            ensureMetricsIsMutable();
+            metrics_.add(builderForValue.build());
+            onChanged();
+          } else {
+            metricsBuilder_.addMessage(builderForValue.build());
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * Metrics to log.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Metric metrics = 7;</code>
+         */
+        public Builder addMetrics(
+            int index, org.mlflow.api.proto.Service.Metric.Builder builderForValue) {
+          if (metricsBuilder_ == null) {
+            ensureMetricsIsMutable();
+            metrics_.add(index, builderForValue.build());
+            onChanged();
+          } else {
+            metricsBuilder_.addMessage(index, builderForValue.build());
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * Metrics to log.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Metric metrics = 7;</code>
+         */
+        public Builder addAllMetrics(
+            java.lang.Iterable<? extends org.mlflow.api.proto.Service.Metric> values) {
+          if (metricsBuilder_ == null) {
+            ensureMetricsIsMutable();
+            com.google.protobuf.AbstractMessageLite.Builder.addAll(
+                values, metrics_);
+            onChanged();
+          } else {
+            metricsBuilder_.addAllMessages(values);
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * Metrics to log.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Metric metrics = 7;</code>
+         */
+        public Builder clearMetrics() {
+          if (metricsBuilder_ == null) {
+            metrics_ = java.util.Collections.emptyList();
+            bitField0_ = (bitField0_ & ~0x00000040);
+            onChanged();
+          } else {
+            metricsBuilder_.clear();
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * Metrics to log.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Metric metrics = 7;</code>
+         */
+        public Builder removeMetrics(int index) {
+          if (metricsBuilder_ == null) {
+            ensureMetricsIsMutable();
+            metrics_.remove(index);
+            onChanged();
+          } else {
+            metricsBuilder_.remove(index);
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * Metrics to log.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Metric metrics = 7;</code>
+         */
+        public org.mlflow.api.proto.Service.Metric.Builder getMetricsBuilder(
+            int index) {
+          return getMetricsFieldBuilder().getBuilder(index);
+        }
+        /**
+         * <pre>
+         * Metrics to log.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Metric metrics = 7;</code>
+         */
+        public org.mlflow.api.proto.Service.MetricOrBuilder getMetricsOrBuilder(
+            int index) {
+          if (metricsBuilder_ == null) {
+            return metrics_.get(index);  } else {
+            return metricsBuilder_.getMessageOrBuilder(index);
+          }
+        }
+        /**
+         * <pre>
+         * Metrics to log.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Metric metrics = 7;</code>
+         */
+        public java.util.List<? extends org.mlflow.api.proto.Service.MetricOrBuilder> 
+             getMetricsOrBuilderList() {
+          if (metricsBuilder_ != null) {
+            return metricsBuilder_.getMessageOrBuilderList();
+          } else {
+            return java.util.Collections.unmodifiableList(metrics_);
+          }
+        }
+        /**
+         * <pre>
+         * Metrics to log.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Metric metrics = 7;</code>
+         */
+        public org.mlflow.api.proto.Service.Metric.Builder addMetricsBuilder() {
+          return getMetricsFieldBuilder().addBuilder(
+              org.mlflow.api.proto.Service.Metric.getDefaultInstance());
+        }
+        /**
+         * <pre>
+         * Metrics to log.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Metric metrics = 7;</code>
+         */
+        public org.mlflow.api.proto.Service.Metric.Builder addMetricsBuilder(
+            int index) {
+          return getMetricsFieldBuilder().addBuilder(
+              index, org.mlflow.api.proto.Service.Metric.getDefaultInstance());
+        }
+        /**
+         * <pre>
+         * Metrics to log.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Metric metrics = 7;</code>
+         */
+        public java.util.List<org.mlflow.api.proto.Service.Metric.Builder> 
+             getMetricsBuilderList() {
+          return getMetricsFieldBuilder().getBuilderList();
+        }
+        private com.google.protobuf.RepeatedFieldBuilderV3<
+            org.mlflow.api.proto.Service.Metric, org.mlflow.api.proto.Service.Metric.Builder, org.mlflow.api.proto.Service.MetricOrBuilder> 
+            getMetricsFieldBuilder() {
+          if (metricsBuilder_ == null) {
+            metricsBuilder_ = new com.google.protobuf.RepeatedFieldBuilderV3<
+                org.mlflow.api.proto.Service.Metric, org.mlflow.api.proto.Service.Metric.Builder, org.mlflow.api.proto.Service.MetricOrBuilder>(
+                    metrics_,
+                    ((bitField0_ & 0x00000040) == 0x00000040),
+                    getParentForChildren(),
+                    isClean());
+            metrics_ = null;
+          }
+          return metricsBuilder_;
+        }
+        @java.lang.Override
+        public final Builder setUnknownFields(
+            final com.google.protobuf.UnknownFieldSet unknownFields) {
+          return super.setUnknownFields(unknownFields);
+        }
+
+        @java.lang.Override
+        public final Builder mergeUnknownFields(
+            final com.google.protobuf.UnknownFieldSet unknownFields) {
+          return super.mergeUnknownFields(unknownFields);
+        }
+
+
+        // @@protoc_insertion_point(builder_scope:mlflow.CreateRuns.RunSpec)
+      }
+
+      // @@protoc_insertion_point(class_scope:mlflow.CreateRuns.RunSpec)
+      private static final org.mlflow.api.proto.Service.CreateRuns.RunSpec DEFAULT_INSTANCE;
+      static {
+        DEFAULT_INSTANCE = new org.mlflow.api.proto.Service.CreateRuns.RunSpec();
+      }
+
+      public static org.mlflow.api.proto.Service.CreateRuns.RunSpec getDefaultInstance() {
+        return DEFAULT_INSTANCE;
+      }
+
+      @java.lang.Deprecated public static final com.google.protobuf.Parser<RunSpec>
+          PARSER = new com.google.protobuf.AbstractParser<RunSpec>() {
+        @java.lang.Override
+        public RunSpec parsePartialFrom(
+            com.google.protobuf.CodedInputStream input,
+            com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+            throws com.google.protobuf.InvalidProtocolBufferException {
+          return new RunSpec(input, extensionRegistry);
+        }
+      };
+
+      public static com.google.protobuf.Parser<RunSpec> parser() {
+        return PARSER;
+      }
+
+      @java.lang.Override
+      public com.google.protobuf.Parser<RunSpec> getParserForType() {
+        return PARSER;
+      }
+
+      @java.lang.Override
+      public org.mlflow.api.proto.Service.CreateRuns.RunSpec getDefaultInstanceForType() {
+        return DEFAULT_INSTANCE;
+      }
+
+    }
+
+    public interface ResponseOrBuilder extends
+        // @@protoc_insertion_point(interface_extends:mlflow.CreateRuns.Response)
+        com.google.protobuf.MessageOrBuilder {
+
+      /**
+       * <pre>
+       * The newly created runs, in the order of the request.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Run runs = 1;</code>
+       */
+      java.util.List<org.mlflow.api.proto.Service.Run> 
+          getRunsList();
+      /**
+       * <pre>
+       * The newly created runs, in the order of the request.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Run runs = 1;</code>
+       */
+      org.mlflow.api.proto.Service.Run getRuns(int index);
+      /**
+       * <pre>
+       * The newly created runs, in the order of the request.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Run runs = 1;</code>
+       */
+      int getRunsCount();
+      /**
+       * <pre>
+       * The newly created runs, in the order of the request.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Run runs = 1;</code>
+       */
+      java.util.List<? extends org.mlflow.api.proto.Service.RunOrBuilder> 
+          getRunsOrBuilderList();
+      /**
+       * <pre>
+       * The newly created runs, in the order of the request.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Run runs = 1;</code>
+       */
+      org.mlflow.api.proto.Service.RunOrBuilder getRunsOrBuilder(
+          int index);
+    }
+    /**
+     * Protobuf type {@code mlflow.CreateRuns.Response}
+     */
+    public  static final class Response extends
+        com.google.protobuf.GeneratedMessageV3 implements
+        // @@protoc_insertion_point(message_implements:mlflow.CreateRuns.Response)
+        ResponseOrBuilder {
+    private static final long serialVersionUID = 0L;
+      // Use Response.newBuilder() to construct.
+      private Response(com.google.protobuf.GeneratedMessageV3.Builder<?> builder) {
+        super(builder);
+      }
+      private Response() {
+        runs_ = java.util.Collections.emptyList();
+      }
+
+      @java.lang.Override
+      public final com.google.protobuf.UnknownFieldSet
+      getUnknownFields() {
+        return this.unknownFields;
+      }
+      private Response(
+          com.google.protobuf.CodedInputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        this();
+        if (extensionRegistry == null) {
+          throw new java.lang.NullPointerException();
+        }
+        int mutable_bitField0_ = 0;
+        com.google.protobuf.UnknownFieldSet.Builder unknownFields =
+            com.google.protobuf.UnknownFieldSet.newBuilder();
+        try {
+          boolean done = false;
+          while (!done) {
+            int tag = input.readTag();
+            switch (tag) {
+              case 0:
+                done = true;
+                break;
+              case 10: {
+                if (!((mutable_bitField0_ & 0x00000001) == 0x00000001)) {
+                  runs_ = new java.util.ArrayList<org.mlflow.api.proto.Service.Run>();
+                  mutable_bitField0_ |= 0x00000001;
+                }
+                runs_.add(
+                    input.readMessage(org.mlflow.api.proto.Service.Run.PARSER, extensionRegistry));
+                break;
+              }
+              default: {
+                if (!parseUnknownField(
+                    input, unknownFields, extensionRegistry, tag)) {
+                  done = true;
+                }
+                break;
+              }
+            }
+          }
+        } catch (com.google.protobuf.InvalidProtocolBufferException e) {
+          throw e.setUnfinishedMessage(this);
+        } catch (java.io.IOException e) {
+          throw new com.google.protobuf.InvalidProtocolBufferException(
+              e).setUnfinishedMessage(this);
+        } finally {
+          if (((mutable_bitField0_ & 0x00000001) == 0x00000001)) {
+            runs_ = java.util.Collections.unmodifiableList(runs_);
+          }
+          this.unknownFields = unknownFields.build();
+          makeExtensionsImmutable();
+        }
+      }
+      public static final com.google.protobuf.Descriptors.Descriptor
+          getDescriptor() {
+        return org.mlflow.api.proto.Service.internal_static_mlflow_CreateRuns_Response_descriptor;
+      }
+
+      @java.lang.Override
+      protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
+          internalGetFieldAccessorTable() {
+        return org.mlflow.api.proto.Service.internal_static_mlflow_CreateRuns_Response_fieldAccessorTable
+            .ensureFieldAccessorsInitialized(
+                org.mlflow.api.proto.Service.CreateRuns.Response.class, org.mlflow.api.proto.Service.CreateRuns.Response.Builder.class);
+      }
+
+      public static final int RUNS_FIELD_NUMBER = 1;
+      private java.util.List<org.mlflow.api.proto.Service.Run> runs_;
+      /**
+       * <pre>
+       * The newly created runs, in the order of the request.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Run runs = 1;</code>
+       */
+      public java.util.List<org.mlflow.api.proto.Service.Run> getRunsList() {
+        return runs_;
+      }
+      /**
+       * <pre>
+       * The newly created runs, in the order of the request.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Run runs = 1;</code>
+       */
+      public java.util.List<? extends org.mlflow.api.proto.Service.RunOrBuilder> 
+          getRunsOrBuilderList() {
+        return runs_;
+      }
+      /**
+       * <pre>
+       * The newly created runs, in the order of the request.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Run runs = 1;</code>
+       */
+      public int getRunsCount() {
+        return runs_.size();
+      }
+      /**
+       * <pre>
+       * The newly created runs, in the order of the request.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Run runs = 1;</code>
+       */
+      public org.mlflow.api.proto.Service.Run getRuns(int index) {
+        return runs_.get(index);
+      }
+      /**
+       * <pre>
+       * The newly created runs, in the order of the request.
+       * </pre>
+       *
+       * <code>repeated .mlflow.Run runs = 1;</code>
+       */
+      public org.mlflow.api.proto.Service.RunOrBuilder getRunsOrBuilder(
+          int index) {
+        return runs_.get(index);
+      }
+
+      private byte memoizedIsInitialized = -1;
+      @java.lang.Override
+      public final boolean isInitialized() {
+        byte isInitialized = memoizedIsInitialized;
+        if (isInitialized == 1) return true;
+        if (isInitialized == 0) return false;
+
+        memoizedIsInitialized = 1;
+        return true;
+      }
+
+      @java.lang.Override
+      public void writeTo(com.google.protobuf.CodedOutputStream output)
+                          throws java.io.IOException {
+        for (int i = 0; i < runs_.size(); i++) {
+          output.writeMessage(1, runs_.get(i));
+        }
+        unknownFields.writeTo(output);
+      }
+
+      @java.lang.Override
+      public int getSerializedSize() {
+        int size = memoizedSize;
+        if (size != -1) return size;
+
+        size = 0;
+        for (int i = 0; i < runs_.size(); i++) {
+          size += com.google.protobuf.CodedOutputStream
+            .computeMessageSize(1, runs_.get(i));
+        }
+        size += unknownFields.getSerializedSize();
+        memoizedSize = size;
+        return size;
+      }
+
+      @java.lang.Override
+      public boolean equals(final java.lang.Object obj) {
+        if (obj == this) {
+         return true;
+        }
+        if (!(obj instanceof org.mlflow.api.proto.Service.CreateRuns.Response)) {
+          return super.equals(obj);
+        }
+        org.mlflow.api.proto.Service.CreateRuns.Response other = (org.mlflow.api.proto.Service.CreateRuns.Response) obj;
+
+        boolean result = true;
+        result = result && getRunsList()
+            .equals(other.getRunsList());
+        result = result && unknownFields.equals(other.unknownFields);
+        return result;
+      }
+
+      @java.lang.Override
+      public int hashCode() {
+        if (memoizedHashCode != 0) {
+          return memoizedHashCode;
+        }
+        int hash = 41;
+        hash = (19 * hash) + getDescriptor().hashCode();
+        if (getRunsCount() > 0) {
+          hash = (37 * hash) + RUNS_FIELD_NUMBER;
+          hash = (53 * hash) + getRunsList().hashCode();
+        }
+        hash = (29 * hash) + unknownFields.hashCode();
+        memoizedHashCode = hash;
+        return hash;
+      }
+
+      public static org.mlflow.api.proto.Service.CreateRuns.Response parseFrom(
+          java.nio.ByteBuffer data)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data);
+      }
+      public static org.mlflow.api.proto.Service.CreateRuns.Response parseFrom(
+          java.nio.ByteBuffer data,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data, extensionRegistry);
+      }
+      public static org.mlflow.api.proto.Service.CreateRuns.Response parseFrom(
+          com.google.protobuf.ByteString data)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data);
+      }
+      public static org.mlflow.api.proto.Service.CreateRuns.Response parseFrom(
+          com.google.protobuf.ByteString data,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data, extensionRegistry);
+      }
+      public static org.mlflow.api.proto.Service.CreateRuns.Response parseFrom(byte[] data)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data);
+      }
+      public static org.mlflow.api.proto.Service.CreateRuns.Response parseFrom(
+          byte[] data,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return PARSER.parseFrom(data, extensionRegistry);
+      }
+      public static org.mlflow.api.proto.Service.CreateRuns.Response parseFrom(java.io.InputStream input)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseWithIOException(PARSER, input);
+      }
+      public static org.mlflow.api.proto.Service.CreateRuns.Response parseFrom(
+          java.io.InputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseWithIOException(PARSER, input, extensionRegistry);
+      }
+      public static org.mlflow.api.proto.Service.CreateRuns.Response parseDelimitedFrom(java.io.InputStream input)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseDelimitedWithIOException(PARSER, input);
+      }
+      public static org.mlflow.api.proto.Service.CreateRuns.Response parseDelimitedFrom(
+          java.io.InputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseDelimitedWithIOException(PARSER, input, extensionRegistry);
+      }
+      public static org.mlflow.api.proto.Service.CreateRuns.Response parseFrom(
+          com.google.protobuf.CodedInputStream input)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseWithIOException(PARSER, input);
+      }
+      public static org.mlflow.api.proto.Service.CreateRuns.Response parseFrom(
+          com.google.protobuf.CodedInputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws java.io.IOException {
+        return com.google.protobuf.GeneratedMessageV3
+            .parseWithIOException(PARSER, input, extensionRegistry);
+      }
+
+      @java.lang.Override
+      public Builder newBuilderForType() { return newBuilder(); }
+      public static Builder newBuilder() {
+        return DEFAULT_INSTANCE.toBuilder();
+      }
+      public static Builder newBuilder(org.mlflow.api.proto.Service.CreateRuns.Response prototype) {
+        return DEFAULT_INSTANCE.toBuilder().mergeFrom(prototype);
+      }
+      @java.lang.Override
+      public Builder toBuilder() {
+        return this == DEFAULT_INSTANCE
+            ? new Builder() : new Builder().mergeFrom(this);
+      }
+
+      @java.lang.Override
+      protected Builder newBuilderForType(
+          com.google.protobuf.GeneratedMessageV3.BuilderParent parent) {
+        Builder builder = new Builder(parent);
+        return builder;
+      }
+      /**
+       * Protobuf type {@code mlflow.CreateRuns.Response}
+       */
+      public static final class Builder extends
+          com.google.protobuf.GeneratedMessageV3.Builder<Builder> implements
+          // @@protoc_insertion_point(builder_implements:mlflow.CreateRuns.Response)
+          org.mlflow.api.proto.Service.CreateRuns.ResponseOrBuilder {
+        public static final com.google.protobuf.Descriptors.Descriptor
+            getDescriptor() {
+          return org.mlflow.api.proto.Service.internal_static_mlflow_CreateRuns_Response_descriptor;
+        }
+
+        @java.lang.Override
+        protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
+            internalGetFieldAccessorTable() {
+          return org.mlflow.api.proto.Service.internal_static_mlflow_CreateRuns_Response_fieldAccessorTable
+              .ensureFieldAccessorsInitialized(
+                  org.mlflow.api.proto.Service.CreateRuns.Response.class, org.mlflow.api.proto.Service.CreateRuns.Response.Builder.class);
+        }
+
+        // Construct using org.mlflow.api.proto.Service.CreateRuns.Response.newBuilder()
+        private Builder() {
+          maybeForceBuilderInitialization();
+        }
+
+        private Builder(
+            com.google.protobuf.GeneratedMessageV3.BuilderParent parent) {
+          super(parent);
+          maybeForceBuilderInitialization();
+        }
+        private void maybeForceBuilderInitialization() {
+          if (com.google.protobuf.GeneratedMessageV3
+                  .alwaysUseFieldBuilders) {
+            getRunsFieldBuilder();
+          }
+        }
+        @java.lang.Override
+        public Builder clear() {
+          super.clear();
+          if (runsBuilder_ == null) {
+            runs_ = java.util.Collections.emptyList();
+            bitField0_ = (bitField0_ & ~0x00000001);
+          } else {
+            runsBuilder_.clear();
+          }
+          return this;
+        }
+
+        @java.lang.Override
+        public com.google.protobuf.Descriptors.Descriptor
+            getDescriptorForType() {
+          return org.mlflow.api.proto.Service.internal_static_mlflow_CreateRuns_Response_descriptor;
+        }
+
+        @java.lang.Override
+        public org.mlflow.api.proto.Service.CreateRuns.Response getDefaultInstanceForType() {
+          return org.mlflow.api.proto.Service.CreateRuns.Response.getDefaultInstance();
+        }
+
+        @java.lang.Override
+        public org.mlflow.api.proto.Service.CreateRuns.Response build() {
+          org.mlflow.api.proto.Service.CreateRuns.Response result = buildPartial();
+          if (!result.isInitialized()) {
+            throw newUninitializedMessageException(result);
+          }
+          return result;
+        }
+
+        @java.lang.Override
+        public org.mlflow.api.proto.Service.CreateRuns.Response buildPartial() {
+          org.mlflow.api.proto.Service.CreateRuns.Response result = new org.mlflow.api.proto.Service.CreateRuns.Response(this);
+          int from_bitField0_ = bitField0_;
+          if (runsBuilder_ == null) {
+            if (((bitField0_ & 0x00000001) == 0x00000001)) {
+              runs_ = java.util.Collections.unmodifiableList(runs_);
+              bitField0_ = (bitField0_ & ~0x00000001);
+            }
+            result.runs_ = runs_;
+          } else {
+            result.runs_ = runsBuilder_.build();
+          }
+          onBuilt();
+          return result;
+        }
+
+        @java.lang.Override
+        public Builder clone() {
+          return (Builder) super.clone();
+        }
+        @java.lang.Override
+        public Builder setField(
+            com.google.protobuf.Descriptors.FieldDescriptor field,
+            java.lang.Object value) {
+          return (Builder) super.setField(field, value);
+        }
+        @java.lang.Override
+        public Builder clearField(
+            com.google.protobuf.Descriptors.FieldDescriptor field) {
+          return (Builder) super.clearField(field);
+        }
+        @java.lang.Override
+        public Builder clearOneof(
+            com.google.protobuf.Descriptors.OneofDescriptor oneof) {
+          return (Builder) super.clearOneof(oneof);
+        }
+        @java.lang.Override
+        public Builder setRepeatedField(
+            com.google.protobuf.Descriptors.FieldDescriptor field,
+            int index, java.lang.Object value) {
+          return (Builder) super.setRepeatedField(field, index, value);
+        }
+        @java.lang.Override
+        public Builder addRepeatedField(
+            com.google.protobuf.Descriptors.FieldDescriptor field,
+            java.lang.Object value) {
+          return (Builder) super.addRepeatedField(field, value);
+        }
+        @java.lang.Override
+        public Builder mergeFrom(com.google.protobuf.Message other) {
+          if (other instanceof org.mlflow.api.proto.Service.CreateRuns.Response) {
+            return mergeFrom((org.mlflow.api.proto.Service.CreateRuns.Response)other);
+          } else {
+            super.mergeFrom(other);
+            return this;
+          }
+        }
+
+        public Builder mergeFrom(org.mlflow.api.proto.Service.CreateRuns.Response other) {
+          if (other == org.mlflow.api.proto.Service.CreateRuns.Response.getDefaultInstance()) return this;
+          if (runsBuilder_ == null) {
+            if (!other.runs_.isEmpty()) {
+              if (runs_.isEmpty()) {
+                runs_ = other.runs_;
+                bitField0_ = (bitField0_ & ~0x00000001);
+              } else {
+                ensureRunsIsMutable();
+                runs_.addAll(other.runs_);
+              }
+              onChanged();
+            }
+          } else {
+            if (!other.runs_.isEmpty()) {
+              if (runsBuilder_.isEmpty()) {
+                runsBuilder_.dispose();
+                runsBuilder_ = null;
+                runs_ = other.runs_;
+                bitField0_ = (bitField0_ & ~0x00000001);
+                runsBuilder_ = 
+                  com.google.protobuf.GeneratedMessageV3.alwaysUseFieldBuilders ?
+                     getRunsFieldBuilder() : null;
+              } else {
+                runsBuilder_.addAllMessages(other.runs_);
+              }
+            }
+          }
+          this.mergeUnknownFields(other.unknownFields);
+          onChanged();
+          return this;
+        }
+
+        @java.lang.Override
+        public final boolean isInitialized() {
+          return true;
+        }
+
+        @java.lang.Override
+        public Builder mergeFrom(
+            com.google.protobuf.CodedInputStream input,
+            com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+            throws java.io.IOException {
+          org.mlflow.api.proto.Service.CreateRuns.Response parsedMessage = null;
+          try {
+            parsedMessage = PARSER.parsePartialFrom(input, extensionRegistry);
+          } catch (com.google.protobuf.InvalidProtocolBufferException e) {
+            parsedMessage = (org.mlflow.api.proto.Service.CreateRuns.Response) e.getUnfinishedMessage();
+            throw e.unwrapIOException();
+          } finally {
+            if (parsedMessage != null) {
+              mergeFrom(parsedMessage);
+            }
+          }
+          return this;
+        }
+        private int bitField0_;
+
+        private java.util.List<org.mlflow.api.proto.Service.Run> runs_ =
+          java.util.Collections.emptyList();
+        private void ensureRunsIsMutable() {
+          if (!((bitField0_ & 0x00000001) == 0x00000001)) {
+            runs_ = new java.util.ArrayList<org.mlflow.api.proto.Service.Run>(runs_);
+            bitField0_ |= 0x00000001;
+           }
+        }
+
+        private com.google.protobuf.RepeatedFieldBuilderV3<
+            org.mlflow.api.proto.Service.Run, org.mlflow.api.proto.Service.Run.Builder, org.mlflow.api.proto.Service.RunOrBuilder> runsBuilder_;
+
+        /**
+         * <pre>
+         * The newly created runs, in the order of the request.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public java.util.List<org.mlflow.api.proto.Service.Run> getRunsList() {
+          if (runsBuilder_ == null) {
+            return java.util.Collections.unmodifiableList(runs_);
+          } else {
+            return runsBuilder_.getMessageList();
+          }
+        }
+        /**
+         * <pre>
+         * The newly created runs, in the order of the request.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public int getRunsCount() {
+          if (runsBuilder_ == null) {
+            return runs_.size();
+          } else {
+            return runsBuilder_.getCount();
+          }
+        }
+        /**
+         * <pre>
+         * The newly created runs, in the order of the request.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public org.mlflow.api.proto.Service.Run getRuns(int index) {
+          if (runsBuilder_ == null) {
+            return runs_.get(index);
+          } else {
+            return runsBuilder_.getMessage(index);
+          }
+        }
+        /**
+         * <pre>
+         * The newly created runs, in the order of the request.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public Builder setRuns(
+            int index, org.mlflow.api.proto.Service.Run value) {
+          if (runsBuilder_ == null) {
+            if (value == null) {
+              throw new NullPointerException();
+            }
+            ensureRunsIsMutable();
+            runs_.set(index, value);
+            onChanged();
+          } else {
+            runsBuilder_.setMessage(index, value);
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * The newly created runs, in the order of the request.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public Builder setRuns(
+            int index, org.mlflow.api.proto.Service.Run.Builder builderForValue) {
+          if (runsBuilder_ == null) {
+            ensureRunsIsMutable();
+            runs_.set(index, builderForValue.build());
+            onChanged();
+          } else {
+            runsBuilder_.setMessage(index, builderForValue.build());
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * The newly created runs, in the order of the request.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public Builder addRuns(org.mlflow.api.proto.Service.Run value) {
+          if (runsBuilder_ == null) {
+            if (value == null) {
+              throw new NullPointerException();
+            }
+            ensureRunsIsMutable();
+            runs_.add(value);
+            onChanged();
+          } else {
+            runsBuilder_.addMessage(value);
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * The newly created runs, in the order of the request.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public Builder addRuns(
+            int index, org.mlflow.api.proto.Service.Run value) {
+          if (runsBuilder_ == null) {
+            if (value == null) {
+              throw new NullPointerException();
+            }
+            ensureRunsIsMutable();
+            runs_.add(index, value);
+            onChanged();
+          } else {
+            runsBuilder_.addMessage(index, value);
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * The newly created runs, in the order of the request.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public Builder addRuns(
+            org.mlflow.api.proto.Service.Run.Builder builderForValue) {
+          if (runsBuilder_ == null) {
+            ensureRunsIsMutable();
+            runs_.add(builderForValue.build());
+            onChanged();
+          } else {
+            runsBuilder_.addMessage(builderForValue.build());
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * The newly created runs, in the order of the request.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public Builder addRuns(
+            int index, org.mlflow.api.proto.Service.Run.Builder builderForValue) {
+          if (runsBuilder_ == null) {
+            ensureRunsIsMutable();
+            runs_.add(index, builderForValue.build());
+            onChanged();
+          } else {
+            runsBuilder_.addMessage(index, builderForValue.build());
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * The newly created runs, in the order of the request.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public Builder addAllRuns(
+            java.lang.Iterable<? extends org.mlflow.api.proto.Service.Run> values) {
+          if (runsBuilder_ == null) {
+            ensureRunsIsMutable();
+            com.google.protobuf.AbstractMessageLite.Builder.addAll(
+                values, runs_);
+            onChanged();
+          } else {
+            runsBuilder_.addAllMessages(values);
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * The newly created runs, in the order of the request.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public Builder clearRuns() {
+          if (runsBuilder_ == null) {
+            runs_ = java.util.Collections.emptyList();
+            bitField0_ = (bitField0_ & ~0x00000001);
+            onChanged();
+          } else {
+            runsBuilder_.clear();
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * The newly created runs, in the order of the request.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public Builder removeRuns(int index) {
+          if (runsBuilder_ == null) {
+            ensureRunsIsMutable();
+            runs_.remove(index);
+            onChanged();
+          } else {
+            runsBuilder_.remove(index);
+          }
+          return this;
+        }
+        /**
+         * <pre>
+         * The newly created runs, in the order of the request.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public org.mlflow.api.proto.Service.Run.Builder getRunsBuilder(
+            int index) {
+          return getRunsFieldBuilder().getBuilder(index);
+        }
+        /**
+         * <pre>
+         * The newly created runs, in the order of the request.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public org.mlflow.api.proto.Service.RunOrBuilder getRunsOrBuilder(
+            int index) {
+          if (runsBuilder_ == null) {
+            return runs_.get(index);  } else {
+            return runsBuilder_.getMessageOrBuilder(index);
+          }
+        }
+        /**
+         * <pre>
+         * The newly created runs, in the order of the request.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public java.util.List<? extends org.mlflow.api.proto.Service.RunOrBuilder> 
+             getRunsOrBuilderList() {
+          if (runsBuilder_ != null) {
+            return runsBuilder_.getMessageOrBuilderList();
+          } else {
+            return java.util.Collections.unmodifiableList(runs_);
+          }
+        }
+        /**
+         * <pre>
+         * The newly created runs, in the order of the request.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public org.mlflow.api.proto.Service.Run.Builder addRunsBuilder() {
+          return getRunsFieldBuilder().addBuilder(
+              org.mlflow.api.proto.Service.Run.getDefaultInstance());
+        }
+        /**
+         * <pre>
+         * The newly created runs, in the order of the request.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public org.mlflow.api.proto.Service.Run.Builder addRunsBuilder(
+            int index) {
+          return getRunsFieldBuilder().addBuilder(
+              index, org.mlflow.api.proto.Service.Run.getDefaultInstance());
+        }
+        /**
+         * <pre>
+         * The newly created runs, in the order of the request.
+         * </pre>
+         *
+         * <code>repeated .mlflow.Run runs = 1;</code>
+         */
+        public java.util.List<org.mlflow.api.proto.Service.Run.Builder> 
+             getRunsBuilderList() {
+          return getRunsFieldBuilder().getBuilderList();
+        }
+        private com.google.protobuf.RepeatedFieldBuilderV3<
+            org.mlflow.api.proto.Service.Run, org.mlflow.api.proto.Service.Run.Builder, org.mlflow.api.proto.Service.RunOrBuilder> 
+            getRunsFieldBuilder() {
+          if (runsBuilder_ == null) {
+            runsBuilder_ = new com.google.protobuf.RepeatedFieldBuilderV3<
+                org.mlflow.api.proto.Service.Run, org.mlflow.api.proto.Service.Run.Builder, org.mlflow.api.proto.Service.RunOrBuilder>(
+                    runs_,
+                    ((bitField0_ & 0x00000001) == 0x00000001),
+                    getParentForChildren(),
+                    isClean());
+            runs_ = null;
+          }
+          return runsBuilder_;
+        }
+        @java.lang.Override
+        public final Builder setUnknownFields(
+            final com.google.protobuf.UnknownFieldSet unknownFields) {
+          return super.setUnknownFields(unknownFields);
+        }
+
+        @java.lang.Override
+        public final Builder mergeUnknownFields(
+            final com.google.protobuf.UnknownFieldSet unknownFields) {
+          return super.mergeUnknownFields(unknownFields);
+        }
+
+
+        // @@protoc_insertion_point(builder_scope:mlflow.CreateRuns.Response)
+      }
+
+      // @@protoc_insertion_point(class_scope:mlflow.CreateRuns.Response)
+      private static final org.mlflow.api.proto.Service.CreateRuns.Response DEFAULT_INSTANCE;
+      static {
+        DEFAULT_INSTANCE = new org.mlflow.api.proto.Service.CreateRuns.Response();
+      }
+
+      public static org.mlflow.api.proto.Service.CreateRuns.Response getDefaultInstance() {
+        return DEFAULT_INSTANCE;
+      }
+
+      @java.lang.Deprecated public static final com.google.protobuf.Parser<Response>
+          PARSER = new com.google.protobuf.AbstractParser<Response>() {
+        @java.lang.Override
+        public Response parsePartialFrom(
+            com.google.protobuf.CodedInputStream input,
+            com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+            throws com.google.protobuf.InvalidProtocolBufferException {
+          return new Response(input, extensionRegistry);
+        }
+      };
+
+      public static com.google.protobuf.Parser<Response> parser() {
+        return PARSER;
+      }
+
+      @java.lang.Override
+      public com.google.protobuf.Parser<Response> getParserForType() {
+        return PARSER;
+      }
+
+      @java.lang.Override
+      public org.mlflow.api.proto.Service.CreateRuns.Response getDefaultInstanceForType() {
+        return DEFAULT_INSTANCE;
+      }
+
+    }
+
+    private int bitField0_;
+    public static final int EXPERIMENT_ID_FIELD_NUMBER = 1;
+    private volatile java.lang.Object experimentId_;
+    /**
+     * <pre>
+     * ID of the associated experiment.
+     * </pre>
+     *
+     * <code>optional string experiment_id = 1;</code>
+     */
+    public boolean hasExperimentId() {
+      return ((bitField0_ & 0x00000001) == 0x00000001);
+    }
+    /**
+     * <pre>
+     * ID of the associated experiment.
+     * </pre>
+     *
+     * <code>optional string experiment_id = 1;</code>
+     */
+    public java.lang.String getExperimentId() {
+      java.lang.Object ref = experimentId_;
+      if (ref instanceof java.lang.String) {
+        return (java.lang.String) ref;
+      } else {
+        com.google.protobuf.ByteString bs = 
+            (com.google.protobuf.ByteString) ref;
+        java.lang.String s = bs.toStringUtf8();
+        if (bs.isValidUtf8()) {
+          experimentId_ = s;
+        }
+        return s;
+      }
+    }
+    /**
+     * <pre>
+     * ID of the associated experiment.
+     * </pre>
+     *
+     * <code>optional string experiment_id = 1;</code>
+     */
+    public com.google.protobuf.ByteString
+        getExperimentIdBytes() {
+      java.lang.Object ref = experimentId_;
+      if (ref instanceof java.lang.String) {
+        com.google.protobuf.ByteString b = 
+            com.google.protobuf.ByteString.copyFromUtf8(
+                (java.lang.String) ref);
+        experimentId_ = b;
+        return b;
+      } else {
+        return (com.google.protobuf.ByteString) ref;
+      }
+    }
+
+    public static final int RUNS_FIELD_NUMBER = 2;
+    private java.util.List<org.mlflow.api.proto.Service.CreateRuns.RunSpec> runs_;
+    /**
+     * <pre>
+     * Runs to create.
+     * </pre>
+     *
+     * <code>repeated .mlflow.CreateRuns.RunSpec runs = 2;</code>
+     */
+    public java.util.List<org.mlflow.api.proto.Service.CreateRuns.RunSpec> getRunsList() {
+      return runs_;
+    }
+    /**
+     * <pre>
+     * Runs to create.
+     * </pre>
+     *
+     * <code>repeated .mlflow.CreateRuns.RunSpec runs = 2;</code>
+     */
+    public java.util.List<? extends org.mlflow.api.proto.Service.CreateRuns.RunSpecOrBuilder> 
+        getRunsOrBuilderList() {
+      return runs_;
+    }
+    /**
+     * <pre>
+     * Runs to create.
+     * </pre>
+     *
+     * <code>repeated .mlflow.CreateRuns.RunSpec runs = 2;</code>
+     */
+    public int getRunsCount() {
+      return runs_.size();
+    }
+    /**
+     * <pre>
+     * Runs to create.
+     * </pre>
+     *
+     * <code>repeated .mlflow.CreateRuns.RunSpec runs = 2;</code>
+     */
+    public org.mlflow.api.proto.Service.CreateRuns.RunSpec getRuns(int index) {
+      return runs_.get(index);
+    }
+    /**
+     * <pre>
+     * Runs to create.
+     * </pre>
+     *
+     * <code>repeated .mlflow.CreateRuns.RunSpec runs = 2;</code>
+     */
+    public org.mlflow.api.proto.Service.CreateRuns.RunSpecOrBuilder getRunsOrBuilder(
+        int index) {
+      return runs_.get(index);
+    }
+
+    private byte memoizedIsInitialized = -1;
+    @java.lang.Override
+    public final boolean isInitialized() {
+      byte isInitialized = memoizedIsInitialized;
+      if (isInitialized == 1) return true;
+      if (isInitialized == 0) return false;
+
+      memoizedIsInitialized = 1;
+      return true;
+    }
+
+    @java.lang.Override
+    public void writeTo(com.google.protobuf.CodedOutputStream output)
+                        throws java.io.IOException {
+      if (((bitField0_ & 0x00000001) == 0x00000001)) {
+        com.google.protobuf.GeneratedMessageV3.writeString(output, 1, experimentId_);
+      }
+      for (int i = 0; i < runs_.size(); i++) {
+        output.writeMessage(2, runs_.get(i));
+      }
+      unknownFields.writeTo(output);
+    }
+
+    @java.lang.Override
+    public int getSerializedSize() {
+      int size = memoizedSize;
+      if (size != -1) return size;
+
+      size = 0;
+      if (((bitField0_ & 0x00000001) == 0x00000001)) {
+        size += com.google.protobuf.GeneratedMessageV3.computeStringSize(1, experimentId_);
+      }
+      for (int i = 0; i < runs_.size(); i++) {
+        size += com.google.protobuf.CodedOutputStream
+          .computeMessageSize(2, runs_.get(i));
+      }
+      size += unknownFields.getSerializedSize();
+      memoizedSize = size;
+      return size;
+    }
+
+    @java.lang.Override
+    public boolean equals(final java.lang.Object obj) {
+      if (obj == this) {
+       return true;
+      }
+      if (!(obj instanceof org.mlflow.api.proto.Service.CreateRuns)) {
+        return super.equals(obj);
+      }
+      org.mlflow.api.proto.Service.CreateRuns other = (org.mlflow.api.proto.Service.CreateRuns) obj;
+
+      boolean result = true;
+      result = result && (hasExperimentId() == other.hasExperimentId());
+      if (hasExperimentId()) {
+        result = result && getExperimentId()
+            .equals(other.getExperimentId());
+      }
+      result = result && getRunsList()
+          .equals(other.getRunsList());
+      result = result && unknownFields.equals(other.unknownFields);
+      return result;
+    }
+
+    @java.lang.Override
+    public int hashCode() {
+      if (memoizedHashCode != 0) {
+        return memoizedHashCode;
+      }
+      int hash = 41;
+      hash = (19 * hash) + getDescriptor().hashCode();
+      if (hasExperimentId()) {
+        hash = (37 * hash) + EXPERIMENT_ID_FIELD_NUMBER;
+        hash = (53 * hash) + getExperimentId().hashCode();
+      }
+      if (getRunsCount() > 0) {
+        hash = (37 * hash) + RUNS_FIELD_NUMBER;
+        hash = (53 * hash) + getRunsList().hashCode();
+      }
+      hash = (29 * hash) + unknownFields.hashCode();
+      memoizedHashCode = hash;
+      return hash;
+    }
+
+    public static org.mlflow.api.proto.Service.CreateRuns parseFrom(
+        java.nio.ByteBuffer data)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data);
+    }
+    public static org.mlflow.api.proto.Service.CreateRuns parseFrom(
+        java.nio.ByteBuffer data,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data, extensionRegistry);
+    }
+    public static org.mlflow.api.proto.Service.CreateRuns parseFrom(
+        com.google.protobuf.ByteString data)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data);
+    }
+    public static org.mlflow.api.proto.Service.CreateRuns parseFrom(
+        com.google.protobuf.ByteString data,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data, extensionRegistry);
+    }
+    public static org.mlflow.api.proto.Service.CreateRuns parseFrom(byte[] data)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data);
+    }
+    public static org.mlflow.api.proto.Service.CreateRuns parseFrom(
+        byte[] data,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws com.google.protobuf.InvalidProtocolBufferException {
+      return PARSER.parseFrom(data, extensionRegistry);
+    }
+    public static org.mlflow.api.proto.Service.CreateRuns parseFrom(java.io.InputStream input)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseWithIOException(PARSER, input);
+    }
+    public static org.mlflow.api.proto.Service.CreateRuns parseFrom(
+        java.io.InputStream input,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseWithIOException(PARSER, input, extensionRegistry);
+    }
+    public static org.mlflow.api.proto.Service.CreateRuns parseDelimitedFrom(java.io.InputStream input)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseDelimitedWithIOException(PARSER, input);
+    }
+    public static org.mlflow.api.proto.Service.CreateRuns parseDelimitedFrom(
+        java.io.InputStream input,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseDelimitedWithIOException(PARSER, input, extensionRegistry);
+    }
+    public static org.mlflow.api.proto.Service.CreateRuns parseFrom(
+        com.google.protobuf.CodedInputStream input)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseWithIOException(PARSER, input);
+    }
+    public static org.mlflow.api.proto.Service.CreateRuns parseFrom(
+        com.google.protobuf.CodedInputStream input,
+        com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+        throws java.io.IOException {
+      return com.google.protobuf.GeneratedMessageV3
+          .parseWithIOException(PARSER, input, extensionRegistry);
+    }
+
+    @java.lang.Override
+    public Builder newBuilderForType() { return newBuilder(); }
+    public static Builder newBuilder() {
+      return DEFAULT_INSTANCE.toBuilder();
+    }
+    public static Builder newBuilder(org.mlflow.api.proto.Service.CreateRuns prototype) {
+      return DEFAULT_INSTANCE.toBuilder().mergeFrom(prototype);
+    }
+    @java.lang.Override
+    public Builder toBuilder() {
+      return this == DEFAULT_INSTANCE
+          ? new Builder() : new Builder().mergeFrom(this);
+    }
+
+    @java.lang.Override
+    protected Builder newBuilderForType(
+        com.google.protobuf.GeneratedMessageV3.BuilderParent parent) {
+      Builder builder = new Builder(parent);
+      return builder;
+    }
+    /**
+     * Protobuf type {@code mlflow.CreateRuns}
+     */
+    public static final class Builder extends
+        com.google.protobuf.GeneratedMessageV3.Builder<Builder> implements
+        // @@protoc_insertion_point(builder_implements:mlflow.CreateRuns)
+        org.mlflow.api.proto.Service.CreateRunsOrBuilder {
+      public static final com.google.protobuf.Descriptors.Descriptor
+          getDescriptor() {
+        return org.mlflow.api.proto.Service.internal_static_mlflow_CreateRuns_descriptor;
+      }
+
+      @java.lang.Override
+      protected com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
+          internalGetFieldAccessorTable() {
+        return org.mlflow.api.proto.Service.internal_static_mlflow_CreateRuns_fieldAccessorTable
+            .ensureFieldAccessorsInitialized(
+                org.mlflow.api.proto.Service.CreateRuns.class, org.mlflow.api.proto.Service.CreateRuns.Builder.class);
+      }
+
+      // Construct using org.mlflow.api.proto.Service.CreateRuns.newBuilder()
+      private Builder() {
+        maybeForceBuilderInitialization();
+      }
+
+      private Builder(
+          com.google.protobuf.GeneratedMessageV3.BuilderParent parent) {
+        super(parent);
+        maybeForceBuilderInitialization();
+      }
+      private void maybeForceBuilderInitialization() {
+        if (com.google.protobuf.GeneratedMessageV3
+                .alwaysUseFieldBuilders) {
+          getRunsFieldBuilder();
+        }
+      }
+      @java.lang.Override
+      public Builder clear() {
+        super.clear();
+        experimentId_ = "";
+        bitField0_ = (bitField0_ & ~0x00000001);
+        if (runsBuilder_ == null) {
+          runs_ = java.util.Collections.emptyList();
+          bitField0_ = (bitField0_ & ~0x00000002);
+        } else {
+          runsBuilder_.clear();
+        }
+        return this;
+      }
+
+      @java.lang.Override
+      public com.google.protobuf.Descriptors.Descriptor
+          getDescriptorForType() {
+        return org.mlflow.api.proto.Service.internal_static_mlflow_CreateRuns_descriptor;
+      }
+
+      @java.lang.Override
+      public org.mlflow.api.proto.Service.CreateRuns getDefaultInstanceForType() {
+        return org.mlflow.api.proto.Service.CreateRuns.getDefaultInstance();
+      }
+
+      @java.lang.Override
+      public org.mlflow.api.proto.Service.CreateRuns build() {
+        org.mlflow.api.proto.Service.CreateRuns result = buildPartial();
+        if (!result.isInitialized()) {
+          throw newUninitializedMessageException(result);
+        }
+        return result;
+      }
+
+      @java.lang.Override
+      public org.mlflow.api.proto.Service.CreateRuns buildPartial() {
+        org.mlflow.api.proto.Service.CreateRuns result = new org.mlflow.api.proto.Service.CreateRuns(this);
+        int from_bitField0_ = bitField0_;
+        int to_bitField0_ = 0;
+        if (((from_bitField0_ & 0x00000001) == 0x00000001)) {
+          to_bitField0_ |= 0x00000001;
+        }
+        result.experimentId_ = experimentId_;
+        if (runsBuilder_ == null) {
+          if (((bitField0_ & 0x00000002) == 0x00000002)) {
+            runs_ = java.util.Collections.unmodifiableList(runs_);
+            bitField0_ = (bitField0_ & ~0x00000002);
+          }
+          result.runs_ = runs_;
+        } else {
+          result.runs_ = runsBuilder_.build();
+        }
+        result.bitField0_ = to_bitField0_;
+        onBuilt();
+        return result;
+      }
+
+      @java.lang.Override
+      public Builder clone() {
+        return (Builder) super.clone();
+      }
+      @java.lang.Override
+      public Builder setField(
+          com.google.protobuf.Descriptors.FieldDescriptor field,
+          java.lang.Object value) {
+        return (Builder) super.setField(field, value);
+      }
+      @java.lang.Override
+      public Builder clearField(
+          com.google.protobuf.Descriptors.FieldDescriptor field) {
+        return (Builder) super.clearField(field);
+      }
+      @java.lang.Override
+      public Builder clearOneof(
+          com.google.protobuf.Descriptors.OneofDescriptor oneof) {
+        return (Builder) super.clearOneof(oneof);
+      }
+      @java.lang.Override
+      public Builder setRepeatedField(
+          com.google.protobuf.Descriptors.FieldDescriptor field,
+          int index, java.lang.Object value) {
+        return (Builder) super.setRepeatedField(field, index, value);
+      }
+      @java.lang.Override
+      public Builder addRepeatedField(
+          com.google.protobuf.Descriptors.FieldDescriptor field,
+          java.lang.Object value) {
+        return (Builder) super.addRepeatedField(field, value);
+      }
+      @java.lang.Override
+      public Builder mergeFrom(com.google.protobuf.Message other) {
+        if (other instanceof org.mlflow.api.proto.Service.CreateRuns) {
+          return mergeFrom((org.mlflow.api.proto.Service.CreateRuns)other);
+        } else {
+          super.mergeFrom(other);
+          return this;
+        }
+      }
+
+      public Builder mergeFrom(org.mlflow.api.proto.Service.CreateRuns other) {
+        if (other == org.mlflow.api.proto.Service.CreateRuns.getDefaultInstance()) return this;
+        if (other.hasExperimentId()) {
+          bitField0_ |= 0x00000001;
+          experimentId_ = other.experimentId_;
+          onChanged();
+        }
+        if (runsBuilder_ == null) {
+          if (!other.runs_.isEmpty()) {
+            if (runs_.isEmpty()) {
+              runs_ = other.runs_;
+              bitField0_ = (bitField0_ & ~0x00000002);
+            } else {
+              ensureRunsIsMutable();
+              runs_.addAll(other.runs_);
+            }
+            onChanged();
+          }
+        } else {
+          if (!other.runs_.isEmpty()) {
+            if (runsBuilder_.isEmpty()) {
+              runsBuilder_.dispose();
+              runsBuilder_ = null;
+              runs_ = other.runs_;
+              bitField0_ = (bitField0_ & ~0x00000002);
+              runsBuilder_ = 
+                com.google.protobuf.GeneratedMessageV3.alwaysUseFieldBuilders ?
+                   getRunsFieldBuilder() : null;
+            } else {
+              runsBuilder_.addAllMessages(other.runs_);
+            }
+          }
+        }
+        this.mergeUnknownFields(other.unknownFields);
+        onChanged();
+        return this;
+      }
+
+      @java.lang.Override
+      public final boolean isInitialized() {
+        return true;
+      }
+
+      @java.lang.Override
+      public Builder mergeFrom(
+          com.google.protobuf.CodedInputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws java.io.IOException {
+        org.mlflow.api.proto.Service.CreateRuns parsedMessage = null;
+        try {
+          parsedMessage = PARSER.parsePartialFrom(input, extensionRegistry);
+        } catch (com.google.protobuf.InvalidProtocolBufferException e) {
+          parsedMessage = (org.mlflow.api.proto.Service.CreateRuns) e.getUnfinishedMessage();
+          throw e.unwrapIOException();
+        } finally {
+          if (parsedMessage != null) {
+            mergeFrom(parsedMessage);
+          }
+        }
+        return this;
+      }
+      private int bitField0_;
+
+      private java.lang.Object experimentId_ = "";
+      /**
+       * <pre>
+       * ID of the associated experiment.
+       * </pre>
+       *
+       * <code>optional string experiment_id = 1;</code>
+       */
+      public boolean hasExperimentId() {
+        return ((bitField0_ & 0x00000001) == 0x00000001);
+      }
+      /**
+       * <pre>
+       * ID of the associated experiment.
+       * </pre>
+       *
+       * <code>optional string experiment_id = 1;</code>
+       */
+      public java.lang.String getExperimentId() {
+        java.lang.Object ref = experimentId_;
+        if (!(ref instanceof java.lang.String)) {
+          com.google.protobuf.ByteString bs =
+              (com.google.protobuf.ByteString) ref;
+          java.lang.String s = bs.toStringUtf8();
+          if (bs.isValidUtf8()) {
+            experimentId_ = s;
+          }
+          return s;
+        } else {
+          return (java.lang.String) ref;
+        }
+      }
+      /**
+       * <pre>
+       * ID of the associated experiment.
+       * </pre>
+       *
+       * <code>optional string experiment_id = 1;</code>
+       */
+      public com.google.protobuf.ByteString
+          getExperimentIdBytes() {
+        java.lang.Object ref = experimentId_;
+        if (ref instanceof String) {
+          com.google.protobuf.ByteString b = 
+              com.google.protobuf.ByteString.copyFromUtf8(
+                  (java.lang.String) ref);
+          experimentId_ = b;
+          return b;
+        } else {
+          return (com.google.protobuf.ByteString) ref;
+        }
+      }
+      /**
+       * <pre>
+       * ID of the associated experiment.
+       * </pre>
+       *
+       * <code>optional string experiment_id = 1;</code>
+       */
+      public Builder setExperimentId(
+          java.lang.String value) {
+        if (value == null) {
+    throw new NullPointerException();
+  }
+  bitField0_ |= 0x00000001;
+        experimentId_ = value;
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * ID of the associated experiment.
+       * </pre>
+       *
+       * <code>optional string experiment_id = 1;</code>
+       */
+      public Builder clearExperimentId() {
+        bitField0_ = (bitField0_ & ~0x00000001);
+        experimentId_ = getDefaultInstance().getExperimentId();
+        onChanged();
+        return this;
+      }
+      /**
+       * <pre>
+       * ID of the associated experiment.
+       * </pre>
+       *
+       * <code>optional string experiment_id = 1;</code>
+       */
+      public Builder setExperimentIdBytes(
+          com.google.protobuf.ByteString value) {
+        if (value == null) {
+    throw new NullPointerException();
+  }
+  bitField0_ |= 0x00000001;
+        experimentId_ = value;
+        onChanged();
+        return this;
+      }
+
+      private java.util.List<org.mlflow.api.proto.Service.CreateRuns.RunSpec> runs_ =
+        java.util.Collections.emptyList();
+      private void ensureRunsIsMutable() {
+        if (!((bitField0_ & 0x00000002) == 0x00000002)) {
+          runs_ = new java.util.ArrayList<org.mlflow.api.proto.Service.CreateRuns.RunSpec>(runs_);
+          bitField0_ |= 0x00000002;
+         }
+      }
+
+      private com.google.protobuf.RepeatedFieldBuilderV3<
+          org.mlflow.api.proto.Service.CreateRuns.RunSpec, org.mlflow.api.proto.Service.CreateRuns.RunSpec.Builder, org.mlflow.api.proto.Service.CreateRuns.RunSpecOrBuilder> runsBuilder_;
+
+      /**
+       * <pre>
+       * Runs to create.
+       * </pre>
+       *
+       * <code>repeated .mlflow.CreateRuns.RunSpec runs = 2;</code>
+       */
+      public java.util.List<org.mlflow.api.proto.Service.CreateRuns.RunSpec> getRunsList() {
+        if (runsBuilder_ == null) {
+          return java.util.Collections.unmodifiableList(runs_);
+        } else {
+          return runsBuilder_.getMessageList();
+        }
+      }
+      /**
+       * <pre>
+       * Runs to create.
+       * </pre>
+       *
+       * <code>repeated .mlflow.CreateRuns.RunSpec runs = 2;</code>
+       */
+      public int getRunsCount() {
+        if (runsBuilder_ == null) {
+          return runs_.size();
+        } else {
+          return runsBuilder_.getCount();
+        }
+      }
+      /**
+       * <pre>
+       * Runs to create.
+       * </pre>
+       *
+       * <code>repeated .mlflow.CreateRuns.RunSpec runs = 2;</code>
+       */
+      public org.mlflow.api.proto.Service.CreateRuns.RunSpec getRuns(int index) {
+        if (runsBuilder_ == null) {
+          return runs_.get(index);
+        } else {
+          return runsBuilder_.getMessage(index);
+        }
+      }
+      /**
+       * <pre>
+       * Runs to create.
+       * </pre>
+       *
+       * <code>repeated .mlflow.CreateRuns.RunSpec runs = 2;</code>
+       */
+      public Builder setRuns(
+          int index, org.mlflow.api.proto.Service.CreateRuns.RunSpec value) {
+        if (runsBuilder_ == null) {
+          if (value == null) {
+            throw new NullPointerException();
+          }
+          ensureRunsIsMutable();
+          runs_.set(index, value);
+          onChanged();
+        } else {
+          runsBuilder_.setMessage(index, value);
+        }
+        return this;
+      }
+      /**
+       * <pre>
+       * Runs to create.
+       * </pre>
+       *
+       * <code>repeated .mlflow.CreateRuns.RunSpec runs = 2;</code>
+       */
+      public Builder setRuns(
+          int index, org.mlflow.api.proto.Service.CreateRuns.RunSpec.Builder builderForValue) {
+        if (runsBuilder_ == null) {
+          ensureRunsIsMutable();
+          runs_.set(index, builderForValue.build());
+          onChanged();
+        } else {
+          runsBuilder_.setMessage(index, builderForValue.build());
+        }
+        return this;
+      }
+      /**
+       * <pre>
+       * Runs to create.
+       * </pre>
+       *
+       * <code>repeated .mlflow.CreateRuns.RunSpec runs = 2;</code>
+       */
+      public Builder addRuns(org.mlflow.api.proto.Service.CreateRuns.RunSpec value) {
+        if (runsBuilder_ == null) {
+          if (value == null) {
+            throw new NullPointerException();
+          }
+          ensureRunsIsMutable();
+          runs_.add(value);
+          onChanged();
+        } else {
+          runsBuilder_.addMessage(value);
+        }
+        return this;
+      }
+      /**
+       * <pre>
+       * Runs to create.
+       * </pre>
+       *
+       * <code>repeated .mlflow.CreateRuns.RunSpec runs = 2;</code>
+       */
+      public Builder addRuns(
+          int index, org.mlflow.api.proto.Service.CreateRuns.RunSpec value) {
+        if (runsBuilder_ == null) {
+          if (value == null) {
+            throw new NullPointerException();
+          }
+          ensureRunsIsMutable();
+          runs_.add(index, value);
+          onChanged();
+        } else {
+          runsBuilder_.addMessage(index, value);
+        }
+        return this;
+      }
+      /**
+       * <pre>
+       * Runs to create.
+       * </pre>
+       *
+       * <code>repeated .mlflow.CreateRuns.RunSpec runs = 2;</code>
+       */
+      public Builder addRuns(
+          org.mlflow.api.proto.Service.CreateRuns.RunSpec.Builder builderForValue) {
+        if (runsBuilder_ == null) {
+          ensureRunsIsMutable();
+          runs_.add(builderForValue.build());
+          onChanged();
+        } else {
+          runsBuilder_.addMessage(builderForValue.build());
+        }
+        return this;
+      }
+      /**
+       * <pre>
+       * Runs to create.
+       * </pre>
+       *
+       * <code>repeated .mlflow.CreateRuns.RunSpec runs = 2;</code>
+       */
+      public Builder addRuns(
+          int index, org.mlflow.api.proto.Service.CreateRuns.RunSpec.Builder builderForValue) {
+        if (runsBuilder_ == null) {
+          ensureRunsIsMutable();
+          runs_.add(index, builderForValue.build());
+          onChanged();
+        } else {
+          runsBuilder_.addMessage(index, builderForValue.build());
+        }
+        return this;
+      }
+      /**
+       * <pre>
+       * Runs to create.
+       * </pre>
+       *
+       * <code>repeated .mlflow.CreateRuns.RunSpec runs = 2;</code>
+       */
+      public Builder addAllRuns(
+          java.lang.Iterable<? extends org.mlflow.api.proto.Service.CreateRuns.RunSpec> values) {
+        if (runsBuilder_ == null) {
+          ensureRunsIsMutable();
+          com.google.protobuf.AbstractMessageLite.Builder.addAll(
+              values, runs_);
+          onChanged();
+        } else {
+          runsBuilder_.addAllMessages(values);
+        }
+        return this;
+      }
+      /**
+       * <pre>
+       * Runs to create.
+       * </pre>
+       *
+       * <code>repeated .mlflow.CreateRuns.RunSpec runs = 2;</code>
+       */
+      public Builder clearRuns() {
+        if (runsBuilder_ == null) {
+          runs_ = java.util.Collections.emptyList();
+          bitField0_ = (bitField0_ & ~0x00000002);
+          onChanged();
+        } else {
+          runsBuilder_.clear();
+        }
+        return this;
+      }
+      /**
+       * <pre>
+       * Runs to create.
+       * </pre>
+       *
+       * <code>repeated .mlflow.CreateRuns.RunSpec runs = 2;</code>
+       */
+      public Builder removeRuns(int index) {
+        if (runsBuilder_ == null) {
+          ensureRunsIsMutable();
+          runs_.remove(index);
+          onChanged();
+        } else {
+          runsBuilder_.remove(index);
+        }
+        return this;
+      }
+      /**
+       * <pre>
+       * Runs to create.
+       * </pre>
+       *
+       * <code>repeated .mlflow.CreateRuns.RunSpec runs = 2;</code>
+       */
+      public org.mlflow.api.proto.Service.CreateRuns.RunSpec.Builder getRunsBuilder(
+          int index) {
+        return getRunsFieldBuilder().getBuilder(index);
+      }
+      /**
+       * <pre>
+       * Runs to create.
+       * </pre>
+       *
+       * <code>repeated .mlflow.CreateRuns.RunSpec runs = 2;</code>
+       */
+      public org.mlflow.api.proto.Service.CreateRuns.RunSpecOrBuilder getRunsOrBuilder(
+          int index) {
+        if (runsBuilder_ == null) {
+          return runs_.get(index);  } else {
+          return runsBuilder_.getMessageOrBuilder(index);
+        }
+      }
+      /**
+       * <pre>
+       * Runs to create.
+       * </pre>
+       *
+       * <code>repeated .mlflow.CreateRuns.RunSpec runs = 2;</code>
+       */
+      public java.util.List<? extends org.mlflow.api.proto.Service.CreateRuns.RunSpecOrBuilder> 
+           getRunsOrBuilderList() {
+        if (runsBuilder_ != null) {
+          return runsBuilder_.getMessageOrBuilderList();
+        } else {
+          return java.util.Collections.unmodifiableList(runs_);
+        }
+      }
+      /**
+       * <pre>
+       * Runs to create.
+       * </pre>
+       *
+       * <code>repeated .mlflow.CreateRuns.RunSpec runs = 2;</code>
+       */
+      public org.mlflow.api.proto.Service.CreateRuns.RunSpec.Builder addRunsBuilder() {
+        return getRunsFieldBuilder().addBuilder(
+            org.mlflow.api.proto.Service.CreateRuns.RunSpec.getDefaultInstance());
+      }
+      /**
+       * <pre>
+       * Runs to create.
+       * </pre>
+       *
+       * <code>repeated .mlflow.CreateRuns.RunSpec runs = 2;</code>
+       */
+      public org.mlflow.api.proto.Service.CreateRuns.RunSpec.Builder addRunsBuilder(
+          int index) {
+        return getRunsFieldBuilder().addBuilder(
+            index, org.mlflow.api.proto.Service.CreateRuns.RunSpec.getDefaultInstance());
+      }
+      /**
+       * <pre>
+       * Runs to create.
+       * </pre>
+       *
+       * <code>repeated .mlflow.CreateRuns.RunSpec runs = 2;</code>
+       */
+      public java.util.List<org.mlflow.api.proto.Service.CreateRuns.RunSpec.Builder> 
+           getRunsBuilderList() {
+        return getRunsFieldBuilder().getBuilderList();
+      }
+      private com.google.protobuf.RepeatedFieldBuilderV3<
+          org.mlflow.api.proto.Service.CreateRuns.RunSpec, org.mlflow.api.proto.Service.CreateRuns.RunSpec.Builder, org.mlflow.api.proto.Service.CreateRuns.RunSpecOrBuilder> 
+          getRunsFieldBuilder() {
+        if (runsBuilder_ == null) {
+          runsBuilder_ = new com.google.protobuf.RepeatedFieldBuilderV3<
+              org.mlflow.api.proto.Service.CreateRuns.RunSpec, org.mlflow.api.proto.Service.CreateRuns.RunSpec.Builder, org.mlflow.api.proto.Service.CreateRuns.RunSpecOrBuilder>(
+                  runs_,
+                  ((bitField0_ & 0x00000002) == 0x00000002),
+                  getParentForChildren(),
+                  isClean());
+          runs_ = null;
+        }
+        return runsBuilder_;
+      }
+      @java.lang.Override
+      public final Builder setUnknownFields(
+          final com.google.protobuf.UnknownFieldSet unknownFields) {
+        return super.setUnknownFields(unknownFields);
+      }
+
+      @java.lang.Override
+      public final Builder mergeUnknownFields(
+          final com.google.protobuf.UnknownFieldSet unknownFields) {
+        return super.mergeUnknownFields(unknownFields);
+      }
+
+
+      // @@protoc_insertion_point(builder_scope:mlflow.CreateRuns)
+    }
+
+    // @@protoc_insertion_point(class_scope:mlflow.CreateRuns)
+    private static final org.mlflow.api.proto.Service.CreateRuns DEFAULT_INSTANCE;
+    static {
+      DEFAULT_INSTANCE = new org.mlflow.api.proto.Service.CreateRuns();
+    }
+
+    public static org.mlflow.api.proto.Service.CreateRuns getDefaultInstance() {
+      return DEFAULT_INSTANCE;
+    }
+
+    @java.lang.Deprecated public static final com.google.protobuf.Parser<CreateRuns>
+        PARSER = new com.google.protobuf.AbstractParser<CreateRuns>() {
+      @java.lang.Override
+      public CreateRuns parsePartialFrom(
+          com.google.protobuf.CodedInputStream input,
+          com.google.protobuf.ExtensionRegistryLite extensionRegistry)
+          throws com.google.protobuf.InvalidProtocolBufferException {
+        return new CreateRuns(input, extensionRegistry);
+      }
+    };
+
+    public static com.google.protobuf.Parser<CreateRuns> parser() {
+      return PARSER;
+    }
+
+    @java.lang.Override
+    public com.google.protobuf.Parser<CreateRuns> getParserForType() {
+      return PARSER;
+    }
+
+    @java.lang.Override
+    public org.mlflow.api.proto.Service.CreateRuns getDefaultInstanceForType() {
+      return DEFAULT_INSTANCE;
+    }
+
+  }
+
   public interface UpdateRunOrBuilder extends
       // @@protoc_insertion_point(interface_extends:mlflow.UpdateRun)
       com.google.protobuf.MessageOrBuilder {
@@ -49307,6 +53785,21 @@ public final class Service {
   private static final 
     com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
       internal_static_mlflow_CreateRun_Response_fieldAccessorTable;
+  private static final com.google.protobuf.Descriptors.Descriptor
+    internal_static_mlflow_CreateRuns_descriptor;
+  private static final 
+    com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
+      internal_static_mlflow_CreateRuns_fieldAccessorTable;
+  private static final com.google.protobuf.Descriptors.Descriptor
+    internal_static_mlflow_CreateRuns_RunSpec_descriptor;
+  private static final 
+    com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
+      internal_static_mlflow_CreateRuns_RunSpec_fieldAccessorTable;
+  private static final com.google.protobuf.Descriptors.Descriptor
+    internal_static_mlflow_CreateRuns_Response_descriptor;
+  private static final 
+    com.google.protobuf.GeneratedMessageV3.FieldAccessorTable
+      internal_static_mlflow_CreateRuns_Response_fieldAccessorTable;
   private static final com.google.protobuf.Descriptors.Descriptor
     internal_static_mlflow_UpdateRun_descriptor;
   private static final 
@@ -49519,6 +54012,15 @@ public final class Service {
       " \001(\t\022\022\n\nstart_time\030\007 \001(\003\022\034\n\004tags\030\t \003(\0132\016" +
       ".mlflow.RunTag\032$\n\010Response\022\030\n\003run\030\001 \001(\0132" +
       "\013.mlflow.Run:+\342?(\n&com.databricks.rpc.RP" +
+      "C[$this.Response]\"\345\002\n\nCreateRuns\022\025\n\rexpe" +
+      "riment_id\030\001 \001(\t\022(\n\004runs\030\002 \003(\0132\032.mlflow.C" +
+      "reateRuns.RunSpec\032\301\001\n\007RunSpec\022\017\n\007user_id" +
+      "\030\001 \001(\t\022\022\n\nstart_time\030\002 \001(\003\022\020\n\010end_time\030\003" +
+      " \001(\003\022!\n\006status\030\004 \001(\0162\021.mlflow.RunStatus\022" +
+      "\034\n\004tags\030\005 \003(\0132\016.mlflow.RunTag\022\035\n\006params\030" +
+      "\006 \003(\0132\r.mlflow.Param\022\037\n\007metrics\030\007 \003(\0132\016." +
+      "mlflow.Metric\032%\n\010Response\022\031\n\004runs\030\001 \003(\0132" +
+      "\013.mlflow.Run:+\342?(\n&com.databricks.rpc.RP" +
       "C[$this.Response]\"\276\001\n\tUpdateRun\022\016\n\006run_i" +
       "d\030\004 \001(\t\022\020\n\010run_uuid\030\001 \001(\t\022!\n\006status\030\002 \001(" +
       "\0162\021.mlflow.RunStatus\022\020\n\010end_time\030\003 \001(\003\032-" +
@@ -49584,7 +54086,7 @@ public final class Service {
       "*I\n\nSourceType\022\014\n\010NOTEBOOK\020\001\022\007\n\003JOB\020\002\022\013\n" +
       "\007PROJECT\020\003\022\t\n\005LOCAL\020\004\022\014\n\007UNKNOWN\020\350\007*M\n\tR" +
       "unStatus\022\013\n\007RUNNING\020\001\022\r\n\tSCHEDULED\020\002\022\014\n\010" +
-      "FINISHED\020\003\022\n\n\006FAILED\020\004\022\n\n\006KILLED\020\0052\341\036\n\rM" +
+      "FINISHED\020\003\022\n\n\006FAILED\020\004\022\n\n\006KILLED\020\0052\220 \n\rM" +
       "lflowService\022\246\001\n\023getExperimentByName\022\033.m" +
       "lflow.GetExperimentByName\032$.mlflow.GetEx" +
       "perimentByName.Response\"L\362\206\031H\n,\n\003GET\022\037/m" +
@@ -49623,68 +54125,72 @@ public final class Service {
       "lflow.CreateRun.Response\"`\362\206\031\\\n!\n\004POST\022\023" +
       "/mlflow/runs/create\032\004\010\002\020\000\n)\n\004POST\022\033/prev" +
       "iew/mlflow/runs/create\032\004\010\002\020\000\020\001*\nCreate R" +
-      "un\022\234\001\n\tupdateRun\022\021.mlflow.UpdateRun\032\032.ml" +
-      "flow.UpdateRun.Response\"`\362\206\031\\\n!\n\004POST\022\023/" +
-      "mlflow/runs/update\032\004\010\002\020\000\n)\n\004POST\022\033/previ" +
-      "ew/mlflow/runs/update\032\004\010\002\020\000\020\001*\nUpdate Ru" +
-      "n\022\234\001\n\tdeleteRun\022\021.mlflow.DeleteRun\032\032.mlf" +
-      "low.DeleteRun.Response\"`\362\206\031\\\n!\n\004POST\022\023/m" +
-      "lflow/runs/delete\032\004\010\002\020\000\n)\n\004POST\022\033/previe" +
-      "w/mlflow/runs/delete\032\004\010\002\020\000\020\001*\nDelete Run" +
-      "\022\242\001\n\nrestoreRun\022\022.mlflow.RestoreRun\032\033.ml" +
-      "flow.RestoreRun.Response\"c\362\206\031_\n\"\n\004POST\022\024" +
-      "/mlflow/runs/restore\032\004\010\002\020\000\n*\n\004POST\022\034/pre" +
-      "view/mlflow/runs/restore\032\004\010\002\020\000\020\001*\013Restor" +
-      "e Run\022\244\001\n\tlogMetric\022\021.mlflow.LogMetric\032\032" +
-      ".mlflow.LogMetric.Response\"h\362\206\031d\n%\n\004POST" +
-      "\022\027/mlflow/runs/log-metric\032\004\010\002\020\000\n-\n\004POST\022" +
-      "\037/preview/mlflow/runs/log-metric\032\004\010\002\020\000\020\001" +
-      "*\nLog Metric\022\246\001\n\010logParam\022\020.mlflow.LogPa" +
-      "ram\032\031.mlflow.LogParam.Response\"m\362\206\031i\n(\n\004" +
-      "POST\022\032/mlflow/runs/log-parameter\032\004\010\002\020\000\n0" +
-      "\n\004POST\022\"/preview/mlflow/runs/log-paramet" +
-      "er\032\004\010\002\020\000\020\001*\tLog Param\022\341\001\n\020setExperimentT" +
-      "ag\022\030.mlflow.SetExperimentTag\032!.mlflow.Se" +
-      "tExperimentTag.Response\"\217\001\362\206\031\212\001\n4\n\004POST\022" +
-      "&/mlflow/experiments/set-experiment-tag\032" +
-      "\004\010\002\020\000\n<\n\004POST\022./preview/mlflow/experimen" +
-      "ts/set-experiment-tag\032\004\010\002\020\000\020\001*\022Set Exper" +
-      "iment Tag\022\222\001\n\006setTag\022\016.mlflow.SetTag\032\027.m" +
-      "lflow.SetTag.Response\"_\362\206\031[\n\"\n\004POST\022\024/ml" +
-      "flow/runs/set-tag\032\004\010\002\020\000\n*\n\004POST\022\034/previe" +
-      "w/mlflow/runs/set-tag\032\004\010\002\020\000\020\001*\007Set Tag\022\244" +
-      "\001\n\tdeleteTag\022\021.mlflow.DeleteTag\032\032.mlflow" +
-      ".DeleteTag.Response\"h\362\206\031d\n%\n\004POST\022\027/mlfl" +
-      "ow/runs/delete-tag\032\004\010\002\020\000\n-\n\004POST\022\037/previ" +
-      "ew/mlflow/runs/delete-tag\032\004\010\002\020\000\020\001*\nDelet" +
-      "e Tag\022\210\001\n\006getRun\022\016.mlflow.GetRun\032\027.mlflo" +
-      "w.GetRun.Response\"U\362\206\031Q\n\035\n\003GET\022\020/mlflow/" +
-      "runs/get\032\004\010\002\020\000\n%\n\003GET\022\030/preview/mlflow/r" +
-      "uns/get\032\004\010\002\020\000\020\001*\007Get Run\022\314\001\n\nsearchRuns\022" +
-      "\022.mlflow.SearchRuns\032\033.mlflow.SearchRuns." +
-      "Response\"\214\001\362\206\031\207\001\n!\n\004POST\022\023/mlflow/runs/s" +
-      "earch\032\004\010\002\020\000\n)\n\004POST\022\033/preview/mlflow/run" +
-      "s/search\032\004\010\002\020\000\n(\n\003GET\022\033/preview/mlflow/r" +
-      "uns/search\032\004\010\002\020\000\020\001*\013Search Runs\022\260\001\n\rlist" +
-      "Artifacts\022\025.mlflow.ListArtifacts\032\036.mlflo" +
-      "w.ListArtifacts.Response\"h\362\206\031d\n#\n\003GET\022\026/" +
-      "mlflow/artifacts/list\032\004\010\002\020\000\n+\n\003GET\022\036/pre" +
-      "view/mlflow/artifacts/list\032\004\010\002\020\000\020\001*\016List" +
-      " Artifacts\022\307\001\n\020getMetricHistory\022\030.mlflow" +
-      ".GetMetricHistory\032!.mlflow.GetMetricHist" +
-      "ory.Response\"v\362\206\031r\n(\n\003GET\022\033/mlflow/metri" +
-      "cs/get-history\032\004\010\002\020\000\n0\n\003GET\022#/preview/ml" +
-      "flow/metrics/get-history\032\004\010\002\020\000\020\001*\022Get Me" +
-      "tric History\022\236\001\n\010logBatch\022\020.mlflow.LogBa" +
-      "tch\032\031.mlflow.LogBatch.Response\"e\362\206\031a\n$\n\004" +
-      "POST\022\026/mlflow/runs/log-batch\032\004\010\002\020\000\n,\n\004PO" +
-      "ST\022\036/preview/mlflow/runs/log-batch\032\004\010\002\020\000" +
-      "\020\001*\tLog Batch\022\236\001\n\010logModel\022\020.mlflow.LogM" +
-      "odel\032\031.mlflow.LogModel.Response\"e\362\206\031a\n$\n" +
-      "\004POST\022\026/mlflow/runs/log-model\032\004\010\002\020\000\n,\n\004P" +
-      "OST\022\036/preview/mlflow/runs/log-model\032\004\010\002\020" +
-      "\000\020\001*\tLog ModelB\036\n\024org.mlflow.api.proto\220\001" +
-      "\001\342?\002\020\001"
+      "un\022\254\001\n\ncreateRuns\022\022.mlflow.CreateRuns\032\033." +
+      "mlflow.CreateRuns.Response\"m\362\206\031i\n\'\n\004POST" +
+      "\022\031/mlflow/runs/create-batch\032\004\010\002\020\000\n/\n\004POS" +
+      "T\022!/preview/mlflow/runs/create-batch\032\004\010\002" +
+      "\020\000\020\001*\013Create Runs\022\234\001\n\tupdateRun\022\021.mlflow" +
+      ".UpdateRun\032\032.mlflow.UpdateRun.Response\"`" +
+      "\362\206\031\\\n!\n\004POST\022\023/mlflow/runs/update\032\004\010\002\020\000\n" +
+      ")\n\004POST\022\033/preview/mlflow/runs/update\032\004\010\002" +
+      "\020\000\020\001*\nUpdate Run\022\234\001\n\tdeleteRun\022\021.mlflow." +
+      "DeleteRun\032\032.mlflow.DeleteRun.Response\"`\362" +
+      "\206\031\\\n!\n\004POST\022\023/mlflow/runs/delete\032\004\010\002\020\000\n)" +
+      "\n\004POST\022\033/preview/mlflow/runs/delete\032\004\010\002\020" +
+      "\000\020\001*\nDelete Run\022\242\001\n\nrestoreRun\022\022.mlflow." +
+      "RestoreRun\032\033.mlflow.RestoreRun.Response\"" +
+      "c\362\206\031_\n\"\n\004POST\022\024/mlflow/runs/restore\032\004\010\002\020" +
+      "\000\n*\n\004POST\022\034/preview/mlflow/runs/restore\032" +
+      "\004\010\002\020\000\020\001*\013Restore Run\022\244\001\n\tlogMetric\022\021.mlf" +
+      "low.LogMetric\032\032.mlflow.LogMetric.Respons" +
+      "e\"h\362\206\031d\n%\n\004POST\022\027/mlflow/runs/log-metric" +
+      "\032\004\010\002\020\000\n-\n\004POST\022\037/preview/mlflow/runs/log" +
+      "-metric\032\004\010\002\020\000\020\001*\nLog Metric\022\246\001\n\010logParam" +
+      "\022\020.mlflow.LogParam\032\031.mlflow.LogParam.Res" +
+      "ponse\"m\362\206\031i\n(\n\004POST\022\032/mlflow/runs/log-pa" +
+      "rameter\032\004\010\002\020\000\n0\n\004POST\022\"/preview/mlflow/r" +
+      "uns/log-parameter\032\004\010\002\020\000\020\001*\tLog Param\022\341\001\n" +
+      "\020setExperimentTag\022\030.mlflow.SetExperiment" +
+      "Tag\032!.mlflow.SetExperimentTag.Response\"\217" +
+      "\001\362\206\031\212\001\n4\n\004POST\022&/mlflow/experiments/set-" +
+      "experiment-tag\032\004\010\002\020\000\n<\n\004POST\022./preview/m" +
+      "lflow/experiments/set-experiment-tag\032\004\010\002" +
+      "\020\000\020\001*\022Set Experiment Tag\022\222\001\n\006setTag\022\016.ml" +
+      "flow.SetTag\032\027.mlflow.SetTag.Response\"_\362\206" +
+      "\031[\n\"\n\004POST\022\024/mlflow/runs/set-tag\032\004\010\002\020\000\n*" +
+      "\n\004POST\022\034/preview/mlflow/runs/set-tag\032\004\010\002" +
+      "\020\000\020\001*\007Set Tag\022\244\001\n\tdeleteTag\022\021.mlflow.Del" +
+      "eteTag\032\032.mlflow.DeleteTag.Response\"h\362\206\031d" +
+      "\n%\n\004POST\022\027/mlflow/runs/delete-tag\032\004\010\002\020\000\n" +
+      "-\n\004POST\022\037/preview/mlflow/runs/delete-tag" +
+      "\032\004\010\002\020\000\020\001*\nDelete Tag\022\210\001\n\006getRun\022\016.mlflow" +
+      ".GetRun\032\027.mlflow.GetRun.Response\"U\362\206\031Q\n\035" +
+      "\n\003GET\022\020/mlflow/runs/get\032\004\010\002\020\000\n%\n\003GET\022\030/p" +
+      "review/mlflow/runs/get\032\004\010\002\020\000\020\001*\007Get Run\022" +
+      "\314\001\n\nsearchRuns\022\022.mlflow.SearchRuns\032\033.mlf" +
+      "low.SearchRuns.Response\"\214\001\362\206\031\207\001\n!\n\004POST\022" +
+      "\023/mlflow/runs/search\032\004\010\002\020\000\n)\n\004POST\022\033/pre" +
+      "view/mlflow/runs/search\032\004\010\002\020\000\n(\n\003GET\022\033/p" +
+      "review/mlflow/runs/search\032\004\010\002\020\000\020\001*\013Searc" +
+      "h Runs\022\260\001\n\rlistArtifacts\022\025.mlflow.ListAr" +
+      "tifacts\032\036.mlflow.ListArtifacts.Response\"" +
+      "h\362\206\031d\n#\n\003GET\022\026/mlflow/artifacts/list\032\004\010\002" +
+      "\020\000\n+\n\003GET\022\036/preview/mlflow/artifacts/lis" +
+      "t\032\004\010\002\020\000\020\001*\016List Artifacts\022\307\001\n\020getMetricH" +
+      "istory\022\030.mlflow.GetMetricHistory\032!.mlflo" +
+      "w.GetMetricHistory.Response\"v\362\206\031r\n(\n\003GET" +
+      "\022\033/mlflow/metrics/get-history\032\004\010\002\020\000\n0\n\003G" +
+      "ET\022#/preview/mlflow/metrics/get-history\032" +
+      "\004\010\002\020\000\020\001*\022Get Metric History\022\236\001\n\010logBatch" +
+      "\022\020.mlflow.LogBatch\032\031.mlflow.LogBatch.Res" +
+      "ponse\"e\362\206\031a\n$\n\004POST\022\026/mlflow/runs/log-ba" +
+      "tch\032\004\010\002\020\000\n,\n\004POST\022\036/preview/mlflow/runs/" +
+      "log-batch\032\004\010\002\020\000\020\001*\tLog Batch\022\236\001\n\010logMode" +
+      "l\022\020.mlflow.LogModel\032\031.mlflow.LogModel.Re" +
+      "sponse\"e\362\206\031a\n$\n\004POST\022\026/mlflow/runs/log-m" +
+      "odel\032\004\010\002\020\000\n,\n\004POST\022\036/preview/mlflow/runs" +
+      "/log-model\032\004\010\002\020\000\020\001*\tLog ModelB\036\n\024org.mlf" +
+      "low.api.proto\220\001\001\342?\002\020\001"
     };
     com.google.protobuf.Descriptors.FileDescriptor.InternalDescriptorAssigner assigner =
         new com.google.protobuf.Descriptors.FileDescriptor.    InternalDescriptorAssigner() {
@@ -49832,8 +54338,26 @@ public final class Service {
       com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
         internal_static_mlflow_CreateRun_Response_descriptor,
         new java.lang.String[] { "Run", });
-    internal_static_mlflow_UpdateRun_descriptor =
+    internal_static_mlflow_CreateRuns_descriptor =
       getDescriptor().getMessageTypes().get(15);
+    internal_static_mlflow_CreateRuns_fieldAccessorTable = new
+      com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
+        internal_static_mlflow_CreateRuns_descriptor,
+        new java.lang.String[] { "ExperimentId", "Runs", });
+    internal_static_mlflow_CreateRuns_RunSpec_descriptor =
+      internal_static_mlflow_CreateRuns_descriptor.getNestedTypes().get(0);
+    internal_static_mlflow_CreateRuns_RunSpec_fieldAccessorTable = new
+      com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
+        internal_static_mlflow_CreateRuns_RunSpec_descriptor,
+        new java.lang.String[] { "UserId", "StartTime", "EndTime", "Status", "Tags", "Params", "Metrics", });
+    internal_static_mlflow_CreateRuns_Response_descriptor =
+      internal_static_mlflow_CreateRuns_descriptor.getNestedTypes().get(1);
+    internal_static_mlflow_CreateRuns_Response_fieldAccessorTable = new
+      com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
+        internal_static_mlflow_CreateRuns_Response_descriptor,
+        new java.lang.String[] { "Runs", });
+    internal_static_mlflow_UpdateRun_descriptor =
+      getDescriptor().getMessageTypes().get(16);
     internal_static_mlflow_UpdateRun_fieldAccessorTable = new
       com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
         internal_static_mlflow_UpdateRun_descriptor,
@@ -49845,7 +54369,7 @@ public final class Service {
         internal_static_mlflow_UpdateRun_Response_descriptor,
         new java.lang.String[] { "RunInfo", });
     internal_static_mlflow_DeleteRun_descriptor =
-      getDescriptor().getMessageTypes().get(16);
+      getDescriptor().getMessageTypes().get(17);
     internal_static_mlflow_DeleteRun_fieldAccessorTable = new
       com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
         internal_static_mlflow_DeleteRun_descriptor,
@@ -49857,7 +54381,7 @@ public final class Service {
         internal_static_mlflow_DeleteRun_Response_descriptor,
         new java.lang.String[] { });
     internal_static_mlflow_RestoreRun_descriptor =
-      getDescriptor().getMessageTypes().get(17);
+      getDescriptor().getMessageTypes().get(18);
     internal_static_mlflow_RestoreRun_fieldAccessorTable = new
       com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
         internal_static_mlflow_RestoreRun_descriptor,
@@ -49869,7 +54393,7 @@ public final class Service {
         internal_static_mlflow_RestoreRun_Response_descriptor,
         new java.lang.String[] { });
     internal_static_mlflow_LogMetric_descriptor =
-      getDescriptor().getMessageTypes().get(18);
+      getDescriptor().getMessageTypes().get(19);
     internal_static_mlflow_LogMetric_fieldAccessorTable = new
       com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
         internal_static_mlflow_LogMetric_descriptor,
@@ -49881,7 +54405,7 @@ public final class Service {
         internal_static_mlflow_LogMetric_Response_descriptor,
         new java.lang.String[] { });
     internal_static_mlflow_LogParam_descriptor =
-      getDescriptor().getMessageTypes().get(19);
+      getDescriptor().getMessageTypes().get(20);
     internal_static_mlflow_LogParam_fieldAccessorTable = new
       com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
         internal_static_mlflow_LogParam_descriptor,
@@ -49893,7 +54417,7 @@ public final class Service {
         internal_static_mlflow_LogParam_Response_descriptor,
         new java.lang.String[] { });
     internal_static_mlflow_SetExperimentTag_descriptor =
-      getDescriptor().getMessageTypes().get(20);
+      getDescriptor().getMessageTypes().get(21);
     internal_static_mlflow_SetExperimentTag_fieldAccessorTable = new
       com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
         internal_static_mlflow_SetExperimentTag_descriptor,
@@ -49905,7 +54429,7 @@ public final class Service {
         internal_static_mlflow_SetExperimentTag_Response_descriptor,
         new java.lang.String[] { });
     internal_static_mlflow_SetTag_descriptor =
-      getDescriptor().getMessageTypes().get(21);
+      getDescriptor().getMessageTypes().get(22);
     internal_static_mlflow_SetTag_fieldAccessorTable = new
       com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
         internal_static_mlflow_SetTag_descriptor,
@@ -49917,7 +54441,7 @@ public final class Service {
         internal_static_mlflow_SetTag_Response_descriptor,
         new java.lang.String[] { });
     internal_static_mlflow_DeleteTag_descriptor =
-      getDescriptor().getMessageTypes().get(22);
+      getDescriptor().getMessageTypes().get(23);
     internal_static_mlflow_DeleteTag_fieldAccessorTable = new
       com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
         internal_static_mlflow_DeleteTag_descriptor,
@@ -49929,7 +54453,7 @@ public final class Service {
         internal_static_mlflow_DeleteTag_Response_descriptor,
         new java.lang.String[] { });
     internal_static_mlflow_GetRun_descriptor =
-      getDescriptor().getMessageTypes().get(23);
+      getDescriptor().getMessageTypes().get(24);
     internal_static_mlflow_GetRun_fieldAccessorTable = new
       com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
         internal_static_mlflow_GetRun_descriptor,
@@ -49941,7 +54465,7 @@ public final class Service {
         internal_static_mlflow_GetRun_Response_descriptor,
         new java.lang.String[] { "Run", });
     internal_static_mlflow_SearchRuns_descriptor =
-      getDescriptor().getMessageTypes().get(24);
+      getDescriptor().getMessageTypes().get(25);
     internal_static_mlflow_SearchRuns_fieldAccessorTable = new
       com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
         internal_static_mlflow_SearchRuns_descriptor,
@@ -49953,7 +54477,7 @@ public final class Service {
         internal_static_mlflow_SearchRuns_Response_descriptor,
         new java.lang.String[] { "Runs", "NextPageToken", });
     internal_static_mlflow_ListArtifacts_descriptor =
-      getDescriptor().getMessageTypes().get(25);
+      getDescriptor().getMessageTypes().get(26);
     internal_static_mlflow_ListArtifacts_fieldAccessorTable = new
       com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
         internal_static_mlflow_ListArtifacts_descriptor,
@@ -49965,13 +54489,13 @@ public final class Service {
         internal_static_mlflow_ListArtifacts_Response_descriptor,
         new java.lang.String[] { "RootUri", "Files", "NextPageToken", });
     internal_static_mlflow_FileInfo_descriptor =
-      getDescriptor().getMessageTypes().get(26);
+      getDescriptor().getMessageTypes().get(27);
     internal_static_mlflow_FileInfo_fieldAccessorTable = new
       com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
         internal_static_mlflow_FileInfo_descriptor,
         new java.lang.String[] { "Path", "IsDir", "FileSize", });
     internal_static_mlflow_GetMetricHistory_descriptor =
-      getDescriptor().getMessageTypes().get(27);
+      getDescriptor().getMessageTypes().get(28);
     internal_static_mlflow_GetMetricHistory_fieldAccessorTable = new
       com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
         internal_static_mlflow_GetMetricHistory_descriptor,
@@ -49983,7 +54507,7 @@ public final class Service {
         internal_static_mlflow_GetMetricHistory_Response_descriptor,
         new java.lang.String[] { "Metrics", });
     internal_static_mlflow_LogBatch_descriptor =
-      getDescriptor().getMessageTypes().get(28);
+      getDescriptor().getMessageTypes().get(29);
     internal_static_mlflow_LogBatch_fieldAccessorTable = new
       com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
         internal_static_mlflow_LogBatch_descriptor,
@@ -49995,7 +54519,7 @@ public final class Service {
         internal_static_mlflow_LogBatch_Response_descriptor,
         new java.lang.String[] { });
     internal_static_mlflow_LogModel_descriptor =
-      getDescriptor().getMessageTypes().get(29);
+      getDescriptor().getMessageTypes().get(30);
     internal_static_mlflow_LogModel_fieldAccessorTable = new
       com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
         internal_static_mlflow_LogModel_descriptor,
@@ -50007,7 +54531,7 @@ public final class Service {
         internal_static_mlflow_LogModel_Response_descriptor,
         new java.lang.String[] { });
     internal_static_mlflow_GetExperimentByName_descriptor =
-      getDescriptor().getMessageTypes().get(30);
+      getDescriptor().getMessageTypes().get(31);
     internal_static_mlflow_GetExperimentByName_fieldAccessorTable = new
       com.google.protobuf.GeneratedMessageV3.FieldAccessorTable(
         internal_static_mlflow_GetExperimentByName_descriptor,
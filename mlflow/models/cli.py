@@ -4,6 +4,11 @@ import os
 
 from mlflow.models import Model
 from mlflow.models.model import MLMODEL_FILE_NAME
+from mlflow.models.model_cache import (
+    LocalModelCache,
+    MODEL_CACHE_DIR_ENV_VAR,
+    MODEL_CACHE_MAX_BYTES_ENV_VAR,
+)
 from mlflow.store.artifact.models_artifact_repo import ModelsArtifactRepository
 from mlflow.tracking.artifact_utils import _download_artifact_from_uri
 from mlflow.utils import cli_args
@@ -32,8 +37,20 @@ def commands():
 @cli_args.NO_CONDA
 @cli_args.INSTALL_MLFLOW
 @cli_args.ENABLE_MLSERVER
+@cli_args.MAX_BATCH_SIZE
+@cli_args.MAX_BATCH_DELAY
+@cli_args.PRELOAD_MODEL
 def serve(
-    model_uri, port, host, workers, no_conda=False, install_mlflow=False, enable_mlserver=False
+    model_uri,
+    port,
+    host,
+    workers,
+    no_conda=False,
+    install_mlflow=False,
+    enable_mlserver=False,
+    max_batch_size=None,
+    max_batch_delay_ms=None,
+    preload_model=False,
 ):
     """
     Serve a model saved with MLflow by launching a webserver on the specified host and port.
@@ -43,6 +60,14 @@ def serve(
 
     You can make requests to ``POST /invocations`` in pandas split- or record-oriented formats.
 
+    With ``--max-batch-size``, the inputs of concurrent requests to a ``python_function`` model are
+    merged into batches that are passed to the model at once, and the distribution of batch sizes
+    is exposed on ``GET /metrics``.
+
+    With ``--preload-model``, a ``python_function`` model is loaded once before the gunicorn
+    workers are forked, and the workers share its memory. The model load time and the memory
+    usage of each worker are logged and exposed on ``GET /metrics``.
+
     Example:
 
     .. code-block:: bash
@@ -55,7 +80,13 @@ def serve(
         }'
     """
     return _get_flavor_backend(
-        model_uri, no_conda=no_conda, workers=workers, install_mlflow=install_mlflow
+        model_uri,
+        no_conda=no_conda,
+        workers=workers,
+        install_mlflow=install_mlflow,
+        max_batch_size=max_batch_size,
+        max_batch_delay_ms=max_batch_delay_ms,
+        preload_model=preload_model,
     ).serve(model_uri=model_uri, port=port, host=host, enable_mlserver=enable_mlserver)
 
 
@@ -124,6 +155,27 @@ def prepare_env(model_uri, no_conda, install_mlflow):
     ).prepare_env(model_uri=model_uri)
 
 
+@commands.command("warm-cache")
+@cli_args.MODEL_URI
+@click.option(
+    "--cache-dir",
+    envvar=MODEL_CACHE_DIR_ENV_VAR,
+    required=True,
+    help="Directory of the local model cache. Defaults to the value of the "
+    f"{MODEL_CACHE_DIR_ENV_VAR} environment variable.",
+)
+def warm_cache(model_uri, cache_dir):
+    """
+    Download the model to the local model cache, unless it is already cached, and print its local
+    path. When the MLFLOW_MODEL_CACHE_DIR environment variable is set to the cache directory,
+    ``mlflow.pyfunc.load_model`` and the ``load_model`` functions of the model flavors load cached
+    models from the cache instead of downloading them.
+    """
+    max_bytes = os.environ.get(MODEL_CACHE_MAX_BYTES_ENV_VAR)
+    model_cache = LocalModelCache(cache_dir, int(max_bytes) if max_bytes else None)
+    click.echo(model_cache.download(model_uri))
+
+
 @commands.command("build-docker")
 @cli_args.MODEL_URI
 @click.option("--name", "-n", default="mlflow-pyfunc-servable", help="Name to use for built image")
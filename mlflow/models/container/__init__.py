@@ -37,6 +37,7 @@ SUPPORTED_FLAVORS = [pyfunc.FLAVOR_NAME, mleap.FLAVOR_NAME]
 
 DISABLE_NGINX = "DISABLE_NGINX"
 ENABLE_MLSERVER = "ENABLE_MLSERVER"
+PRELOAD_MODEL = "PRELOAD_MODEL"
 
 SERVING_ENVIRONMENT = "SERVING_ENVIRONMENT"
 
@@ -171,7 +172,13 @@ def _serve_pyfunc(model):
     # Since MLServer will run without NGINX, expose the server in the `8080`
     # port, which is the assumed "public" port.
     port = DEFAULT_MLSERVER_PORT if enable_mlserver else DEFAULT_INFERENCE_SERVER_PORT
-    cmd, cmd_env = inference_server.get_cmd(model_uri=MODEL_PATH, nworkers=cpu_count, port=port)
+    cmd, cmd_env = inference_server.get_cmd(
+        model_uri=MODEL_PATH,
+        nworkers=cpu_count,
+        port=port,
+        # Loading the model once before forking avoids keeping a copy of it per CPU
+        preload_model=os.getenv(PRELOAD_MODEL, "false").lower() == "true",
+    )
 
     bash_cmds.append(cmd)
     inference_server_process = Popen(["/bin/bash", "-c", " && ".join(bash_cmds)], env=cmd_env)
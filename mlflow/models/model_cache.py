@@ -0,0 +1,230 @@
+"""
+On-disk cache of the models downloaded by ``mlflow.pyfunc.load_model`` and the ``load_model``
+functions of the model flavors.
+
+The cache is enabled by setting the ``MLFLOW_MODEL_CACHE_DIR`` environment variable to the
+directory of the cache, which can be shared by concurrent processes. ``models:/`` and ``runs:/``
+URIs are resolved to the artifact location of the model, and the model is cached under a key
+derived from this location and a fingerprint of its contents: the paths and sizes of its files, as
+reported by the artifact repository. Loading a cached model thus only requires reading this
+metadata, instead of downloading the model again. Models that are already on the local filesystem
+are not cached.
+
+The total size of the cached models can be bounded with the ``MLFLOW_MODEL_CACHE_MAX_BYTES``
+environment variable, in which case the least recently used models are evicted first. Cached
+models must not be modified.
+"""
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import time
+
+from mlflow.store.artifact.artifact_repository_registry import get_artifact_repository
+from mlflow.store.artifact.models_artifact_repo import ModelsArtifactRepository
+from mlflow.store.artifact.runs_artifact_repo import RunsArtifactRepository
+from mlflow.store.artifact.utils.models import is_using_databricks_registry
+from mlflow.utils.file_utils import exclusive_lock, get_local_path_or_none
+
+_logger = logging.getLogger(__name__)
+
+MODEL_CACHE_DIR_ENV_VAR = "MLFLOW_MODEL_CACHE_DIR"
+MODEL_CACHE_MAX_BYTES_ENV_VAR = "MLFLOW_MODEL_CACHE_MAX_BYTES"
+
+# Models used more recently than this are never evicted, since they may still be being loaded
+_MIN_EVICTION_AGE_SECONDS = 10 * 60
+# Temporary download directories left by processes that failed are deleted after this time
+_STALE_DOWNLOAD_AGE_SECONDS = 24 * 60 * 60
+
+_ENTRY_METADATA_FILE_NAME = "entry.json"
+_ENTRY_ARTIFACTS_DIR_NAME = "artifacts"
+_TEMP_DIR_PREFIX = ".download-"
+_EVICTION_LOCK_FILE_NAME = ".eviction.lock"
+
+
+def resolve_model_uri(model_uri):
+    """
+    Resolve a ``models:/`` or ``runs:/`` URI to the URI of the artifact location of the model.
+
+    :return: The URI of the artifact location of the model, or ``None`` if it cannot be resolved,
+             e.g. for models of the Databricks model registry.
+    """
+    if ModelsArtifactRepository.is_models_uri(model_uri):
+        if is_using_databricks_registry(model_uri):
+            return None
+        return ModelsArtifactRepository.get_underlying_uri(model_uri)
+    if RunsArtifactRepository.is_runs_uri(model_uri):
+        return RunsArtifactRepository.get_underlying_uri(model_uri)
+    return model_uri
+
+
+def _list_files(artifact_repo, path=None):
+    for file_info in artifact_repo.list_artifacts(path):
+        if file_info.is_dir:
+            yield from _list_files(artifact_repo, file_info.path)
+        else:
+            yield file_info.path, file_info.file_size
+
+
+def _get_dir_size(path):
+    return sum(
+        os.path.getsize(os.path.join(root, name))
+        for root, _, names in os.walk(path)
+        for name in names
+    )
+
+
+def _read_entry_metadata(entry_dir):
+    try:
+        with open(os.path.join(entry_dir, _ENTRY_METADATA_FILE_NAME)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+class LocalModelCache:
+    """
+    Caches downloaded models in a local directory. Each model is downloaded to a temporary
+    directory, then renamed to the directory of its entry in the cache, so that concurrent
+    processes never observe a partially downloaded model. A file lock per entry ensures that each
+    model is downloaded once.
+    """
+
+    def __init__(self, root_dir, max_bytes=None):
+        """
+        :param root_dir: The directory of the cache, which is created if it does not exist.
+        :param max_bytes: The maximum total size of the cached models in bytes, or ``None`` for no
+                          limit. The limit may be exceeded by models that were used in the last
+                          10 minutes, which are never evicted.
+        """
+        self._root_dir = os.path.abspath(root_dir)
+        self._max_bytes = max_bytes
+        os.makedirs(self._root_dir, exist_ok=True)
+
+    @classmethod
+    def from_env(cls):
+        """
+        :return: The cache configured with the ``MLFLOW_MODEL_CACHE_DIR`` and
+                 ``MLFLOW_MODEL_CACHE_MAX_BYTES`` environment variables, or ``None`` if the cache
+                 is not enabled.
+        """
+        root_dir = os.environ.get(MODEL_CACHE_DIR_ENV_VAR)
+        if not root_dir:
+            return None
+        max_bytes = os.environ.get(MODEL_CACHE_MAX_BYTES_ENV_VAR)
+        return cls(root_dir, int(max_bytes) if max_bytes else None)
+
+    def download(self, model_uri):
+        """
+        Get the local path of the specified model from the cache, downloading it first if it is
+        not cached.
+
+        :param model_uri: The URI of the model.
+        :return: The local path of the model, which must not be modified. Models that are already
+                 on the local filesystem or that cannot be cached are downloaded to a new
+                 temporary directory instead, as by ``_download_artifact_from_uri``.
+        """
+        from mlflow.tracking.artifact_utils import _download_artifact_from_uri
+
+        artifact_uri = resolve_model_uri(model_uri)
+        if artifact_uri is None or get_local_path_or_none(artifact_uri) is not None:
+            return _download_artifact_from_uri(model_uri)
+
+        key = self._get_key(artifact_uri)
+        entry_dir = os.path.join(self._root_dir, key)
+        local_path = self._get_cached_path(entry_dir)
+        if local_path is not None:
+            return local_path
+
+        with exclusive_lock(entry_dir + ".lock"):
+            # Another process may have downloaded the model while we waited for the lock
+            local_path = self._get_cached_path(entry_dir)
+            if local_path is None:
+                local_path = self._add(entry_dir, artifact_uri)
+        if self._max_bytes is not None:
+            self._evict(keep=key)
+        return local_path
+
+    @staticmethod
+    def _get_key(artifact_uri):
+        files = sorted(_list_files(get_artifact_repository(artifact_uri)))
+        fingerprint = json.dumps([artifact_uri, files])
+        return hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _get_cached_path(entry_dir):
+        metadata = _read_entry_metadata(entry_dir)
+        if metadata is None:
+            return None
+        try:
+            # Record the time the model was last used, which is the order in which models are
+            # evicted
+            os.utime(entry_dir)
+        except OSError:
+            # The model was evicted by another process
+            return None
+        return os.path.join(entry_dir, _ENTRY_ARTIFACTS_DIR_NAME, metadata["path"])
+
+    def _add(self, entry_dir, artifact_uri):
+        from mlflow.tracking.artifact_utils import _download_artifact_from_uri
+
+        temp_dir = tempfile.mkdtemp(prefix=_TEMP_DIR_PREFIX, dir=self._root_dir)
+        try:
+            artifacts_dir = os.path.join(temp_dir, _ENTRY_ARTIFACTS_DIR_NAME)
+            os.mkdir(artifacts_dir)
+            local_path = _download_artifact_from_uri(artifact_uri, output_path=artifacts_dir)
+            metadata = {
+                "artifact_uri": artifact_uri,
+                "path": os.path.relpath(local_path, artifacts_dir),
+                "size": _get_dir_size(artifacts_dir),
+            }
+            with open(os.path.join(temp_dir, _ENTRY_METADATA_FILE_NAME), "w") as f:
+                json.dump(metadata, f)
+            os.rename(temp_dir, entry_dir)
+        except Exception:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+            # Without file locks, another process may have added the model first
+            local_path = self._get_cached_path(entry_dir)
+            if local_path is None:
+                raise
+            return local_path
+        return os.path.join(entry_dir, _ENTRY_ARTIFACTS_DIR_NAME, metadata["path"])
+
+    def _evict(self, keep):
+        with exclusive_lock(os.path.join(self._root_dir, _EVICTION_LOCK_FILE_NAME)):
+            now = time.time()
+            entries = []
+            for dir_entry in os.scandir(self._root_dir):
+                if not dir_entry.is_dir():
+                    continue
+                if dir_entry.name.startswith(_TEMP_DIR_PREFIX):
+                    if dir_entry.stat().st_mtime < now - _STALE_DOWNLOAD_AGE_SECONDS:
+                        shutil.rmtree(dir_entry.path, ignore_errors=True)
+                    continue
+                metadata = _read_entry_metadata(dir_entry.path)
+                if metadata is not None:
+                    entries.append((dir_entry.stat().st_mtime, dir_entry.name, metadata["size"]))
+
+            total_size = sum(size for _, _, size in entries)
+            min_last_used_time = now - _MIN_EVICTION_AGE_SECONDS
+            for last_used_time, key, size in sorted(entries):
+                if total_size <= self._max_bytes or last_used_time > min_last_used_time:
+                    break
+                if key != keep:
+                    self._remove(key)
+                    total_size -= size
+
+    def _remove(self, key):
+        entry_dir = os.path.join(self._root_dir, key)
+        with exclusive_lock(entry_dir + ".lock"):
+            # Rename the entry first, so that other processes never observe a partially removed
+            # model
+            temp_dir = tempfile.mkdtemp(prefix=_TEMP_DIR_PREFIX, dir=self._root_dir)
+            os.rename(entry_dir, os.path.join(temp_dir, key))
+            # NB: A process that locks a new lock file while we hold this one may download the
+            # model concurrently, in which case the model it fails to rename is discarded
+            os.remove(entry_dir + ".lock")
+        _logger.debug("Evicted model %s from the model cache", key)
+        shutil.rmtree(temp_dir, ignore_errors=True)
@@ -32,7 +32,7 @@ from mlflow.utils.docstring_utils import format_docstring, LOG_MODEL_PARAM_DOCS
 from mlflow.models.signature import ModelSignature
 from mlflow.models.utils import _save_example
 from mlflow.models import Model, ModelInputExample
-from mlflow.tracking.artifact_utils import _download_artifact_from_uri
+from mlflow.tracking.artifact_utils import _download_model_from_uri
 from mlflow.utils.model_utils import _get_flavor_configuration
 from mlflow.models.model import MLMODEL_FILE_NAME
 from mlflow.exceptions import MlflowException
@@ -282,7 +282,7 @@ def load_model(model_uri, dst_path=None):
 
     :return: A Prophet model instance
     """
-    local_model_path = _download_artifact_from_uri(artifact_uri=model_uri, output_path=dst_path)
+    local_model_path = _download_model_from_uri(model_uri, output_path=dst_path)
     flavor_conf = _get_flavor_configuration(model_path=local_model_path, flavor_name=FLAVOR_NAME)
     pr_model_path = os.path.join(
         local_model_path, flavor_conf.get(_MODEL_BINARY_KEY, _MODEL_BINARY_FILE_NAME)
@@ -227,7 +227,7 @@ from mlflow.pyfunc.model import (  # pylint: disable=unused-import
     get_default_conda_env,
 )
 from mlflow.pyfunc.model import get_default_pip_requirements
-from mlflow.tracking.artifact_utils import _download_artifact_from_uri
+from mlflow.tracking.artifact_utils import _download_artifact_from_uri, _download_model_from_uri
 from mlflow.types import DataType, Schema, TensorSpec
 from mlflow.types.utils import clean_tensor_type
 from mlflow.utils import PYTHON_VERSION, get_major_minor_py_version
@@ -452,6 +452,90 @@ def _enforce_col_schema(pfInput: PyFuncInput, input_schema: Schema):
     return new_pfInput
 
 
+def _compile_mlflow_datatype_converter(name, dtype, t: DataType):
+    """
+    Compile the conversion ``_enforce_mlflow_datatype`` applies to columns of the given dtype.
+
+    :return: ``None`` if columns of type ``dtype`` already conform to ``t``, or a function
+             converting the values of such columns to ``t``.
+    """
+
+    def enforce(values):
+        return _enforce_mlflow_datatype(name, values, t)
+
+    if dtype == np.object and t not in (DataType.binary, DataType.string):
+        # The conversion of object columns depends on the types of their values
+        return enforce
+    empty_values = pandas.Series([], dtype=dtype)
+    try:
+        converted = _enforce_mlflow_datatype(name, empty_values, t)
+    except MlflowException:
+        # Raise the error from the actual values, the error message may depend on them
+        return enforce
+    if converted is empty_values:
+        return None
+    target_dtype = converted.dtype
+
+    def convert(values):
+        return values.astype(target_dtype, errors="raise")
+
+    return convert
+
+
+class _ColSchemaEnforcementPlan(object):
+    """
+    Enforcement of a column-based signature, compiled once per model.
+
+    The conversion of each column only depends on the column dtype and on the declared type, so
+    the converters are derived from ``_enforce_mlflow_datatype`` once for every combination of
+    input columns and dtypes and reused for subsequent inputs. Columns that already conform to the
+    schema are not converted, and the input is returned as is if none of its columns needs to be
+    converted, dropped or reordered.
+    """
+
+    _MAX_CACHED_INPUT_SIGNATURES = 128
+
+    def __init__(self, input_schema: Schema):
+        self.input_schema = input_schema
+        self._input_types = input_schema.input_types()
+        self._input_names = input_schema.input_names() if input_schema.has_input_names() else None
+        self._converters = {}
+
+    def _get_converters(self, pfInput: pandas.DataFrame, input_names):
+        input_signature = (tuple(pfInput.columns), tuple(pfInput.dtypes))
+        converters = self._converters.get(input_signature)
+        if converters is None:
+            converters = [
+                _compile_mlflow_datatype_converter(x, pfInput[x].dtype, t)
+                for x, t in zip(input_names, self._input_types)
+            ]
+            if len(self._converters) >= self._MAX_CACHED_INPUT_SIGNATURES:
+                self._converters.clear()
+            self._converters[input_signature] = converters
+        return converters
+
+    def enforce(self, pfInput: pandas.DataFrame):
+        if not pfInput.columns.is_unique:
+            return _enforce_col_schema(pfInput, self.input_schema)
+        if self._input_names is None:
+            input_names = list(pfInput.columns[: len(self._input_types)])
+        else:
+            input_names = self._input_names
+        converters = self._get_converters(pfInput, input_names)
+        if all(convert is None for convert in converters):
+            if list(pfInput.columns) == input_names:
+                # NB: Return a copy so that callers never mutate the DataFrame they passed in
+                return pfInput.copy(deep=False)
+            return pfInput[input_names]
+        return pandas.DataFrame(
+            {
+                x: pfInput[x] if convert is None else convert(pfInput[x])
+                for x, convert in zip(input_names, converters)
+            },
+            columns=input_names,
+        )
+
+
 def _enforce_tensor_schema(pfInput: PyFuncInput, input_schema: Schema):
     """Enforce the input tensor(s) conforms to the model's tensor-based signature."""
     if input_schema.has_input_names():
@@ -493,7 +577,11 @@ def _enforce_tensor_schema(pfInput: PyFuncInput, input_schema: Schema):
     return new_pfInput
 
 
-def _enforce_schema(pfInput: PyFuncInput, input_schema: Schema):
+def _enforce_schema(
+    pfInput: PyFuncInput,
+    input_schema: Schema,
+    col_schema_plan: "_ColSchemaEnforcementPlan" = None,
+):
     """
     Enforces the provided input matches the model's input schema,
 
@@ -505,6 +593,9 @@ def _enforce_schema(pfInput: PyFuncInput, input_schema: Schema):
 
     For tensor-based signatures, we make sure the shape and type of the input matches the shape
     and type specified in model's input schema.
+
+    If provided, ``col_schema_plan`` is the compiled enforcement of the column-based signature
+    ``input_schema``.
     """
     if not input_schema.is_tensor_spec():
         if isinstance(pfInput, (list, np.ndarray, dict)):
@@ -556,11 +647,11 @@ def _enforce_schema(pfInput: PyFuncInput, input_schema: Schema):
                 "only verify their count.".format(len(input_schema.inputs), num_actual_columns)
             )
 
-    return (
-        _enforce_tensor_schema(pfInput, input_schema)
-        if input_schema.is_tensor_spec()
-        else _enforce_col_schema(pfInput, input_schema)
-    )
+    if input_schema.is_tensor_spec():
+        return _enforce_tensor_schema(pfInput, input_schema)
+    if col_schema_plan is not None:
+        return col_schema_plan.enforce(pfInput)
+    return _enforce_col_schema(pfInput, input_schema)
 
 
 class PyFuncModel(object):
@@ -585,6 +676,19 @@ class PyFuncModel(object):
             raise MlflowException("Model is missing metadata.")
         self._model_meta = model_meta
         self._model_impl = model_impl
+        self._col_schema_plan = None
+        self._get_col_schema_plan(model_meta.get_input_schema())
+
+    def _get_col_schema_plan(self, input_schema):
+        """
+        :return: The enforcement plan of the column-based ``input_schema``, compiled on first use
+                 and again only if the signature of the model is replaced.
+        """
+        if input_schema is None or input_schema.is_tensor_spec():
+            return None
+        if self._col_schema_plan is None or self._col_schema_plan.input_schema is not input_schema:
+            self._col_schema_plan = _ColSchemaEnforcementPlan(input_schema)
+        return self._col_schema_plan
 
     def predict(self, data: PyFuncInput) -> PyFuncOutput:
         """
@@ -601,7 +705,7 @@ class PyFuncModel(object):
         """
         input_schema = self.metadata.get_input_schema()
         if input_schema is not None:
-            data = _enforce_schema(data, input_schema)
+            data = _enforce_schema(data, input_schema, self._get_col_schema_plan(input_schema))
         return self._model_impl.predict(data)
 
     @property
@@ -648,7 +752,7 @@ def load_model(model_uri: str, suppress_warnings: bool = True, dst_path: str = N
                      This directory must already exist. If unspecified, a local output
                      path will be created.
     """
-    local_path = _download_artifact_from_uri(artifact_uri=model_uri, output_path=dst_path)
+    local_path = _download_model_from_uri(model_uri, output_path=dst_path)
     model_meta = Model.load(os.path.join(local_path, MLMODEL_FILE_NAME))
 
     conf = model_meta.flavors.get(FLAVOR_NAME)
@@ -734,6 +838,14 @@ def spark_udf(spark, model_uri, result_type="double"):
     converted to string. If the result type is not an array type, the left most column with
     matching type is returned.
 
+    On Spark 3.0 and above, the UDF processes the batches of each task as an iterator, so the model
+    is fetched once per task rather than once per batch. The model is loaded once per Python worker,
+    and all the Python workers of an executor share the same extracted copy of the model files.
+    Loaded models are cached by each Python worker. The cache can be bounded by setting the
+    ``MLFLOW_SPARK_MODEL_CACHE_SIZE`` (number of models) or ``MLFLOW_SPARK_MODEL_CACHE_MAX_BYTES``
+    (total size of the model files) environment variables on the executors, in which case the
+    least recently used models are evicted first.
+
     NOTE: Inputs of type ``pyspark.sql.types.DateType`` are not supported on earlier versions of
     Spark (2.4 and below).
 
@@ -794,8 +906,11 @@ def spark_udf(spark, model_uri, result_type="double"):
     # Scope Spark import to this method so users don't need pyspark to use non-Spark-related
     # functionality.
     import functools
+    import warnings
+    import pyspark
     from mlflow.pyfunc.spark_model_cache import SparkModelCache
-    from pyspark.sql.functions import pandas_udf
+    from packaging.version import Version
+    from pyspark.sql.functions import pandas_udf, PandasUDFType
     from pyspark.sql.types import _parse_datatype_string
     from pyspark.sql.types import ArrayType, DataType as SparkDataType
     from pyspark.sql.types import DoubleType, IntegerType, FloatType, LongType, StringType
@@ -823,8 +938,7 @@ def spark_udf(spark, model_uri, result_type="double"):
         archive_path = SparkModelCache.add_local_model(spark, local_model_path)
         model_metadata = Model.load(os.path.join(local_model_path, MLMODEL_FILE_NAME))
 
-    def predict(*args):
-        model = SparkModelCache.get_or_load(archive_path)
+    def predict(model, *args):
         input_schema = model.metadata.get_input_schema()
         pdf = None
 
@@ -863,15 +977,15 @@ def spark_udf(spark, model_uri, result_type="double"):
         if type(elem_type) == IntegerType:
             result = result.select_dtypes(
                 [np.byte, np.ubyte, np.short, np.ushort, np.int32]
-            ).astype(np.int32)
+            ).astype(np.int32, copy=False)
         elif type(elem_type) == LongType:
             result = result.select_dtypes([np.byte, np.ubyte, np.short, np.ushort, np.int, np.long])
 
         elif type(elem_type) == FloatType:
-            result = result.select_dtypes(include=(np.number,)).astype(np.float32)
+            result = result.select_dtypes(include=(np.number,)).astype(np.float32, copy=False)
 
         elif type(elem_type) == DoubleType:
-            result = result.select_dtypes(include=(np.number,)).astype(np.float64)
+            result = result.select_dtypes(include=(np.number,)).astype(np.float64, copy=False)
 
         if len(result.columns) == 0:
             raise MlflowException(
@@ -885,11 +999,31 @@ def spark_udf(spark, model_uri, result_type="double"):
             result = result.applymap(str)
 
         if type(result_type) == ArrayType:
-            return pandas.Series(result.to_numpy().tolist())
+            # NB: Each row is passed to Arrow as a view of the result array, which Arrow converts
+            # to a list value directly, rather than as a list of Python objects
+            return pandas.Series(list(result.to_numpy()), index=result.index)
         else:
             return result[result.columns[0]]
 
-    udf = pandas_udf(predict, result_type)
+    if Version(pyspark.__version__) >= Version("3.0.0"):
+
+        def predict_batches(iterator):
+            # Load the model once per Python worker and reuse it for all the batches of the task
+            model = SparkModelCache.get_or_load(archive_path)
+            for args in iterator:
+                yield predict(model, *(args if isinstance(args, tuple) else (args,)))
+
+        with warnings.catch_warnings():
+            # NB: The variable number of UDF arguments can not be expressed with the Python type
+            # hints Spark otherwise recommends to declare iterator UDFs with
+            warnings.simplefilter("ignore", UserWarning)
+            udf = pandas_udf(predict_batches, result_type, PandasUDFType.SCALAR_ITER)
+    else:
+
+        def predict_batch(*args):
+            return predict(SparkModelCache.get_or_load(archive_path), *args)
+
+        udf = pandas_udf(predict_batch, result_type)
     udf.metadata = model_metadata
 
     @functools.wraps(udf)
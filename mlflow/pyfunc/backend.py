@@ -21,11 +21,24 @@ class PyFuncBackend(FlavorBackend):
     Flavor backend implementation for the generic python models.
     """
 
-    def __init__(self, config, workers=1, no_conda=False, install_mlflow=False, **kwargs):
+    def __init__(
+        self,
+        config,
+        workers=1,
+        no_conda=False,
+        install_mlflow=False,
+        max_batch_size=None,
+        max_batch_delay_ms=None,
+        preload_model=False,
+        **kwargs,
+    ):
         super().__init__(config=config, **kwargs)
         self._nworkers = workers or 1
         self._no_conda = no_conda
         self._install_mlflow = install_mlflow
+        self._max_batch_size = max_batch_size
+        self._max_batch_delay_ms = max_batch_delay_ms
+        self._preload_model = preload_model
 
     def prepare_env(self, model_uri):
         local_path = _download_artifact_from_uri(model_uri)
@@ -71,7 +84,15 @@ class PyFuncBackend(FlavorBackend):
         local_path = _download_artifact_from_uri(model_uri)
 
         server_implementation = mlserver if enable_mlserver else scoring_server
-        command, command_env = server_implementation.get_cmd(local_path, port, host, self._nworkers)
+        command, command_env = server_implementation.get_cmd(
+            local_path,
+            port,
+            host,
+            self._nworkers,
+            max_batch_size=self._max_batch_size,
+            max_batch_delay_ms=self._max_batch_delay_ms,
+            preload_model=self._preload_model,
+        )
 
         if not self._no_conda and ENV in self._config:
             conda_env_path = os.path.join(local_path, self._config[ENV])
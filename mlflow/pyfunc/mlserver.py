@@ -7,7 +7,13 @@ MLServerDefaultModelName = "mlflow-model"
 
 
 def get_cmd(
-    model_uri: str, port: int = None, host: str = None, nworkers: int = None
+    model_uri: str,
+    port: int = None,
+    host: str = None,
+    nworkers: int = None,
+    max_batch_size: int = None,
+    max_batch_delay_ms: float = None,
+    preload_model: bool = False,  # pylint: disable=unused-argument
 ) -> Tuple[str, Dict[str, str]]:
     cmd = f"mlserver start {model_uri}"
 
@@ -24,6 +30,12 @@ def get_cmd(
     if nworkers:
         cmd_env["MLSERVER_MODEL_PARALLEL_WORKERS"] = str(nworkers)
 
+    # MLServer implements adaptive batching natively
+    if max_batch_size:
+        cmd_env["MLSERVER_MODEL_MAX_BATCH_SIZE"] = str(max_batch_size)
+        if max_batch_delay_ms is not None:
+            cmd_env["MLSERVER_MODEL_MAX_BATCH_TIME"] = str(max_batch_delay_ms / 1000)
+
     cmd_env["MLSERVER_MODEL_IMPLEMENTATION"] = MLServerMLflowRuntime
     cmd_env["MLSERVER_MODEL_URI"] = model_uri
 
@@ -3,12 +3,19 @@ Scoring server for python model format.
 The passed int model is expected to have function:
    predict(pandas.Dataframe) -> pandas.DataFrame
 
-Input, expected in text/csv or application/json format,
-is parsed into pandas.DataFrame and passed to the model.
+Input, expected in text/csv, application/json, Arrow IPC stream or Parquet format,
+is parsed into pandas.DataFrame and passed to the model. Input in .npy or .npz format
+is parsed into numpy arrays and passed to the model without going through a DataFrame.
+Predictions are returned as JSON, or in one of the binary formats if requested through
+the Accept header.
 
 Defines two endpoints:
     /ping used for health check
     /invocations used for scoring
+
+If dynamic batching is enabled, the inputs of concurrent requests are merged into batches before
+being passed to the model, and the distribution of batch sizes is exposed on the /metrics endpoint
+along with the model load time and memory usage of the worker.
 """
 from collections import OrderedDict
 from typing import Tuple, Dict
@@ -31,9 +38,8 @@ from mlflow.types import Schema
 from mlflow.utils import reraise
 from mlflow.utils.file_utils import path_to_local_file_uri
 from mlflow.utils.proto_json_utils import (
-    NumpyEncoder,
     _dataframe_from_json,
-    _get_jsonable_obj,
+    _dumps_jsonable_obj,
     parse_tf_serving_input,
 )
 
@@ -43,24 +49,58 @@ except ImportError:
     from mlflow.pyfunc import load_pyfunc as load_model
 from mlflow.protos.databricks_pb2 import BAD_REQUEST
 from mlflow.server.handlers import catch_mlflow_exception
+from mlflow.pyfunc.scoring_server.batching import (
+    MAX_BATCH_DELAY_ENV_KEY,
+    MAX_BATCH_SIZE_ENV_KEY,
+    PredictionBatcher,
+    get_batching_config_from_env,
+)
+from mlflow.pyfunc.scoring_server.parsing import dataframe_from_decoded_json, decode_json
+from mlflow.pyfunc.scoring_server.preloading import (
+    PRELOAD_MODEL_ENV_KEY,
+    load_server_model,
+    worker_stats_to_prometheus,
+)
 
 try:
     from StringIO import StringIO
 except ImportError:
     from io import StringIO
+from io import BytesIO
 
 _SERVER_MODEL_PATH = "__pyfunc_model_path__"
 
+# Maximum number of threads of each gunicorn worker when dynamic batching is enabled
+_MAX_BATCHING_THREADS = 32
+
 CONTENT_TYPE_CSV = "text/csv"
 CONTENT_TYPE_JSON = "application/json"
 CONTENT_TYPE_JSON_RECORDS_ORIENTED = "application/json; format=pandas-records"
 CONTENT_TYPE_JSON_SPLIT_ORIENTED = "application/json; format=pandas-split"
 CONTENT_TYPE_JSON_SPLIT_NUMPY = "application/json-numpy-split"
+CONTENT_TYPE_ARROW_STREAM = "application/vnd.apache.arrow.stream"
+CONTENT_TYPE_PARQUET = "application/vnd.apache.parquet"
+CONTENT_TYPE_NPY = "application/x-npy"
+CONTENT_TYPE_NPZ = "application/x-npz"
 
 CONTENT_TYPES = [
     CONTENT_TYPE_CSV,
     CONTENT_TYPE_JSON,
     CONTENT_TYPE_JSON_SPLIT_NUMPY,
+    CONTENT_TYPE_ARROW_STREAM,
+    CONTENT_TYPE_PARQUET,
+    CONTENT_TYPE_NPY,
+    CONTENT_TYPE_NPZ,
+]
+
+# Formats the predictions can be returned in, negotiated through the Accept header of the request.
+# JSON is returned if the request does not express any preference.
+RESPONSE_CONTENT_TYPES = [
+    CONTENT_TYPE_JSON,
+    CONTENT_TYPE_ARROW_STREAM,
+    CONTENT_TYPE_PARQUET,
+    CONTENT_TYPE_NPY,
+    CONTENT_TYPE_NPZ,
 ]
 
 CONTENT_TYPE_FORMAT_RECORDS_ORIENTED = "pandas-records"
@@ -79,8 +119,13 @@ def infer_and_parse_json_input(json_input, schema: Schema = None):
                        DataFrame, or a stream containing such a string representation.
     :param schema: Optional schema specification to be used during parsing.
     """
+    # NB: The payload is decoded like pandas does, so that DataFrames can be built from the decoded
+    # values. TF serving inputs are parsed from the same decoded values
+    pandas_decoded_input = decode_json(json_input)
     try:
-        decoded_input = json.loads(json_input)
+        decoded_input = (
+            json.loads(json_input) if pandas_decoded_input is None else pandas_decoded_input
+        )
     except json.decoder.JSONDecodeError:
         _handle_serving_error(
             error_message=(
@@ -91,7 +136,9 @@ def infer_and_parse_json_input(json_input, schema: Schema = None):
         )
 
     if isinstance(decoded_input, list):
-        return parse_json_input(json_input=json_input, orient="records", schema=schema)
+        return _parse_decoded_json_input(
+            json_input, pandas_decoded_input, orient="records", schema=schema
+        )
     elif isinstance(decoded_input, dict):
         if "instances" in decoded_input or "inputs" in decoded_input:
             try:
@@ -102,7 +149,9 @@ def infer_and_parse_json_input(json_input, schema: Schema = None):
                     error_code=BAD_REQUEST,
                 )
         else:
-            return parse_json_input(json_input=json_input, orient="split", schema=schema)
+            return _parse_decoded_json_input(
+                json_input, pandas_decoded_input, orient="split", schema=schema
+            )
     else:
         _handle_serving_error(
             error_message=(
@@ -121,9 +170,26 @@ def parse_json_input(json_input, orient="split", schema: Schema = None):
                    or 'records'.
     :param schema: Optional schema specification to be used during parsing.
     """
+    if hasattr(json_input, "read"):
+        json_input = json_input.read()
+    # Payloads that are not JSON strings (e.g. paths to JSON files) are left to pandas
+    decoded_input = decode_json(json_input)
+    return _parse_decoded_json_input(json_input, decoded_input, orient=orient, schema=schema)
 
+
+def _parse_decoded_json_input(json_input, decoded_input, orient, schema: Schema = None):
+    """
+    Parse a JSON-serialized Pandas DataFrame that has already been decoded into ``decoded_input``.
+    The DataFrame is built from the decoded structure if possible, and ``json_input`` is parsed
+    with Pandas otherwise.
+    """
     try:
-        return _dataframe_from_json(json_input, pandas_orient=orient, schema=schema)
+        df = None
+        if decoded_input is not None:
+            df = dataframe_from_decoded_json(decoded_input, orient=orient, schema=schema)
+        if df is None:
+            df = _dataframe_from_json(json_input, pandas_orient=orient, schema=schema)
+        return df
     except Exception:
         _handle_serving_error(
             error_message=(
@@ -180,12 +246,162 @@ def parse_split_oriented_json_input_to_numpy(json_input):
         )
 
 
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.ipc
+        import pyarrow.parquet
+
+        return pyarrow
+    except ImportError:
+        _handle_serving_error(
+            error_message=(
+                "The Arrow and Parquet formats require the `pyarrow` package to be installed in"
+                " the environment of the model."
+            ),
+            error_code=BAD_REQUEST,
+            include_traceback=False,
+        )
+
+
+def parse_arrow_stream_input(arrow_input):
+    """
+    :param arrow_input: Bytes of a Pandas DataFrame serialized in the Arrow IPC streaming format.
+    """
+    pyarrow = _import_pyarrow()
+    try:
+        return pyarrow.ipc.open_stream(arrow_input).read_pandas()
+    except Exception:
+        _handle_serving_error(
+            error_message=(
+                "Failed to parse input as a Pandas DataFrame. Ensure that the input is a valid"
+                " Arrow IPC stream produced using e.g. `pyarrow.ipc.new_stream()`."
+            ),
+            error_code=BAD_REQUEST,
+        )
+
+
+def parse_parquet_input(parquet_input):
+    """
+    :param parquet_input: Bytes of a Pandas DataFrame serialized in the Parquet format.
+    """
+    pyarrow = _import_pyarrow()
+    try:
+        return pyarrow.parquet.read_table(pyarrow.BufferReader(parquet_input)).to_pandas()
+    except Exception:
+        _handle_serving_error(
+            error_message=(
+                "Failed to parse input as a Pandas DataFrame. Ensure that the input is a valid"
+                " Parquet file produced using the `pandas.DataFrame.to_parquet()` method."
+            ),
+            error_code=BAD_REQUEST,
+        )
+
+
+def parse_npy_input(npy_input):
+    """
+    :param npy_input: Bytes of a Numpy array serialized with `numpy.save()`.
+    """
+    try:
+        return np.load(BytesIO(npy_input), allow_pickle=False)
+    except Exception:
+        _handle_serving_error(
+            error_message=(
+                "Failed to parse input as a Numpy array. Ensure that the input is a valid .npy"
+                " file produced using the `numpy.save()` method. Object arrays are not supported."
+            ),
+            error_code=BAD_REQUEST,
+        )
+
+
+def parse_npz_input(npz_input):
+    """
+    :param npz_input: Bytes of named Numpy arrays serialized with `numpy.savez()`.
+    :return: A dictionary mapping each name to its array.
+    """
+    try:
+        with np.load(BytesIO(npz_input), allow_pickle=False) as arrays:
+            return {name: arrays[name] for name in arrays.files}
+    except Exception:
+        _handle_serving_error(
+            error_message=(
+                "Failed to parse input as a dictionary of Numpy arrays. Ensure that the input is"
+                " a valid .npz file produced using the `numpy.savez()` method. Object arrays are"
+                " not supported."
+            ),
+            error_code=BAD_REQUEST,
+        )
+
+
+def _predictions_to_dataframe(raw_predictions):
+    if isinstance(raw_predictions, pd.DataFrame):
+        return raw_predictions
+    if isinstance(raw_predictions, pd.Series):
+        return raw_predictions.to_frame()
+    if isinstance(raw_predictions, dict):
+        return pd.DataFrame({k: list(np.asarray(v)) for k, v in raw_predictions.items()})
+    predictions = np.asarray(raw_predictions)
+    if predictions.ndim > 2:
+        raise MlflowException(
+            "Predictions with {} dimensions cannot be converted to a table. Request them in the"
+            " '{}' format instead.".format(predictions.ndim, CONTENT_TYPE_NPY),
+            error_code=BAD_REQUEST,
+        )
+    return pd.DataFrame(predictions)
+
+
+def predictions_to_arrow_stream(raw_predictions, output):
+    pyarrow = _import_pyarrow()
+    df = _predictions_to_dataframe(raw_predictions)
+    df.columns = df.columns.astype(str)
+    table = pyarrow.Table.from_pandas(df, preserve_index=False)
+    with pyarrow.ipc.new_stream(output, table.schema) as writer:
+        writer.write_table(table)
+
+
+def predictions_to_parquet(raw_predictions, output):
+    pyarrow = _import_pyarrow()
+    df = _predictions_to_dataframe(raw_predictions)
+    df.columns = df.columns.astype(str)
+    pyarrow.parquet.write_table(pyarrow.Table.from_pandas(df, preserve_index=False), output)
+
+
+def predictions_to_npy(raw_predictions, output):
+    if isinstance(raw_predictions, dict):
+        raise MlflowException(
+            "Predictions with multiple outputs cannot be converted to a single array. Request them"
+            " in the '{}' format instead.".format(CONTENT_TYPE_NPZ),
+            error_code=BAD_REQUEST,
+        )
+    if isinstance(raw_predictions, (pd.DataFrame, pd.Series)):
+        raw_predictions = raw_predictions.to_numpy()
+    np.save(output, np.asarray(raw_predictions), allow_pickle=False)
+
+
+def predictions_to_npz(raw_predictions, output):
+    if isinstance(raw_predictions, dict):
+        arrays = {k: np.asarray(v) for k, v in raw_predictions.items()}
+    elif isinstance(raw_predictions, pd.DataFrame):
+        arrays = {str(c): raw_predictions[c].to_numpy() for c in raw_predictions.columns}
+    else:
+        arrays = {"predictions": np.asarray(raw_predictions)}
+    np.savez(output, **arrays)
+
+
+_PREDICTIONS_WRITERS = {
+    CONTENT_TYPE_ARROW_STREAM: predictions_to_arrow_stream,
+    CONTENT_TYPE_PARQUET: predictions_to_parquet,
+    CONTENT_TYPE_NPY: predictions_to_npy,
+    CONTENT_TYPE_NPZ: predictions_to_npz,
+}
+
+
 def predictions_to_json(raw_predictions, output):
-    predictions = _get_jsonable_obj(raw_predictions, pandas_orient="records")
+    predictions = _dumps_jsonable_obj(raw_predictions, pandas_orient="records")
     wrapper_attr_name = os.environ.get(PREDICTIONS_WRAPPER_ATTR_NAME_ENV_KEY, None)
     if wrapper_attr_name:
-        predictions = {wrapper_attr_name: predictions}
-    json.dump(predictions, output, cls=NumpyEncoder)
+        predictions = "{" + json.dumps(wrapper_attr_name) + ": " + predictions + "}"
+    output.write(predictions)
 
 
 def _handle_serving_error(error_message, error_code, include_traceback=True):
@@ -216,6 +432,26 @@ def init(model: PyFuncModel):
     """
     app = flask.Flask(__name__)
     input_schema = model.metadata.get_input_schema()
+    max_batch_size, max_batch_delay_ms = get_batching_config_from_env()
+    if max_batch_size is not None:
+        batcher = PredictionBatcher(model.predict, max_batch_size, max_batch_delay_ms)
+        predict = batcher.predict
+    else:
+        batcher = None
+        predict = model.predict
+
+    @app.route("/metrics", methods=["GET"])
+    def metrics():  # pylint: disable=unused-variable
+        """
+        Expose the model load time and memory usage of the worker serving the request, and the
+        distribution of the number of requests predicted in each batch if batching is enabled.
+        """
+        response = worker_stats_to_prometheus("mlflow_scoring_server")
+        if batcher is not None:
+            response += batcher.batch_size_histogram.to_prometheus(
+                "mlflow_scoring_server_batch_size"
+            )
+        return flask.Response(response=response, status=200, mimetype="text/plain")
 
     @app.route("/ping", methods=["GET"])
     def ping():  # pylint: disable=unused-variable
@@ -232,9 +468,26 @@ def init(model: PyFuncModel):
     def transformation():  # pylint: disable=unused-variable
         """
         Do an inference on a single batch of data. In this sample server,
-        we take data as CSV or json, convert it to a Pandas DataFrame or Numpy,
-        generate predictions and convert them back to json.
+        we take data as CSV, json, Arrow, Parquet or Numpy, convert it to a Pandas DataFrame or
+        Numpy, generate predictions and convert them back to the format requested in the Accept
+        header (json by default).
         """
+        response_type = flask.request.accept_mimetypes.best_match(RESPONSE_CONTENT_TYPES)
+        if response_type is None:
+            # Requests without an Accept header receive JSON, as before content negotiation
+            if flask.request.headers.get("Accept"):
+                return flask.Response(
+                    response=(
+                        "This predictor can only return predictions in the following content"
+                        " types: {supported_content_types}. Got Accept header '{accept}'.".format(
+                            supported_content_types=RESPONSE_CONTENT_TYPES,
+                            accept=flask.request.headers.get("Accept"),
+                        )
+                    ),
+                    status=406,
+                    mimetype="text/plain",
+                )
+            response_type = CONTENT_TYPE_JSON
 
         # Content-Type can include other attributes like CHARSET
         # Content-type RFC: https://datatracker.ietf.org/doc/html/rfc2045#section-5.1
@@ -270,7 +523,7 @@ def init(model: PyFuncModel):
             mime_type == CONTENT_TYPE_JSON and content_format == CONTENT_TYPE_FORMAT_SPLIT_ORIENTED
         ):
             data = parse_json_input(
-                json_input=StringIO(flask.request.data.decode("utf-8")),
+                json_input=flask.request.data.decode("utf-8"),
                 orient="split",
                 schema=input_schema,
             )
@@ -279,12 +532,20 @@ def init(model: PyFuncModel):
             and content_format == CONTENT_TYPE_FORMAT_RECORDS_ORIENTED
         ):
             data = parse_json_input(
-                json_input=StringIO(flask.request.data.decode("utf-8")),
+                json_input=flask.request.data.decode("utf-8"),
                 orient="records",
                 schema=input_schema,
             )
         elif mime_type == CONTENT_TYPE_JSON_SPLIT_NUMPY and not content_format:
             data = parse_split_oriented_json_input_to_numpy(flask.request.data.decode("utf-8"))
+        elif mime_type == CONTENT_TYPE_ARROW_STREAM and not content_format:
+            data = parse_arrow_stream_input(flask.request.data)
+        elif mime_type == CONTENT_TYPE_PARQUET and not content_format:
+            data = parse_parquet_input(flask.request.data)
+        elif mime_type == CONTENT_TYPE_NPY and not content_format:
+            data = parse_npy_input(flask.request.data)
+        elif mime_type == CONTENT_TYPE_NPZ and not content_format:
+            data = parse_npz_input(flask.request.data)
         else:
             return flask.Response(
                 response=(
@@ -303,7 +564,7 @@ def init(model: PyFuncModel):
         # Do the prediction
 
         try:
-            raw_predictions = model.predict(data)
+            raw_predictions = predict(data)
         except MlflowException as e:
             _handle_serving_error(
                 error_message=e.message, error_code=BAD_REQUEST, include_traceback=False
@@ -317,9 +578,27 @@ def init(model: PyFuncModel):
                 ),
                 error_code=BAD_REQUEST,
             )
-        result = StringIO()
-        predictions_to_json(raw_predictions, result)
-        return flask.Response(response=result.getvalue(), status=200, mimetype="application/json")
+        if response_type == CONTENT_TYPE_JSON:
+            result = StringIO()
+            predictions_to_json(raw_predictions, result)
+            return flask.Response(
+                response=result.getvalue(), status=200, mimetype=CONTENT_TYPE_JSON
+            )
+
+        result = BytesIO()
+        try:
+            _PREDICTIONS_WRITERS[response_type](raw_predictions, result)
+        except MlflowException:
+            raise
+        except Exception:
+            _handle_serving_error(
+                error_message=(
+                    "Failed to serialize the predictions as '{}'. Request them in a different"
+                    " format using the Accept header.".format(response_type)
+                ),
+                error_code=BAD_REQUEST,
+            )
+        return flask.Response(response=result.getvalue(), status=200, mimetype=response_type)
 
     return app
 
@@ -344,12 +623,18 @@ def _predict(model_uri, input_path, output_path, content_type, json_format):
 
 
 def _serve(model_uri, port, host):
-    pyfunc_model = load_model(model_uri)
+    pyfunc_model = load_server_model(model_uri)
     init(pyfunc_model).run(port=port, host=host)
 
 
 def get_cmd(
-    model_uri: str, port: int = None, host: int = None, nworkers: int = None
+    model_uri: str,
+    port: int = None,
+    host: int = None,
+    nworkers: int = None,
+    max_batch_size: int = None,
+    max_batch_delay_ms: float = None,
+    preload_model: bool = False,
 ) -> Tuple[str, Dict[str, str]]:
     local_uri = path_to_local_file_uri(model_uri)
     # NB: Absolute windows paths do not work with mlflow apis, use file uri to ensure
@@ -364,6 +649,15 @@ def get_cmd(
         if nworkers:
             args.append(f"-w {nworkers}")
 
+        if max_batch_size:
+            # Requests can only be batched if each worker handles them concurrently. Since a
+            # request may contain many rows, fewer threads than rows in a batch are enough
+            args.append(f"--threads {min(max_batch_size, _MAX_BATCHING_THREADS)}")
+
+        if preload_model:
+            # Load the model once in the master process and share it with the forked workers
+            args.append("--preload")
+
         command = (
             f"gunicorn {' '.join(args)} ${{GUNICORN_CMD_ARGS}}"
             " -- mlflow.pyfunc.scoring_server.wsgi:app"
@@ -383,5 +677,11 @@ def get_cmd(
 
     command_env = os.environ.copy()
     command_env[_SERVER_MODEL_PATH] = local_uri
+    if max_batch_size:
+        command_env[MAX_BATCH_SIZE_ENV_KEY] = str(max_batch_size)
+        if max_batch_delay_ms is not None:
+            command_env[MAX_BATCH_DELAY_ENV_KEY] = str(max_batch_delay_ms)
+    if preload_model and os.name != "nt":
+        command_env[PRELOAD_MODEL_ENV_KEY] = "true"
 
     return command, command_env
@@ -0,0 +1,260 @@
+"""
+Dynamic batching of prediction requests for the pyfunc scoring server.
+
+Inputs of concurrent ``/invocations`` requests are queued and merged into a single pandas
+DataFrame or numpy array, which is passed to ``PyFuncModel.predict`` once. The predictions are then
+split back into the responses of the individual requests.
+"""
+import logging
+import os
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+_logger = logging.getLogger(__name__)
+
+# Environment variables used to pass the batching configuration of `mlflow models serve` to the
+# scoring server workers
+MAX_BATCH_SIZE_ENV_KEY = "MLFLOW_SCORING_SERVER_MAX_BATCH_SIZE"
+MAX_BATCH_DELAY_ENV_KEY = "MLFLOW_SCORING_SERVER_MAX_BATCH_DELAY_MS"
+
+_DEFAULT_MAX_BATCH_DELAY_MS = 10
+
+
+def get_batching_config_from_env():
+    """
+    :return: A ``(max_batch_size, max_batch_delay_ms)`` tuple read from the environment.
+             ``max_batch_size`` is ``None`` if dynamic batching is disabled.
+    """
+    max_batch_size = os.environ.get(MAX_BATCH_SIZE_ENV_KEY)
+    max_batch_delay_ms = os.environ.get(MAX_BATCH_DELAY_ENV_KEY, _DEFAULT_MAX_BATCH_DELAY_MS)
+    if max_batch_size is None or int(max_batch_size) <= 1:
+        return None, None
+    return int(max_batch_size), float(max_batch_delay_ms)
+
+
+class _PendingPrediction:
+    def __init__(self, data):
+        self.data = data
+        self.num_rows = len(data)
+        self.predictions = None
+        self.error = None
+        self.done = threading.Event()
+
+    def set_result(self, predictions=None, error=None):
+        self.predictions = predictions
+        self.error = error
+        self.done.set()
+
+
+def _get_batch_key(data):
+    """
+    :return: A key identifying the inputs that ``data`` can be merged with, or ``None`` if it cannot
+             be merged with other inputs.
+    """
+    if isinstance(data, pd.DataFrame):
+        return ("DataFrame", tuple(data.columns), tuple(data.dtypes))
+    elif isinstance(data, np.ndarray) and data.ndim > 0:
+        return ("ndarray", data.shape[1:], data.dtype)
+    return None
+
+
+def _merge_inputs(inputs):
+    if isinstance(inputs[0], pd.DataFrame):
+        return pd.concat(inputs, ignore_index=True)
+    return np.concatenate(inputs)
+
+
+def _split_predictions(predictions, num_rows):
+    """
+    :return: A list containing the predictions of each merged input, or ``None`` if ``predictions``
+             cannot be split along the rows of the merged inputs.
+    """
+    if not isinstance(predictions, (pd.DataFrame, pd.Series, np.ndarray, list)):
+        return None
+    if len(predictions) != sum(num_rows):
+        return None
+    splits = []
+    start = 0
+    for n in num_rows:
+        if isinstance(predictions, (pd.DataFrame, pd.Series)):
+            splits.append(predictions.iloc[start : start + n].reset_index(drop=True))
+        else:
+            splits.append(predictions[start : start + n])
+        start += n
+    return splits
+
+
+class BatchSizeHistogram:
+    """
+    Cumulative histogram of the number of requests whose inputs were merged into each batch passed
+    to the model.
+    """
+
+    def __init__(self, max_batch_size):
+        self.buckets = []
+        bucket = 1
+        while bucket < max_batch_size:
+            self.buckets.append(bucket)
+            bucket *= 2
+        self.buckets.append(max_batch_size)
+        self._counts = [0] * len(self.buckets)
+        self._count = 0
+        self._sum = 0
+        self._lock = threading.Lock()
+
+    def observe(self, batch_size):
+        with self._lock:
+            for i, bucket in enumerate(self.buckets):
+                if batch_size <= bucket:
+                    self._counts[i] += 1
+            self._count += 1
+            self._sum += batch_size
+
+    def to_prometheus(self, name):
+        """
+        :return: The histogram in the Prometheus text exposition format.
+        """
+        with self._lock:
+            lines = ["# TYPE {name} histogram".format(name=name)]
+            for bucket, count in zip(self.buckets, self._counts):
+                lines.append(
+                    '{name}_bucket{{le="{le}"}} {count}'.format(name=name, le=bucket, count=count)
+                )
+            lines.append('{name}_bucket{{le="+Inf"}} {count}'.format(name=name, count=self._count))
+            lines.append("{name}_sum {sum}".format(name=name, sum=self._sum))
+            lines.append("{name}_count {count}".format(name=name, count=self._count))
+        return "\n".join(lines) + "\n"
+
+
+class PredictionBatcher:
+    """
+    Merges the inputs of concurrent prediction requests into batches of up to ``max_batch_size``
+    rows, waiting at most ``max_batch_delay_ms`` milliseconds for a batch to fill up, and predicts
+    each batch from a background thread.
+
+    Inputs that cannot be merged (e.g. dictionaries of tensors) and batches whose predictions cannot
+    be split back into the rows of each input are predicted separately, as are the inputs of a
+    batch that fails so that errors are only reported to the requests that caused them.
+    """
+
+    def __init__(self, predict_fn, max_batch_size, max_batch_delay_ms):
+        """
+        :param predict_fn: The function used to compute predictions, e.g. ``PyFuncModel.predict``.
+        :param max_batch_size: The maximum number of rows in a batch. Inputs containing more rows
+                               are predicted on their own.
+        :param max_batch_delay_ms: The maximum number of milliseconds to wait for additional
+                                   requests before predicting a batch.
+        """
+        self._predict_fn = predict_fn
+        self._max_batch_size = max_batch_size
+        self._max_batch_delay = max_batch_delay_ms / 1000
+        self.batch_size_histogram = BatchSizeHistogram(max_batch_size)
+        self._pid = os.getpid()
+        self._cond = threading.Condition()
+        self._pending = []
+        self._thread = None
+
+    def _reset(self):
+        self._pid = os.getpid()
+        self._cond = threading.Condition()
+        self._pending = []
+        self._thread = None
+
+    def predict(self, data):
+        """
+        Compute the predictions of the specified input as part of a batch, blocking until they are
+        available.
+        """
+        if _get_batch_key(data) is None:
+            self.batch_size_histogram.observe(1)
+            return self._predict_fn(data)
+
+        # The background thread of a parent process does not exist in forked worker processes
+        if self._pid != os.getpid():
+            self._reset()
+        pending_prediction = _PendingPrediction(data)
+        with self._cond:
+            self._pending.append((time.monotonic(), pending_prediction))
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._predict_pending_batches,
+                    name="MlflowScoringServerBatchingThread",
+                    daemon=True,
+                )
+                self._thread.start()
+            self._cond.notify_all()
+
+        pending_prediction.done.wait()
+        if pending_prediction.error is not None:
+            raise pending_prediction.error
+        return pending_prediction.predictions
+
+    def _get_num_pending_rows(self):
+        return sum(pending_prediction.num_rows for _, pending_prediction in self._pending)
+
+    def _next_batch(self):
+        with self._cond:
+            while not self._pending:
+                self._cond.wait()
+            deadline = self._pending[0][0] + self._max_batch_delay
+            while self._get_num_pending_rows() < self._max_batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                self._cond.wait(timeout)
+
+            batch = []
+            num_rows = 0
+            while self._pending:
+                pending_prediction = self._pending[0][1]
+                if batch and num_rows + pending_prediction.num_rows > self._max_batch_size:
+                    break
+                batch.append(pending_prediction)
+                num_rows += pending_prediction.num_rows
+                self._pending.pop(0)
+            return batch
+
+    def _predict_pending_batches(self):
+        while True:
+            batch = self._next_batch()
+            batches_by_key = {}
+            for pending_prediction in batch:
+                batches_by_key.setdefault(_get_batch_key(pending_prediction.data), []).append(
+                    pending_prediction
+                )
+            for pending_predictions in batches_by_key.values():
+                self._predict_batch(pending_predictions)
+
+    def _predict_batch(self, pending_predictions):
+        if len(pending_predictions) > 1:
+            try:
+                predictions = self._predict_fn(
+                    _merge_inputs(
+                        [pending_prediction.data for pending_prediction in pending_predictions]
+                    )
+                )
+                splits = _split_predictions(
+                    predictions,
+                    [pending_prediction.num_rows for pending_prediction in pending_predictions],
+                )
+            except Exception:
+                _logger.debug(
+                    "Failed to predict batch, predicting inputs separately", exc_info=True
+                )
+                splits = None
+
+            if splits is not None:
+                self.batch_size_histogram.observe(len(pending_predictions))
+                for pending_prediction, split in zip(pending_predictions, splits):
+                    pending_prediction.set_result(predictions=split)
+                return
+
+        for pending_prediction in pending_predictions:
+            self.batch_size_histogram.observe(1)
+            try:
+                pending_prediction.set_result(predictions=self._predict_fn(pending_prediction.data))
+            except Exception as e:
+                pending_prediction.set_result(error=e)
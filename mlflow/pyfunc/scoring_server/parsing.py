@@ -0,0 +1,284 @@
+"""
+Single-pass parsing of JSON-serialized pandas DataFrames for the pyfunc scoring server.
+
+``pd.read_json`` requires the raw request body, so inferring the orientation of a payload and then
+reading it with pandas parses every request twice. The functions below build the DataFrame
+directly from the already decoded JSON structure, one column at a time, converting each column to
+the dtype declared by the model's input ``Schema``. Binary columns are base64-decoded in a single
+vectorized pass over all of their values.
+
+The result is the same DataFrame ``mlflow.utils.proto_json_utils._dataframe_from_json`` would
+produce, provided that the payload is decoded with ``decode_json``, which parses floats like
+``pd.read_json(..., precise_float=False)``. Payloads for which ``pd.read_json`` applies
+conversions that are not replicated here (e.g. parsing of numeric column labels or of date-like
+columns) are reported as unsupported, and the caller is expected to fall back to
+``_dataframe_from_json``.
+"""
+import base64
+import functools
+from io import StringIO
+
+import numpy as np
+import pandas as pd
+
+from mlflow.types import DataType, Schema
+
+# NB: The JSON decoder of pandas is private. If it cannot be imported, payloads are not decoded
+# and are always parsed with `pd.read_json`
+try:
+    from pandas._libs.json import ujson_loads as _pandas_json_loads
+except ImportError:
+    try:
+        # pandas < 2.0
+        from pandas._libs.json import loads as _pandas_json_loads
+    except ImportError:
+        _pandas_json_loads = None
+
+_SPLIT_ORIENT_KEYS = {"columns", "index", "data"}
+
+# ``pd.read_json`` interprets integer index labels as timestamps if they are all greater than
+# 31536000 (i.e. 1971-01-01 in seconds since epoch)
+_MIN_TIMESTAMP = 31536000
+
+_BASE64_ALPHABET = b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/"
+_BASE64_PAD = 64
+_BASE64_WHITESPACE = 65
+_BASE64_INVALID = 255
+
+_BASE64_LOOKUP = np.full(256, _BASE64_INVALID, dtype=np.uint8)
+_BASE64_LOOKUP[np.frombuffer(_BASE64_ALPHABET, dtype=np.uint8)] = np.arange(64, dtype=np.uint8)
+_BASE64_LOOKUP[ord("=")] = _BASE64_PAD
+# `base64.encodebytes` inserts a newline every 76 characters and at the end of the output
+_BASE64_LOOKUP[np.frombuffer(b" \t\n\r", dtype=np.uint8)] = _BASE64_WHITESPACE
+
+
+def _is_date_like_column(name):
+    # Mirrors the column names `pd.read_json(..., keep_default_dates=True)` parses as dates
+    name = name.lower()
+    return (
+        name.endswith("_at")
+        or name.endswith("_time")
+        or name in ("modified", "date", "datetime")
+        or name.startswith("timestamp")
+    )
+
+
+def _is_numeric_label(label):
+    try:
+        float(label)
+        return True
+    except ValueError:
+        return False
+
+
+def _has_supported_labels(columns, index):
+    """
+    :return: ``True`` if ``pd.read_json`` would keep the given column and index labels as they
+             are, without converting them to numbers or timestamps.
+    """
+    if len(set(columns)) != len(columns):
+        return False
+    if not all(isinstance(c, str) and not _is_numeric_label(c) for c in columns):
+        return False
+    if index is not None:
+        if not all(isinstance(i, int) and not isinstance(i, bool) for i in index):
+            return False
+        if index and min(index) > _MIN_TIMESTAMP:
+            return False
+    return True
+
+
+def _columns_from_split(decoded_input):
+    if not isinstance(decoded_input, dict) or not set(decoded_input) <= _SPLIT_ORIENT_KEYS:
+        return None
+    columns = decoded_input.get("columns")
+    rows = decoded_input.get("data")
+    index = decoded_input.get("index")
+    if not isinstance(columns, list) or not isinstance(rows, list) or not rows:
+        return None
+    if index is not None and (not isinstance(index, list) or len(index) != len(rows)):
+        return None
+    if not all(isinstance(row, list) and len(row) == len(columns) for row in rows):
+        return None
+    return columns, [list(values) for values in zip(*rows)], index
+
+
+def _columns_from_records(decoded_input):
+    if not isinstance(decoded_input, list) or not decoded_input:
+        return None
+    if not all(isinstance(record, dict) for record in decoded_input):
+        return None
+    columns = list(dict.fromkeys(key for record in decoded_input for key in record))
+    # Missing values are filled with NaN by pandas regardless of the column type, which is not
+    # replicated here
+    if not all(len(record) == len(columns) for record in decoded_input):
+        return None
+    return columns, [[record[c] for record in decoded_input] for c in columns], None
+
+
+def decode_json(json_input):
+    """
+    Decode a JSON string with the decoder of ``pd.read_json(..., precise_float=False)``. Floats
+    decoded this way are the same as the ones pandas would parse, while ``json.loads`` may round
+    them differently.
+
+    :param json_input: A JSON string.
+    :return: The decoded JSON value, or ``None`` if pandas cannot decode the string or if its
+             decoder is not available.
+    """
+    if _pandas_json_loads is None:
+        return None
+    try:
+        return _pandas_json_loads(json_input, precise_float=False)
+    except (TypeError, ValueError):
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def _read_json_applies_extension_dtypes():
+    """
+    :return: ``True`` if ``pd.read_json`` converts columns to the pandas extension dtypes (e.g.
+             ``pd.StringDtype``) passed in its ``dtype`` argument. Older versions of pandas only
+             apply numpy dtypes and keep the inferred type of the other columns.
+    """
+    df = pd.read_json(
+        StringIO('{"columns": ["a"], "data": [[1]]}'),
+        orient="split",
+        dtype={"a": pd.StringDtype()},
+    )
+    return pd.api.types.is_extension_array_dtype(df["a"].dtype)
+
+
+def _get_column_dtypes(schema: Schema, columns):
+    """
+    :return: A dictionary mapping each column to the dtype ``pd.read_json`` forces on it, or to
+             ``None`` if the inferred type of the column is kept. ``None`` is returned instead of
+             a dictionary if some columns would be subject to pandas' type inference.
+    """
+    if schema.is_tensor_spec():
+        if len(schema.inputs) == 1:
+            return {c: schema.numpy_types()[0] for c in columns}
+        dtypes = dict(zip(schema.input_names(), schema.numpy_types()))
+    else:
+        dtypes = dict(zip(schema.input_names(), schema.pandas_types()))
+    if not all(c in dtypes for c in columns):
+        return None
+    column_dtypes = {}
+    for c in columns:
+        dtype = dtypes[c]
+        if (
+            pd.api.types.is_extension_array_dtype(dtype)
+            and not _read_json_applies_extension_dtypes()
+        ):
+            dtype = None
+        column_dtypes[c] = dtype
+    return column_dtypes
+
+
+def _decode_base64_values(values):
+    return [base64.decodebytes(bytes(x, "utf8")) for x in values]
+
+
+def decode_base64_column(values):
+    """
+    Decode a sequence of base64-encoded strings, as produced by
+    ``mlflow.utils.proto_json_utils.NumpyEncoder`` for binary data.
+
+    All values are decoded at once with numpy. Values containing characters other than the base64
+    alphabet, padding and whitespace are decoded one by one with ``base64.decodebytes``.
+
+    :param values: A sequence of base64-encoded strings.
+    :return: A list with the decoded ``bytes`` of each value.
+    """
+    values = list(values)
+    if not values:
+        return []
+    try:
+        encoded = "".join(values).encode("ascii")
+    except (TypeError, UnicodeEncodeError):
+        return _decode_base64_values(values)
+
+    num_values = len(values)
+    lengths = np.fromiter(map(len, values), dtype=np.int64, count=num_values)
+    codes = _BASE64_LOOKUP[np.frombuffer(encoded, dtype=np.uint8)]
+    owners = np.repeat(np.arange(num_values), lengths)
+    is_whitespace = codes == _BASE64_WHITESPACE
+    if is_whitespace.any():
+        codes = codes[~is_whitespace]
+        owners = owners[~is_whitespace]
+        lengths = np.bincount(owners, minlength=num_values)
+    if (codes == _BASE64_INVALID).any() or (lengths % 4).any():
+        return _decode_base64_values(values)
+
+    # Padding is only valid as the last one or two characters of a value
+    ends = np.cumsum(lengths)
+    is_pad = codes == _BASE64_PAD
+    pad_owners = owners[is_pad]
+    num_padding = np.bincount(pad_owners, minlength=num_values)
+    if (num_padding > 2).any() or (
+        np.flatnonzero(is_pad) < ends[pad_owners] - num_padding[pad_owners]
+    ).any():
+        return _decode_base64_values(values)
+
+    quads = np.where(is_pad, 0, codes).astype(np.uint8).reshape(-1, 4)
+    decoded = np.empty((len(quads), 3), dtype=np.uint8)
+    decoded[:, 0] = (quads[:, 0] << 2) | (quads[:, 1] >> 4)
+    decoded[:, 1] = (quads[:, 1] << 4) | (quads[:, 2] >> 2)
+    decoded[:, 2] = (quads[:, 2] << 6) | quads[:, 3]
+    data = decoded.tobytes()
+    starts = (ends - lengths) // 4 * 3
+    sizes = lengths // 4 * 3 - num_padding
+    return [data[start : start + size] for start, size in zip(starts.tolist(), sizes.tolist())]
+
+
+def dataframe_from_decoded_json(decoded_input, orient="split", schema: Schema = None):
+    """
+    Build a pandas DataFrame from a decoded JSON payload without parsing it again.
+
+    :param decoded_input: The result of ``decode_json`` on a JSON-serialized pandas DataFrame.
+    :param orient: The pandas DataFrame orientation of the payload. This is either 'split' or
+                   'records'.
+    :param schema: Optional schema specification whose types are applied to the columns.
+    :return: A pandas DataFrame, or ``None`` if the payload must be parsed with
+             ``mlflow.utils.proto_json_utils._dataframe_from_json`` instead.
+    """
+    if orient == "split":
+        parsed = _columns_from_split(decoded_input)
+    elif orient == "records":
+        parsed = _columns_from_records(decoded_input)
+    else:
+        return None
+    if parsed is None:
+        return None
+    columns, column_values, index = parsed
+    if not _has_supported_labels(columns, index):
+        return None
+
+    if schema is not None:
+        dtypes = _get_column_dtypes(schema, columns)
+        if dtypes is None:
+            return None
+    elif any(_is_date_like_column(c) for c in columns):
+        return None
+
+    df = pd.DataFrame(dict(zip(columns, column_values)), columns=columns, index=index)
+    if schema is None:
+        for c in columns:
+            if df[c].isna().any():
+                df[c] = df[c].fillna(np.nan)
+        return df
+
+    for c in columns:
+        if dtypes[c] is None:
+            # The dtype is not applied by this version of `pd.read_json` either
+            continue
+        try:
+            df[c] = df[c].astype(dtypes[c])
+        except (TypeError, ValueError):
+            # Same as `pd.read_json`, the inferred type is kept if the column cannot be converted
+            pass
+    if not schema.is_tensor_spec():
+        for type_, name in zip(schema.input_types(), schema.input_names()):
+            if type_ == DataType.binary and name in dtypes:
+                df[name] = decode_base64_column(df[name])
+    return df
@@ -0,0 +1,134 @@
+"""
+Loading of the model served by the pyfunc scoring server, optionally once in the gunicorn master.
+
+By default, each gunicorn worker imports ``mlflow.pyfunc.scoring_server.wsgi`` and loads its own
+copy of the model. If the model is preloaded, gunicorn imports the app in the master process before
+forking the workers, which then share the memory pages of the model copy-on-write. The garbage
+collector is frozen after loading so that collections in the workers do not write to (and thereby
+copy) the pages of the objects inherited from the master.
+
+The time it took to load the model and the memory usage of each worker are logged when the worker
+starts, and exposed on the ``/metrics`` endpoint.
+"""
+import gc
+import logging
+import os
+import time
+
+_logger = logging.getLogger(__name__)
+
+# Environment variable used to tell the scoring server workers that the model is loaded by the
+# gunicorn master process
+PRELOAD_MODEL_ENV_KEY = "MLFLOW_SCORING_SERVER_PRELOAD_MODEL"
+
+_model_load_stats = {}
+
+
+def is_preload_enabled():
+    return os.environ.get(PRELOAD_MODEL_ENV_KEY, "false").lower() == "true"
+
+
+def get_memory_usage():
+    """
+    :return: A dictionary with the resident (``rss``), proportional (``pss``), shared and private
+             memory of the current process in bytes. ``pss`` accounts for each shared page
+             divided by the number of processes sharing it, and is the most accurate measure of
+             the memory used by each worker. Only the available measures are returned, i.e. none
+             outside of Linux.
+    """
+    try:
+        with open("/proc/self/smaps_rollup") as f:
+            lines = f.readlines()
+    except OSError:
+        lines = []
+    fields = {}
+    for line in lines:
+        key, _, value = line.partition(":")
+        if value.strip().endswith("kB"):
+            fields[key] = int(value.split()[0]) * 1024
+    if "Rss" in fields:
+        return {
+            "rss": fields["Rss"],
+            "pss": fields.get("Pss", 0),
+            "shared": fields.get("Shared_Clean", 0) + fields.get("Shared_Dirty", 0),
+            "private": fields.get("Private_Clean", 0) + fields.get("Private_Dirty", 0),
+        }
+
+    try:
+        with open("/proc/self/statm") as f:
+            _, resident, shared = f.read().split()[:3]
+    except OSError:
+        return {}
+    page_size = os.sysconf("SC_PAGE_SIZE")
+    return {"rss": int(resident) * page_size, "shared": int(shared) * page_size}
+
+
+def _log_worker_stats():
+    memory_usage = get_memory_usage()
+    _logger.info(
+        "Scoring server worker %d started. Model loaded in %.2f seconds by the %s process. "
+        "Memory usage: %s",
+        os.getpid(),
+        _model_load_stats["seconds"],
+        "master" if _model_load_stats["preloaded"] else "worker",
+        ", ".join(
+            "{}={:.1f}MB".format(name, size / 1024 ** 2) for name, size in memory_usage.items()
+        )
+        or "unknown",
+    )
+
+
+def load_server_model(model_uri):
+    """
+    Load the model served by the scoring server and record the time it took. If the model is
+    preloaded, prepare the process to be forked into workers.
+    """
+    from mlflow.pyfunc import load_model
+
+    preload = is_preload_enabled()
+    if preload:
+        # Collections before forking free objects all over the heap and leave holes in the pages
+        # that will be shared with the workers
+        gc.disable()
+    try:
+        start_time = time.time()
+        model = load_model(model_uri)
+        _model_load_stats.update(seconds=time.time() - start_time, preloaded=preload)
+        # NB: `gc.freeze()` and `os.register_at_fork()` are only available in Python >= 3.7
+        if preload and hasattr(gc, "freeze"):
+            # Move every object into the permanent generation, which is never collected
+            gc.freeze()
+    finally:
+        if preload:
+            gc.enable()
+
+    if not preload:
+        _log_worker_stats()
+    elif hasattr(os, "register_at_fork"):
+        os.register_at_fork(after_in_child=_log_worker_stats)
+    return model
+
+
+def worker_stats_to_prometheus(prefix):
+    """
+    :return: The model load time and the memory usage of the current worker, as gauges in the
+             Prometheus text format.
+    """
+    lines = []
+    if _model_load_stats:
+        lines += [
+            "# TYPE {}_model_load_seconds gauge".format(prefix),
+            '{}_model_load_seconds{{process="{}"}} {}'.format(
+                prefix,
+                "master" if _model_load_stats["preloaded"] else "worker",
+                _model_load_stats["seconds"],
+            ),
+        ]
+    memory_usage = get_memory_usage()
+    if memory_usage:
+        lines.append("# TYPE {}_worker_memory_bytes gauge".format(prefix))
+        lines += [
+            '{}_worker_memory_bytes{{type="{}"}} {}'.format(prefix, name, size)
+            for name, size in memory_usage.items()
+        ]
+    return "".join(line + "\n" for line in lines)
@@ -1,6 +1,6 @@
 import os
 from mlflow.pyfunc import scoring_server
-from mlflow.pyfunc import load_model
+from mlflow.pyfunc.scoring_server.preloading import load_server_model
 
 
-app = scoring_server.init(load_model(os.environ[scoring_server._SERVER_MODEL_PATH]))
+app = scoring_server.init(load_server_model(os.environ[scoring_server._SERVER_MODEL_PATH]))
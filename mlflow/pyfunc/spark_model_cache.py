@@ -1,10 +1,60 @@
+import hashlib
 import os
 import shutil
 import tempfile
 import zipfile
+from collections import OrderedDict
 
 from pyspark.files import SparkFiles
 
+from mlflow.utils.file_utils import exclusive_lock
+
+# Maximum number of models each Python worker keeps loaded. Unlimited by default.
+SPARK_MODEL_CACHE_SIZE_ENV_VAR = "MLFLOW_SPARK_MODEL_CACHE_SIZE"
+# Maximum total size in bytes of the files of the models each Python worker keeps loaded, which is
+# used as an estimate of their memory usage. Unlimited by default.
+SPARK_MODEL_CACHE_MAX_BYTES_ENV_VAR = "MLFLOW_SPARK_MODEL_CACHE_MAX_BYTES"
+
+_EXTRACTED_MODELS_DIR_NAME = "mlflow_spark_models"
+
+
+def _get_cache_limit(env_var):
+    value = os.environ.get(env_var)
+    return int(value) if value else None
+
+
+def _get_archive_digest(archive_path):
+    sha256 = hashlib.sha256()
+    with open(archive_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+def _get_dir_size(path):
+    return sum(
+        os.path.getsize(os.path.join(root, name))
+        for root, _, names in os.walk(path)
+        for name in names
+    )
+
+
+def _is_process_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+class _CachedModel(object):
+    def __init__(self, model, digest, size):
+        self.model = model
+        self.digest = digest
+        self.size = size
+
 
 class SparkModelCache(object):
     """Caches models in memory on Spark Executors, to avoid continually reloading from disk.
@@ -14,13 +64,31 @@ class SparkModelCache(object):
     Python's module loading behavior for classes in different modules. In this case, we
     are relying on the fact that Python will load a module at-most-once, and can therefore
     store per-process state in a static map.
+
+    The number of models and the total size of their files can be bounded with the
+    ``MLFLOW_SPARK_MODEL_CACHE_SIZE`` and ``MLFLOW_SPARK_MODEL_CACHE_MAX_BYTES`` environment
+    variables of the executors (e.g. ``spark.executorEnv.MLFLOW_SPARK_MODEL_CACHE_SIZE``), in
+    which case the least recently used models are evicted first.
+
+    Model archives are extracted once per executor, to a directory named after the SHA-256 of the
+    archive that is shared by all the Python workers of the executor. Each worker holds a reference
+    to the directories of the models it has loaded, and a directory is deleted once the last
+    reference to it is released.
     """
 
-    # Map from unique name --> loaded model.
-    _models = {}
+    # Map from unique name --> cached model, from the least to the most recently used.
+    _models = OrderedDict()
+
+    # Map from unique name --> SHA-256 of the model archive.
+    _archive_digests = {}
 
-    # Number of cache hits we've had, for testing purposes.
+    # Number of models of this Python worker using each extracted model directory.
+    _digest_refcounts = {}
+
+    # Number of cache hits, misses and evictions we've had.
     _cache_hits = 0
+    _cache_misses = 0
+    _cache_evictions = 0
 
     def __init__(self):
         pass
@@ -38,28 +106,137 @@ class SparkModelCache(object):
         spark.sparkContext.addFile(archive_path)
         return archive_path
 
+    @staticmethod
+    def get_stats():
+        """Return the hit, miss and eviction counts of the cache of this Python worker, along with
+        the number of models it holds and the total size of their files in bytes.
+        """
+        return {
+            "hits": SparkModelCache._cache_hits,
+            "misses": SparkModelCache._cache_misses,
+            "evictions": SparkModelCache._cache_evictions,
+            "models": len(SparkModelCache._models),
+            "bytes": sum(cached.size for cached in SparkModelCache._models.values()),
+        }
+
+    @staticmethod
+    def _get_extracted_models_dir():
+        path = os.path.join(SparkFiles.getRootDirectory(), _EXTRACTED_MODELS_DIR_NAME)
+        os.makedirs(path, exist_ok=True)
+        return path
+
+    @staticmethod
+    def _get_digest(archive_path):
+        if archive_path not in SparkModelCache._archive_digests:
+            # BUG: Despite the documentation of SparkContext.addFile() and SparkFiles.get() in
+            # Scala and Python, it turns out that we actually need to use the basename as the
+            # input to SparkFiles.get(), as opposed to the (absolute) path.
+            local_archive_path = SparkFiles.get(os.path.basename(archive_path))
+            SparkModelCache._archive_digests[archive_path] = _get_archive_digest(local_archive_path)
+        return SparkModelCache._archive_digests[archive_path]
+
+    @staticmethod
+    def _get_or_extract(archive_path):
+        """Given a path returned by add_local_model(), this method will return the local directory
+        the model archive is extracted to, and register this Python worker as one of its users.
+        Identical archives are extracted at most once per executor.
+        """
+        digest = SparkModelCache._get_digest(archive_path)
+        models_dir = SparkModelCache._get_extracted_models_dir()
+        local_path = os.path.join(models_dir, digest)
+        if SparkModelCache._digest_refcounts.get(digest, 0) > 0:
+            SparkModelCache._digest_refcounts[digest] += 1
+            return local_path
+
+        refs_dir = local_path + ".refs"
+        with exclusive_lock(local_path + ".lock"):
+            os.makedirs(refs_dir, exist_ok=True)
+            open(os.path.join(refs_dir, str(os.getpid())), "w").close()
+            if not os.path.isdir(local_path):
+                # Extract to a temporary directory first, then rename it, so that other Python
+                # workers never observe a partially extracted model.
+                temp_dir = tempfile.mkdtemp(dir=models_dir)
+                local_archive_path = SparkFiles.get(os.path.basename(archive_path))
+                with zipfile.ZipFile(local_archive_path, "r") as zip_ref:
+                    zip_ref.extractall(temp_dir)
+                try:
+                    os.rename(temp_dir, local_path)
+                except OSError:
+                    # Another Python worker extracted the model first
+                    shutil.rmtree(temp_dir, ignore_errors=True)
+                    if not os.path.isdir(local_path):
+                        raise
+        SparkModelCache._digest_refcounts[digest] = 1
+        return local_path
+
+    @staticmethod
+    def _release(digest):
+        """Release a reference of this Python worker to an extracted model directory, and delete
+        the directory if no live Python worker of the executor references it anymore.
+        """
+        SparkModelCache._digest_refcounts[digest] -= 1
+        if SparkModelCache._digest_refcounts[digest] > 0:
+            return
+        del SparkModelCache._digest_refcounts[digest]
+
+        local_path = os.path.join(SparkModelCache._get_extracted_models_dir(), digest)
+        refs_dir = local_path + ".refs"
+        with exclusive_lock(local_path + ".lock") as locked:
+            try:
+                os.remove(os.path.join(refs_dir, str(os.getpid())))
+            except OSError:
+                pass
+            if not locked:
+                # Without file locks, the directory could be deleted while being reused
+                return
+            for pid in os.listdir(refs_dir):
+                if _is_process_alive(int(pid)):
+                    return
+            shutil.rmtree(local_path, ignore_errors=True)
+            shutil.rmtree(refs_dir, ignore_errors=True)
+
+    @staticmethod
+    def _evict():
+        """Evict the least recently used models until the cache is within its limits. The most
+        recently used model is never evicted.
+        """
+        max_models = _get_cache_limit(SPARK_MODEL_CACHE_SIZE_ENV_VAR)
+        max_bytes = _get_cache_limit(SPARK_MODEL_CACHE_MAX_BYTES_ENV_VAR)
+        models = SparkModelCache._models
+        while len(models) > 1 and (
+            (max_models is not None and len(models) > max_models)
+            or (max_bytes is not None and sum(c.size for c in models.values()) > max_bytes)
+        ):
+            _, evicted = models.popitem(last=False)
+            SparkModelCache._cache_evictions += 1
+            SparkModelCache._release(evicted.digest)
+
     @staticmethod
     def get_or_load(archive_path):
         """Given a path returned by add_local_model(), this method will return the loaded model.
-        If this Python process ever loaded the model before, we will reuse that copy.
+        If this Python process ever loaded the model before and did not evict it, we will reuse
+        that copy.
         """
         if archive_path in SparkModelCache._models:
             SparkModelCache._cache_hits += 1
-            return SparkModelCache._models[archive_path]
-
-        # BUG: Despite the documentation of SparkContext.addFile() and SparkFiles.get() in Scala
-        # and Python, it turns out that we actually need to use the basename as the input to
-        # SparkFiles.get(), as opposed to the (absolute) path.
-        archive_path_basename = os.path.basename(archive_path)
-        local_path = SparkFiles.get(archive_path_basename)
-        temp_dir = tempfile.mkdtemp()
-        zip_ref = zipfile.ZipFile(local_path, "r")
-        zip_ref.extractall(temp_dir)
-        zip_ref.close()
+            SparkModelCache._models.move_to_end(archive_path)
+            return SparkModelCache._models[archive_path].model
+
+        SparkModelCache._cache_misses += 1
+        local_path = SparkModelCache._get_or_extract(archive_path)
+        digest = SparkModelCache._get_digest(archive_path)
 
         # We must rely on a supposed cyclic import here because we want this behavior
         # on the Spark Executors (i.e., don't try to pickle the load_model function).
         from mlflow.pyfunc import load_pyfunc  # pylint: disable=cyclic-import
 
-        SparkModelCache._models[archive_path] = load_pyfunc(temp_dir)
-        return SparkModelCache._models[archive_path]
+        try:
+            model = load_pyfunc(local_path)
+        except Exception:
+            SparkModelCache._release(digest)
+            raise
+        SparkModelCache._models[archive_path] = _CachedModel(
+            model, digest, _get_dir_size(local_path)
+        )
+        SparkModelCache._evict()
+        return model
@@ -1,6 +1,51 @@
 import os
 import sys
 
+from mlflow.exceptions import MlflowException
+
+# Maximum number of input rows that the pyfunc implementations of the deep learning flavors
+# (``pytorch`` and ``tensorflow``) pass to the model at once. Unlimited by default.
+INFERENCE_BATCH_SIZE_ENV_VAR = "MLFLOW_PYFUNC_INFERENCE_BATCH_SIZE"
+# Number of threads that these flavors use to parallelize individual operations. Defaults to the
+# setting of the deep learning framework.
+INFERENCE_INTRA_OP_THREADS_ENV_VAR = "MLFLOW_PYFUNC_INFERENCE_INTRA_OP_THREADS"
+
+
+def _get_positive_int_env_var(env_var):
+    value = os.environ.get(env_var)
+    if not value:
+        return None
+    try:
+        value = int(value)
+    except ValueError:
+        value = 0
+    if value <= 0:
+        raise MlflowException(
+            "The value of {} must be a positive integer, got '{}'".format(
+                env_var, os.environ[env_var]
+            )
+        )
+    return value
+
+
+def _get_inference_batch_size():
+    return _get_positive_int_env_var(INFERENCE_BATCH_SIZE_ENV_VAR)
+
+
+def _get_inference_intra_op_threads():
+    return _get_positive_int_env_var(INFERENCE_INTRA_OP_THREADS_ENV_VAR)
+
+
+def _get_batch_slices(num_rows, batch_size):
+    """
+    Returns the slices that split the specified number of rows into batches of at most
+    ``batch_size`` rows, or a single slice if ``batch_size`` is ``None``. Empty inputs get a single
+    empty batch.
+    """
+    if batch_size is None or num_rows <= batch_size:
+        return [slice(0, num_rows)]
+    return [slice(start, start + batch_size) for start in range(0, num_rows, batch_size)]
+
 
 def _add_code_to_system_path(code_path):
     sys.path = [code_path] + _get_code_dirs(code_path) + sys.path
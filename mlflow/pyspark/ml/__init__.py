@@ -6,7 +6,6 @@ from pkg_resources import resource_filename
 import weakref
 
 import mlflow
-from mlflow.entities import Metric, Param
 from mlflow.tracking.client import MlflowClient
 from mlflow.utils import (
     _chunk_dict,
@@ -18,6 +17,7 @@ from mlflow.utils.autologging_utils import (
     _get_new_training_session_class,
     autologging_integration,
     safe_patch,
+    MlflowAutologgingQueueingClient,
 )
 from mlflow.utils.autologging_utils import get_method_call_arg_value
 from mlflow.utils.file_utils import TempDir
@@ -312,9 +312,6 @@ def _get_instance_param_map(instance, uid_to_indexed_name_map):
 
 
 def _create_child_runs_for_parameter_search(parent_estimator, parent_model, parent_run, child_tags):
-    from itertools import zip_longest
-
-    client = MlflowClient()
     # Use the start time of the parent parameter search run as a rough estimate for the
     # start time of child runs, since we cannot precisely determine when each point
     # in the parameter search space was explored
@@ -325,45 +322,35 @@ def _create_child_runs_for_parameter_search(parent_estimator, parent_model, pare
     tuned_estimator = parent_estimator.getEstimator()
 
     metrics_dict, _ = _get_param_search_metrics_and_best_index(parent_estimator, parent_model)
-    for i in range(len(estimator_param_maps)):
-        child_estimator = tuned_estimator.copy(estimator_param_maps[i])
-        tags_to_log = dict(child_tags) if child_tags else {}
-        tags_to_log.update({MLFLOW_PARENT_RUN_ID: parent_run.info.run_id})
-        tags_to_log.update(_get_estimator_info_tags(child_estimator))
-
-        child_run = client.create_run(
-            experiment_id=parent_run.info.experiment_id,
-            start_time=child_run_start_time,
-            tags=tags_to_log,
-        )
+    # The child runs are created in bulk, along with their params and metrics, when the
+    # queueing client is flushed
+    with MlflowAutologgingQueueingClient() as autologging_client:
+        for i in range(len(estimator_param_maps)):
+            child_estimator = tuned_estimator.copy(estimator_param_maps[i])
+            tags_to_log = dict(child_tags) if child_tags else {}
+            tags_to_log.update({MLFLOW_PARENT_RUN_ID: parent_run.info.run_id})
+            tags_to_log.update(_get_estimator_info_tags(child_estimator))
+
+            pending_child_run_id = autologging_client.create_run(
+                experiment_id=parent_run.info.experiment_id,
+                start_time=child_run_start_time,
+                tags=tags_to_log,
+            )
 
-        params_to_log = _get_instance_param_map(
-            child_estimator, parent_estimator._autologging_metadata.uid_to_indexed_name_map
-        )
-        param_batches_to_log = _chunk_dict(params_to_log, chunk_size=MAX_PARAMS_TAGS_PER_BATCH)
-        metrics_to_log = {k: v[i] for k, v in metrics_dict.items()}
-        for params_batch, metrics_batch in zip_longest(
-            param_batches_to_log, [metrics_to_log], fillvalue={}
-        ):
-            # Trim any parameter keys / values and metric keys that exceed the limits
-            # imposed by corresponding MLflow Tracking APIs (e.g., LogParam, LogMetric)
-            truncated_params_batch = _truncate_dict(
-                params_batch, MAX_ENTITY_KEY_LENGTH, MAX_PARAM_VAL_LENGTH
+            params_to_log = _get_instance_param_map(
+                child_estimator, parent_estimator._autologging_metadata.uid_to_indexed_name_map
+            )
+            autologging_client.log_params(
+                run_id=pending_child_run_id,
+                params={str(key): value for key, value in params_to_log.items()},
             )
-            truncated_metrics_batch = _truncate_dict(
-                metrics_batch, max_key_length=MAX_ENTITY_KEY_LENGTH
+            autologging_client.log_metrics(
+                run_id=pending_child_run_id,
+                metrics={str(key): v[i] for key, v in metrics_dict.items()},
             )
-            client.log_batch(
-                run_id=child_run.info.run_id,
-                params=[
-                    Param(str(key), str(value)) for key, value in truncated_params_batch.items()
-                ],
-                metrics=[
-                    Metric(key=str(key), value=value, timestamp=child_run_end_time, step=0)
-                    for key, value in truncated_metrics_batch.items()
-                ],
+            autologging_client.set_terminated(
+                run_id=pending_child_run_id, end_time=child_run_end_time
             )
-        client.set_terminated(run_id=child_run.info.run_id, end_time=child_run_end_time)
 
 
 def _log_parameter_search_results_as_artifact(param_maps, metrics_dict, run_id):
@@ -28,7 +28,7 @@ from mlflow.models.model import MLMODEL_FILE_NAME
 from mlflow.models.utils import ModelInputExample, _save_example
 from mlflow.protos.databricks_pb2 import RESOURCE_DOES_NOT_EXIST
 from mlflow.pytorch import pickle_module as mlflow_pytorch_pickle_module
-from mlflow.tracking.artifact_utils import _download_artifact_from_uri
+from mlflow.tracking.artifact_utils import _download_artifact_from_uri, _download_model_from_uri
 from mlflow.utils.annotations import experimental
 from mlflow.utils.environment import (
     _mlflow_conda_env,
@@ -697,7 +697,7 @@ def load_model(model_uri, dst_path=None, **kwargs):
     """
     import torch
 
-    local_model_path = _download_artifact_from_uri(artifact_uri=model_uri, output_path=dst_path)
+    local_model_path = _download_model_from_uri(model_uri, output_path=dst_path)
     try:
         pyfunc_conf = _get_flavor_configuration(
             model_path=local_model_path, flavor_name=pyfunc.FLAVOR_NAME
@@ -727,7 +727,14 @@ def _load_pyfunc(path, **kwargs):
 
     :param path: Local filesystem path to the MLflow Model with the ``pytorch`` flavor.
     """
-    return _PyTorchWrapper(_load_model(path, **kwargs))
+    import torch
+
+    num_threads = pyfunc_utils._get_inference_intra_op_threads()
+    if num_threads is not None:
+        torch.set_num_threads(num_threads)
+    return _PyTorchWrapper(
+        _load_model(path, **kwargs), batch_size=pyfunc_utils._get_inference_batch_size()
+    )
 
 
 class _PyTorchWrapper(object):
@@ -736,16 +743,26 @@ class _PyTorchWrapper(object):
     predict(data: pd.DataFrame) -> model's output as pd.DataFrame (pandas DataFrame)
     """
 
-    def __init__(self, pytorch_model):
+    def __init__(self, pytorch_model, batch_size=None):
+        """
+        :param pytorch_model: A PyTorch model.
+        :param batch_size: The maximum number of input rows passed to the model at once, or
+                           ``None`` to pass the whole input at once.
+        """
         self.pytorch_model = pytorch_model
+        self.pytorch_model.eval()
+        self.batch_size = batch_size
+        # The device the model was last moved to by `predict`
+        self._device = None
 
     def predict(self, data, device="cpu"):
         import torch
 
+        # NB: `torch.from_numpy` shares the memory of contiguous arrays instead of copying them
         if isinstance(data, pd.DataFrame):
-            inp_data = data.values.astype(np.float32)
+            inp_data = np.ascontiguousarray(data.values, dtype=np.float32)
         elif isinstance(data, np.ndarray):
-            inp_data = data
+            inp_data = np.ascontiguousarray(data)
         elif isinstance(data, (list, dict)):
             raise TypeError(
                 "The PyTorch flavor does not support List or Dict input types. "
@@ -754,22 +771,25 @@ class _PyTorchWrapper(object):
         else:
             raise TypeError("Input data should be pandas.DataFrame or numpy.ndarray")
 
-        self.pytorch_model.to(device)
-        self.pytorch_model.eval()
+        if device != self._device:
+            self.pytorch_model.to(device)
+            self._device = device
+        preds = []
         with torch.no_grad():
-            input_tensor = torch.from_numpy(inp_data).to(device)
-            preds = self.pytorch_model(input_tensor)
-            if not isinstance(preds, torch.Tensor):
-                raise TypeError(
-                    "Expected PyTorch model to output a single output tensor, "
-                    "but got output of type '{}'".format(type(preds))
-                )
-            if isinstance(data, pd.DataFrame):
-                predicted = pd.DataFrame(preds.numpy())
-                predicted.index = data.index
-            else:
-                predicted = preds.numpy()
-            return predicted
+            for batch in pyfunc_utils._get_batch_slices(len(inp_data), self.batch_size):
+                input_tensor = torch.from_numpy(inp_data[batch]).to(device)
+                batch_preds = self.pytorch_model(input_tensor)
+                if not isinstance(batch_preds, torch.Tensor):
+                    raise TypeError(
+                        "Expected PyTorch model to output a single output tensor, "
+                        "but got output of type '{}'".format(type(batch_preds))
+                    )
+                preds.append(batch_preds.cpu().numpy())
+        predicted = preds[0] if len(preds) == 1 else np.concatenate(preds)
+        if isinstance(data, pd.DataFrame):
+            predicted = pd.DataFrame(predicted)
+            predicted.index = data.index
+        return predicted
 
 
 @experimental
@@ -1,5 +1,6 @@
 import os
 import shlex
+import shutil
 import sys
 import textwrap
 
@@ -12,6 +13,7 @@ from mlflow.server.handlers import (
     _add_static_prefix,
     get_model_version_artifact_handler,
 )
+from mlflow.server.response_cache import SharedMemoryResponseCache
 from mlflow.utils.process import exec_cmd
 
 # NB: These are intenrnal environment variables used for communication between
@@ -22,6 +24,14 @@ ARTIFACTS_DESTINATION_ENV_VAR = "_MLFLOW_SERVER_ARTIFACT_DESTINATION"
 PROMETHEUS_EXPORTER_ENV_VAR = "prometheus_multiproc_dir"
 SERVE_ARTIFACTS_ENV_VAR = "_MLFLOW_SERVER_SERVE_ARTIFACTS"
 ARTIFACTS_ONLY_ENV_VAR = "_MLFLOW_SERVER_ARTIFACTS_ONLY"
+WRITE_BEHIND_INTERVAL_MS_ENV_VAR = "_MLFLOW_SERVER_WRITE_BEHIND_INTERVAL_MS"
+RESPONSE_CACHE_TTL_SECONDS_ENV_VAR = "_MLFLOW_SERVER_RESPONSE_CACHE_TTL_SECONDS"
+RESPONSE_CACHE_MAX_ENTRIES_ENV_VAR = "_MLFLOW_SERVER_RESPONSE_CACHE_MAX_ENTRIES"
+RESPONSE_CACHE_DIR_ENV_VAR = "_MLFLOW_SERVER_RESPONSE_CACHE_DIR"
+
+# Number of threads of each gunicorn worker in write-behind mode. Writes are only group-committed
+# if a worker handles several requests concurrently, which sync workers do not do
+_WRITE_BEHIND_GUNICORN_THREADS = 16
 
 REL_STATIC_DIR = "js/build"
 
@@ -99,9 +109,20 @@ def _build_waitress_command(waitress_opts, host, port):
     )
 
 
-def _build_gunicorn_command(gunicorn_opts, host, port, workers):
+def _sets_gunicorn_concurrency(opts):
+    """
+    :return: ``True`` if the given gunicorn options set the number of threads or the worker class.
+    """
+    return any(
+        opt.split("=")[0] in ("--threads", "--worker-class") or opt.startswith("-k") for opt in opts
+    )
+
+
+def _build_gunicorn_command(gunicorn_opts, host, port, workers, threads=None):
     bind_address = "%s:%s" % (host, port)
     opts = shlex.split(gunicorn_opts) if gunicorn_opts else []
+    if threads is not None and not _sets_gunicorn_concurrency(opts):
+        opts += ["--threads", "%s" % threads]
     return ["gunicorn"] + opts + ["-b", bind_address, "-w", "%s" % workers, "mlflow.server:app"]
 
 
@@ -118,11 +139,28 @@ def _run_server(
     gunicorn_opts=None,
     waitress_opts=None,
     expose_prometheus=None,
+    write_behind_interval_ms=None,
+    response_cache_ttl_seconds=None,
+    response_cache_backend="memory",
+    response_cache_max_entries=1000,
 ):
     """
     Run the MLflow server, wrapping it in gunicorn or waitress on windows
     :param static_prefix: If set, the index.html asset will be served from the path static_prefix.
                           If left None, the index.html asset will be served from the root path.
+    :param write_behind_interval_ms: If set, run metrics, params and tags are group-committed to
+                                     the backend store by each server worker every
+                                     ``write_behind_interval_ms`` milliseconds (see
+                                     :py:mod:`mlflow.server.write_behind`). The gunicorn workers
+                                     are then run with several threads, unless ``gunicorn_opts``
+                                     sets their number of threads or their worker class.
+    :param response_cache_ttl_seconds: If set, the responses of the read endpoints of the tracking
+                                       server are cached for up to ``response_cache_ttl_seconds``
+                                       seconds (see :py:mod:`mlflow.server.response_cache`).
+    :param response_cache_backend: ``"memory"`` to cache responses in the memory of each server
+                                   worker, or ``"shared-memory"`` to cache them in shared memory
+                                   files that are shared by the server workers.
+    :param response_cache_max_entries: The maximum number of cached responses.
     :return: None
     """
     env_map = {}
@@ -142,9 +180,27 @@ def _run_server(
     if expose_prometheus:
         env_map[PROMETHEUS_EXPORTER_ENV_VAR] = expose_prometheus
 
+    if write_behind_interval_ms is not None:
+        env_map[WRITE_BEHIND_INTERVAL_MS_ENV_VAR] = str(write_behind_interval_ms)
+
+    response_cache_dir = None
+    if response_cache_ttl_seconds is not None:
+        env_map[RESPONSE_CACHE_TTL_SECONDS_ENV_VAR] = str(response_cache_ttl_seconds)
+        env_map[RESPONSE_CACHE_MAX_ENTRIES_ENV_VAR] = str(response_cache_max_entries)
+        if response_cache_backend == "shared-memory":
+            response_cache_dir = SharedMemoryResponseCache.get_default_root_dir()
+            env_map[RESPONSE_CACHE_DIR_ENV_VAR] = response_cache_dir
+
     # TODO: eventually may want waitress on non-win32
     if sys.platform == "win32":
         full_command = _build_waitress_command(waitress_opts, host, port)
     else:
-        full_command = _build_gunicorn_command(gunicorn_opts, host, port, workers or 4)
-    exec_cmd(full_command, env=env_map, stream_output=True)
+        threads = _WRITE_BEHIND_GUNICORN_THREADS if write_behind_interval_ms is not None else None
+        full_command = _build_gunicorn_command(
+            gunicorn_opts, host, port, workers or 4, threads=threads
+        )
+    try:
+        exec_cmd(full_command, env=env_map, stream_output=True)
+    finally:
+        if response_cache_dir is not None:
+            shutil.rmtree(response_cache_dir, ignore_errors=True)
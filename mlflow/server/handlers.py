@@ -1,15 +1,16 @@
 # Define all the service endpoint handlers here.
+import io
 import json
 import os
 import re
-import tempfile
 import posixpath
 
 import logging
-from functools import wraps
+from functools import lru_cache, wraps
 
 from flask import Response, request, current_app, send_file
 from google.protobuf import descriptor
+from werkzeug.wsgi import wrap_file
 
 from mlflow.entities import Metric, Param, RunTag, ViewType, ExperimentTag, FileInfo
 from mlflow.entities.model_registry import RegisteredModelTag, ModelVersionTag
@@ -27,6 +28,7 @@ from mlflow.protos.service_pb2 import (
     ListArtifacts,
     GetMetricHistory,
     CreateRun,
+    CreateRuns,
     UpdateRun,
     LogMetric,
     LogParam,
@@ -72,12 +74,16 @@ from mlflow.protos.mlflow_artifacts_pb2 import (
     ListArtifacts as ListArtifactsMlflowArtifacts,
 )
 from mlflow.protos.databricks_pb2 import RESOURCE_DOES_NOT_EXIST, INVALID_PARAMETER_VALUE
+from mlflow.store.artifact.artifact_repo import _TemporaryFile
 from mlflow.store.artifact.artifact_repository_registry import get_artifact_repository
 from mlflow.store.db.db_types import DATABASE_ENGINES
+from mlflow.store.tracking import RunSpec
+from mlflow.server.response_cache import InMemoryResponseCache, SharedMemoryResponseCache
+from mlflow.server.write_behind import WriteBehindQueue
 from mlflow.tracking._model_registry.registry import ModelRegistryStoreRegistry
 from mlflow.tracking._tracking_service.registry import TrackingStoreRegistry
 from mlflow.utils.proto_json_utils import message_to_json, parse_dict
-from mlflow.utils.validation import _validate_batch_log_api_req
+from mlflow.utils.validation import _validate_batch_log_api_req, _validate_batch_log_limits
 from mlflow.utils.string_utils import is_string_type
 from mlflow.tracking.registry import UnsupportedModelRegistryStoreURIException
 
@@ -85,7 +91,11 @@ _logger = logging.getLogger(__name__)
 _tracking_store = None
 _model_registry_store = None
 _artifact_repo = None
+_write_behind_queue = None
+_response_cache = None
 STATIC_PREFIX_ENV_VAR = "_MLFLOW_STATIC_PREFIX"
+# Size of the chunks in which artifacts are streamed to and from the artifact repository
+_ARTIFACT_STREAM_CHUNK_SIZE = 1024 * 1024  # 1 MB
 
 
 class TrackingStoreRegistryWrapper(TrackingStoreRegistry):
@@ -155,6 +165,100 @@ def _get_tracking_store(backend_store_uri=None, default_artifact_root=None):
     return _tracking_store
 
 
+def _get_write_behind_queue():
+    """
+    :return: The ``WriteBehindQueue`` of this server worker if write-behind logging of run data is
+             enabled, or ``None`` if run data is written to the tracking store directly.
+    """
+    from mlflow.server import WRITE_BEHIND_INTERVAL_MS_ENV_VAR
+
+    global _write_behind_queue
+    interval_ms = os.environ.get(WRITE_BEHIND_INTERVAL_MS_ENV_VAR)
+    if not interval_ms:
+        return None
+    if _write_behind_queue is None:
+        # Cached responses are invalidated once the writes are committed by the queue
+        _write_behind_queue = WriteBehindQueue(
+            _get_tracking_store(),
+            int(interval_ms) / 1000,
+            on_commit=lambda run_ids: _invalidate_cached_responses(
+                lambda: [d for run_id in run_ids for d in _get_run_dependencies(run_id)]
+            ),
+        )
+    return _write_behind_queue
+
+
+def _get_response_cache():
+    """
+    :return: The ``ResponseCache`` of this server worker if caching of the responses of read
+             endpoints is enabled, or ``None`` if responses are always read from the tracking store.
+    """
+    from mlflow.server import (
+        RESPONSE_CACHE_TTL_SECONDS_ENV_VAR,
+        RESPONSE_CACHE_MAX_ENTRIES_ENV_VAR,
+        RESPONSE_CACHE_DIR_ENV_VAR,
+    )
+
+    global _response_cache
+    ttl_seconds = os.environ.get(RESPONSE_CACHE_TTL_SECONDS_ENV_VAR)
+    if not ttl_seconds:
+        return None
+    if _response_cache is None:
+        max_entries = int(os.environ.get(RESPONSE_CACHE_MAX_ENTRIES_ENV_VAR, "1000"))
+        cache_dir = os.environ.get(RESPONSE_CACHE_DIR_ENV_VAR)
+        if cache_dir:
+            _response_cache = SharedMemoryResponseCache(int(ttl_seconds), max_entries, cache_dir)
+        else:
+            _response_cache = InMemoryResponseCache(int(ttl_seconds), max_entries)
+    return _response_cache
+
+
+def _get_response_json(request_message, dependencies, read_response_message):
+    """
+    Get the JSON of the response to a request from the response cache if it is enabled, or read the
+    response message from the tracking store.
+
+    :param request_message: The request message.
+    :param dependencies: Function returning the names of the dependencies of the response (see
+                         :py:mod:`mlflow.server.response_cache`).
+    :param read_response_message: Function reading the response message from the tracking store.
+    """
+    response_cache = _get_response_cache()
+    if response_cache is None:
+        return message_to_json(read_response_message())
+    return response_cache.get(
+        endpoint=type(request_message).__name__,
+        request=request_message.SerializeToString(deterministic=True),
+        dependencies=dependencies(),
+        read_response=lambda: message_to_json(read_response_message()),
+    )
+
+
+@lru_cache(maxsize=10000)
+def _get_experiment_id_of_run(run_id):
+    return _get_tracking_store().get_run(run_id).info.experiment_id
+
+
+def _get_run_dependencies(run_id):
+    return ["run:" + run_id, "experiment-runs:" + _get_experiment_id_of_run(run_id)]
+
+
+def _get_experiment_dependencies(experiment_id):
+    return ["experiment:" + experiment_id, "experiment-runs:" + experiment_id]
+
+
+def _invalidate_cached_responses(dependencies):
+    """
+    Invalidate the cached responses that depend on data written to the tracking store, if the
+    response cache is enabled.
+
+    :param dependencies: Function returning the names of the dependencies that were written.
+    """
+    response_cache = _get_response_cache()
+    if response_cache is not None:
+        response_cache.invalidate(dependencies())
+
+
 def _get_model_registry_store(backend_store_uri=None):
     from mlflow.server import BACKEND_STORE_URI_ENV_VAR
 
@@ -339,11 +443,20 @@ def _create_experiment():
 @_disable_if_artifacts_only
 def _get_experiment():
     request_message = _get_request_message(GetExperiment())
-    response_message = GetExperiment.Response()
-    experiment = _get_tracking_store().get_experiment(request_message.experiment_id).to_proto()
-    response_message.experiment.MergeFrom(experiment)
+
+    def read_response_message():
+        response_message = GetExperiment.Response()
+        experiment = _get_tracking_store().get_experiment(request_message.experiment_id)
+        response_message.experiment.MergeFrom(experiment.to_proto())
+        return response_message
+
+    response_json = _get_response_json(
+        request_message,
+        lambda: ["experiment:" + request_message.experiment_id],
+        read_response_message,
+    )
     response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
+    response.set_data(response_json)
     return response
 
 
@@ -370,6 +483,9 @@ def _get_experiment_by_name():
 def _delete_experiment():
     request_message = _get_request_message(DeleteExperiment())
     _get_tracking_store().delete_experiment(request_message.experiment_id)
+    _invalidate_cached_responses(
+        lambda: _get_experiment_dependencies(request_message.experiment_id)
+    )
     response_message = DeleteExperiment.Response()
     response = Response(mimetype="application/json")
     response.set_data(message_to_json(response_message))
@@ -381,6 +497,9 @@ def _delete_experiment():
 def _restore_experiment():
     request_message = _get_request_message(RestoreExperiment())
     _get_tracking_store().restore_experiment(request_message.experiment_id)
+    _invalidate_cached_responses(
+        lambda: _get_experiment_dependencies(request_message.experiment_id)
+    )
     response_message = RestoreExperiment.Response()
     response = Response(mimetype="application/json")
     response.set_data(message_to_json(response_message))
@@ -395,6 +514,7 @@ def _update_experiment():
         _get_tracking_store().rename_experiment(
             request_message.experiment_id, request_message.new_name
         )
+        _invalidate_cached_responses(lambda: ["experiment:" + request_message.experiment_id])
     response_message = UpdateExperiment.Response()
     response = Response(mimetype="application/json")
     response.set_data(message_to_json(response_message))
@@ -413,6 +533,7 @@ def _create_run():
         start_time=request_message.start_time,
         tags=tags,
     )
+    _invalidate_cached_responses(lambda: ["experiment-runs:" + request_message.experiment_id])
 
     response_message = CreateRun.Response()
     response_message.run.MergeFrom(run.to_proto())
@@ -421,6 +542,34 @@ def _create_run():
     return response
 
 
+@catch_mlflow_exception
+@_disable_if_artifacts_only
+def _create_runs():
+    request_message = _get_request_message(CreateRuns())
+    runs = [
+        RunSpec(
+            user_id=run.user_id,
+            start_time=run.start_time,
+            end_time=run.end_time if run.HasField("end_time") else None,
+            status=run.status if run.HasField("status") else None,
+            tags=[RunTag.from_proto(proto_tag) for proto_tag in run.tags],
+            params=[Param.from_proto(proto_param) for proto_param in run.params],
+            metrics=[Metric.from_proto(proto_metric) for proto_metric in run.metrics],
+        )
+        for run in request_message.runs
+    ]
+    created_runs = _get_tracking_store().create_runs(
+        experiment_id=request_message.experiment_id, runs=runs
+    )
+    _invalidate_cached_responses(lambda: ["experiment-runs:" + request_message.experiment_id])
+
+    response_message = CreateRuns.Response()
+    response_message.runs.extend([run.to_proto() for run in created_runs])
+    response = Response(mimetype="application/json")
+    response.set_data(message_to_json(response_message))
+    return response
+
+
 @catch_mlflow_exception
 @_disable_if_artifacts_only
 def _update_run():
@@ -429,6 +578,7 @@ def _update_run():
     updated_info = _get_tracking_store().update_run_info(
         run_id, request_message.status, request_message.end_time
     )
+    _invalidate_cached_responses(lambda: _get_run_dependencies(run_id))
     response_message = UpdateRun.Response(run_info=updated_info.to_proto())
     response = Response(mimetype="application/json")
     response.set_data(message_to_json(response_message))
@@ -440,6 +590,7 @@ def _update_run():
 def _delete_run():
     request_message = _get_request_message(DeleteRun())
     _get_tracking_store().delete_run(request_message.run_id)
+    _invalidate_cached_responses(lambda: _get_run_dependencies(request_message.run_id))
     response_message = DeleteRun.Response()
     response = Response(mimetype="application/json")
     response.set_data(message_to_json(response_message))
@@ -451,6 +602,7 @@ def _delete_run():
 def _restore_run():
     request_message = _get_request_message(RestoreRun())
     _get_tracking_store().restore_run(request_message.run_id)
+    _invalidate_cached_responses(lambda: _get_run_dependencies(request_message.run_id))
     response_message = RestoreRun.Response()
     response = Response(mimetype="application/json")
     response.set_data(message_to_json(response_message))
@@ -465,7 +617,12 @@ def _log_metric():
         request_message.key, request_message.value, request_message.timestamp, request_message.step
     )
     run_id = request_message.run_id or request_message.run_uuid
-    _get_tracking_store().log_metric(run_id, metric)
+    write_behind_queue = _get_write_behind_queue()
+    if write_behind_queue is not None:
+        write_behind_queue.log_batch(run_id, metrics=[metric])
+    else:
+        _get_tracking_store().log_metric(run_id, metric)
+        _invalidate_cached_responses(lambda: _get_run_dependencies(run_id))
     response_message = LogMetric.Response()
     response = Response(mimetype="application/json")
     response.set_data(message_to_json(response_message))
@@ -478,7 +635,12 @@ def _log_param():
     request_message = _get_request_message(LogParam())
     param = Param(request_message.key, request_message.value)
     run_id = request_message.run_id or request_message.run_uuid
-    _get_tracking_store().log_param(run_id, param)
+    write_behind_queue = _get_write_behind_queue()
+    if write_behind_queue is not None:
+        write_behind_queue.log_batch(run_id, params=[param])
+    else:
+        _get_tracking_store().log_param(run_id, param)
+        _invalidate_cached_responses(lambda: _get_run_dependencies(run_id))
     response_message = LogParam.Response()
     response = Response(mimetype="application/json")
     response.set_data(message_to_json(response_message))
@@ -491,6 +653,7 @@ def _set_experiment_tag():
     request_message = _get_request_message(SetExperimentTag())
     tag = ExperimentTag(request_message.key, request_message.value)
     _get_tracking_store().set_experiment_tag(request_message.experiment_id, tag)
+    _invalidate_cached_responses(lambda: ["experiment:" + request_message.experiment_id])
     response_message = SetExperimentTag.Response()
     response = Response(mimetype="application/json")
     response.set_data(message_to_json(response_message))
@@ -503,7 +666,12 @@ def _set_tag():
     request_message = _get_request_message(SetTag())
     tag = RunTag(request_message.key, request_message.value)
     run_id = request_message.run_id or request_message.run_uuid
-    _get_tracking_store().set_tag(run_id, tag)
+    write_behind_queue = _get_write_behind_queue()
+    if write_behind_queue is not None:
+        write_behind_queue.log_batch(run_id, tags=[tag])
+    else:
+        _get_tracking_store().set_tag(run_id, tag)
+        _invalidate_cached_responses(lambda: _get_run_dependencies(run_id))
     response_message = SetTag.Response()
     response = Response(mimetype="application/json")
     response.set_data(message_to_json(response_message))
@@ -515,6 +683,7 @@ def _set_tag():
 def _delete_tag():
     request_message = _get_request_message(DeleteTag())
     _get_tracking_store().delete_tag(request_message.run_id, request_message.key)
+    _invalidate_cached_responses(lambda: _get_run_dependencies(request_message.run_id))
     response_message = DeleteTag.Response()
     response = Response(mimetype="application/json")
     response.set_data(message_to_json(response_message))
@@ -525,11 +694,18 @@ def _delete_tag():
 @_disable_if_artifacts_only
 def _get_run():
     request_message = _get_request_message(GetRun())
-    response_message = GetRun.Response()
     run_id = request_message.run_id or request_message.run_uuid
-    response_message.run.MergeFrom(_get_tracking_store().get_run(run_id).to_proto())
+
+    def read_response_message():
+        response_message = GetRun.Response()
+        response_message.run.MergeFrom(_get_tracking_store().get_run(run_id).to_proto())
+        return response_message
+
+    response_json = _get_response_json(
+        request_message, lambda: ["run:" + run_id], read_response_message
+    )
     response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
+    response.set_data(response_json)
     return response
 
 
@@ -537,7 +713,6 @@ def _get_run():
 @_disable_if_artifacts_only
 def _search_runs():
     request_message = _get_request_message(SearchRuns())
-    response_message = SearchRuns.Response()
     run_view_type = ViewType.ACTIVE_ONLY
     if request_message.HasField("run_view_type"):
         run_view_type = ViewType.from_proto(request_message.run_view_type)
@@ -546,14 +721,24 @@ def _search_runs():
     experiment_ids = request_message.experiment_ids
     order_by = request_message.order_by
     page_token = request_message.page_token
-    run_entities = _get_tracking_store().search_runs(
-        experiment_ids, filter_string, run_view_type, max_results, order_by, page_token
+
+    def read_response_message():
+        response_message = SearchRuns.Response()
+        run_entities = _get_tracking_store().search_runs(
+            experiment_ids, filter_string, run_view_type, max_results, order_by, page_token
+        )
+        response_message.runs.extend([r.to_proto() for r in run_entities])
+        if run_entities.token:
+            response_message.next_page_token = run_entities.token
+        return response_message
+
+    response_json = _get_response_json(
+        request_message,
+        lambda: ["experiment-runs:" + experiment_id for experiment_id in experiment_ids],
+        read_response_message,
     )
-    response_message.runs.extend([r.to_proto() for r in run_entities])
-    if run_entities.token:
-        response_message.next_page_token = run_entities.token
     response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
+    response.set_data(response_json)
     return response
 
 
@@ -580,12 +765,21 @@ def _list_artifacts():
 @_disable_if_artifacts_only
 def _get_metric_history():
     request_message = _get_request_message(GetMetricHistory())
-    response_message = GetMetricHistory.Response()
     run_id = request_message.run_id or request_message.run_uuid
-    metric_entites = _get_tracking_store().get_metric_history(run_id, request_message.metric_key)
-    response_message.metrics.extend([m.to_proto() for m in metric_entites])
+
+    def read_response_message():
+        response_message = GetMetricHistory.Response()
+        metric_entites = _get_tracking_store().get_metric_history(
+            run_id, request_message.metric_key
+        )
+        response_message.metrics.extend([m.to_proto() for m in metric_entites])
+        return response_message
+
+    response_json = _get_response_json(
+        request_message, lambda: ["run:" + run_id], read_response_message
+    )
     response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
+    response.set_data(response_json)
     return response
 
 
@@ -621,9 +815,17 @@ def _log_batch():
     metrics = [Metric.from_proto(proto_metric) for proto_metric in request_message.metrics]
     params = [Param.from_proto(proto_param) for proto_param in request_message.params]
     tags = [RunTag.from_proto(proto_tag) for proto_tag in request_message.tags]
-    _get_tracking_store().log_batch(
-        run_id=request_message.run_id, metrics=metrics, params=params, tags=tags
-    )
+    write_behind_queue = _get_write_behind_queue()
+    if write_behind_queue is not None:
+        _validate_batch_log_limits(metrics, params, tags)
+        write_behind_queue.log_batch(
+            request_message.run_id, metrics=metrics, params=params, tags=tags
+        )
+    else:
+        _get_tracking_store().log_batch(
+            run_id=request_message.run_id, metrics=metrics, params=params, tags=tags
+        )
+        _invalidate_cached_responses(lambda: _get_run_dependencies(request_message.run_id))
     response_message = LogBatch.Response()
     response = Response(mimetype="application/json")
     response.set_data(message_to_json(response_message))
@@ -655,6 +857,7 @@ def _log_model():
     _get_tracking_store().record_logged_model(
         run_id=request_message.run_id, mlflow_model=Model.from_dict(model)
     )
+    _invalidate_cached_responses(lambda: _get_run_dependencies(request_message.run_id))
     response_message = LogModel.Response()
     response = Response(mimetype="application/json")
     response.set_data(message_to_json(response_message))
@@ -921,23 +1124,47 @@ def _download_artifact(artifact_path):
     from `artifact_path` (a relative path from the root artifact directory).
     """
     basename = posixpath.basename(artifact_path)
-    tmp_dir = tempfile.TemporaryDirectory()
-    tmp_path = os.path.join(tmp_dir.name, basename)
     artifact_repo = _get_artifact_repo_mlflow_artifacts()
-    artifact_repo._download_file(artifact_path, tmp_path)
-
-    # Ref: https://stackoverflow.com/a/24613980/6943581
-    file_handle = open(tmp_path, "rb")
-
-    def stream_and_remove_file():
-        yield from file_handle
+    file_handle = artifact_repo._open_file(artifact_path)
+    try:
+        file_size = file_handle.seek(0, io.SEEK_END)
+        file_handle.seek(0)
+        etag = _get_artifact_etag(file_handle)
+    except BaseException:
         file_handle.close()
-        tmp_dir.cleanup()
+        raise
 
-    return current_app.response_class(
-        stream_and_remove_file(),
+    response = current_app.response_class(
+        wrap_file(request.environ, file_handle, _ARTIFACT_STREAM_CHUNK_SIZE),
         headers={"Content-Disposition": "attachment", "filename": basename},
+        direct_passthrough=True,
     )
+    response.content_length = file_size
+    if etag is not None:
+        response.set_etag(etag)
+    if isinstance(file_handle, _TemporaryFile):
+        # NB: Repositories that cannot read files incrementally download the whole artifact for
+        # each request. Ranges are not served for them, so that clients download it at once
+        return response.make_conditional(request)
+    response.headers["Accept-Ranges"] = "bytes"
+    # Serves `Range` requests (e.g. to resume interrupted downloads) with a 206 response containing
+    # the requested bytes, and conditional requests with a 304 response
+    return response.make_conditional(request, accept_ranges=True, complete_length=file_size)
+
+
+def _get_artifact_etag(file_handle):
+    """
+    :return: An entity tag identifying the contents of the specified artifact file object, based on
+             the `etag` attribute of the file object if it defines one or its size and modification
+             time otherwise. ``None`` if neither is available.
+    """
+    if hasattr(file_handle, "etag"):
+        return file_handle.etag.strip('"') if file_handle.etag else None
+    try:
+        stat = os.fstat(file_handle.fileno())
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        return None
+    return "%x-%x" % (stat.st_mtime_ns, stat.st_size)
 
 
 @catch_mlflow_exception
@@ -947,20 +1174,8 @@ def _upload_artifact(artifact_path):
     A request handler for `PUT /mlflow-artifacts/artifacts/<artifact_path>` to upload an artifact
     to `artifact_path` (a relative path from the root artifact directory).
     """
-    head, tail = posixpath.split(artifact_path)
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        tmp_path = os.path.join(tmp_dir, tail)
-        with open(tmp_path, "wb") as f:
-            chunk_size = 1024 * 1024  # 1 MB
-            while True:
-                chunk = request.stream.read(chunk_size)
-                if len(chunk) == 0:
-                    break
-                f.write(chunk)
-
-        artifact_repo = _get_artifact_repo_mlflow_artifacts()
-        artifact_repo.log_artifact(tmp_path, artifact_path=head or None)
-
+    artifact_repo = _get_artifact_repo_mlflow_artifacts()
+    artifact_repo._upload_stream(request.stream, artifact_path)
     return _wrap_response(UploadArtifact.Response())
 
 
@@ -1041,6 +1256,7 @@ HANDLERS = {
     RestoreExperiment: _restore_experiment,
     UpdateExperiment: _update_experiment,
     CreateRun: _create_run,
+    CreateRuns: _create_runs,
     UpdateRun: _update_run,
     DeleteRun: _delete_run,
     RestoreRun: _restore_run,
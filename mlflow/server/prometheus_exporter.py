@@ -1,19 +1,81 @@
-from prometheus_flask_exporter.multiprocess import GunicornInternalPrometheusMetrics
-from flask import request
-
-from mlflow.version import VERSION
-
-
-def activate_prometheus_exporter(app):
-    def mlflow_version(_: request):
-        return VERSION
-
-    metrics = GunicornInternalPrometheusMetrics(
-        app,
-        export_defaults=True,
-        defaults_prefix="mlflow",
-        excluded_paths=["/health"],
-        group_by=mlflow_version,
-    )
-
-    return metrics
+from prometheus_flask_exporter.multiprocess import GunicornInternalPrometheusMetrics
+from flask import request
+
+from mlflow.server import response_cache, write_behind
+from mlflow.version import VERSION
+
+
+class _WriteBehindMetrics:
+    """
+    Exports the queue depth and the commit latency of the write-behind queues of the server workers
+    (see :py:mod:`mlflow.server.write_behind`).
+    """
+
+    def __init__(self):
+        from prometheus_client import Gauge, Histogram
+
+        # NB: In multiprocess mode, metric values are written to files that are collected by the
+        # registry of the exporter, so the metrics do not need to be registered anywhere. The queue
+        # depth is summed across the live server workers, which each have their own queue
+        self._queue_depth = Gauge(
+            "mlflow_write_behind_queue_depth",
+            "Number of run data writes waiting to be committed",
+            multiprocess_mode="livesum",
+            registry=None,
+        )
+        self._commit_latency = Histogram(
+            "mlflow_write_behind_commit_latency_seconds",
+            "Time taken to commit a group of run data writes",
+            registry=None,
+        )
+        self._commit_size = Histogram(
+            "mlflow_write_behind_commit_writes",
+            "Number of run data writes committed together",
+            buckets=(1, 2, 5, 10, 20, 50, 100, 200, 500, 1000),
+            registry=None,
+        )
+
+    def on_queue_depth(self, queue_depth):
+        self._queue_depth.set(queue_depth)
+
+    def on_commit(self, num_writes, seconds):
+        self._commit_latency.observe(seconds)
+        self._commit_size.observe(num_writes)
+
+
+class _ResponseCacheMetrics:
+    """
+    Exports the number of lookups of the response caches of the server workers by endpoint and
+    result, from which their hit rates can be computed (see
+    :py:mod:`mlflow.server.response_cache`).
+    """
+
+    def __init__(self):
+        from prometheus_client import Counter
+
+        self._lookups = Counter(
+            "mlflow_response_cache_lookups",
+            "Number of lookups of responses in the response cache",
+            labelnames=("endpoint", "result"),
+            registry=None,
+        )
+
+    def on_lookup(self, endpoint, hit):
+        self._lookups.labels(endpoint=endpoint, result="hit" if hit else "miss").inc()
+
+
+def activate_prometheus_exporter(app):
+    def mlflow_version(_: request):
+        return VERSION
+
+    metrics = GunicornInternalPrometheusMetrics(
+        app,
+        export_defaults=True,
+        defaults_prefix="mlflow",
+        excluded_paths=["/health"],
+        group_by=mlflow_version,
+    )
+    write_behind.set_stats_listener(_WriteBehindMetrics())
+    response_cache.set_stats_listener(_ResponseCacheMetrics())
+
+    return metrics
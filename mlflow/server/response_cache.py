@@ -0,0 +1,287 @@
+"""
+Read-through caching of the responses of the tracking server's read endpoints.
+
+The MLflow UI and other dashboards poll endpoints such as GetRun, GetExperiment, GetMetricHistory
+and SearchRuns repeatedly, and each of these requests reads the backend store. When a response
+cache is enabled, the handlers of these endpoints serve the JSON of the response from the cache
+instead, and only read the backend store if the response is not cached yet or has expired.
+
+Each cached response depends on one or more named *dependencies*, e.g. ``run:<run_id>``. The
+handlers that write to the backend store invalidate the dependencies that they modify, which
+causes the responses that depend on them to be read from the backend store again. To do so, the
+cache keeps a version of each dependency: responses are cached along with the versions of their
+dependencies at the time they were read, and are only served if these versions are still
+current. The versions are captured *before* reading the backend store, so that a response read
+concurrently with a write is never served after the write is complete.
+
+Two backends are available:
+
+- ``InMemoryResponseCache`` caches responses in the memory of each server worker. Writes only
+  invalidate the responses cached by the worker that handles them, so the responses cached by
+  other workers may be stale until they expire.
+- ``SharedMemoryResponseCache`` caches responses in files of a directory that is shared by the
+  server workers, which is placed in shared memory (``/dev/shm``) when available. Writes
+  invalidate the responses cached by all the workers.
+"""
+import hashlib
+import itertools
+import os
+import pickle
+import tempfile
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+_stats_listener = None
+
+
+def set_stats_listener(listener):
+    """
+    Register an object that is notified of the lookups of the response caches of this process,
+    e.g. to export their hit rate as Prometheus metrics. The object must define an
+    ``on_lookup(endpoint, hit)`` method, which is called with the name of the endpoint whose
+    response is looked up and whether it is served from the cache.
+    """
+    global _stats_listener
+    _stats_listener = listener
+
+
+class ResponseCache:
+    """
+    Base class of response caches. Subclasses store the cached responses and the versions of
+    their dependencies by implementing the ``_get_entry``, ``_set_entry``, ``_get_version`` and
+    ``_new_version`` methods.
+    """
+
+    def __init__(self, ttl_seconds):
+        """
+        :param ttl_seconds: The number of seconds for which responses are cached.
+        """
+        self._ttl_seconds = ttl_seconds
+
+    def get(self, endpoint, request, dependencies, read_response):
+        """
+        Get the response to a request from the cache, or read it and cache it if it is not cached.
+
+        :param endpoint: The name of the endpoint that handles the request.
+        :param request: A bytes or string representation of the request. Requests to the same
+                        endpoint with the same representation get the same response.
+        :param dependencies: The names of the dependencies of the response.
+        :param read_response: A function that reads the response from the backend store. Its
+                              result must be picklable. Exceptions raised by the function are
+                              propagated and not cached.
+        :return: The response.
+        """
+        key = (endpoint, request)
+        entry = self._get_entry(key)
+        versions = [self._get_version(dependency) for dependency in dependencies]
+        hit = entry is not None and entry[0] > time.time() and entry[1] == versions
+        if _stats_listener is not None:
+            _stats_listener.on_lookup(endpoint, hit)
+        if hit:
+            return entry[2]
+
+        expires_at = time.time() + self._ttl_seconds
+        response = read_response()
+        self._set_entry(key, (expires_at, versions, response))
+        return response
+
+    def invalidate(self, dependencies):
+        """
+        Invalidate the cached responses that depend on any of the specified dependencies.
+        """
+        for dependency in dependencies:
+            self._new_version(dependency)
+
+    def _get_entry(self, key):
+        """
+        :return: The ``(expires_at, versions, response)`` tuple cached for the specified key, or
+                 ``None``.
+        """
+        raise NotImplementedError
+
+    def _set_entry(self, key, entry):
+        raise NotImplementedError
+
+    def _get_version(self, dependency):
+        """
+        :return: The current version of the specified dependency. Dependencies that have never
+                 been invalidated must have a version too.
+        """
+        raise NotImplementedError
+
+    def _new_version(self, dependency):
+        """
+        Assign a version to the specified dependency that it has never had before.
+        """
+        raise NotImplementedError
+
+
+class InMemoryResponseCache(ResponseCache):
+    """
+    Caches the responses in the memory of the process, evicting the least recently used responses
+    when the cache is full.
+    """
+
+    def __init__(self, ttl_seconds, max_entries):
+        """
+        :param ttl_seconds: The number of seconds for which responses are cached.
+        :param max_entries: The maximum number of cached responses.
+        """
+        super().__init__(ttl_seconds)
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        # Dependencies that have been invalidated, mapped to their version and the time they were
+        # invalidated. The other dependencies have version 0
+        self._versions = {}
+        self._version_counter = itertools.count(1)
+
+    def _get_entry(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def _set_entry(self, key, entry):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+            if len(self._versions) > self._max_entries:
+                self._forget_old_versions()
+
+    def _forget_old_versions(self):
+        # NB: A dependency that was last invalidated more than one TTL ago can safely go back to
+        # version 0, since any response cached before it was invalidated has expired by now
+        min_invalidation_time = time.time() - self._ttl_seconds
+        self._versions = {
+            dependency: (version, invalidation_time)
+            for dependency, (version, invalidation_time) in self._versions.items()
+            if invalidation_time >= min_invalidation_time
+        }
+
+    def _get_version(self, dependency):
+        with self._lock:
+            version, _ = self._versions.get(dependency, (0, None))
+            return version
+
+    def _new_version(self, dependency):
+        with self._lock:
+            self._versions[dependency] = (next(self._version_counter), time.time())
+
+
+class SharedMemoryResponseCache(ResponseCache):
+    """
+    Caches the responses in files of a directory that can be shared by several processes. Each
+    response and each dependency version is stored in its own file, which is replaced atomically
+    when it changes. The least recently cached responses are evicted when the cache is full.
+    """
+
+    # The number of responses cached by a process between two evictions
+    _EVICTION_INTERVAL = 100
+
+    def __init__(self, ttl_seconds, max_entries, root_dir):
+        """
+        :param ttl_seconds: The number of seconds for which responses are cached.
+        :param max_entries: The maximum number of cached responses, which may be exceeded by
+                            the responses cached in between two evictions.
+        :param root_dir: The directory of the cache files, which is created if it does not exist.
+        """
+        super().__init__(ttl_seconds)
+        self._max_entries = max_entries
+        self._entries_dir = os.path.join(root_dir, "entries")
+        self._versions_dir = os.path.join(root_dir, "versions")
+        os.makedirs(self._entries_dir, exist_ok=True)
+        os.makedirs(self._versions_dir, exist_ok=True)
+        self._lock = threading.Lock()
+        self._num_entries_set = 0
+
+    @staticmethod
+    def get_default_root_dir():
+        """
+        :return: A new directory for the cache files, in shared memory if available.
+        """
+        shm_dir = "/dev/shm"
+        return tempfile.mkdtemp(
+            prefix="mlflow-response-cache-", dir=shm_dir if os.path.isdir(shm_dir) else None
+        )
+
+    @staticmethod
+    def _get_file_name(obj):
+        return hashlib.sha256(pickle.dumps(obj)).hexdigest()
+
+    @staticmethod
+    def _read_file(path):
+        try:
+            with open(path, "rb") as f:
+                return pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+
+    @staticmethod
+    def _write_file(path, obj):
+        tmp_path = "{}.{}.tmp".format(path, uuid.uuid4().hex)
+        with open(tmp_path, "wb") as f:
+            pickle.dump(obj, f)
+        os.replace(tmp_path, path)
+
+    def _get_entry(self, key):
+        stored = self._read_file(os.path.join(self._entries_dir, self._get_file_name(key)))
+        # Guard against collisions of file names
+        if stored is None or stored[0] != key:
+            return None
+        return stored[1]
+
+    def _set_entry(self, key, entry):
+        self._write_file(os.path.join(self._entries_dir, self._get_file_name(key)), (key, entry))
+        with self._lock:
+            self._num_entries_set += 1
+            evict = self._num_entries_set % self._EVICTION_INTERVAL == 0
+        if evict:
+            self._evict()
+
+    def _evict(self):
+        # NB: Version files that were last written more than one TTL ago are removed as well. The
+        # dependency goes back to the initial version, which is safe since any response cached
+        # before it was invalidated has expired by now
+        min_mtime = time.time() - self._ttl_seconds
+        for entry in os.scandir(self._versions_dir):
+            self._remove_if_older_than(entry, min_mtime)
+
+        entries = []
+        for entry in os.scandir(self._entries_dir):
+            if not self._remove_if_older_than(entry, min_mtime):
+                entries.append(entry)
+        if len(entries) > self._max_entries:
+            entries.sort(key=self._get_mtime)
+            for entry in entries[: len(entries) - self._max_entries]:
+                self._remove_if_older_than(entry, float("inf"))
+
+    @staticmethod
+    def _get_mtime(dir_entry):
+        try:
+            return dir_entry.stat().st_mtime
+        except OSError:
+            return 0
+
+    @classmethod
+    def _remove_if_older_than(cls, dir_entry, min_mtime):
+        if cls._get_mtime(dir_entry) >= min_mtime:
+            return False
+        try:
+            os.remove(dir_entry.path)
+        except OSError:
+            # The file was removed by another process
+            pass
+        return True
+
+    def _get_version(self, dependency):
+        return self._read_file(os.path.join(self._versions_dir, self._get_file_name(dependency)))
+
+    def _new_version(self, dependency):
+        path = os.path.join(self._versions_dir, self._get_file_name(dependency))
+        self._write_file(path, uuid.uuid4().hex)
@@ -0,0 +1,181 @@
+"""
+Write-behind logging of run metrics, params and tags for the tracking server.
+
+By default, each LogMetric, LogParam, SetTag and LogBatch request is written to the backend store
+in its own database transaction. When many clients log to the same runs concurrently, these
+transactions contend on the same rows (e.g. of the ``latest_metrics`` table, which is locked with
+``SELECT ... FOR UPDATE``).
+
+In write-behind mode, request handlers append their writes to the ``WriteBehindQueue`` of the
+server worker instead, and block until the writes are committed. A background thread commits the
+queued writes in groups: it waits for writes to accumulate for a short interval, then logs all of
+them with a single transaction of the backend store. If a group fails to commit, e.g. because one
+of its writes is invalid, the writes of the group are committed one at a time so that only the
+requests whose writes fail are answered with an error.
+
+Writes are only grouped if a server worker handles several requests concurrently. Gunicorn workers
+are therefore run with several threads in write-behind mode, unless another worker class is set.
+"""
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future
+
+_logger = logging.getLogger(__name__)
+
+# Maximum number of queued writes committed in a single transaction
+_MAX_WRITES_PER_COMMIT = 1000
+
+_stats_listener = None
+
+
+def set_stats_listener(listener):
+    """
+    Register an object that is notified of the activity of the write-behind queues of this process,
+    e.g. to export it as Prometheus metrics. The object must define the following methods:
+
+    - ``on_queue_depth(queue_depth)``, called with the number of queued writes whenever it changes.
+    - ``on_commit(num_writes, seconds)``, called with the number of writes of each group and the
+      time it took to commit them.
+    """
+    global _stats_listener
+    _stats_listener = listener
+
+
+class _Write:
+    """
+    Metrics, params and tags to log to a run, along with the future used to wait for the result of
+    logging them.
+    """
+
+    def __init__(self, run_id, metrics, params, tags):
+        self.run_id = run_id
+        self.metrics = list(metrics)
+        self.params = list(params)
+        self.tags = list(tags)
+        self.future = Future()
+
+
+def _group_writes_by_run(writes):
+    """
+    :return: A list of ``(run_id, metrics, params, tags)`` tuples, with the data of all the writes
+             to each run in the order in which they were queued. The list is sorted by run ID so
+             that concurrent transactions lock the rows of different runs in the same order.
+    """
+    data_by_run_id = {}
+    for write in writes:
+        metrics, params, tags = data_by_run_id.setdefault(write.run_id, ([], [], []))
+        metrics.extend(write.metrics)
+        params.extend(write.params)
+        tags.extend(write.tags)
+    return [(run_id,) + data_by_run_id[run_id] for run_id in sorted(data_by_run_id)]
+
+
+class WriteBehindQueue:
+    """
+    Queues the run data logged by the request handlers of a server worker and group-commits it to
+    the tracking store from a background thread.
+    """
+
+    def __init__(self, store, interval_seconds, on_commit=None):
+        """
+        :param store: The tracking store to log run data to. Groups of writes are logged with its
+                      ``log_batches`` method, which must log all of them in a single transaction,
+                      and individual writes with its ``log_batch`` method.
+        :param interval_seconds: The time to wait for writes to accumulate before committing them.
+        :param on_commit: Optional function called with the sorted IDs of the runs written by each
+                          committed transaction, after the commit and before the requests waiting
+                          for the writes are unblocked, e.g. to invalidate cached responses. If it
+                          raises, the requests fail with its exception.
+        """
+        self._store = store
+        self._interval_seconds = interval_seconds
+        self._on_commit = on_commit
+        self._pid = os.getpid()
+        self._cond = threading.Condition()
+        self._writes = []
+        self._thread = None
+
+    def _reset(self):
+        self._pid = os.getpid()
+        self._cond = threading.Condition()
+        self._writes = []
+        self._thread = None
+
+    def log_batch(self, run_id, metrics=(), params=(), tags=()):
+        """
+        Queue the specified run data and block until it is committed.
+
+        :raises Exception: The exception raised by the tracking store when logging the data.
+        """
+        write = _Write(run_id, metrics, params, tags)
+        # The thread of the parent process is not running in forked server workers
+        if self._pid != os.getpid():
+            self._reset()
+        with self._cond:
+            self._writes.append(write)
+            self._report_queue_depth()
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._commit_writes, name="MlflowWriteBehindThread", daemon=True
+                )
+                self._thread.start()
+            self._cond.notify_all()
+        write.future.result()
+
+    def _commit_writes(self):
+        while True:
+            with self._cond:
+                while not self._writes:
+                    self._cond.wait()
+            # Let concurrent requests queue their writes, so that they are committed together
+            time.sleep(self._interval_seconds)
+            with self._cond:
+                writes = self._writes[:_MAX_WRITES_PER_COMMIT]
+                self._writes = self._writes[_MAX_WRITES_PER_COMMIT:]
+                self._report_queue_depth()
+
+            start_time = time.time()
+            self._commit(writes)
+            if _stats_listener is not None:
+                _stats_listener.on_commit(len(writes), time.time() - start_time)
+
+    def _commit(self, writes):
+        try:
+            self._store.log_batches(_group_writes_by_run(writes))
+        except Exception:
+            _logger.debug(
+                "Failed to commit %d writes together, committing them one at a time",
+                len(writes),
+                exc_info=True,
+            )
+        else:
+            self._complete(writes)
+            return
+
+        for write in writes:
+            try:
+                self._store.log_batch(
+                    run_id=write.run_id, metrics=write.metrics, params=write.params, tags=write.tags
+                )
+            except Exception as e:
+                write.future.set_exception(e)
+            else:
+                self._complete([write])
+
+    def _complete(self, committed_writes):
+        try:
+            if self._on_commit is not None:
+                self._on_commit(sorted({write.run_id for write in committed_writes}))
+        except Exception as e:
+            for write in committed_writes:
+                write.future.set_exception(e)
+        else:
+            for write in committed_writes:
+                write.future.set_result(None)
+
+    def _report_queue_depth(self):
+        # NB: Called with the lock held, so that queue depths are reported in order
+        if _stats_listener is not None:
+            _stats_listener.on_queue_depth(len(self._writes))
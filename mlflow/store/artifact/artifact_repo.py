@@ -1,13 +1,34 @@
+import io
 import os
 import posixpath
+import shutil
 import tempfile
 from abc import abstractmethod, ABCMeta
+from concurrent.futures import Future, ThreadPoolExecutor
 
+from mlflow.utils.file_utils import relative_path_to_artifact_path
 from mlflow.utils.validation import path_not_unique, bad_path_message
 
 from mlflow.exceptions import MlflowException
 from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE, RESOURCE_DOES_NOT_EXIST
 
+# Size of the chunks in which artifact contents are copied between streams
+_STREAM_CHUNK_SIZE = 1024 * 1024  # 1 MB
+
+# Environment variable specifying the maximum number of files that an artifact repository uploads
+# or downloads concurrently
+_ARTIFACT_MAX_WORKERS_ENV_VAR = "MLFLOW_ARTIFACT_MAX_WORKERS"
+
+
+def _get_default_max_workers():
+    # Use at most 8 threads or 2 * the number of CPU cores available on the system (whichever is
+    # smaller) unless configured otherwise
+    max_workers = os.environ.get(_ARTIFACT_MAX_WORKERS_ENV_VAR)
+    if max_workers is not None:
+        return int(max_workers)
+    num_cpus = os.cpu_count() or 4
+    return min(num_cpus * 2, 8)
+
 
 class ArtifactRepository:
     """
@@ -17,8 +38,14 @@ class ArtifactRepository:
 
     __metaclass__ = ABCMeta
 
+    # Whether the repository can transfer several files concurrently. Repositories whose transfers
+    # share a single connection that is not thread safe transfer files one at a time instead
+    _supports_concurrent_transfers = True
+
     def __init__(self, artifact_uri):
         self.artifact_uri = artifact_uri
+        # Threads are only started once transfers are submitted to the pool
+        self.thread_pool = ThreadPoolExecutor(max_workers=_get_default_max_workers())
 
     @abstractmethod
     def log_artifact(self, local_file, artifact_path=None):
@@ -33,17 +60,87 @@ class ArtifactRepository:
         """
         pass
 
-    @abstractmethod
     def log_artifacts(self, local_dir, artifact_path=None):
         """
         Log the files in the specified local directory as artifacts, optionally taking
-        an ``artifact_path`` to place them in within the run's artifacts.
+        an ``artifact_path`` to place them in within the run's artifacts. By default, files are
+        uploaded concurrently via :py:meth:`log_artifact`.
 
         :param local_dir: Directory of local artifacts to log
         :param artifact_path: Directory within the run's artifact directory in which to log the
                               artifacts
         """
-        pass
+        self._upload_files_concurrently(local_dir, artifact_path, self.log_artifact)
+
+    def _upload_files_concurrently(self, local_dir, artifact_path, upload_func):
+        """
+        Upload the files in the specified local directory concurrently using the repository's
+        thread pool.
+
+        :param local_dir: Directory of local artifacts to upload.
+        :param artifact_path: Directory within the repository in which to upload the artifacts.
+        :param upload_func: A function accepting the path of a local file and the artifact
+                            directory (or ``None`` for the repository root) in which to upload it.
+        """
+        local_dir = os.path.abspath(local_dir)
+        inflight_uploads = {}
+        for root, _, filenames in os.walk(local_dir):
+            artifact_dir = artifact_path
+            if root != local_dir:
+                rel_path = relative_path_to_artifact_path(os.path.relpath(root, local_dir))
+                artifact_dir = (
+                    posixpath.join(artifact_path, rel_path) if artifact_path else rel_path
+                )
+            for f in filenames:
+                local_file = os.path.join(root, f)
+                inflight_uploads[local_file] = self._submit_transfer(
+                    upload_func, local_file, artifact_dir
+                )
+        self._join_transfers(inflight_uploads, "uploading one or more artifacts to")
+
+    def _submit_transfer(self, transfer_func, *args, **kwargs):
+        """
+        Run the specified transfer on the repository's thread pool, or on the calling thread if
+        the repository does not support concurrent transfers.
+
+        :return: A ``concurrent.futures.Future`` of the result of the transfer.
+        """
+        if self._supports_concurrent_transfers:
+            return self.thread_pool.submit(transfer_func, *args, **kwargs)
+
+        future = Future()
+        try:
+            future.set_result(transfer_func(*args, **kwargs))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def _join_transfers(self, inflight_transfers, description):
+        """
+        Wait for the specified transfers to complete, raising an ``MlflowException`` that
+        describes all of the failed transfers if any.
+
+        :param inflight_transfers: A dictionary mapping file paths to the futures of their
+                                   transfers.
+        """
+        failed_transfers = {}
+        for path, future in inflight_transfers.items():
+            try:
+                future.result()
+            except Exception as e:
+                failed_transfers[path] = repr(e)
+
+        if len(failed_transfers) > 0:
+            raise MlflowException(
+                message=(
+                    "The following failures occurred while {description} {artifact_root}:"
+                    " {failures}".format(
+                        description=description,
+                        artifact_root=self.artifact_uri,
+                        failures=failed_transfers,
+                    )
+                )
+            )
 
     @abstractmethod
     def list_artifacts(self, path):
@@ -105,12 +202,16 @@ class ArtifactRepository:
         :return: Absolute path of the local filesystem location containing the desired artifacts.
         """
 
-        # TODO: Probably need to add a more efficient method to stream just a single artifact
-        #       without downloading it, or to get a pre-signed URL for cloud storage.
+        # Files of directory artifacts are downloaded concurrently if supported, while directories
+        # are listed by the calling thread
+        inflight_downloads = {}
+
         def download_artifact(src_artifact_path, dst_local_dir_path):
             """
-            Download the file artifact specified by `src_artifact_path` to the local filesystem
-            directory specified by `dst_local_dir_path`.
+            Schedule the download of the file artifact specified by `src_artifact_path` to the
+            local filesystem directory specified by `dst_local_dir_path` on the repository's
+            thread pool, or download it immediately if the repository does not support concurrent
+            transfers.
 
             :param src_artifact_path: A relative, POSIX-style path referring to a file artifact
                                       stored within the repository's artifact root location.
@@ -126,8 +227,10 @@ class ArtifactRepository:
             local_destination_file_path = self._create_download_destination(
                 src_artifact_path=src_artifact_path, dst_local_dir_path=dst_local_dir_path
             )
-            self._download_file(
-                remote_file_path=src_artifact_path, local_path=local_destination_file_path
+            inflight_downloads[src_artifact_path] = self._submit_transfer(
+                self._download_file,
+                remote_file_path=src_artifact_path,
+                local_path=local_destination_file_path,
             )
             return local_destination_file_path
 
@@ -177,11 +280,20 @@ class ArtifactRepository:
 
         # Check if the artifacts points to a directory
         if self._is_directory(artifact_path):
-            return download_artifact_dir(
+            dst_local_path = download_artifact_dir(
                 src_artifact_dir_path=artifact_path, dst_local_dir_path=dst_path
             )
+            # Join futures to ensure that all artifacts have been downloaded prior to returning
+            self._join_transfers(inflight_downloads, "downloading one or more artifacts from")
+            return dst_local_path
         else:
-            return download_artifact(src_artifact_path=artifact_path, dst_local_dir_path=dst_path)
+            local_destination_file_path = self._create_download_destination(
+                src_artifact_path=artifact_path, dst_local_dir_path=dst_path
+            )
+            self._download_file(
+                remote_file_path=artifact_path, local_path=local_destination_file_path
+            )
+            return local_destination_file_path
 
     @abstractmethod
     def _download_file(self, remote_file_path, local_path):
@@ -195,6 +307,44 @@ class ArtifactRepository:
         """
         pass
 
+    def _open_file(self, remote_file_path):
+        """
+        Open the file at the specified relative remote path for reading. Repositories that can
+        read files incrementally from their storage backend should override this method. By
+        default, the file is downloaded to a temporary directory, which is removed once the
+        returned file object is closed.
+
+        :param remote_file_path: Source path to the remote file, relative to the root
+                                 directory of the artifact repository.
+        :return: A readable, seekable binary file object. The caller is responsible for closing it.
+        """
+        tmp_dir = tempfile.TemporaryDirectory()
+        try:
+            local_path = os.path.join(tmp_dir.name, posixpath.basename(remote_file_path))
+            self._download_file(remote_file_path, local_path)
+            return _TemporaryFile(local_path, tmp_dir)
+        except BaseException:
+            tmp_dir.cleanup()
+            raise
+
+    def _upload_stream(self, stream, remote_file_path):
+        """
+        Write the contents of the specified binary stream to the file at the specified relative
+        remote path. Repositories that can write files incrementally to their storage backend
+        should override this method. By default, the stream is written to a temporary file, which
+        is then logged via :py:meth:`log_artifact`.
+
+        :param stream: A readable binary file object.
+        :param remote_file_path: Destination path of the remote file, relative to the root
+                                 directory of the artifact repository.
+        """
+        head, tail = posixpath.split(remote_file_path)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_path = os.path.join(tmp_dir, tail)
+            with open(tmp_path, "wb") as f:
+                shutil.copyfileobj(stream, f, _STREAM_CHUNK_SIZE)
+            self.log_artifact(tmp_path, artifact_path=head or None)
+
     def delete_artifacts(self, artifact_path=None):
         """
         Delete the artifacts at the specified location.
@@ -205,6 +355,25 @@ class ArtifactRepository:
         pass
 
 
+class _TemporaryFile(io.BufferedReader):
+    """
+    A readable binary file in a temporary directory, which is removed when the file is closed.
+    """
+
+    # The temporary copy does not identify the contents of the artifact it was downloaded from
+    etag = None
+
+    def __init__(self, path, tmp_dir):
+        super().__init__(io.FileIO(path, "rb"))
+        self._tmp_dir = tmp_dir
+
+    def close(self):
+        try:
+            super().close()
+        finally:
+            self._tmp_dir.cleanup()
+
+
 def verify_artifact_path(artifact_path):
     if artifact_path and path_not_unique(artifact_path):
         raise MlflowException(
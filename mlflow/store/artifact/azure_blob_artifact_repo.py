@@ -92,23 +92,6 @@ class AzureBlobArtifactRepository(ArtifactRepository):
         with open(local_file, "rb") as file:
             container_client.upload_blob(dest_path, file, overwrite=True)
 
-    def log_artifacts(self, local_dir, artifact_path=None):
-        (container, _, dest_path, _) = self.parse_wasbs_uri(self.artifact_uri)
-        container_client = self.client.get_container_client(container)
-        if artifact_path:
-            dest_path = posixpath.join(dest_path, artifact_path)
-        local_dir = os.path.abspath(local_dir)
-        for (root, _, filenames) in os.walk(local_dir):
-            upload_path = dest_path
-            if root != local_dir:
-                rel_path = os.path.relpath(root, local_dir)
-                upload_path = posixpath.join(dest_path, rel_path)
-            for f in filenames:
-                remote_file_path = posixpath.join(upload_path, f)
-                local_file_path = os.path.join(root, f)
-                with open(local_file_path, "rb") as file:
-                    container_client.upload_blob(remote_file_path, file, overwrite=True)
-
     def list_artifacts(self, path=None):
         # Newer versions of `azure-storage-blob` (>= 12.4.0) provide a public
         # `azure.storage.blob.BlobPrefix` object to signify that a blob is a directory,
@@ -11,7 +11,6 @@ from mlflow.store.artifact.databricks_artifact_repo import DatabricksArtifactRep
 from mlflow.store.artifact.local_artifact_repo import LocalArtifactRepository
 from mlflow.tracking._tracking_service import utils
 from mlflow.utils.databricks_utils import get_databricks_host_creds
-from mlflow.utils.file_utils import relative_path_to_artifact_path
 from mlflow.utils.rest_utils import http_request, http_request_safe, RESOURCE_DOES_NOT_EXIST
 from mlflow.utils.string_utils import strip_prefix
 from mlflow.utils.uri import (
@@ -120,18 +119,6 @@ class DbfsRestArtifactRepository(ArtifactRepository):
                     endpoint=http_endpoint, method="POST", data=f, allow_redirects=False
                 )
 
-    def log_artifacts(self, local_dir, artifact_path=None):
-        artifact_path = artifact_path or ""
-        for (dirpath, _, filenames) in os.walk(local_dir):
-            artifact_subdir = artifact_path
-            if dirpath != local_dir:
-                rel_path = os.path.relpath(dirpath, local_dir)
-                rel_path = relative_path_to_artifact_path(rel_path)
-                artifact_subdir = posixpath.join(artifact_path, rel_path)
-            for name in filenames:
-                file_path = os.path.join(dirpath, name)
-                self.log_artifact(file_path, artifact_subdir)
-
     def list_artifacts(self, path=None):
         if path:
             dbfs_path = self._get_dbfs_path(path)
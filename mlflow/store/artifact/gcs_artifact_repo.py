@@ -5,7 +5,6 @@ import urllib.parse
 
 from mlflow.entities import FileInfo
 from mlflow.store.artifact.artifact_repo import ArtifactRepository
-from mlflow.utils.file_utils import relative_path_to_artifact_path
 from mlflow.exceptions import MlflowException
 
 
@@ -58,20 +57,14 @@ class GCSArtifactRepository(ArtifactRepository):
 
     def log_artifacts(self, local_dir, artifact_path=None):
         (bucket, dest_path) = self.parse_gcs_uri(self.artifact_uri)
-        if artifact_path:
-            dest_path = posixpath.join(dest_path, artifact_path)
         gcs_bucket = self._get_bucket(bucket)
 
-        local_dir = os.path.abspath(local_dir)
-        for (root, _, filenames) in os.walk(local_dir):
-            upload_path = dest_path
-            if root != local_dir:
-                rel_path = os.path.relpath(root, local_dir)
-                rel_path = relative_path_to_artifact_path(rel_path)
-                upload_path = posixpath.join(dest_path, rel_path)
-            for f in filenames:
-                path = posixpath.join(upload_path, f)
-                gcs_bucket.blob(path).upload_from_filename(os.path.join(root, f))
+        def upload_file(local_file, artifact_dir):
+            path = posixpath.join(dest_path, artifact_dir) if artifact_dir else dest_path
+            path = posixpath.join(path, os.path.basename(local_file))
+            gcs_bucket.blob(path).upload_from_filename(local_file)
+
+        self._upload_files_concurrently(local_dir, artifact_path, upload_file)
 
     def list_artifacts(self, path=None):
         (bucket, artifact_path) = self.parse_gcs_uri(self.artifact_uri)
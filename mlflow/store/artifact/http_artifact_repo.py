@@ -1,12 +1,25 @@
 import os
 import requests
 import posixpath
+from concurrent.futures import ThreadPoolExecutor
 
 from mlflow.entities import FileInfo
+from mlflow.exceptions import MlflowException
 from mlflow.store.artifact.artifact_repo import ArtifactRepository, verify_artifact_path
-from mlflow.utils.file_utils import relative_path_to_artifact_path
 from mlflow.utils.rest_utils import augmented_raise_for_status
 
+_DOWNLOAD_CHUNK_SIZE = 1024 * 1024  # 1 MB
+# Files larger than this are downloaded as concurrent ranged requests of (at most) this size
+_DOWNLOAD_PART_SIZE = 64 * 1024 * 1024  # 64 MB
+_MAX_DOWNLOAD_WORKERS = 8
+# Maximum number of attempts to download a file or part, resuming from the last received byte
+_MAX_DOWNLOAD_ATTEMPTS = 5
+_RETRYABLE_DOWNLOAD_ERRORS = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.ChunkedEncodingError,
+    requests.exceptions.Timeout,
+)
+
 
 class HttpArtifactRepository(ArtifactRepository):
     """Stores artifacts in a remote artifact storage using HTTP requests"""
@@ -29,20 +42,6 @@ class HttpArtifactRepository(ArtifactRepository):
             resp = self._session.put(url, data=f, timeout=600)
             augmented_raise_for_status(resp)
 
-    def log_artifacts(self, local_dir, artifact_path=None):
-        local_dir = os.path.abspath(local_dir)
-        for root, _, filenames in os.walk(local_dir):
-            if root == local_dir:
-                artifact_dir = artifact_path
-            else:
-                rel_path = os.path.relpath(root, local_dir)
-                rel_path = relative_path_to_artifact_path(rel_path)
-                artifact_dir = (
-                    posixpath.join(artifact_path, rel_path) if artifact_path else rel_path
-                )
-            for f in filenames:
-                self.log_artifact(os.path.join(root, f), artifact_dir)
-
     def list_artifacts(self, path=None):
         sep = "/mlflow-artifacts/artifacts"
         head, tail = self.artifact_uri.split(sep, maxsplit=1)
@@ -66,7 +65,85 @@ class HttpArtifactRepository(ArtifactRepository):
         url = posixpath.join(self.artifact_uri, remote_file_path)
         with self._session.get(url, stream=True, timeout=10) as resp:
             augmented_raise_for_status(resp)
-            with open(local_path, "wb") as f:
-                chunk_size = 1024 * 1024  # 1 MB
-                for chunk in resp.iter_content(chunk_size=chunk_size):
-                    f.write(chunk)
+            content_length = resp.headers.get("Content-Length")
+            file_size = int(content_length) if content_length is not None else None
+            etag = resp.headers.get("ETag")
+            supports_ranges = resp.headers.get("Accept-Ranges") == "bytes" and file_size is not None
+            if supports_ranges and file_size > _DOWNLOAD_PART_SIZE:
+                num_bytes_written = None
+            else:
+                with open(local_path, "wb") as f:
+                    num_bytes_written = 0
+                    try:
+                        for chunk in resp.iter_content(chunk_size=_DOWNLOAD_CHUNK_SIZE):
+                            f.write(chunk)
+                            num_bytes_written += len(chunk)
+                    except _RETRYABLE_DOWNLOAD_ERRORS:
+                        if not supports_ranges:
+                            raise
+
+        if num_bytes_written is None:
+            self._download_file_in_parts(url, local_path, file_size, etag)
+        elif supports_ranges and num_bytes_written < file_size:
+            # Resume the interrupted download from the last received byte
+            self._download_range(url, local_path, num_bytes_written, file_size, etag)
+
+    def _download_file_in_parts(self, url, local_path, file_size, etag):
+        with open(local_path, "wb") as f:
+            f.truncate(file_size)
+        ranges = [
+            (start, min(start + _DOWNLOAD_PART_SIZE, file_size))
+            for start in range(0, file_size, _DOWNLOAD_PART_SIZE)
+        ]
+        with ThreadPoolExecutor(max_workers=_MAX_DOWNLOAD_WORKERS) as executor:
+            futures = [
+                executor.submit(self._download_range, url, local_path, start, end, etag)
+                for start, end in ranges
+            ]
+            for future in futures:
+                future.result()
+
+    def _download_range(self, url, local_path, start, end, etag):
+        """
+        Download bytes ``[start, end)`` of the file at ``url`` into the same byte range of the
+        existing file at ``local_path``, resuming from the last received byte upon transient
+        failures.
+
+        :param etag: The entity tag of the file, if known. The download fails if the file is
+                     modified on the server while it is being downloaded.
+        """
+        offset = start
+        num_attempts = 0
+        while offset < end:
+            headers = {"Range": "bytes=%d-%d" % (offset, end - 1)}
+            if etag is not None:
+                headers["If-Range"] = etag
+            num_attempts += 1
+            try:
+                with self._session.get(url, headers=headers, stream=True, timeout=10) as resp:
+                    augmented_raise_for_status(resp)
+                    if resp.status_code != 206:
+                        raise MlflowException(
+                            "Failed to download byte range [{start}, {end}) of {url}: the artifact"
+                            " was modified during the download or the server does not support"
+                            " range requests.".format(start=offset, end=end, url=url)
+                        )
+                    with open(local_path, "r+b") as f:
+                        f.seek(offset)
+                        for chunk in resp.iter_content(chunk_size=_DOWNLOAD_CHUNK_SIZE):
+                            f.write(chunk[: end - offset])
+                            offset += len(chunk)
+            except _RETRYABLE_DOWNLOAD_ERRORS:
+                if num_attempts >= _MAX_DOWNLOAD_ATTEMPTS:
+                    raise
+            else:
+                if offset < end and num_attempts >= _MAX_DOWNLOAD_ATTEMPTS:
+                    raise MlflowException(
+                        "Failed to download {url}: received {received} of {expected} bytes after"
+                        " {attempts} attempts.".format(
+                            url=url,
+                            received=offset - start,
+                            expected=end - start,
+                            attempts=num_attempts,
+                        )
+                    )
@@ -1,8 +1,14 @@
 import distutils.dir_util as dir_util
 import os
+import posixpath
 import shutil
+import tempfile
 
-from mlflow.store.artifact.artifact_repo import ArtifactRepository, verify_artifact_path
+from mlflow.store.artifact.artifact_repo import (
+    ArtifactRepository,
+    verify_artifact_path,
+    _STREAM_CHUNK_SIZE,
+)
 from mlflow.utils.file_utils import (
     mkdir,
     list_all,
@@ -103,6 +109,30 @@ class LocalArtifactRepository(ArtifactRepository):
         remote_file_path = os.path.join(self.artifact_dir, os.path.normpath(remote_file_path))
         shutil.copyfile(remote_file_path, local_path)
 
+    def _open_file(self, remote_file_path):
+        # NOTE: The remote_file_path is expected to be in posix format.
+        # Posix paths work fine on windows but just in case we normalize it here.
+        return open(os.path.join(self.artifact_dir, os.path.normpath(remote_file_path)), "rb")
+
+    def _upload_stream(self, stream, remote_file_path):
+        head, tail = posixpath.split(remote_file_path)
+        verify_artifact_path(head or None)
+        artifact_dir = (
+            os.path.join(self.artifact_dir, os.path.normpath(head)) if head else self.artifact_dir
+        )
+        if not os.path.exists(artifact_dir):
+            mkdir(artifact_dir)
+        # Write to a temporary file in the destination directory and rename it so that partially
+        # uploaded files are never visible under the artifact path
+        fd, tmp_path = tempfile.mkstemp(prefix=".%s." % tail, dir=artifact_dir)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                shutil.copyfileobj(stream, f, _STREAM_CHUNK_SIZE)
+            os.replace(tmp_path, os.path.join(artifact_dir, tail))
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
     def delete_artifacts(self, artifact_path=None):
         artifact_path = (
             os.path.join(self._artifact_dir, artifact_path) if artifact_path else self._artifact_dir
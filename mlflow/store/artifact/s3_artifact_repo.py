@@ -1,5 +1,6 @@
 from datetime import datetime
 from functools import lru_cache
+import io
 import os
 from mimetypes import guess_type
 
@@ -10,7 +11,6 @@ from mlflow import data
 from mlflow.entities import FileInfo
 from mlflow.exceptions import MlflowException
 from mlflow.store.artifact.artifact_repo import ArtifactRepository
-from mlflow.utils.file_utils import relative_path_to_artifact_path
 
 
 _MAX_CACHE_SECONDS = 300
@@ -104,9 +104,9 @@ class S3ArtifactRepository(ArtifactRepository):
 
         return _cached_get_s3_client(signature_version, s3_endpoint_url, verify, timestamp)
 
-    def _upload_file(self, s3_client, local_file, bucket, key):
+    def _get_upload_extra_args(self, file_name):
         extra_args = dict()
-        guessed_type, guessed_encoding = guess_type(local_file)
+        guessed_type, guessed_encoding = guess_type(file_name)
         if guessed_type is not None:
             extra_args["ContentType"] = guessed_type
         if guessed_encoding is not None:
@@ -114,7 +114,15 @@ class S3ArtifactRepository(ArtifactRepository):
         environ_extra_args = self.get_s3_file_upload_extra_args()
         if environ_extra_args is not None:
             extra_args.update(environ_extra_args)
-        s3_client.upload_file(Filename=local_file, Bucket=bucket, Key=key, ExtraArgs=extra_args)
+        return extra_args
+
+    def _upload_file(self, s3_client, local_file, bucket, key):
+        s3_client.upload_file(
+            Filename=local_file,
+            Bucket=bucket,
+            Key=key,
+            ExtraArgs=self._get_upload_extra_args(local_file),
+        )
 
     def log_artifact(self, local_file, artifact_path=None):
         (bucket, dest_path) = data.parse_s3_uri(self.artifact_uri)
@@ -125,26 +133,6 @@ class S3ArtifactRepository(ArtifactRepository):
             s3_client=self._get_s3_client(), local_file=local_file, bucket=bucket, key=dest_path
         )
 
-    def log_artifacts(self, local_dir, artifact_path=None):
-        (bucket, dest_path) = data.parse_s3_uri(self.artifact_uri)
-        if artifact_path:
-            dest_path = posixpath.join(dest_path, artifact_path)
-        s3_client = self._get_s3_client()
-        local_dir = os.path.abspath(local_dir)
-        for (root, _, filenames) in os.walk(local_dir):
-            upload_path = dest_path
-            if root != local_dir:
-                rel_path = os.path.relpath(root, local_dir)
-                rel_path = relative_path_to_artifact_path(rel_path)
-                upload_path = posixpath.join(dest_path, rel_path)
-            for f in filenames:
-                self._upload_file(
-                    s3_client=s3_client,
-                    local_file=os.path.join(root, f),
-                    bucket=bucket,
-                    key=posixpath.join(upload_path, f),
-                )
-
     def list_artifacts(self, path=None):
         (bucket, artifact_path) = data.parse_s3_uri(self.artifact_uri)
         dest_path = artifact_path
@@ -194,6 +182,24 @@ class S3ArtifactRepository(ArtifactRepository):
         s3_client = self._get_s3_client()
         s3_client.download_file(bucket, s3_full_path, local_path)
 
+    def _open_file(self, remote_file_path):
+        (bucket, s3_root_path) = data.parse_s3_uri(self.artifact_uri)
+        s3_full_path = posixpath.join(s3_root_path, remote_file_path)
+        s3_client = self._get_s3_client()
+        return _S3ObjectReader(s3_client, bucket, s3_full_path)
+
+    def _upload_stream(self, stream, remote_file_path):
+        (bucket, s3_root_path) = data.parse_s3_uri(self.artifact_uri)
+        s3_full_path = posixpath.join(s3_root_path, remote_file_path)
+        s3_client = self._get_s3_client()
+        # `upload_fileobj` performs a multipart upload for large streams, reading them in chunks
+        s3_client.upload_fileobj(
+            Fileobj=stream,
+            Bucket=bucket,
+            Key=s3_full_path,
+            ExtraArgs=self._get_upload_extra_args(remote_file_path),
+        )
+
     def delete_artifacts(self, artifact_path=None):
         (bucket, dest_path) = data.parse_s3_uri(self.artifact_uri)
         if artifact_path:
@@ -207,3 +213,71 @@ class S3ArtifactRepository(ArtifactRepository):
                 listed_object_path=file_path, artifact_path=dest_path
             )
             s3_client.delete_object(Bucket=bucket, Key=file_path)
+
+
+class _S3ObjectReader(io.RawIOBase):
+    """
+    A seekable, read-only file object over an S3 object. Contents are streamed from a ranged
+    ``GetObject`` request starting at the current position, which is only issued upon the first
+    read after opening the object or seeking to a different position.
+    """
+
+    def __init__(self, s3_client, bucket, key):
+        super().__init__()
+        self._s3_client = s3_client
+        self._bucket = bucket
+        self._key = key
+        head = s3_client.head_object(Bucket=bucket, Key=key)
+        self._size = head["ContentLength"]
+        self.etag = head.get("ETag")
+        self._position = 0
+        self._body = None
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._position
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self._size + offset
+        else:
+            raise ValueError("Invalid whence: %s" % whence)
+        if position < 0:
+            raise ValueError("Negative seek position: %s" % position)
+        if position != self._position:
+            self._close_body()
+            self._position = position
+        return self._position
+
+    def readinto(self, b):
+        if self._position >= self._size:
+            return 0
+        if self._body is None:
+            kwargs = {"Range": "bytes=%d-" % self._position}
+            if self.etag is not None:
+                # Fail rather than mixing the contents of different versions of the object
+                kwargs["IfMatch"] = self.etag
+            response = self._s3_client.get_object(Bucket=self._bucket, Key=self._key, **kwargs)
+            self._body = response["Body"]
+        chunk = self._body.read(len(b))
+        b[: len(chunk)] = chunk
+        self._position += len(chunk)
+        return len(chunk)
+
+    def _close_body(self):
+        if self._body is not None:
+            self._body.close()
+            self._body = None
+
+    def close(self):
+        self._close_body()
+        super().close()
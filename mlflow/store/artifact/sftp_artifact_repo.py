@@ -23,6 +23,9 @@ def _put_r_for_windows(sftp, local_dir, remote_dir, preserve_mtime=False):
 class SFTPArtifactRepository(ArtifactRepository):
     """Stores artifacts as files in a remote directory, via sftp."""
 
+    # All transfers share the same SFTP connection, which is not thread safe
+    _supports_concurrent_transfers = False
+
     def __init__(self, artifact_uri, client=None):
         self.uri = artifact_uri
         parsed = urllib.parse.urlparse(artifact_uri)
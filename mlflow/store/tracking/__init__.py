@@ -5,6 +5,7 @@ artifacts like models, plots, images, etc.
 
 Several constants are used by multiple backend store implementations.
 """
+from collections import namedtuple
 
 # Path to default location for backend when using local FileStore or ArtifactStore.
 # Also used as default location for artifacts, when not provided, in non local file based backends
@@ -18,3 +19,10 @@ DEFAULT_LOCAL_FILE_AND_ARTIFACT_PATH = "./mlruns"
 DEFAULT_ARTIFACTS_URI = "mlflow-artifacts:/"
 SEARCH_MAX_RESULTS_DEFAULT = 1000
 SEARCH_MAX_RESULTS_THRESHOLD = 50000
+
+# Attributes, and initial metrics, params and tags, of a run created with
+# ``AbstractStore.create_runs``. ``status`` is a ``RunStatus`` value, or ``None`` for a running run.
+# ``tags``, ``params`` and ``metrics`` are lists of ``RunTag``, ``Param`` and ``Metric`` entities.
+RunSpec = namedtuple(
+    "RunSpec", ["user_id", "start_time", "end_time", "status", "tags", "params", "metrics"]
+)
@@ -1,6 +1,6 @@
 from abc import abstractmethod, ABCMeta
 
-from mlflow.entities import ViewType
+from mlflow.entities import RunStatus, ViewType
 from mlflow.store.entities.paged_list import PagedList
 from mlflow.store.tracking import SEARCH_MAX_RESULTS_DEFAULT
 
@@ -146,6 +146,32 @@ class AbstractStore:
         """
         pass
 
+    def create_runs(self, experiment_id, runs):
+        """
+        Create multiple runs under the specified experiment ID, along with their initial metrics,
+        params and tags.
+
+        The default implementation creates the runs one by one with ``create_run``, ``log_batch``
+        and ``update_run_info``. Stores that can create runs more efficiently in bulk should
+        override it.
+
+        :param experiment_id: String id of the experiment for the runs
+        :param runs: List of :py:class:`mlflow.store.tracking.RunSpec` describing the runs to
+                     create
+
+        :return: List of the created Run objects, in the order of ``runs``
+        """
+        run_ids = []
+        for run in runs:
+            created_run = self.create_run(experiment_id, run.user_id, run.start_time, run.tags)
+            run_id = created_run.info.run_id
+            self.log_batch(run_id, metrics=run.metrics, params=run.params, tags=[])
+            if run.status is not None or run.end_time is not None:
+                status = RunStatus.RUNNING if run.status is None else run.status
+                self.update_run_info(run_id, status, run.end_time)
+            run_ids.append(run_id)
+        return [self.get_run(run_id) for run_id in run_ids]
+
     @abstractmethod
     def delete_run(self, run_id):
         """
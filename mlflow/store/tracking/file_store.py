@@ -29,6 +29,7 @@ from mlflow.store.tracking import (
     SEARCH_MAX_RESULTS_THRESHOLD,
 )
 from mlflow.store.tracking.abstract_store import AbstractStore
+from mlflow.store.tracking.file_store_index import ExperimentRunIndex, get_run_fingerprint, touch
 from mlflow.utils.validation import (
     _validate_metric_name,
     _validate_param_name,
@@ -39,6 +40,7 @@ from mlflow.utils.validation import (
     _validate_batch_log_data,
     _validate_list_experiments_max_results,
     _validate_param_keys_unique,
+    _validate_create_runs_limits,
 )
 from mlflow.utils.env import get_env
 from mlflow.utils.file_utils import (
@@ -116,6 +118,25 @@ def _read_persisted_run_info_dict(run_info_dict):
     return RunInfo.from_dictionary(dict_copy)
 
 
+def _make_run_snapshot(run):
+    return {
+        "info": _make_persisted_run_info_dict(run.info),
+        "metrics": [[m.key, m.value, m.timestamp, m.step] for m in run.data._metric_objs],
+        "params": run.data.params,
+        "tags": run.data.tags,
+    }
+
+
+def _read_run_snapshot(snapshot):
+    run_info = _read_persisted_run_info_dict(snapshot["info"])
+    metrics = [
+        Metric(key, value, timestamp, step) for key, value, timestamp, step in snapshot["metrics"]
+    ]
+    params = [Param(key, value) for key, value in snapshot["params"].items()]
+    tags = [RunTag(key, value) for key, value in snapshot["tags"].items()]
+    return Run(run_info, RunData(metrics, params, tags))
+
+
 class FileStore(AbstractStore):
     TRASH_FOLDER_NAME = ".trash"
     ARTIFACTS_FOLDER_NAME = "artifacts"
@@ -126,6 +147,14 @@ class FileStore(AbstractStore):
     RESERVED_EXPERIMENT_FOLDERS = [EXPERIMENT_TAGS_FOLDER_NAME]
     META_DATA_FILE_NAME = "meta.yaml"
     DEFAULT_EXPERIMENT_ID = "0"
+    # Files and folders of a run directory whose modification times determine whether the run's
+    # entry in the experiment's run index is up to date
+    _RUN_FINGERPRINT_FILES = [
+        META_DATA_FILE_NAME,
+        METRICS_FOLDER_NAME,
+        PARAMS_FOLDER_NAME,
+        TAGS_FOLDER_NAME,
+    ]
 
     def __init__(self, root_directory=None, artifact_root_uri=None):
         """
@@ -487,6 +516,48 @@ class FileStore(AbstractStore):
         Creates a run with the specified attributes.
         """
         experiment_id = FileStore.DEFAULT_EXPERIMENT_ID if experiment_id is None else experiment_id
+        self._check_experiment_accepts_runs(experiment_id)
+        run_info = self._create_run_info(
+            experiment_id, user_id, start_time, RunStatus.RUNNING, end_time=None
+        )
+        for tag in tags:
+            self.set_tag(run_info.run_id, tag)
+        return self.get_run(run_id=run_info.run_id)
+
+    def create_runs(self, experiment_id, runs):
+        """
+        Creates runs with the specified attributes, metrics, params and tags. The experiment is
+        checked and each run's metadata is written once, instead of once per logged entity.
+        """
+        experiment_id = FileStore.DEFAULT_EXPERIMENT_ID if experiment_id is None else experiment_id
+        _validate_create_runs_limits(runs)
+        for run in runs:
+            _validate_batch_log_data(run.metrics, run.params, run.tags)
+            _validate_param_keys_unique(run.params)
+        self._check_experiment_accepts_runs(experiment_id)
+
+        run_infos = []
+        for run in runs:
+            run_info = self._create_run_info(
+                experiment_id,
+                run.user_id,
+                run.start_time,
+                RunStatus.RUNNING if run.status is None else run.status,
+                run.end_time,
+            )
+            try:
+                for tag in run.tags:
+                    self._set_run_tag(run_info, tag)
+                for param in run.params:
+                    self._log_run_param(run_info, param)
+                for metric in run.metrics:
+                    self._log_run_metric(run_info, metric)
+            except Exception as e:
+                raise MlflowException(e, INTERNAL_ERROR)
+            run_infos.append(run_info)
+        return [self._get_run_from_info(run_info) for run_info in run_infos]
+
+    def _check_experiment_accepts_runs(self, experiment_id):
         experiment = self.get_experiment(experiment_id)
         if experiment is None:
             raise MlflowException(
@@ -499,6 +570,12 @@ class FileStore(AbstractStore):
                 "Could not create run under non-active experiment with ID " "%s." % experiment_id,
                 databricks_pb2.INVALID_STATE,
             )
+
+    def _create_run_info(self, experiment_id, user_id, start_time, status, end_time):
+        """
+        Persist the metadata of a new run and create its directories for logging metrics,
+        parameters and artifacts.
+        """
         run_uuid = uuid.uuid4().hex
         artifact_uri = self._get_artifact_dir(experiment_id, run_uuid)
         run_info = RunInfo(
@@ -507,12 +584,11 @@ class FileStore(AbstractStore):
             experiment_id=experiment_id,
             artifact_uri=artifact_uri,
             user_id=user_id,
-            status=RunStatus.to_string(RunStatus.RUNNING),
+            status=RunStatus.to_string(status),
             start_time=start_time,
-            end_time=None,
+            end_time=end_time,
             lifecycle_stage=LifecycleStage.ACTIVE,
         )
-        # Persist run metadata and create directories for logging metrics, parameters, artifacts
         run_dir = self._get_run_dir(run_info.experiment_id, run_info.run_id)
         mkdir(run_dir)
         run_info_dict = _make_persisted_run_info_dict(run_info)
@@ -520,9 +596,7 @@ class FileStore(AbstractStore):
         mkdir(run_dir, FileStore.METRICS_FOLDER_NAME)
         mkdir(run_dir, FileStore.PARAMS_FOLDER_NAME)
         mkdir(run_dir, FileStore.ARTIFACTS_FOLDER_NAME)
-        for tag in tags:
-            self.set_tag(run_uuid, tag)
-        return self.get_run(run_id=run_uuid)
+        return run_info
 
     def get_run(self, run_id):
         """
@@ -709,10 +783,10 @@ class FileStore(AbstractStore):
             tags.append(self._get_tag_from_file(parent_path, tag_file))
         return tags
 
-    def _list_run_infos(self, experiment_id, view_type):
+    def _list_run_dirs(self, experiment_id):
         self._check_root_dir()
         if not self._has_experiment(experiment_id):
-            return []
+            return None, []
         experiment_dir = self._get_experiment_path(experiment_id, assert_exists=True)
         run_dirs = list_all(
             experiment_dir,
@@ -725,31 +799,73 @@ class FileStore(AbstractStore):
             and os.path.isdir(x),
             full_path=True,
         )
-        run_infos = []
-        for r_dir in run_dirs:
-            try:
-                # trap and warn known issues, will raise unexpected exceptions to caller
-                run_info = self._get_run_info_from_dir(r_dir)
-                if run_info.experiment_id != experiment_id:
-                    logging.warning(
-                        "Wrong experiment ID (%s) recorded for run '%s'. "
-                        "It should be %s. Run will be ignored.",
-                        str(run_info.experiment_id),
-                        str(run_info.run_id),
-                        str(experiment_id),
-                        exc_info=True,
-                    )
-                    continue
-                if LifecycleStage.matches_view_type(view_type, run_info.lifecycle_stage):
-                    run_infos.append(run_info)
-            except MissingConfigException as rnfe:
-                # trap malformed run exception and log warning
-                r_id = os.path.basename(r_dir)
+        return experiment_dir, run_dirs
+
+    def _get_run_info_from_run_dir(self, experiment_id, run_dir):
+        """
+        :return: The ``RunInfo`` of the run stored in ``run_dir``, or ``None`` if the run is
+                 malformed or belongs to a different experiment.
+        """
+        try:
+            # trap and warn known issues, will raise unexpected exceptions to caller
+            run_info = self._get_run_info_from_dir(run_dir)
+            if run_info.experiment_id != experiment_id:
                 logging.warning(
-                    "Malformed run '%s'. Detailed error %s", r_id, str(rnfe), exc_info=True
+                    "Wrong experiment ID (%s) recorded for run '%s'. "
+                    "It should be %s. Run will be ignored.",
+                    str(run_info.experiment_id),
+                    str(run_info.run_id),
+                    str(experiment_id),
+                    exc_info=True,
                 )
+                return None
+            return run_info
+        except MissingConfigException as rnfe:
+            # trap malformed run exception and log warning
+            r_id = os.path.basename(run_dir)
+            logging.warning("Malformed run '%s'. Detailed error %s", r_id, str(rnfe), exc_info=True)
+            return None
+
+    def _list_run_infos(self, experiment_id, view_type):
+        _, run_dirs = self._list_run_dirs(experiment_id)
+        run_infos = []
+        for r_dir in run_dirs:
+            run_info = self._get_run_info_from_run_dir(experiment_id, r_dir)
+            if run_info is not None and LifecycleStage.matches_view_type(
+                view_type, run_info.lifecycle_stage
+            ):
+                run_infos.append(run_info)
         return run_infos
 
+    def _list_runs(self, experiment_id, view_type):
+        """
+        List the runs of the specified experiment, using the experiment's run index (see
+        :py:mod:`mlflow.store.tracking.file_store_index`) to avoid reading the files of runs that
+        have not changed since they were last indexed.
+        """
+        experiment_dir, run_dirs = self._list_run_dirs(experiment_id)
+        if experiment_dir is None:
+            return []
+        index = ExperimentRunIndex(experiment_dir)
+        runs = []
+        for r_dir in run_dirs:
+            run_id = os.path.basename(r_dir)
+            fingerprint = get_run_fingerprint(r_dir, FileStore._RUN_FINGERPRINT_FILES)
+            snapshot = index.get(run_id, fingerprint)
+            if snapshot is not None:
+                run = _read_run_snapshot(snapshot)
+            else:
+                run_info = self._get_run_info_from_run_dir(experiment_id, r_dir)
+                if run_info is None:
+                    continue
+                run = self._get_run_from_info(run_info)
+                index.put(run_id, fingerprint, _make_run_snapshot(run))
+            if LifecycleStage.matches_view_type(view_type, run.info.lifecycle_stage):
+                runs.append(run)
+        index.retain(os.path.basename(r_dir) for r_dir in run_dirs)
+        index.save()
+        return runs
+
     def _search_runs(
         self, experiment_ids, filter_string, run_view_type, max_results, order_by, page_token
     ):
@@ -763,11 +879,12 @@ class FileStore(AbstractStore):
             )
         runs = []
         for experiment_id in experiment_ids:
-            run_infos = self._list_run_infos(experiment_id, run_view_type)
-            runs.extend(self._get_run_from_info(r) for r in run_infos)
+            runs.extend(self._list_runs(experiment_id, run_view_type))
         filtered = SearchUtils.filter(runs, filter_string)
         sorted_runs = SearchUtils.sort(filtered, order_by)
-        runs, next_page_token = SearchUtils.paginate(sorted_runs, page_token, max_results)
+        runs, next_page_token = SearchUtils.paginate_runs(
+            sorted_runs, page_token, max_results, order_by
+        )
         return runs, next_page_token
 
     def log_metric(self, run_id, metric):
@@ -781,6 +898,7 @@ class FileStore(AbstractStore):
         metric_path = self._get_metric_path(run_info.experiment_id, run_info.run_id, metric.key)
         make_containing_dirs(metric_path)
         append_to(metric_path, "%s %s %s\n" % (metric.timestamp, metric.value, metric.step))
+        self._touch_run_subfolder(run_info, FileStore.METRICS_FOLDER_NAME)
 
     def _writeable_value(self, tag_value):
         if tag_value is None:
@@ -809,6 +927,7 @@ class FileStore(AbstractStore):
             )
         make_containing_dirs(param_path)
         write_to(param_path, writeable_param_value)
+        self._touch_run_subfolder(run_info, FileStore.PARAMS_FOLDER_NAME)
 
     def _validate_new_param_value(self, param_path, param_key, run_id, new_value):
         """
@@ -859,6 +978,7 @@ class FileStore(AbstractStore):
         make_containing_dirs(tag_path)
         # Don't add trailing newline
         write_to(tag_path, self._writeable_value(tag.value))
+        self._touch_run_subfolder(run_info, FileStore.TAGS_FOLDER_NAME)
 
     def delete_tag(self, run_id, key):
         """
@@ -876,6 +996,18 @@ class FileStore(AbstractStore):
                 error_code=RESOURCE_DOES_NOT_EXIST,
             )
         os.remove(tag_path)
+        self._touch_run_subfolder(run_info, FileStore.TAGS_FOLDER_NAME)
+
+    def _touch_run_subfolder(self, run_info, subfolder_name):
+        """
+        Bump the modification time of the specified run subfolder so that the run's entry in the
+        experiment's run index is invalidated. This is necessary because writes that overwrite or
+        append to existing files, or that create files in nested subdirectories, do not update the
+        modification time of the subfolder itself.
+        """
+        touch(
+            os.path.join(self._get_run_dir(run_info.experiment_id, run_info.run_id), subfolder_name)
+        )
 
     def _overwrite_run_info(self, run_info):
         run_dir = self._get_run_dir(run_info.experiment_id, run_info.run_id)
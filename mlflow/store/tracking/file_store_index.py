@@ -0,0 +1,133 @@
+"""
+Sidecar index of run metadata used by :py:class:`mlflow.store.tracking.file_store.FileStore` to
+answer searches without reading every metric, param and tag file of every run.
+
+The index is a single JSON file stored under each experiment directory. It maps run IDs to a
+snapshot of the run (its persisted ``meta.yaml`` contents, latest metrics, params and tags) along
+with a fingerprint of the run directory, consisting of the modification times and sizes of the run's
+``meta.yaml`` file and its ``metrics``, ``params`` and ``tags`` directories. ``FileStore`` bumps the
+modification time of the relevant directory on every write, so a snapshot whose fingerprint no
+longer matches the run directory is stale and is re-read from the run's files.
+"""
+import json
+import logging
+import os
+import tempfile
+import time
+
+_logger = logging.getLogger(__name__)
+
+INDEX_FILE_NAME = ".run_index.json"
+_INDEX_FORMAT_VERSION = 1
+
+# Snapshots of runs modified less than this many nanoseconds before they were indexed are
+# considered unreliable, since a subsequent write may not change the (possibly coarse-grained)
+# modification times recorded in their fingerprint. Such runs are re-read on the next search.
+_RACY_WINDOW_NS = 2 * 10 ** 9
+
+
+def get_run_fingerprint(run_dir, file_names):
+    """
+    :param run_dir: Path to the run directory.
+    :param file_names: Names of the files and directories under ``run_dir`` whose modification
+                       times and sizes make up the fingerprint.
+    :return: A JSON-serializable fingerprint of the specified run directory.
+    """
+    fingerprint = []
+    for name in file_names:
+        try:
+            stat = os.stat(os.path.join(run_dir, name))
+            fingerprint.append([stat.st_mtime_ns, stat.st_size])
+        except FileNotFoundError:
+            fingerprint.append(None)
+    return fingerprint
+
+
+def touch(path):
+    """
+    Update the modification time of ``path`` to the current time if it exists, invalidating the
+    index entry of the run that contains it.
+    """
+    try:
+        os.utime(path, None)
+    except FileNotFoundError:
+        pass
+
+
+class ExperimentRunIndex:
+    """
+    Index of the runs stored under a single experiment directory.
+    """
+
+    def __init__(self, experiment_dir):
+        self.path = os.path.join(experiment_dir, INDEX_FILE_NAME)
+        self._entries = self._load()
+        self._dirty = False
+
+    def _load(self):
+        try:
+            with open(self.path, "r") as f:
+                index = json.load(f)
+            if index.get("version") == _INDEX_FORMAT_VERSION:
+                return index["runs"]
+        except FileNotFoundError:
+            pass
+        except Exception:
+            _logger.debug("Ignoring malformed run index '%s'", self.path, exc_info=True)
+        return {}
+
+    def get(self, run_id, fingerprint):
+        """
+        :return: The snapshot recorded for the specified run if it is up to date with respect to
+                 ``fingerprint``, ``None`` otherwise.
+        """
+        entry = self._entries.get(run_id)
+        if entry is None or entry["fingerprint"] != fingerprint:
+            return None
+        mtimes = [item[0] for item in fingerprint if item is not None]
+        if mtimes and max(mtimes) >= entry["indexed_at"] - _RACY_WINDOW_NS:
+            return None
+        return entry["snapshot"]
+
+    def put(self, run_id, fingerprint, snapshot):
+        """
+        Record a snapshot of the specified run.
+
+        :param fingerprint: Fingerprint of the run directory, computed *before* the run's files
+                            were read to produce ``snapshot``.
+        """
+        self._entries[run_id] = {
+            "fingerprint": fingerprint,
+            "indexed_at": int(time.time() * 10 ** 9),
+            "snapshot": snapshot,
+        }
+        self._dirty = True
+
+    def retain(self, run_ids):
+        """
+        Remove the entries of runs that are not in ``run_ids``, e.g. runs that were permanently
+        deleted.
+        """
+        for run_id in set(self._entries) - set(run_ids):
+            del self._entries[run_id]
+            self._dirty = True
+
+    def save(self):
+        """
+        Atomically persist the index if it was modified. Failures (e.g. against a read-only store)
+        are logged and otherwise ignored since the index is only a cache of the run files.
+        """
+        if not self._dirty:
+            return
+        try:
+            fd, tmp_path = tempfile.mkstemp(prefix=INDEX_FILE_NAME, dir=os.path.dirname(self.path))
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump({"version": _INDEX_FORMAT_VERSION, "runs": self._entries}, f)
+                os.replace(tmp_path, self.path)
+            except Exception:
+                os.remove(tmp_path)
+                raise
+            self._dirty = False
+        except Exception:
+            _logger.debug("Failed to write run index '%s'", self.path, exc_info=True)
@@ -14,6 +14,7 @@ from mlflow.protos.service_pb2 import (
     SetTag,
     UpdateRun,
     CreateRun,
+    CreateRuns,
     DeleteRun,
     RestoreRun,
     DeleteExperiment,
@@ -171,6 +172,41 @@ class RestStore(AbstractStore):
         run = Run.from_proto(response_proto.run)
         return run
 
+    def create_runs(self, experiment_id, runs):
+        """
+        Create multiple runs under the specified experiment ID, along with their initial metrics,
+        params and tags, with a single request. Falls back to creating the runs one by one if the
+        server does not support creating runs in bulk.
+
+        :param experiment_id: ID of the experiment for the runs
+        :param runs: List of :py:class:`mlflow.store.tracking.RunSpec` describing the runs to
+                     create
+
+        :return: List of the created Run objects, in the order of ``runs``
+        """
+        run_protos = []
+        for run in runs:
+            run_proto = CreateRuns.RunSpec(
+                user_id=run.user_id,
+                start_time=run.start_time,
+                tags=[tag.to_proto() for tag in run.tags],
+                params=[param.to_proto() for param in run.params],
+                metrics=[metric.to_proto() for metric in run.metrics],
+            )
+            if run.end_time is not None:
+                run_proto.end_time = run.end_time
+            if run.status is not None:
+                run_proto.status = run.status
+            run_protos.append(run_proto)
+        req_body = message_to_json(CreateRuns(experiment_id=str(experiment_id), runs=run_protos))
+        try:
+            response_proto = self._call_endpoint(CreateRuns, req_body)
+        except MlflowException as e:
+            if e.error_code != databricks_pb2.ErrorCode.Name(databricks_pb2.ENDPOINT_NOT_FOUND):
+                raise
+            return super().create_runs(experiment_id, runs)
+        return [Run.from_proto(run_proto) for run_proto in response_proto.runs]
+
     def log_metric(self, run_id, metric):
         """
         Log a metric for the specified run
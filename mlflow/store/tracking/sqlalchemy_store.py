@@ -9,7 +9,7 @@ import sqlalchemy.sql.expression as sql
 
 from mlflow.entities.lifecycle_stage import LifecycleStage
 from mlflow.store.tracking import SEARCH_MAX_RESULTS_THRESHOLD
-from mlflow.store.db.db_types import MYSQL, MSSQL
+from mlflow.store.db.db_types import MYSQL, MSSQL, POSTGRES, SQLITE
 import mlflow.store.db.utils
 from mlflow.store.tracking.dbmodels.models import (
     SqlExperiment,
@@ -34,6 +34,7 @@ from mlflow.protos.databricks_pb2 import (
     INTERNAL_ERROR,
 )
 from mlflow.utils.uri import is_local_uri, extract_db_type_from_uri
+from mlflow.utils import chunk_list
 from mlflow.utils.file_utils import mkdir, local_file_uri_to_path
 from mlflow.utils.search_utils import SearchUtils
 from mlflow.utils.string_utils import is_string_type
@@ -46,11 +47,20 @@ from mlflow.utils.validation import (
     _validate_experiment_tag,
     _validate_tag,
     _validate_list_experiments_max_results,
+    _validate_create_runs_limits,
 )
 from mlflow.utils.mlflow_tags import MLFLOW_LOGGED_MODELS
 
 _logger = logging.getLogger(__name__)
 
+# Maximum number of rows written by a single multi-row INSERT statement, or looked up by a single
+# SELECT statement. This keeps the number of bound parameters per statement well below the limits
+# of the supported databases (e.g. 999 for older versions of SQLite and 2100 for MSSQL).
+_MAX_ROWS_PER_INSERT = 100
+# Maximum number of bound parameters of a single multi-row INSERT statement, for tables with more
+# columns than ``_MAX_ROWS_PER_INSERT`` rows allow (e.g. runs)
+_MAX_VALUES_PER_INSERT = 900
+
 # For each database table, fetch its columns and define an appropriate attribute for each column
 # on the table's associated object representation (Mapper). This is necessary to ensure that
 # columns defined via backreference are available as Mapper instance attributes (e.g.,
@@ -444,6 +454,98 @@ class SqlAlchemyStore(AbstractStore):
 
             return run.to_mlflow_entity()
 
+    def create_runs(self, experiment_id, runs):
+        """
+        Create the specified runs, along with their metrics, params and tags, in a single
+        transaction with multi-row ``INSERT`` statements.
+        """
+        _validate_create_runs_limits(runs)
+        for run in runs:
+            _validate_batch_log_data(run.metrics, run.params, run.tags)
+        with self.ManagedSessionMaker() as session:
+            experiment = self.get_experiment(experiment_id)
+            self._check_experiment_is_active(experiment)
+
+            run_ids = []
+            run_rows, param_rows, metric_rows, latest_metric_rows, tag_rows = [], [], [], [], []
+            for run in runs:
+                run_id = uuid.uuid4().hex
+                run_ids.append(run_id)
+                status = RunStatus.RUNNING if run.status is None else run.status
+                run_rows.append(
+                    dict(
+                        name="",
+                        artifact_uri=append_to_uri_path(
+                            experiment.artifact_location,
+                            run_id,
+                            SqlAlchemyStore.ARTIFACTS_FOLDER_NAME,
+                        ),
+                        run_uuid=run_id,
+                        experiment_id=experiment_id,
+                        source_type=SourceType.to_string(SourceType.UNKNOWN),
+                        source_name="",
+                        entry_point_name="",
+                        user_id=run.user_id,
+                        status=RunStatus.to_string(status),
+                        start_time=run.start_time,
+                        end_time=run.end_time,
+                        source_version="",
+                        lifecycle_stage=LifecycleStage.ACTIVE,
+                    )
+                )
+
+                params = {}
+                for param in run.params:
+                    _check_param_value_unchanged(
+                        run_id, param.key, params.get(param.key), param.value
+                    )
+                    params[param.key] = param.value
+                param_rows.extend(
+                    dict(run_uuid=run_id, key=key, value=value) for key, value in params.items()
+                )
+
+                metrics = {}
+                latest_metrics = {}
+                for metric in run.metrics:
+                    value, is_nan = _get_sql_metric_value(metric.value)
+                    row = dict(
+                        run_uuid=run_id,
+                        key=metric.key,
+                        value=value,
+                        timestamp=metric.timestamp,
+                        step=metric.step,
+                        is_nan=is_nan,
+                    )
+                    metrics.setdefault(_get_metric_row_pk(row), row)
+                    latest = latest_metrics.get(row["key"])
+                    if latest is None or _get_metric_row_order(row) > _get_metric_row_order(latest):
+                        latest_metrics[row["key"]] = row
+                metric_rows.extend(metrics.values())
+                latest_metric_rows.extend(latest_metrics.values())
+
+                tags = {tag.key: tag.value for tag in run.tags}
+                tag_rows.extend(
+                    dict(run_uuid=run_id, key=key, value=value) for key, value in tags.items()
+                )
+
+            try:
+                self._bulk_insert(session, SqlRun, run_rows)
+                self._bulk_insert(session, SqlParam, param_rows)
+                self._bulk_insert(session, SqlMetric, metric_rows)
+                self._bulk_insert(session, SqlLatestMetric, latest_metric_rows)
+                self._bulk_insert(session, SqlTag, tag_rows)
+            except Exception as e:
+                raise MlflowException(e, INTERNAL_ERROR)
+
+            created_runs = {
+                run.run_uuid: run
+                for run in session.query(SqlRun)
+                .options(*self._get_eager_run_query_options())
+                .filter(SqlRun.run_uuid.in_(run_ids))
+                .all()
+            }
+            return [created_runs[run_id].to_mlflow_entity() for run_id in run_ids]
+
     def _get_run(self, session, run_uuid, eager=False):
         """
         :param eager: If ``True``, eagerly loads the run's summary metrics (``latest_metrics``),
@@ -575,14 +677,7 @@ class SqlAlchemyStore(AbstractStore):
 
     def log_metric(self, run_id, metric):
         _validate_metric(metric.key, metric.value, metric.timestamp, metric.step)
-        is_nan = math.isnan(metric.value)
-        if is_nan:
-            value = 0
-        elif math.isinf(metric.value):
-            #  NB: Sql can not represent Infs = > We replace +/- Inf with max/min 64b float value
-            value = 1.7976931348623157e308 if metric.value > 0 else -1.7976931348623157e308
-        else:
-            value = metric.value
+        value, is_nan = _get_sql_metric_value(metric.value)
         with self.ManagedSessionMaker() as session:
             run = self._get_run(run_uuid=run_id, session=session)
             self._check_run_is_active(run)
@@ -749,11 +844,10 @@ class SqlAlchemyStore(AbstractStore):
     def _search_runs(
         self, experiment_ids, filter_string, run_view_type, max_results, order_by, page_token
     ):
-        def compute_next_token(current_size):
+        def compute_next_token(current_size, last_sort_key):
             next_token = None
-            if max_results == current_size:
-                final_offset = offset + max_results
-                next_token = SearchUtils.create_page_token(final_offset)
+            if max_results == current_size and current_size > 0:
+                next_token = SearchUtils.create_keyset_page_token(list(last_sort_key))
 
             return next_token
 
@@ -772,9 +866,17 @@ class SqlAlchemyStore(AbstractStore):
             # ``run.to_mlflow_entity()``, so eager loading helps avoid additional database queries
             # that are otherwise executed at attribute access time under a lazy loading model.
             parsed_filters = SearchUtils.parse_search_filter(filter_string)
-            parsed_orderby, sorting_joins = _get_orderby_clauses(order_by, session)
-
-            query = session.query(SqlRun)
+            sort_keys, sorting_joins = _get_sort_keys(order_by, session)
+            parsed_orderby = _get_orderby_clauses_from_sort_keys(sort_keys)
+
+            # Select the sort key values of each run along with the run itself, so that the
+            # next page token can encode the sort key of the last run on this page
+            query = session.query(SqlRun).add_columns(
+                *[
+                    _get_unlabeled(key).label("sort_key_%s" % i)
+                    for i, (key, _) in enumerate(sort_keys)
+                ]
+            )
             for j in _get_sqlalchemy_filter_clauses(parsed_filters, session):
                 query = query.join(j)
             # using an outer join is necessary here because we want to be able to sort
@@ -783,7 +885,20 @@ class SqlAlchemyStore(AbstractStore):
             for j in sorting_joins:
                 query = query.outerjoin(j)
 
-            offset = SearchUtils.parse_start_offset_from_page_token(page_token)
+            offset, keyset = SearchUtils.parse_page_token_for_search_runs(page_token)
+            keyset_clauses = []
+            if keyset is not None:
+                if len(keyset) != len(sort_keys):
+                    raise MlflowException(
+                        "Invalid page token, it does not match the specified order_by "
+                        "clauses {}".format(order_by),
+                        error_code=INVALID_PARAMETER_VALUE,
+                    )
+                keyset_clauses.append(
+                    _get_keyset_filtering_clause(
+                        sort_keys, keyset, nulls_first=self.db_type != POSTGRES
+                    )
+                )
             queried_runs = (
                 query.distinct()
                 .options(*self._get_eager_run_query_options())
@@ -791,6 +906,7 @@ class SqlAlchemyStore(AbstractStore):
                     SqlRun.experiment_id.in_(experiment_ids),
                     SqlRun.lifecycle_stage.in_(stages),
                     *_get_attributes_filtering_clauses(parsed_filters),
+                    *keyset_clauses,
                 )
                 .order_by(*parsed_orderby)
                 .offset(offset)
@@ -798,8 +914,10 @@ class SqlAlchemyStore(AbstractStore):
                 .all()
             )
 
-            runs = [run.to_mlflow_entity() for run in queried_runs]
-            next_page_token = compute_next_token(len(runs))
+            runs = [row[0].to_mlflow_entity() for row in queried_runs]
+            next_page_token = compute_next_token(
+                len(runs), queried_runs[-1][1:] if queried_runs else None
+            )
 
         return runs, next_page_token
 
@@ -808,20 +926,210 @@ class SqlAlchemyStore(AbstractStore):
         _validate_batch_log_data(metrics, params, tags)
         _validate_batch_log_limits(metrics, params, tags)
         with self.ManagedSessionMaker() as session:
-            run = self._get_run(run_uuid=run_id, session=session)
-            self._check_run_is_active(run)
+            self._log_batch(session, run_id, metrics, params, tags)
+
+    def log_batches(self, batches):
+        """
+        Log batches of metrics, params and tags to one or more runs in a single transaction, so
+        that either all of the batches are logged or none of them. Unlike ``log_batch``, the
+        number of metrics, params and tags of each batch is not limited.
+
+        :param batches: List of ``(run_id, metrics, params, tags)`` tuples. Runs are locked in the
+                        order of the list, which should be consistent across concurrent calls in
+                        order to avoid deadlocks.
+        """
+        for run_id, metrics, params, tags in batches:
+            _validate_run_id(run_id)
+            _validate_batch_log_data(metrics, params, tags)
+        with self.ManagedSessionMaker() as session:
+            for run_id, metrics, params, tags in batches:
+                self._log_batch(session, run_id, metrics, params, tags)
+
+    def _log_batch(self, session, run_id, metrics, params, tags):
+        run = self._get_run(run_uuid=run_id, session=session)
+        self._check_run_is_active(run)
         try:
-            for param in params:
-                self.log_param(run_id, param)
-            for metric in metrics:
-                self.log_metric(run_id, metric)
-            for tag in tags:
-                self.set_tag(run_id, tag)
+            self._log_params(session, run_id, params)
+            self._log_metrics(session, run_id, metrics)
+            self._set_tags(session, run_id, tags)
         except MlflowException as e:
             raise e
         except Exception as e:
             raise MlflowException(e, INTERNAL_ERROR)
 
+    def _log_params(self, session, run_id, params):
+        """
+        Insert a batch of params for the specified run within the given session, using a single
+        query to detect params that were previously logged and a multi-row ``INSERT`` for the rest.
+        Attempting to change the value of an existing param raises an ``MlflowException``.
+        """
+        if not params:
+            return
+
+        new_params = {}
+        for param in params:
+            _check_param_value_unchanged(run_id, param.key, new_params.get(param.key), param.value)
+            new_params[param.key] = param.value
+
+        existing_params = [
+            param
+            for keys in chunk_list(list(new_params), _MAX_ROWS_PER_INSERT)
+            for param in session.query(SqlParam.key, SqlParam.value)
+            .filter(SqlParam.run_uuid == run_id, SqlParam.key.in_(keys))
+            .all()
+        ]
+        for key, old_value in existing_params:
+            _check_param_value_unchanged(run_id, key, old_value, new_params.pop(key))
+
+        self._bulk_insert(
+            session,
+            SqlParam,
+            [dict(run_uuid=run_id, key=key, value=value) for key, value in new_params.items()],
+        )
+
+    def _log_metrics(self, session, run_id, metrics):
+        """
+        Insert a batch of metrics for the specified run within the given session. Metrics that are
+        already present in the ``metrics`` table are skipped, and the ``latest_metrics`` table is
+        updated with the most recent value per key as computed from the batch.
+        """
+        if not metrics:
+            return
+
+        # Deduplicate the batch by primary key, preserving the order in which metrics were logged
+        new_metrics = {}
+        for metric in metrics:
+            value, is_nan = _get_sql_metric_value(metric.value)
+            row = dict(
+                run_uuid=run_id,
+                key=metric.key,
+                value=value,
+                timestamp=metric.timestamp,
+                step=metric.step,
+                is_nan=is_nan,
+            )
+            new_metrics.setdefault(_get_metric_row_pk(row), row)
+
+        # Narrow down candidate duplicates with one query per chunk of rows; exact matching happens
+        # in Python
+        for rows in chunk_list(list(new_metrics.values()), _MAX_ROWS_PER_INSERT):
+            existing_metrics = (
+                session.query(
+                    SqlMetric.key,
+                    SqlMetric.value,
+                    SqlMetric.timestamp,
+                    SqlMetric.step,
+                    SqlMetric.is_nan,
+                )
+                .filter(
+                    SqlMetric.run_uuid == run_id,
+                    SqlMetric.key.in_(list({row["key"] for row in rows})),
+                    SqlMetric.timestamp.in_(list({row["timestamp"] for row in rows})),
+                    SqlMetric.step.in_(list({row["step"] for row in rows})),
+                )
+                .all()
+            )
+            for key, value, timestamp, step, is_nan in existing_metrics:
+                new_metrics.pop((key, value, timestamp, step, bool(is_nan)), None)
+
+        rows = list(new_metrics.values())
+        self._bulk_insert(session, SqlMetric, rows)
+        self._update_latest_metrics_if_necessary(session, run_id, rows)
+
+    def _update_latest_metrics_if_necessary(self, session, run_id, metric_rows):
+        """
+        Update the ``latest_metrics`` table for the specified run given a collection of newly
+        inserted ``metrics`` rows, using a dialect-specific upsert where available.
+        """
+        if not metric_rows:
+            return
+
+        latest_rows = {}
+        for row in metric_rows:
+            current = latest_rows.get(row["key"])
+            if current is None or _get_metric_row_order(row) > _get_metric_row_order(current):
+                latest_rows[row["key"]] = row
+
+        # Lock the existing latest metric rows for the remainder of the transaction in order to
+        # ensure isolation
+        existing_latest_metrics = [
+            latest_metric
+            for keys in chunk_list(list(latest_rows), _MAX_ROWS_PER_INSERT)
+            for latest_metric in session.query(SqlLatestMetric)
+            .filter(SqlLatestMetric.run_uuid == run_id, SqlLatestMetric.key.in_(keys))
+            .with_for_update()
+            .all()
+        ]
+        for latest_metric in existing_latest_metrics:
+            row = latest_rows[latest_metric.key]
+            if _get_metric_row_order(row) <= (
+                latest_metric.step,
+                latest_metric.timestamp,
+                latest_metric.value,
+            ):
+                del latest_rows[latest_metric.key]
+
+        self._bulk_upsert(
+            session,
+            SqlLatestMetric,
+            list(latest_rows.values()),
+            update_columns=["value", "timestamp", "step", "is_nan"],
+        )
+
+    def _set_tags(self, session, run_id, tags):
+        """
+        Upsert a batch of tags for the specified run within the given session. If a tag key
+        appears multiple times in the batch, the last value wins.
+        """
+        if not tags:
+            return
+
+        rows = {tag.key: dict(run_uuid=run_id, key=tag.key, value=tag.value) for tag in tags}
+        self._bulk_upsert(session, SqlTag, list(rows.values()), update_columns=["value"])
+
+    @staticmethod
+    def _bulk_insert(session, model, rows):
+        """
+        Insert the specified rows into the table associated with ``model`` using multi-row
+        ``INSERT`` statements of at most ``_MAX_ROWS_PER_INSERT`` rows and
+        ``_MAX_VALUES_PER_INSERT`` values each.
+        """
+        if not rows:
+            return
+        rows_per_insert = max(1, min(_MAX_ROWS_PER_INSERT, _MAX_VALUES_PER_INSERT // len(rows[0])))
+        for start in range(0, len(rows), rows_per_insert):
+            chunk = rows[start : start + rows_per_insert]
+            session.execute(model.__table__.insert().values(chunk))
+
+    def _bulk_upsert(self, session, model, rows, update_columns):
+        """
+        Insert the specified rows into the table associated with ``model``, overwriting
+        ``update_columns`` for rows whose primary key already exists. PostgreSQL, MySQL and SQLite
+        use a native multi-row upsert; other dialects fall back to merging rows one at a time.
+        """
+        if not rows:
+            return
+
+        insert = _get_dialect_insert(self.db_type)
+        if insert is None:
+            for row in rows:
+                session.merge(model(**row))
+            return
+
+        table = model.__table__
+        for start in range(0, len(rows), _MAX_ROWS_PER_INSERT):
+            stmt = insert(table).values(rows[start : start + _MAX_ROWS_PER_INSERT])
+            if self.db_type == MYSQL:
+                stmt = stmt.on_duplicate_key_update(
+                    {column: stmt.inserted[column] for column in update_columns}
+                )
+            else:
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[column.name for column in table.primary_key.columns],
+                    set_={column: stmt.excluded[column] for column in update_columns},
+                )
+            session.execute(stmt)
+
     def record_logged_model(self, run_id, mlflow_model):
         from mlflow.models import Model
 
@@ -844,6 +1152,63 @@ class SqlAlchemyStore(AbstractStore):
             session.merge(SqlTag(key=MLFLOW_LOGGED_MODELS, value=value, run_uuid=run_id))
 
 
+def _get_sql_metric_value(value):
+    """
+    :return: A tuple of the value to store in the ``value`` column for the specified metric value
+             and whether the metric value is NaN.
+    """
+    is_nan = math.isnan(value)
+    if is_nan:
+        return 0, True
+    elif math.isinf(value):
+        #  NB: Sql can not represent Infs = > We replace +/- Inf with max/min 64b float value
+        return (1.7976931348623157e308 if value > 0 else -1.7976931348623157e308), False
+    else:
+        return value, False
+
+
+def _get_metric_row_pk(row):
+    return row["key"], row["value"], row["timestamp"], row["step"], row["is_nan"]
+
+
+def _get_metric_row_order(row):
+    """
+    :return: A key by which metric rows are ordered when determining the latest value of a metric,
+             consistent with ``SqlAlchemyStore._update_latest_metric_if_necessary``.
+    """
+    return row["step"], row["timestamp"], row["value"]
+
+
+def _check_param_value_unchanged(run_id, key, old_value, new_value):
+    if old_value is not None and old_value != new_value:
+        raise MlflowException(
+            "Changing param values is not allowed. Param with key='{}' was already"
+            " logged with value='{}' for run ID='{}'. Attempted logging new value"
+            " '{}'.".format(key, old_value, run_id, new_value),
+            INVALID_PARAMETER_VALUE,
+        )
+
+
+def _get_dialect_insert(db_type):
+    """
+    :return: The dialect-specific ``insert`` construct supporting upserts for the specified
+             database type, or ``None`` if the dialect (or installed SQLAlchemy version) does not
+             provide one.
+    """
+    try:
+        if db_type == POSTGRES:
+            from sqlalchemy.dialects.postgresql import insert
+        elif db_type == MYSQL:
+            from sqlalchemy.dialects.mysql import insert
+        elif db_type == SQLITE:
+            from sqlalchemy.dialects.sqlite import insert
+        else:
+            return None
+    except ImportError:
+        return None
+    return insert
+
+
 def _get_attributes_filtering_clauses(parsed):
     clauses = []
     for sql_statement in parsed:
@@ -915,8 +1280,23 @@ def _get_orderby_clauses(order_by_list, session):
     """Sorts a set of runs based on their natural ordering and an overriding set of order_bys.
     Runs are naturally ordered first by start time descending, then by run id for tie-breaking.
     """
+    sort_keys, ordering_joins = _get_sort_keys(order_by_list, session)
+    return _get_orderby_clauses_from_sort_keys(sort_keys), ordering_joins
 
-    clauses = []
+
+def _get_orderby_clauses_from_sort_keys(sort_keys):
+    return [key if ascending else key.desc() for key, ascending in sort_keys]
+
+
+def _get_sort_keys(order_by_list, session):
+    """
+    :return: A pair containing a list of ``(expression, ascending)`` tuples by which runs are
+             sorted, consistent with :py:func:`_get_orderby_clauses`, followed by the subqueries
+             that need to be outer-joined to ``SqlRun`` in order to evaluate these expressions.
+             The last sort key is always ``SqlRun.run_uuid``, which makes the ordering total.
+    """
+
+    sort_keys = []
     ordering_joins = []
     clause_id = 0
     observed_order_by_clauses = set()
@@ -956,23 +1336,31 @@ def _get_orderby_clauses(order_by_list, session):
             # same main query, the CASE WHEN columns need to have unique names to
             # avoid ambiguity
             if SearchUtils.is_metric(key_type, "="):
-                clauses.append(
-                    sql.case(
-                        [
-                            # Ideally the use of "IS" is preferred here but owing to sqlalchemy
-                            # translation in MSSQL we are forced to use "=" instead.
-                            # These 2 options are functionally identical / unchanged because
-                            # the column (is_nan) is not nullable. However it could become an issue
-                            # if this precondition changes in the future.
-                            (subquery.c.is_nan == sqlalchemy.true(), 1),
-                            (order_value.is_(None), 1),
-                        ],
-                        else_=0,
-                    ).label("clause_%s" % clause_id)
+                sort_keys.append(
+                    (
+                        sql.case(
+                            [
+                                # Ideally the use of "IS" is preferred here but owing to sqlalchemy
+                                # translation in MSSQL we are forced to use "=" instead.
+                                # These 2 options are functionally identical / unchanged because
+                                # the column (is_nan) is not nullable. However it could become an
+                                # issue if this precondition changes in the future.
+                                (subquery.c.is_nan == sqlalchemy.true(), 1),
+                                (order_value.is_(None), 1),
+                            ],
+                            else_=0,
+                        ).label("clause_%s" % clause_id),
+                        True,
+                    )
                 )
             else:  # other entities do not have an 'is_nan' field
-                clauses.append(
-                    sql.case([(order_value.is_(None), 1)], else_=0).label("clause_%s" % clause_id)
+                sort_keys.append(
+                    (
+                        sql.case([(order_value.is_(None), 1)], else_=0).label(
+                            "clause_%s" % clause_id
+                        ),
+                        True,
+                    )
                 )
 
             if (key_type, key) in observed_order_by_clauses:
@@ -981,12 +1369,48 @@ def _get_orderby_clauses(order_by_list, session):
                 )
             observed_order_by_clauses.add((key_type, key))
 
-            if ascending:
-                clauses.append(order_value)
-            else:
-                clauses.append(order_value.desc())
+            sort_keys.append((order_value, ascending))
 
     if (SearchUtils._ATTRIBUTE_IDENTIFIER, SqlRun.start_time.key) not in observed_order_by_clauses:
-        clauses.append(SqlRun.start_time.desc())
-    clauses.append(SqlRun.run_uuid)
-    return clauses, ordering_joins
+        sort_keys.append((SqlRun.start_time, False))
+    sort_keys.append((SqlRun.run_uuid, True))
+    return sort_keys, ordering_joins
+
+
+def _get_unlabeled(expression):
+    return expression.element if isinstance(expression, sql.Label) else expression
+
+
+def _get_keyset_filtering_clause(sort_keys, keyset, nulls_first):
+    """
+    Build a clause matching the runs that are sorted strictly after the run whose sort key values
+    are ``keyset``, i.e. the lexicographic comparison ``(k_1, ..., k_n) > (v_1, ..., v_n)`` with
+    respect to the direction of each sort key. The comparison is expanded into
+    ``k_1 > v_1 OR (k_1 = v_1 AND k_2 > v_2) OR ...`` since row value comparisons do not support
+    mixed sort directions and are not available on all supported databases.
+
+    :param sort_keys: List of ``(expression, ascending)`` tuples returned by
+                      :py:func:`_get_sort_keys`.
+    :param keyset: Sort key values of the last run on the previous page.
+    :param nulls_first: Whether the database sorts NULL values before non-NULL values when sorting
+                        in ascending order.
+    """
+    clauses = []
+    equal_prefix = []
+    for (key, ascending), value in zip(sort_keys, keyset):
+        key = _get_unlabeled(key)
+        # NULLs are sorted before all other values in ascending order on e.g. SQLite and MySQL,
+        # and after all other values on PostgreSQL. The order is reversed for descending sorts.
+        key_nulls_first = nulls_first == ascending
+        if value is None:
+            after = key.isnot(None) if key_nulls_first else None
+            equal = key.is_(None)
+        else:
+            after = key > value if ascending else key < value
+            if not key_nulls_first:
+                after = sql.or_(after, key.is_(None))
+            equal = key == value
+        if after is not None:
+            clauses.append(sql.and_(*equal_prefix, after))
+        equal_prefix.append(equal)
+    return sql.or_(*clauses)
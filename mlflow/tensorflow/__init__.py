@@ -17,6 +17,7 @@ import atexit
 import time
 import tempfile
 from collections import namedtuple
+import numpy as np
 import pandas
 from packaging.version import Version
 from threading import RLock
@@ -24,6 +25,7 @@ from threading import RLock
 
 import mlflow
 import mlflow.keras
+import mlflow.pyfunc.utils as pyfunc_utils
 from mlflow import pyfunc
 from mlflow.exceptions import MlflowException
 from mlflow.models import Model
@@ -32,7 +34,7 @@ from mlflow.models.signature import ModelSignature
 from mlflow.models.utils import ModelInputExample, _save_example
 from mlflow.protos.databricks_pb2 import DIRECTORY_NOT_EMPTY
 from mlflow.tracking import MlflowClient
-from mlflow.tracking.artifact_utils import _download_artifact_from_uri, get_artifact_uri
+from mlflow.tracking.artifact_utils import _download_model_from_uri, get_artifact_uri
 from mlflow.utils.annotations import keyword_only
 from mlflow.utils.environment import (
     _mlflow_conda_env,
@@ -56,6 +58,7 @@ from mlflow.utils.autologging_utils import (
     batch_metrics_logger,
 )
 from mlflow.entities import Metric
+from mlflow.tensorflow._bounded_queue import _MetricQueue
 from mlflow.tracking._model_registry import DEFAULT_AWAIT_MAX_SLEEP_SECONDS
 
 
@@ -63,12 +66,17 @@ FLAVOR_NAME = "tensorflow"
 
 _logger = logging.getLogger(__name__)
 
+# The number of queued metrics above which the metric queue is flushed
 _MAX_METRIC_QUEUE_SIZE = 500
+# The number of queued metrics above which new metrics are dropped
+_METRIC_QUEUE_CAPACITY = 100 * 1000
 
 _LOG_EVERY_N_STEPS = 1
 
 _metric_queue_lock = RLock()
-_metric_queue = []
+_metric_queue = _MetricQueue(capacity=_METRIC_QUEUE_CAPACITY)
+# Whether a flush of the metric queue has been submitted to the thread pool and has not started
+_flush_scheduled = False
 
 _thread_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1)
 
@@ -368,7 +376,7 @@ def load_model(model_uri, dst_path=None):
             output_tensors = [tf_graph.get_tensor_by_name(output_signature.name)
                                 for _, output_signature in signature_definition.outputs.items()]
     """
-    local_model_path = _download_artifact_from_uri(artifact_uri=model_uri, output_path=dst_path)
+    local_model_path = _download_model_from_uri(model_uri, output_path=dst_path)
     (
         tf_saved_model_dir,
         tf_meta_graph_tags,
@@ -449,10 +457,36 @@ def _load_pyfunc(path):
         tf_signature_def_key,
     ) = _get_and_parse_flavor_configuration(model_path=path)
 
+    num_threads = pyfunc_utils._get_inference_intra_op_threads()
+    if num_threads is not None:
+        try:
+            tensorflow.config.threading.set_intra_op_parallelism_threads(num_threads)
+        except RuntimeError:
+            # Raised if the TensorFlow runtime has already been initialized in this process
+            _logger.warning(
+                "Failed to set the number of intra-op threads of TensorFlow to %s, since the"
+                " TensorFlow runtime has already been initialized",
+                num_threads,
+            )
+
     loaded_model = tensorflow.saved_model.load(  # pylint: disable=no-value-for-parameter
         export_dir=tf_saved_model_dir, tags=tf_meta_graph_tags
     )
-    return _TF2Wrapper(model=loaded_model, infer=loaded_model.signatures[tf_signature_def_key])
+    return _TF2Wrapper(
+        model=loaded_model,
+        infer=loaded_model.signatures[tf_signature_def_key],
+        batch_size=pyfunc_utils._get_inference_batch_size(),
+    )
+
+
+def _reshape_output(output):
+    """
+    Flattens outputs with one element per row, and converts other outputs to lists of rows.
+    """
+    # NB: Equivalent to checking that each row has a single element, without iterating over rows
+    if output.ndim == 1 or len(output) == 0 or output.shape[1] == 1:
+        return output.ravel()
+    return output.tolist()
 
 
 class _TF2Wrapper(object):
@@ -461,10 +495,13 @@ class _TF2Wrapper(object):
     ``predict(data: pandas.DataFrame) -> pandas.DataFrame``. For TensorFlow versions >= 2.0.0.
     """
 
-    def __init__(self, model, infer):
+    def __init__(self, model, infer, batch_size=None):
         """
         :param model: A Tensorflow SavedModel.
         :param infer: Tensorflow function returned by a saved model that is used for inference.
+        :param batch_size: The maximum number of rows of DataFrame inputs passed to ``infer`` at
+                           once, or ``None`` to pass the whole input at once. Dict inputs are
+                           always passed at once.
         """
         # Note: we need to retain the model reference in TF2Wrapper object, because the infer
         #  function in tensorflow will be `ConcreteFunction` which only retains WeakRefs to the
@@ -472,77 +509,63 @@ class _TF2Wrapper(object):
         #  See https://www.tensorflow.org/guide/function#deleting_tfvariables_between_function_calls
         self.model = model
         self.infer = infer
+        self.batch_size = batch_size
 
     def predict(self, data):
         import tensorflow
 
-        feed_dict = {}
         if isinstance(data, dict):
-            feed_dict = {k: tensorflow.constant(v) for k, v in data.items()}
+            inputs = {k: tensorflow.constant(v) for k, v in data.items()}
+            raw_preds = self.infer(**inputs)
+            pred_dict = {col_name: raw_preds[col_name].numpy() for col_name in raw_preds.keys()}
         elif isinstance(data, pandas.DataFrame):
+            inputs = {}
             for df_col_name in list(data):
                 # If there are multiple columns with the same name, selecting the shared name
                 # from the DataFrame will result in another DataFrame containing the columns
                 # with the shared name. TensorFlow cannot make eager tensors out of pandas
                 # DataFrames, so we convert the DataFrame to a numpy array here.
                 val = data[df_col_name]
-                if isinstance(val, pandas.DataFrame):
-                    val = val.values
-                feed_dict[df_col_name] = tensorflow.constant(val)
+                # NB: Batches of contiguous arrays are sliced without copying them
+                inputs[df_col_name] = np.ascontiguousarray(val.values)
+            batch_preds = []
+            for batch in pyfunc_utils._get_batch_slices(len(data), self.batch_size):
+                feed_dict = {k: tensorflow.constant(v[batch]) for k, v in inputs.items()}
+                raw_preds = self.infer(**feed_dict)
+                batch_preds.append({k: raw_preds[k].numpy() for k in raw_preds.keys()})
+            pred_dict = {
+                col_name: np.concatenate([preds[col_name] for preds in batch_preds])
+                if len(batch_preds) > 1
+                else batch_preds[0][col_name]
+                for col_name in batch_preds[0]
+            }
         else:
             raise TypeError("Only dict and DataFrame input types are supported")
 
-        raw_preds = self.infer(**feed_dict)
-        pred_dict = {col_name: raw_preds[col_name].numpy() for col_name in raw_preds.keys()}
-        for col in pred_dict.keys():
-            if all(len(element) == 1 for element in pred_dict[col]):
-                pred_dict[col] = pred_dict[col].ravel()
-            else:
-                pred_dict[col] = pred_dict[col].tolist()
-
+        pred_dict = {col_name: _reshape_output(pred) for col_name, pred in pred_dict.items()}
         if isinstance(data, dict):
             return pred_dict
         else:
             return pandas.DataFrame.from_dict(data=pred_dict)
 
 
-def _assoc_list_to_map(lst):
-    """
-    Convert an association list to a dictionary.
-    """
-    d = {}
-    for run_id, metric in lst:
-        d[run_id] = d[run_id] + [metric] if run_id in d else [metric]
-    return d
-
-
 def _flush_queue():
     """
     Flush the metric queue and log contents in batches to MLflow.
     Queue is divided into batches according to run id.
     """
-    try:
-        # Multiple queue flushes may be scheduled simultaneously on different threads
-        # (e.g., if the queue is at its flush threshold and several more items
-        # are added before a flush occurs). For correctness and efficiency, only one such
-        # flush operation should proceed; all others are redundant and should be dropped
-        acquired_lock = _metric_queue_lock.acquire(blocking=False)
-        if acquired_lock:
-            client = mlflow.tracking.MlflowClient()
-            # For thread safety and to avoid modifying a list while iterating over it, we record a
-            # separate list of the items being flushed and remove each one from the metric queue,
-            # rather than clearing the metric queue or reassigning it (clearing / reassigning is
-            # dangerous because we don't block threads from adding to the queue while a flush is
-            # in progress)
-            snapshot = _metric_queue[:]
-            for item in snapshot:
-                _metric_queue.remove(item)
-
-            metrics_by_run = _assoc_list_to_map(snapshot)
-            for run_id, metrics in metrics_by_run.items():
-                client.log_batch(run_id, metrics=metrics, params=[], tags=[])
-    finally:
-        if acquired_lock:
+    global _flush_scheduled
+
+    _flush_scheduled = False
+    # Multiple queue flushes may be scheduled simultaneously on different threads
+    # (e.g., if the queue is at its flush threshold and several more items
+    # are added before a flush occurs). For correctness and efficiency, only one such
+    # flush operation should proceed; all others are redundant and should be dropped
+    acquired_lock = _metric_queue_lock.acquire(blocking=False)
+    if acquired_lock:
+        try:
+            _metric_queue.flush(mlflow.tracking.MlflowClient().log_batch)
+        finally:
             _metric_queue_lock.release()
 
 
@@ -551,9 +574,13 @@ def _add_to_queue(key, value, step, time, run_id):
     Add a metric to the metric queue. Flush the queue if it exceeds
     max size.
     """
+    global _flush_scheduled
+
     met = Metric(key=key, value=value, timestamp=time, step=step)
-    _metric_queue.append((run_id, met))
-    if len(_metric_queue) > _MAX_METRIC_QUEUE_SIZE:
+    _metric_queue.add(run_id, met)
+    # NB: Checking the flag without a lock may rarely submit a redundant flush, which is a no-op
+    if len(_metric_queue) > _MAX_METRIC_QUEUE_SIZE and not _flush_scheduled:
+        _flush_scheduled = True
         _thread_pool.submit(_flush_queue)
 
 
@@ -0,0 +1,85 @@
+"""
+Defines the bounded queue that buffers the metrics extracted from TensorBoard summary events by
+TensorFlow autologging, until they are logged to MLflow in batches by a background thread.
+"""
+import collections
+import logging
+import threading
+
+from mlflow.utils import chunk_list
+from mlflow.utils.validation import MAX_METRICS_PER_BATCH
+
+_logger = logging.getLogger(__name__)
+
+
+class _MetricQueue:
+    """
+    A bounded queue of ``(run_id, metric)`` items. Adding an item is O(1) and never blocks on a
+    lock: items are appended to a ``collections.deque``, whose appends and pops are thread safe.
+    Flushing drains the items present when it starts, groups them by run and logs them in chunks
+    of at most ``MAX_METRICS_PER_BATCH`` metrics, in time linear in the number of items.
+
+    If the metrics are added faster than they can be logged, e.g. because the tracking server is
+    slow, the queue fills up to its capacity and the metrics added while it is full are dropped.
+    The number of dropped metrics is reported as a warning by the next flush.
+    """
+
+    def __init__(self, capacity):
+        """
+        :param capacity: The maximum number of metrics in the queue.
+        """
+        self._capacity = capacity
+        self._items = collections.deque()
+        self._num_dropped_lock = threading.Lock()
+        self._num_dropped = 0
+        self.num_dropped_total = 0
+
+    def __len__(self):
+        return len(self._items)
+
+    def add(self, run_id, metric):
+        """
+        Add a metric to the queue.
+
+        :return: ``True`` if the metric was added, ``False`` if it was dropped because the queue
+                 is full.
+        """
+        if len(self._items) >= self._capacity:
+            with self._num_dropped_lock:
+                self._num_dropped += 1
+                self.num_dropped_total += 1
+            return False
+        self._items.append((run_id, metric))
+        return True
+
+    def drain(self):
+        """
+        Remove the items present in the queue and return them in insertion order. Items added
+        concurrently are left in the queue.
+        """
+        # NB: Popping the items one by one, instead of swapping the deque for an empty one,
+        # ensures that items added by concurrent threads to the old deque are never lost
+        return [self._items.popleft() for _ in range(len(self._items))]
+
+    def flush(self, log_batch):
+        """
+        Drain the queue and log its metrics.
+
+        :param log_batch: A function accepting ``run_id`` and ``metrics`` arguments that logs a
+                          batch of metrics, e.g. ``MlflowClient.log_batch``.
+        """
+        with self._num_dropped_lock:
+            num_dropped, self._num_dropped = self._num_dropped, 0
+        if num_dropped > 0:
+            _logger.warning(
+                "Dropped %s metrics logged by TensorFlow autologging, since they were produced"
+                " faster than they could be logged to MLflow",
+                num_dropped,
+            )
+
+        metrics_by_run_id = collections.defaultdict(list)
+        for run_id, metric in self.drain():
+            metrics_by_run_id[run_id].append(metric)
+        for run_id, metrics in metrics_by_run_id.items():
+            for metrics_batch in chunk_list(metrics, MAX_METRICS_PER_BATCH):
+                log_batch(run_id=run_id, metrics=metrics_batch)
@@ -0,0 +1,239 @@
+"""
+Defines an AsyncLoggingQueue that buffers the metrics, params and tags logged by
+:py:class:`mlflow.tracking.MlflowClient` and the fluent logging APIs in asynchronous mode, and
+persists them from a background thread by coalescing them into ``log_batch`` requests.
+"""
+
+import atexit
+import logging
+import os
+import threading
+from itertools import zip_longest
+
+from mlflow.exceptions import MlflowException
+from mlflow.utils import chunk_list
+from mlflow.utils.validation import (
+    MAX_ENTITIES_PER_BATCH,
+    MAX_METRICS_PER_BATCH,
+    MAX_PARAMS_TAGS_PER_BATCH,
+)
+
+_logger = logging.getLogger(__name__)
+
+# Environment variable that, if set to "true", makes the logging APIs of `MlflowClient` and the
+# fluent APIs asynchronous unless `synchronous=True` is passed explicitly
+_ASYNC_LOGGING_ENV_VAR = "MLFLOW_ENABLE_ASYNC_LOGGING"
+
+
+def is_async_logging_enabled():
+    """
+    :return: ``True`` if asynchronous logging is enabled by default, ``False`` otherwise.
+    """
+    return os.environ.get(_ASYNC_LOGGING_ENV_VAR, "false").lower() == "true"
+
+
+class _PendingRunData:
+    """
+    Metrics, params and tags pending persistence to a single run.
+    """
+
+    def __init__(self):
+        self.metrics = []
+        self.params = []
+        self._param_keys_and_values = set()
+        # Tags are keyed by name so that only the last value set for a tag is logged
+        self.tags = {}
+
+    def add(self, metrics, params, tags):
+        self.metrics.extend(metrics)
+        for param in params:
+            # Logging the same param value multiple times is a no-op. Conflicting values are kept so
+            # that the resulting `log_batch` request fails with the same error as the synchronous
+            # logging APIs would
+            if (param.key, param.value) not in self._param_keys_and_values:
+                self._param_keys_and_values.add((param.key, param.value))
+                self.params.append(param)
+        for tag in tags:
+            self.tags.pop(tag.key, None)
+            self.tags[tag.key] = tag
+
+    def get_batches(self):
+        """
+        :return: A list of ``(metrics, params, tags)`` tuples that each satisfy the limits of a
+                 ``log_batch`` request.
+        """
+        batches = []
+        metrics = self.metrics
+        for params_batch, tags_batch in zip_longest(
+            chunk_list(self.params, MAX_PARAMS_TAGS_PER_BATCH),
+            chunk_list(list(self.tags.values()), MAX_PARAMS_TAGS_PER_BATCH),
+            fillvalue=[],
+        ):
+            metrics_batch_size = min(
+                MAX_ENTITIES_PER_BATCH - len(params_batch) - len(tags_batch),
+                MAX_METRICS_PER_BATCH,
+            )
+            metrics_batch_size = max(metrics_batch_size, 0)
+            batches.append((metrics[:metrics_batch_size], params_batch, tags_batch))
+            metrics = metrics[metrics_batch_size:]
+
+        for metrics_batch in chunk_list(metrics, MAX_METRICS_PER_BATCH):
+            batches.append((metrics_batch, [], []))
+        return batches
+
+
+class AsyncLoggingQueue:
+    """
+    Buffers run data per run and persists it from a background thread. Data enqueued while a
+    previous batch is being logged is coalesced into the next ``log_batch`` request(s), so that
+    callers never block on the tracking backend.
+
+    Failed operations are collected and raised by the next call to :py:meth:`flush`.
+    """
+
+    def __init__(self, logging_func):
+        """
+        :param logging_func: A function accepting ``run_id``, ``metrics``, ``params`` and
+                             ``tags`` arguments that synchronously logs a batch of run data, e.g.
+                             ``TrackingServiceClient.log_batch``.
+        """
+        self._logging_func = logging_func
+        self._pid = os.getpid()
+        self._cond = threading.Condition()
+        self._pending_data_by_run_id = {}
+        self._is_logging = False
+        self._failures = []
+        self._thread = None
+
+    def _reset(self):
+        self._pid = os.getpid()
+        self._cond = threading.Condition()
+        self._pending_data_by_run_id = {}
+        self._is_logging = False
+        self._failures = []
+        self._thread = None
+
+    def _reset_if_forked(self):
+        # Pending data and the background thread belong to the parent process, which remains
+        # responsible for logging them
+        if self._pid != os.getpid():
+            self._reset()
+
+    def enqueue(self, run_id, metrics=(), params=(), tags=()):
+        """
+        Enqueues the specified run data for asynchronous persistence.
+        """
+        self._reset_if_forked()
+        with self._cond:
+            pending_data = self._pending_data_by_run_id.get(run_id)
+            if pending_data is None:
+                pending_data = self._pending_data_by_run_id[run_id] = _PendingRunData()
+            pending_data.add(metrics, params, tags)
+
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._log_pending_data, name="MlflowAsyncLoggingThread", daemon=True
+                )
+                self._thread.start()
+            self._cond.notify_all()
+
+    def flush(self):
+        """
+        Blocks until all enqueued run data has been persisted.
+
+        :raises MlflowException: If any enqueued data failed to be logged since the last flush.
+        """
+        self._reset_if_forked()
+        with self._cond:
+            while self._pending_data_by_run_id or self._is_logging:
+                self._cond.wait()
+            failures, self._failures = self._failures, []
+
+        if len(failures) > 0:
+            raise MlflowException(
+                message=(
+                    "The following failures occurred while performing one or more asynchronous"
+                    " logging operations: {failures}".format(failures=failures)
+                )
+            )
+
+    def _log_pending_data(self):
+        while True:
+            with self._cond:
+                while not self._pending_data_by_run_id:
+                    self._cond.wait()
+                pending_data_by_run_id, self._pending_data_by_run_id = (
+                    self._pending_data_by_run_id,
+                    {},
+                )
+                self._is_logging = True
+
+            failures = []
+            for run_id, pending_data in pending_data_by_run_id.items():
+                for metrics, params, tags in pending_data.get_batches():
+                    try:
+                        self._logging_func(run_id=run_id, metrics=metrics, params=params, tags=tags)
+                    except Exception as e:
+                        _logger.debug("Failed to log run data asynchronously", exc_info=True)
+                        failures.append(e)
+
+            with self._cond:
+                self._failures.extend(failures)
+                self._is_logging = False
+                self._cond.notify_all()
+
+
+_async_logging_queues = {}
+_async_logging_queues_lock = threading.Lock()
+
+
+def get_async_logging_queue(tracking_uri, logging_func):
+    """
+    :return: The process-wide ``AsyncLoggingQueue`` of the specified tracking URI, which is created
+             with the specified ``logging_func`` if it does not exist yet.
+    """
+    with _async_logging_queues_lock:
+        queue = _async_logging_queues.get(tracking_uri)
+        if queue is None:
+            queue = _async_logging_queues[tracking_uri] = AsyncLoggingQueue(logging_func)
+        return queue
+
+
+def flush_async_logging(tracking_uri=None):
+    """
+    Blocks until all run data logged asynchronously to the specified tracking URI, or to any
+    tracking URI if ``tracking_uri`` is ``None``, has been persisted.
+
+    :raises MlflowException: If any asynchronously logged data failed to be persisted.
+    """
+    with _async_logging_queues_lock:
+        if tracking_uri is None:
+            queues = list(_async_logging_queues.values())
+        else:
+            queues = (
+                [_async_logging_queues[tracking_uri]]
+                if tracking_uri in _async_logging_queues
+                else []
+            )
+
+    failures = []
+    for queue in queues:
+        try:
+            queue.flush()
+        except MlflowException as e:
+            failures.append(e)
+
+    if len(failures) == 1:
+        raise failures[0]
+    elif len(failures) > 1:
+        raise MlflowException(message="\n".join(failure.message for failure in failures))
+
+
+def _flush_async_logging_at_exit():
+    try:
+        flush_async_logging()
+    except Exception as e:
+        _logger.warning("Failed to log run data asynchronously: %s", e)
+
+
+atexit.register(_flush_async_logging_at_exit)
@@ -9,6 +9,10 @@ import os
 
 from mlflow.store.tracking import SEARCH_MAX_RESULTS_DEFAULT
 from mlflow.tracking._tracking_service import utils
+from mlflow.tracking._tracking_service.async_logging_queue import (
+    get_async_logging_queue,
+    flush_async_logging,
+)
 from mlflow.utils.validation import (
     _validate_param_name,
     _validate_tag_name,
@@ -108,6 +112,41 @@ class TrackingServiceClient(object):
             tags=[RunTag(key, value) for (key, value) in tags.items()],
         )
 
+    def create_runs(self, experiment_id, runs):
+        """
+        Create multiple :py:class:`mlflow.entities.Run` objects, along with their initial
+        metrics, params and tags, in a single store operation.
+
+        :param experiment_id: The ID of the experiment to create the runs in.
+        :param runs: A list of :py:class:`mlflow.store.tracking.RunSpec`. If the ``user_id`` of a
+                     run is ``None``, it is extracted from the ``mlflow.user`` tag of the run. If
+                     its ``start_time`` is ``None``, the current timestamp is used, which is also
+                     the default ``end_time`` of runs created in a terminal ``status``.
+        :return: A list of the :py:class:`mlflow.entities.Run` that were created, in the order of
+                 ``runs``.
+        """
+        current_time = int(time.time() * 1000)
+        run_specs = []
+        for run in runs:
+            end_time = run.end_time
+            if end_time is None and run.status is not None and RunStatus.is_terminated(run.status):
+                end_time = current_time
+            tags = list(run.tags or [])
+            user_id = run.user_id
+            if user_id is None:
+                user_id = next((tag.value for tag in tags if tag.key == MLFLOW_USER), "unknown")
+            run_specs.append(
+                run._replace(
+                    user_id=user_id,
+                    start_time=run.start_time or current_time,
+                    end_time=end_time,
+                    tags=tags,
+                    params=list(run.params or []),
+                    metrics=list(run.metrics or []),
+                )
+            )
+        return self.store.create_runs(experiment_id=experiment_id, runs=run_specs)
+
     def list_run_infos(
         self,
         experiment_id,
@@ -209,7 +248,7 @@ class TrackingServiceClient(object):
         """
         self.store.rename_experiment(experiment_id, new_name)
 
-    def log_metric(self, run_id, key, value, timestamp=None, step=None):
+    def log_metric(self, run_id, key, value, timestamp=None, step=None, synchronous=True):
         """
         Log a metric against the run ID.
 
@@ -225,19 +264,30 @@ class TrackingServiceClient(object):
                       may support larger values.
         :param timestamp: Time when this metric was calculated. Defaults to the current system time.
         :param step: Training step (iteration) at which was the metric calculated. Defaults to 0.
+        :param synchronous: If ``False``, the metric is logged asynchronously. See
+                            :py:meth:`flush_async_logging`.
         """
         timestamp = timestamp if timestamp is not None else int(time.time() * 1000)
         step = step if step is not None else 0
         _validate_metric(key, value, timestamp, step)
         metric = Metric(key, value, timestamp, step)
-        self.store.log_metric(run_id, metric)
+        if synchronous:
+            self.store.log_metric(run_id, metric)
+        else:
+            self._get_async_logging_queue().enqueue(run_id, metrics=[metric])
 
-    def log_param(self, run_id, key, value):
+    def log_param(self, run_id, key, value, synchronous=True):
         """
         Log a parameter against the run ID. Value is converted to a string.
+
+        :param synchronous: If ``False``, the param is logged asynchronously. See
+                            :py:meth:`flush_async_logging`.
         """
         _validate_param_name(key)
         param = Param(key, str(value))
+        if not synchronous:
+            self._get_async_logging_queue().enqueue(run_id, params=[param])
+            return
         try:
             self.store.log_param(run_id, param)
         except MlflowException as e:
@@ -259,7 +309,7 @@ class TrackingServiceClient(object):
         tag = ExperimentTag(key, str(value))
         self.store.set_experiment_tag(experiment_id, tag)
 
-    def set_tag(self, run_id, key, value):
+    def set_tag(self, run_id, key, value, synchronous=True):
         """
         Set a tag on the run with the specified ID. Value is converted to a string.
 
@@ -271,10 +321,15 @@ class TrackingServiceClient(object):
         :param value: Tag value (string, but will be string-ified if not).
                       All backend stores will support values up to length 5000, but some
                       may support larger values.
+        :param synchronous: If ``False``, the tag is set asynchronously. See
+                            :py:meth:`flush_async_logging`.
         """
         _validate_tag_name(key)
         tag = RunTag(key, str(value))
-        self.store.set_tag(run_id, tag)
+        if synchronous:
+            self.store.set_tag(run_id, tag)
+        else:
+            self._get_async_logging_queue().enqueue(run_id, tags=[tag])
 
     def delete_tag(self, run_id, key):
         """
@@ -285,7 +340,7 @@ class TrackingServiceClient(object):
         """
         self.store.delete_tag(run_id, key)
 
-    def log_batch(self, run_id, metrics=(), params=(), tags=()):
+    def log_batch(self, run_id, metrics=(), params=(), tags=(), synchronous=True):
         """
         Log multiple metrics, params, and/or tags.
 
@@ -293,6 +348,9 @@ class TrackingServiceClient(object):
         :param metrics: If provided, List of Metric(key, value, timestamp) instances.
         :param params: If provided, List of Param(key, value) instances.
         :param tags: If provided, List of RunTag(key, value) instances.
+        :param synchronous: If ``False``, the metrics, params and tags are logged asynchronously,
+                            possibly coalesced with other asynchronously logged run data. See
+                            :py:meth:`flush_async_logging`.
 
         Raises an MlflowException if any errors occur.
         :return: None
@@ -307,7 +365,24 @@ class TrackingServiceClient(object):
             _validate_param_name(param.key)
         for tag in tags:
             _validate_tag_name(tag.key)
-        self.store.log_batch(run_id=run_id, metrics=metrics, params=params, tags=tags)
+        if synchronous:
+            self.store.log_batch(run_id=run_id, metrics=metrics, params=params, tags=tags)
+        else:
+            self._get_async_logging_queue().enqueue(
+                run_id, metrics=metrics, params=params, tags=tags
+            )
+
+    def _get_async_logging_queue(self):
+        return get_async_logging_queue(self.tracking_uri, self.log_batch)
+
+    def flush_async_logging(self):
+        """
+        Blocks until all metrics, params and tags logged asynchronously to the tracking server of
+        this client have been persisted.
+
+        Raises an MlflowException if any asynchronously logged data failed to be persisted.
+        """
+        flush_async_logging(self.tracking_uri)
 
     def _record_logged_model(self, run_id, mlflow_model):
         from mlflow.models import Model
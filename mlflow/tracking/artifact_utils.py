@@ -132,3 +132,24 @@ def _upload_artifacts_to_databricks(
         return posixpath.join(dest_root, dest_artifact_path, dirname)  # new source
     finally:
         shutil.rmtree(local_dir)
+
+
+def _download_model_from_uri(model_uri, output_path=None):
+    """
+    Download the model at the specified URI, as by ``_download_artifact_from_uri``. If no output
+    path is specified and the local model cache is enabled (see
+    :py:mod:`mlflow.models.model_cache`), the model is read from the cache instead, and downloaded
+    to the cache if it is not cached yet.
+
+    :param model_uri: The URI of the model.
+    :param output_path: The local filesystem path to which to download the model. If unspecified,
+                        a local output path will be created, or the model will be read from the
+                        local model cache if it is enabled.
+    """
+    if output_path is None:
+        from mlflow.models.model_cache import LocalModelCache
+
+        model_cache = LocalModelCache.from_env()
+        if model_cache is not None:
+            return model_cache.download(model_uri)
+    return _download_artifact_from_uri(artifact_uri=model_uri, output_path=output_path)
@@ -20,12 +20,13 @@ from mlflow.entities.model_registry.model_version_stages import ALL_STAGES
 from mlflow.exceptions import MlflowException
 from mlflow.protos.databricks_pb2 import FEATURE_DISABLED
 from mlflow.store.model_registry import SEARCH_REGISTERED_MODEL_MAX_RESULTS_DEFAULT
-from mlflow.store.tracking import SEARCH_MAX_RESULTS_DEFAULT
+from mlflow.store.tracking import SEARCH_MAX_RESULTS_DEFAULT, RunSpec
 from mlflow.tracking._model_registry.client import ModelRegistryClient
 from mlflow.tracking._model_registry import utils as registry_utils
 from mlflow.tracking._model_registry import DEFAULT_AWAIT_MAX_SLEEP_SECONDS
 from mlflow.tracking._tracking_service import utils
 from mlflow.tracking._tracking_service.client import TrackingServiceClient
+from mlflow.tracking._tracking_service.async_logging_queue import is_async_logging_enabled
 from mlflow.tracking.artifact_utils import _upload_artifacts_to_databricks
 from mlflow.tracking.registry import UnsupportedModelRegistryStoreURIException
 from mlflow.utils.databricks_utils import (
@@ -264,6 +265,54 @@ class MlflowClient(object):
         """
         return self._tracking_client.create_run(experiment_id, start_time, tags)
 
+    def create_runs(self, experiment_id: str, runs: Sequence[RunSpec]) -> List[Run]:
+        """
+        Create multiple :py:class:`mlflow.entities.Run` objects, along with their initial
+        metrics, params and tags, with a single tracking operation. This is considerably faster
+        than creating each run and logging its data separately, e.g. for the child runs of a
+        hyperparameter search.
+
+        :param experiment_id: The string ID of the experiment to create the runs in.
+        :param runs: A list of :py:class:`mlflow.store.tracking.RunSpec`. The ``user_id`` of a
+                     run defaults to the value of its ``mlflow.user`` tag, and its
+                     ``start_time`` to the current timestamp. A ``status`` and ``end_time`` can
+                     be specified to create runs that have already terminated. At most 1000 runs,
+                     with at most 10000 metrics, params and tags in total, can be created at once.
+        :return: A list of the :py:class:`mlflow.entities.Run` that were created, in the order of
+                 ``runs``.
+
+        .. code-block:: python
+            :caption: Example
+
+            from mlflow.entities import Metric, Param, RunStatus
+            from mlflow.store.tracking import RunSpec
+            from mlflow.tracking import MlflowClient
+
+            client = MlflowClient()
+            runs = client.create_runs(
+                "0",
+                [
+                    RunSpec(
+                        user_id=None,
+                        start_time=None,
+                        end_time=None,
+                        status=RunStatus.FINISHED,
+                        tags=[],
+                        params=[Param("alpha", str(alpha))],
+                        metrics=[Metric("rmse", rmse, timestamp=0, step=0)],
+                    )
+                    for alpha, rmse in [(0.1, 0.82), (0.5, 0.79)]
+                ],
+            )
+            print([run.data.params for run in runs])
+
+        .. code-block:: text
+            :caption: Output
+
+            [{'alpha': '0.1'}, {'alpha': '0.5'}]
+        """
+        return self._tracking_client.create_runs(experiment_id, runs)
+
     def list_run_infos(
         self,
         experiment_id: str,
@@ -631,6 +680,7 @@ class MlflowClient(object):
         value: float,
         timestamp: Optional[int] = None,
         step: Optional[int] = None,
+        synchronous: Optional[bool] = None,
     ) -> None:
         """
         Log a metric against the run ID.
@@ -648,6 +698,12 @@ class MlflowClient(object):
         :param timestamp: Time when this metric was calculated. Defaults to the current system time.
         :param step: Integer training step (iteration) at which was the metric calculated.
                      Defaults to 0.
+        :param synchronous: If ``False``, the metric is logged asynchronously from a background
+                            thread and this method returns immediately; use
+                            :py:meth:`flush_async_logging` to wait for asynchronously logged data
+                            to be persisted. Defaults to ``True`` unless the
+                            ``MLFLOW_ENABLE_ASYNC_LOGGING`` environment variable is set to
+                            ``"true"``.
 
         .. code-block:: python
             :caption: Example
@@ -687,9 +743,13 @@ class MlflowClient(object):
             metrics: {'m': 1.5}
             status: FINISHED
         """
-        self._tracking_client.log_metric(run_id, key, value, timestamp, step)
+        self._tracking_client.log_metric(
+            run_id, key, value, timestamp, step, synchronous=_is_synchronous(synchronous)
+        )
 
-    def log_param(self, run_id: str, key: str, value: Any) -> None:
+    def log_param(
+        self, run_id: str, key: str, value: Any, synchronous: Optional[bool] = None
+    ) -> None:
         """
         Log a parameter against the run ID.
 
@@ -701,6 +761,12 @@ class MlflowClient(object):
         :param value: Parameter value (string, but will be string-ified if not).
                       All backend stores will support values up to length 5000, but some
                       may support larger values.
+        :param synchronous: If ``False``, the param is logged asynchronously from a background
+                            thread and this method returns immediately; use
+                            :py:meth:`flush_async_logging` to wait for asynchronously logged data
+                            to be persisted. Defaults to ``True`` unless the
+                            ``MLFLOW_ENABLE_ASYNC_LOGGING`` environment variable is set to
+                            ``"true"``.
 
         .. code-block:: python
             :caption: Example
@@ -740,7 +806,9 @@ class MlflowClient(object):
             params: {'p': '1'}
             status: FINISHED
         """
-        self._tracking_client.log_param(run_id, key, value)
+        self._tracking_client.log_param(
+            run_id, key, value, synchronous=_is_synchronous(synchronous)
+        )
 
     def set_experiment_tag(self, experiment_id: str, key: str, value: Any) -> None:
         """
@@ -773,7 +841,9 @@ class MlflowClient(object):
         """
         self._tracking_client.set_experiment_tag(experiment_id, key, value)
 
-    def set_tag(self, run_id: str, key: str, value: Any) -> None:
+    def set_tag(
+        self, run_id: str, key: str, value: Any, synchronous: Optional[bool] = None
+    ) -> None:
         """
         Set a tag on the run with the specified ID. Value is converted to a string.
 
@@ -785,6 +855,12 @@ class MlflowClient(object):
         :param value: Tag value (string, but will be string-ified if not).
                       All backend stores will support values up to length 5000, but some
                       may support larger values.
+        :param synchronous: If ``False``, the tag is set asynchronously from a background
+                            thread and this method returns immediately; use
+                            :py:meth:`flush_async_logging` to wait for asynchronously logged data
+                            to be persisted. Defaults to ``True`` unless the
+                            ``MLFLOW_ENABLE_ASYNC_LOGGING`` environment variable is set to
+                            ``"true"``.
 
         .. code-block:: python
             :caption: Example
@@ -816,7 +892,7 @@ class MlflowClient(object):
             run_id: 4f226eb5758145e9b28f78514b59a03b
             Tags: {'nlp.framework': 'Spark NLP'}
         """
-        self._tracking_client.set_tag(run_id, key, value)
+        self._tracking_client.set_tag(run_id, key, value, synchronous=_is_synchronous(synchronous))
 
     def delete_tag(self, run_id: str, key: str) -> None:
         """
@@ -864,6 +940,7 @@ class MlflowClient(object):
         metrics: Sequence[Metric] = (),
         params: Sequence[Param] = (),
         tags: Sequence[RunTag] = (),
+        synchronous: Optional[bool] = None,
     ) -> None:
         """
         Log multiple metrics, params, and/or tags.
@@ -872,6 +949,13 @@ class MlflowClient(object):
         :param metrics: If provided, List of Metric(key, value, timestamp) instances.
         :param params: If provided, List of Param(key, value) instances.
         :param tags: If provided, List of RunTag(key, value) instances.
+        :param synchronous: If ``False``, the metrics, params and tags are logged asynchronously
+                            from a background thread, possibly coalesced with other asynchronously
+                            logged data, and this method returns immediately; use
+                            :py:meth:`flush_async_logging` to wait for asynchronously logged data
+                            to be persisted. Defaults to ``True`` unless the
+                            ``MLFLOW_ENABLE_ASYNC_LOGGING`` environment variable is set to
+                            ``"true"``.
 
         Raises an MlflowException if any errors occur.
         :return: None
@@ -915,7 +999,21 @@ class MlflowClient(object):
             tags: {'t': 't'}
             status: FINISHED
         """
-        self._tracking_client.log_batch(run_id, metrics, params, tags)
+        self._tracking_client.log_batch(
+            run_id, metrics, params, tags, synchronous=_is_synchronous(synchronous)
+        )
+
+    def flush_async_logging(self) -> None:
+        """
+        Blocks until all metrics, params and tags logged asynchronously to the tracking server of
+        this client (see the ``synchronous`` argument of :py:meth:`log_batch`) have been persisted.
+        Asynchronously logged data is also flushed when the active run is ended via
+        :py:func:`mlflow.end_run` and upon interpreter exit.
+
+        Raises an MlflowException if any asynchronously logged data failed to be persisted since
+        the last flush.
+        """
+        self._tracking_client.flush_async_logging()
 
     def log_artifact(self, run_id, local_path, artifact_path=None) -> None:
         """
@@ -2790,3 +2888,7 @@ class MlflowClient(object):
             Tags: {}
         """
         self._get_registry_client().delete_model_version_tag(name, version, key)
+
+
+def _is_synchronous(synchronous):
+    return not is_async_logging_enabled() if synchronous is None else synchronous
@@ -20,6 +20,9 @@ from mlflow.protos.databricks_pb2 import (
     RESOURCE_DOES_NOT_EXIST,
 )
 from mlflow.tracking.client import MlflowClient
+from mlflow.tracking._tracking_service.async_logging_queue import (
+    flush_async_logging as _flush_async_logging,
+)
 from mlflow.tracking import artifact_utils, _get_store
 from mlflow.tracking.context import registry as context_registry
 from mlflow.store.tracking import SEARCH_MAX_RESULTS_DEFAULT
@@ -328,7 +331,11 @@ def end_run(status: str = RunStatus.to_string(RunStatus.FINISHED)) -> None:
         # Clear out the global existing run environment variable as well.
         env.unset_variable(_RUN_ID_ENV_VAR)
         run = _active_run_stack.pop()
-        MlflowClient().set_terminated(run.info.run_id, status)
+        client = MlflowClient()
+        try:
+            client.flush_async_logging()
+        finally:
+            client.set_terminated(run.info.run_id, status)
 
 
 atexit.register(end_run)
@@ -393,7 +400,7 @@ def get_run(run_id: str) -> Run:
     return MlflowClient().get_run(run_id)
 
 
-def log_param(key: str, value: Any) -> None:
+def log_param(key: str, value: Any, synchronous: Optional[bool] = None) -> None:
     """
     Log a parameter under the current run. If no run is active, this method will create
     a new active run.
@@ -405,6 +412,11 @@ def log_param(key: str, value: Any) -> None:
     :param value: Parameter value (string, but will be string-ified if not).
                   All backend stores will support values up to length 5000, but some
                   may support larger values.
+    :param synchronous: If ``False``, the param is logged asynchronously from a background thread
+                        and this function returns immediately. Asynchronously logged data is
+                        persisted by :py:func:`flush_async_logging`, when the run is ended and upon
+                        interpreter exit. Defaults to ``True`` unless the
+                        ``MLFLOW_ENABLE_ASYNC_LOGGING`` environment variable is set to ``"true"``.
 
     .. code-block:: python
         :caption: Example
@@ -415,10 +427,10 @@ def log_param(key: str, value: Any) -> None:
             mlflow.log_param("learning_rate", 0.01)
     """
     run_id = _get_or_start_run().info.run_id
-    MlflowClient().log_param(run_id, key, value)
+    MlflowClient().log_param(run_id, key, value, synchronous=synchronous)
 
 
-def set_tag(key: str, value: Any) -> None:
+def set_tag(key: str, value: Any, synchronous: Optional[bool] = None) -> None:
     """
     Set a tag under the current run. If no run is active, this method will create a
     new active run.
@@ -430,6 +442,11 @@ def set_tag(key: str, value: Any) -> None:
     :param value: Tag value (string, but will be string-ified if not).
                   All backend stores will support values up to length 5000, but some
                   may support larger values.
+    :param synchronous: If ``False``, the tag is set asynchronously from a background thread and
+                        this function returns immediately. Asynchronously logged data is persisted
+                        by :py:func:`flush_async_logging`, when the run is ended and upon
+                        interpreter exit. Defaults to ``True`` unless the
+                        ``MLFLOW_ENABLE_ASYNC_LOGGING`` environment variable is set to ``"true"``.
 
     .. code-block:: python
         :caption: Example
@@ -440,7 +457,7 @@ def set_tag(key: str, value: Any) -> None:
            mlflow.set_tag("release.version", "2.2.0")
     """
     run_id = _get_or_start_run().info.run_id
-    MlflowClient().set_tag(run_id, key, value)
+    MlflowClient().set_tag(run_id, key, value, synchronous=synchronous)
 
 
 def delete_tag(key: str) -> None:
@@ -468,7 +485,9 @@ def delete_tag(key: str) -> None:
     MlflowClient().delete_tag(run_id, key)
 
 
-def log_metric(key: str, value: float, step: Optional[int] = None) -> None:
+def log_metric(
+    key: str, value: float, step: Optional[int] = None, synchronous: Optional[bool] = None
+) -> None:
     """
     Log a metric under the current run. If no run is active, this method will create
     a new active run.
@@ -483,6 +502,11 @@ def log_metric(key: str, value: float, step: Optional[int] = None) -> None:
                   All backend stores will support values up to length 5000, but some
                   may support larger values.
     :param step: Metric step (int). Defaults to zero if unspecified.
+    :param synchronous: If ``False``, the metric is logged asynchronously from a background thread
+                        and this function returns immediately. Asynchronously logged data is
+                        persisted by :py:func:`flush_async_logging`, when the run is ended and upon
+                        interpreter exit. Defaults to ``True`` unless the
+                        ``MLFLOW_ENABLE_ASYNC_LOGGING`` environment variable is set to ``"true"``.
 
     .. code-block:: python
         :caption: Example
@@ -493,10 +517,14 @@ def log_metric(key: str, value: float, step: Optional[int] = None) -> None:
             mlflow.log_metric("mse", 2500.00)
     """
     run_id = _get_or_start_run().info.run_id
-    MlflowClient().log_metric(run_id, key, value, int(time.time() * 1000), step or 0)
+    MlflowClient().log_metric(
+        run_id, key, value, int(time.time() * 1000), step or 0, synchronous=synchronous
+    )
 
 
-def log_metrics(metrics: Dict[str, float], step: Optional[int] = None) -> None:
+def log_metrics(
+    metrics: Dict[str, float], step: Optional[int] = None, synchronous: Optional[bool] = None
+) -> None:
     """
     Log multiple metrics for the current run. If no run is active, this method will create a new
     active run.
@@ -507,6 +535,11 @@ def log_metrics(metrics: Dict[str, float], step: Optional[int] = None) -> None:
                     max / min float values.
     :param step: A single integer step at which to log the specified
                  Metrics. If unspecified, each metric is logged at step zero.
+    :param synchronous: If ``False``, the metrics are logged asynchronously from a background thread
+                        and this function returns immediately. Asynchronously logged data is
+                        persisted by :py:func:`flush_async_logging`, when the run is ended and upon
+                        interpreter exit. Defaults to ``True`` unless the
+                        ``MLFLOW_ENABLE_ASYNC_LOGGING`` environment variable is set to ``"true"``.
 
     :returns: None
 
@@ -524,16 +557,23 @@ def log_metrics(metrics: Dict[str, float], step: Optional[int] = None) -> None:
     run_id = _get_or_start_run().info.run_id
     timestamp = int(time.time() * 1000)
     metrics_arr = [Metric(key, value, timestamp, step or 0) for key, value in metrics.items()]
-    MlflowClient().log_batch(run_id=run_id, metrics=metrics_arr, params=[], tags=[])
+    MlflowClient().log_batch(
+        run_id=run_id, metrics=metrics_arr, params=[], tags=[], synchronous=synchronous
+    )
 
 
-def log_params(params: Dict[str, Any]) -> None:
+def log_params(params: Dict[str, Any], synchronous: Optional[bool] = None) -> None:
     """
     Log a batch of params for the current run. If no run is active, this method will create a
     new active run.
 
     :param params: Dictionary of param_name: String -> value: (String, but will be string-ified if
                    not)
+    :param synchronous: If ``False``, the params are logged asynchronously from a background thread
+                        and this function returns immediately. Asynchronously logged data is
+                        persisted by :py:func:`flush_async_logging`, when the run is ended and upon
+                        interpreter exit. Defaults to ``True`` unless the
+                        ``MLFLOW_ENABLE_ASYNC_LOGGING`` environment variable is set to ``"true"``.
     :returns: None
 
     .. code-block:: python
@@ -549,16 +589,23 @@ def log_params(params: Dict[str, Any]) -> None:
     """
     run_id = _get_or_start_run().info.run_id
     params_arr = [Param(key, str(value)) for key, value in params.items()]
-    MlflowClient().log_batch(run_id=run_id, metrics=[], params=params_arr, tags=[])
+    MlflowClient().log_batch(
+        run_id=run_id, metrics=[], params=params_arr, tags=[], synchronous=synchronous
+    )
 
 
-def set_tags(tags: Dict[str, Any]) -> None:
+def set_tags(tags: Dict[str, Any], synchronous: Optional[bool] = None) -> None:
     """
     Log a batch of tags for the current run. If no run is active, this method will create a
     new active run.
 
     :param tags: Dictionary of tag_name: String -> value: (String, but will be string-ified if
                  not)
+    :param synchronous: If ``False``, the tags are set asynchronously from a background thread and
+                        this function returns immediately. Asynchronously logged data is persisted
+                        by :py:func:`flush_async_logging`, when the run is ended and upon
+                        interpreter exit. Defaults to ``True`` unless the
+                        ``MLFLOW_ENABLE_ASYNC_LOGGING`` environment variable is set to ``"true"``.
     :returns: None
 
     .. code-block:: python
@@ -576,7 +623,30 @@ def set_tags(tags: Dict[str, Any]) -> None:
     """
     run_id = _get_or_start_run().info.run_id
     tags_arr = [RunTag(key, str(value)) for key, value in tags.items()]
-    MlflowClient().log_batch(run_id=run_id, metrics=[], params=[], tags=tags_arr)
+    MlflowClient().log_batch(
+        run_id=run_id, metrics=[], params=[], tags=tags_arr, synchronous=synchronous
+    )
+
+
+def flush_async_logging() -> None:
+    """
+    Blocks until all metrics, params and tags logged asynchronously (e.g. via
+    ``mlflow.log_metric(..., synchronous=False)``) have been persisted.
+
+    Raises an MlflowException if any asynchronously logged data failed to be persisted since the
+    last flush.
+
+    .. code-block:: python
+        :caption: Example
+
+        import mlflow
+
+        with mlflow.start_run():
+            for step in range(100):
+                mlflow.log_metric("loss", 1.0 / (step + 1), step=step, synchronous=False)
+            mlflow.flush_async_logging()
+    """
+    _flush_async_logging()
 
 
 def log_artifact(local_path: str, artifact_path: Optional[str] = None) -> None:
@@ -1131,72 +1201,7 @@ def search_runs(
     if output_format == "list":
         return runs  # List[mlflow.entities.run.Run]
     elif output_format == "pandas":
-        import numpy as np
-        import pandas as pd
-
-        info = {
-            "run_id": [],
-            "experiment_id": [],
-            "status": [],
-            "artifact_uri": [],
-            "start_time": [],
-            "end_time": [],
-        }
-        params, metrics, tags = ({}, {}, {})
-        PARAM_NULL, METRIC_NULL, TAG_NULL = (None, np.nan, None)
-        for i, run in enumerate(runs):
-            info["run_id"].append(run.info.run_id)
-            info["experiment_id"].append(run.info.experiment_id)
-            info["status"].append(run.info.status)
-            info["artifact_uri"].append(run.info.artifact_uri)
-            info["start_time"].append(pd.to_datetime(run.info.start_time, unit="ms", utc=True))
-            info["end_time"].append(pd.to_datetime(run.info.end_time, unit="ms", utc=True))
-
-            # Params
-            param_keys = set(params.keys())
-            for key in param_keys:
-                if key in run.data.params:
-                    params[key].append(run.data.params[key])
-                else:
-                    params[key].append(PARAM_NULL)
-            new_params = set(run.data.params.keys()) - param_keys
-            for p in new_params:
-                params[p] = [PARAM_NULL] * i  # Fill in null values for all previous runs
-                params[p].append(run.data.params[p])
-
-            # Metrics
-            metric_keys = set(metrics.keys())
-            for key in metric_keys:
-                if key in run.data.metrics:
-                    metrics[key].append(run.data.metrics[key])
-                else:
-                    metrics[key].append(METRIC_NULL)
-            new_metrics = set(run.data.metrics.keys()) - metric_keys
-            for m in new_metrics:
-                metrics[m] = [METRIC_NULL] * i
-                metrics[m].append(run.data.metrics[m])
-
-            # Tags
-            tag_keys = set(tags.keys())
-            for key in tag_keys:
-                if key in run.data.tags:
-                    tags[key].append(run.data.tags[key])
-                else:
-                    tags[key].append(TAG_NULL)
-            new_tags = set(run.data.tags.keys()) - tag_keys
-            for t in new_tags:
-                tags[t] = [TAG_NULL] * i
-                tags[t].append(run.data.tags[t])
-
-        data = {}
-        data.update(info)
-        for key in metrics:
-            data["metrics." + key] = metrics[key]
-        for key in params:
-            data["params." + key] = params[key]
-        for key in tags:
-            data["tags." + key] = tags[key]
-        return pd.DataFrame(data)
+        return _get_runs_dataframe(runs)
     else:
         raise ValueError(
             "Unsupported output format: %s. Supported string values are 'pandas' or 'list'"
@@ -1204,6 +1209,57 @@ def search_runs(
         )
 
 
+def _get_runs_dataframe(runs):
+    """
+    Build the ``pandas.DataFrame`` returned by :py:func:`search_runs` for the specified runs.
+
+    Each metric, param and tag column is materialized as a NumPy array filled with the column's
+    null value and populated with a single vectorized assignment, so that the cost is linear in the
+    number of logged values rather than in the number of runs times the number of distinct keys.
+    """
+    import numpy as np
+    import pandas as pd
+
+    num_runs = len(runs)
+    data = {
+        "run_id": [run.info.run_id for run in runs],
+        "experiment_id": [run.info.experiment_id for run in runs],
+        "status": [run.info.status for run in runs],
+        "artifact_uri": [run.info.artifact_uri for run in runs],
+    }
+    for column in ["start_time", "end_time"]:
+        timestamps = [getattr(run.info, column) for run in runs]
+        # NB: Time columns of empty results keep the dtype of the other empty columns
+        data[column] = pd.to_datetime(timestamps, unit="ms", utc=True) if runs else timestamps
+
+    # Map each key to the indices of the runs that logged it and the corresponding values
+    metrics, params, tags = ({}, {}, {})
+    for i, run in enumerate(runs):
+        for columns, values in [
+            (metrics, run.data.metrics),
+            (params, run.data.params),
+            (tags, run.data.tags),
+        ]:
+            for key, value in values.items():
+                indices_and_values = columns.get(key)
+                if indices_and_values is None:
+                    indices_and_values = columns[key] = ([], [])
+                indices_and_values[0].append(i)
+                indices_and_values[1].append(value)
+
+    for prefix, columns, null_value, dtype in [
+        ("metrics.", metrics, np.nan, np.float64),
+        ("params.", params, None, object),
+        ("tags.", tags, None, object),
+    ]:
+        for key, (indices, values) in columns.items():
+            column = np.full(num_runs, null_value, dtype=dtype)
+            column[indices] = values
+            data[prefix + key] = column
+
+    return pd.DataFrame(data)
+
+
 def list_run_infos(
     experiment_id: str,
     run_view_type: int = ViewType.ACTIVE_ONLY,
@@ -76,13 +76,11 @@ def parse_args():
     return parser.parse_args()
 
 
-def main():
-    args = parse_args()
-    model_path = args.model_path
-    flavor = args.flavor
-    # Mirror `sys.path` of the parent process
-    sys.path = json.loads(args.sys_path)
-
+def capture_imported_modules(model_path, flavor, output_file):
+    """
+    Loads the specified model, captures the modules imported during the loading procedure and
+    writes their names to `output_file`, one per line.
+    """
     if flavor == mlflow.spark.FLAVOR_NAME and is_in_databricks_runtime():
         # Clear 'PYSPARK_GATEWAY_PORT' and 'PYSPARK_GATEWAY_SECRET' to enforce launching a new JVM
         # gateway before calling `mlflow.spark._load_pyfunc` that creates a new spark session
@@ -114,8 +112,9 @@ def main():
         with cap_cm:
             importlib.import_module(f"mlflow.{flavor}")._load_pyfunc(model_path)
 
-    # Store the imported modules in `output_file`
-    write_to(args.output_file, "\n".join(cap_cm.imported_modules))
+    # Store the imported modules in `output_file`, sorted so that the output of different captures
+    # can be compared
+    write_to(output_file, "\n".join(sorted(cap_cm.imported_modules)))
 
     # Clean up a spark session created by `mlflow.spark._load_pyfunc`
     if flavor == mlflow.spark.FLAVOR_NAME:
@@ -130,5 +129,12 @@ def main():
                 pass
 
 
+def main():
+    args = parse_args()
+    # Mirror `sys.path` of the parent process
+    sys.path = json.loads(args.sys_path)
+    capture_imported_modules(args.model_path, args.flavor, args.output_file)
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,63 @@
+"""
+A fork server for `_capture_modules.py`. This script should be executed in a fresh python
+interpreter process using `subprocess`.
+
+The server imports `_capture_modules.py` once, then reads capture requests from its standard input,
+one JSON object per line. It handles each request in a child process forked from itself, so that
+the python interpreter and MLflow are already initialized when the model is loaded, and modules
+imported while loading a model never leak into the captures of the next models. For each request,
+it writes the exit code of the child process to its standard output as a JSON object.
+"""
+import json
+import os
+import sys
+import traceback
+
+from mlflow.utils._capture_modules import capture_imported_modules
+
+
+def _handle_request(request):
+    """
+    Runs in a child process forked from the server, and never returns.
+    """
+    exit_code = 1
+    try:
+        # Report the output of the capture in the error file instead of the standard output of
+        # the server, which is used to respond to requests
+        error_fd = os.open(request["error_file"], os.O_WRONLY | os.O_CREAT | os.O_TRUNC)
+        os.dup2(error_fd, 1)
+        os.dup2(error_fd, 2)
+        # Mirror the environment, the working directory and `sys.path` of the parent process
+        os.environ.clear()
+        os.environ.update(request["env"])
+        os.chdir(request["cwd"])
+        sys.path = request["sys_path"]
+        capture_imported_modules(request["model_path"], request["flavor"], request["output_file"])
+        exit_code = 0
+    except BaseException:
+        traceback.print_exc()
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(exit_code)
+
+
+def _get_exit_code(wait_status):
+    if os.WIFSIGNALED(wait_status):
+        return -os.WTERMSIG(wait_status)
+    return os.WEXITSTATUS(wait_status)
+
+
+def main():
+    for line in sys.stdin:
+        request = json.loads(line)
+        pid = os.fork()
+        if pid == 0:
+            _handle_request(request)
+        _, wait_status = os.waitpid(pid, 0)
+        sys.stdout.write(json.dumps({"exit_code": _get_exit_code(wait_status)}) + "\n")
+        sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main()
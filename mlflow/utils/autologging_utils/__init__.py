@@ -2,12 +2,15 @@
 
 import inspect
 import logging
+import os
+import threading
 import time
 import contextlib
 
 import mlflow
 from mlflow.entities import Metric
 from mlflow.tracking.client import MlflowClient
+from mlflow.utils import chunk_list
 from mlflow.utils.validation import MAX_METRICS_PER_BATCH
 
 # Define the module-level logger for autologging utilities before importing utilities defined in
@@ -182,6 +185,18 @@ def resolve_input_example_and_signature(
     return input_example if log_input_example else None, model_signature
 
 
+# Environment variables that configure the `BatchMetricsLogger` objects of autologging
+# integrations. See the `BatchMetricsLogger` constructor for the meaning of each setting
+_METRICS_MAX_LATENCY_SECONDS_ENV_VAR = "MLFLOW_AUTOLOGGING_METRICS_MAX_LATENCY_SECONDS"
+_METRICS_MAX_BUFFERED_ENV_VAR = "MLFLOW_AUTOLOGGING_METRICS_MAX_BUFFERED"
+_METRICS_TARGET_OVERHEAD_PERCENT_ENV_VAR = "MLFLOW_AUTOLOGGING_METRICS_TARGET_OVERHEAD_PERCENT"
+
+
+def _get_env_var_value(env_var, value_type, default):
+    value = os.environ.get(env_var)
+    return value_type(value) if value else default
+
+
 class BatchMetricsLogger:
     """
     The BatchMetricsLogger will log metrics in batch against an mlflow run.
@@ -191,47 +206,169 @@ class BatchMetricsLogger:
     from `mlflow.active_run()` each time `record_metrics()` or `flush()` is called; in this
     case, callers must ensure that an active run is present before invoking
     `record_metrics()` or `flush()`.
+
+    Batches are logged on a background thread, so that the training thread does not block on the
+    tracking server. Metrics recorded while a batch is being logged are buffered and logged in the
+    next batch. Exceptions raised while logging a batch are re-raised by the next call to
+    `record_metrics()` or `flush()`.
     """
 
-    def __init__(self, run_id=None, tracking_uri=None):
+    def __init__(
+        self,
+        run_id=None,
+        tracking_uri=None,
+        max_latency_seconds=None,
+        max_buffered_metrics=None,
+        target_overhead_percent=None,
+    ):
+        """
+        :param run_id: ID of the run that the metrics will be logged to.
+        :param tracking_uri: The tracking URI of the run.
+        :param max_latency_seconds: If specified, recorded metrics are logged at most this many
+                                    seconds after they are recorded, as long as the tracking
+                                    server keeps up. Defaults to the value of the
+                                    ``MLFLOW_AUTOLOGGING_METRICS_MAX_LATENCY_SECONDS`` environment
+                                    variable, or no limit.
+        :param max_buffered_metrics: If specified, a batch is logged as soon as this many metrics
+                                     are buffered, and `record_metrics()` waits for the previous
+                                     batch to be logged if necessary. Defaults to the value of the
+                                     ``MLFLOW_AUTOLOGGING_METRICS_MAX_BUFFERED`` environment
+                                     variable, or no limit.
+        :param target_overhead_percent: Batches are logged so that the time spent logging them
+                                        stays below this percentage of the training time, unless
+                                        one of the limits above requires logging them earlier.
+                                        If 0, batches are only logged when one of the limits
+                                        above requires it or when `flush()` is called.
+                                        Defaults to the value of the
+                                        ``MLFLOW_AUTOLOGGING_METRICS_TARGET_OVERHEAD_PERCENT``
+                                        environment variable, or 10.
+        """
         self.run_id = run_id
         self.client = MlflowClient(tracking_uri)
+        self.max_latency_seconds = (
+            max_latency_seconds
+            if max_latency_seconds is not None
+            else _get_env_var_value(_METRICS_MAX_LATENCY_SECONDS_ENV_VAR, float, None)
+        )
+        self.max_buffered_metrics = (
+            max_buffered_metrics
+            if max_buffered_metrics is not None
+            else _get_env_var_value(_METRICS_MAX_BUFFERED_ENV_VAR, int, None)
+        )
+        self.target_overhead_percent = (
+            target_overhead_percent
+            if target_overhead_percent is not None
+            else _get_env_var_value(_METRICS_TARGET_OVERHEAD_PERCENT_ENV_VAR, float, 10)
+        )
 
         # data is an array of Metric objects
         self.data = []
         self.total_training_time = 0
         self.total_log_batch_time = 0
+        # The time spent by the calling thread in `record_metrics()` and `flush()`, which is the
+        # overhead of the logger on training
+        self.total_overhead_time = 0
         self.previous_training_timestamp = None
+        self._oldest_data_timestamp = None
+        # The thread logging the previous batch, the exception it raised and the metrics of the
+        # batch that were not logged because of it
+        self._log_batch_thread = None
+        self._log_batch_exception = None
+        self._unlogged_data = []
+
+    @property
+    def overhead_percent(self):
+        """
+        The time spent by the calling thread in `record_metrics()` and `flush()`, as a percentage
+        of the training time measured between calls to `record_metrics()`.
+        """
+        if self.total_training_time == 0:
+            return 0
+        return 100 * self.total_overhead_time / self.total_training_time
 
     def flush(self):
         """
         The metrics accumulated by BatchMetricsLogger will be batch logged to an MLFlow run.
+        Blocks until they are logged.
         """
-        self._timed_log_batch()
-        self.data = []
+        start = time.time()
+        try:
+            self._log_data_in_background()
+            self._wait_for_log_batch_thread()
+        finally:
+            self.total_overhead_time += time.time() - start
+        _logger.debug(
+            "Logging metrics took %.2f%% of the training time on the training thread",
+            self.overhead_percent,
+        )
 
-    def _timed_log_batch(self):
+    def _wait_for_log_batch_thread(self):
+        if self._log_batch_thread is not None:
+            self._log_batch_thread.join()
+            self._log_batch_thread = None
+        if self._log_batch_exception is not None:
+            exception, self._log_batch_exception = self._log_batch_exception, None
+            # Metrics that failed to be logged are put back in the buffer, to be logged with the
+            # next batch
+            self.data = self._unlogged_data + self.data
+            self._oldest_data_timestamp = self.data[0].timestamp / 1000
+            self._unlogged_data = []
+            raise exception
+
+    def _log_data_in_background(self):
+        """
+        Swaps the buffered metrics for an empty buffer and logs them on a background thread, after
+        the previous batch has been logged.
+        """
+        self._wait_for_log_batch_thread()
+        if not self.data:
+            return
         if self.run_id is None:
             # Retrieving run_id from active mlflow run.
             current_run_id = mlflow.active_run().info.run_id
         else:
             current_run_id = self.run_id
+        data, self.data = self.data, []
+        self._oldest_data_timestamp = None
+        self._log_batch_thread = threading.Thread(
+            target=self._timed_log_batch,
+            args=(current_run_id, data),
+            name="MlflowBatchMetricsLogger",
+            daemon=True,
+        )
+        self._log_batch_thread.start()
 
+    def _timed_log_batch(self, run_id, data):
         start = time.time()
-        metrics_slices = [
-            self.data[i : i + MAX_METRICS_PER_BATCH]
-            for i in range(0, len(self.data), MAX_METRICS_PER_BATCH)
-        ]
-        for metrics_slice in metrics_slices:
-            self.client.log_batch(run_id=current_run_id, metrics=metrics_slice)
-        end = time.time()
-        self.total_log_batch_time += end - start
+        num_logged_metrics = 0
+        try:
+            for metrics_slice in chunk_list(data, MAX_METRICS_PER_BATCH):
+                self.client.log_batch(run_id=run_id, metrics=metrics_slice)
+                num_logged_metrics += len(metrics_slice)
+        except Exception as e:
+            self._unlogged_data = data[num_logged_metrics:]
+            self._log_batch_exception = e
+        finally:
+            self.total_log_batch_time += time.time() - start
+
+    def _is_logging_batch(self):
+        return self._log_batch_thread is not None and self._log_batch_thread.is_alive()
 
     def _should_flush(self):
-        target_training_to_logging_time_ratio = 10
+        if self.max_buffered_metrics is not None and len(self.data) >= self.max_buffered_metrics:
+            return True
+        if self._is_logging_batch():
+            return False
         if (
-            self.total_training_time
-            >= self.total_log_batch_time * target_training_to_logging_time_ratio
+            self.max_latency_seconds is not None
+            and self._oldest_data_timestamp is not None
+            and time.time() - self._oldest_data_timestamp >= self.max_latency_seconds
+        ):
+            return True
+        if (
+            self.target_overhead_percent > 0
+            and self.total_training_time * self.target_overhead_percent
+            >= self.total_log_batch_time * 100
         ):
             return True
 
@@ -258,14 +395,22 @@ class BatchMetricsLogger:
         if step is None:
             step = 0
 
-        for key, value in metrics.items():
-
-            self.data.append(Metric(key, value, int(current_timestamp * 1000), step))
+        try:
+            for key, value in metrics.items():
 
-        if self._should_flush():
-            self.flush()
+                self.data.append(Metric(key, value, int(current_timestamp * 1000), step))
+            if self._oldest_data_timestamp is None:
+                self._oldest_data_timestamp = current_timestamp
 
-        self.previous_training_timestamp = current_timestamp
+            if self._should_flush():
+                self._log_data_in_background()
+            elif not self._is_logging_batch():
+                # Report the exception raised while logging the previous batch, if any
+                self._wait_for_log_batch_thread()
+        finally:
+            # Exclude the overhead of the logger from the training time
+            self.previous_training_timestamp = time.time()
+            self.total_overhead_time += self.previous_training_timestamp - current_timestamp
 
 
 @contextlib.contextmanager
@@ -273,9 +418,11 @@ def batch_metrics_logger(run_id):
     """
     Context manager that yields a BatchMetricsLogger object, which metrics can be logged against.
     The BatchMetricsLogger keeps metrics in a list until it decides they should be logged, at
-    which point the accumulated metrics will be batch logged. The BatchMetricsLogger ensures
-    that logging imposes no more than a 10% overhead on the training, where the training is
-    measured by adding up the time elapsed between consecutive calls to record_metrics.
+    which point the accumulated metrics will be batch logged on a background thread. The
+    BatchMetricsLogger ensures that logging imposes no more than a 10% overhead on the training
+    by default, where the training is measured by adding up the time elapsed between consecutive
+    calls to record_metrics. This can be configured with the environment variables described in
+    the BatchMetricsLogger constructor.
 
     If logging a batch fails, a warning will be emitted and subsequent metrics will continue to
     be collected.
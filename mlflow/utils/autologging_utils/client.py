@@ -11,22 +11,25 @@ Remove this developer API.
 import os
 import time
 import logging
-from collections import namedtuple
+from collections import defaultdict, namedtuple
 from concurrent.futures import ThreadPoolExecutor
 from itertools import zip_longest
 from typing import Any, Dict, Optional, Union
 
-from mlflow.entities import Param, RunTag, Metric
+from mlflow.entities import Param, RunStatus, RunTag, Metric
 from mlflow.exceptions import MlflowException
+from mlflow.store.tracking import RunSpec
 from mlflow.tracking.client import MlflowClient
 from mlflow.utils import chunk_list, _truncate_dict
 from mlflow.utils.validation import (
     MAX_ENTITIES_PER_BATCH,
+    MAX_ENTITIES_PER_RUNS_BATCH,
     MAX_ENTITY_KEY_LENGTH,
     MAX_TAG_VAL_LENGTH,
     MAX_PARAM_VAL_LENGTH,
     MAX_PARAMS_TAGS_PER_BATCH,
     MAX_METRICS_PER_BATCH,
+    MAX_RUNS_PER_BATCH,
 )
 
 
@@ -226,7 +229,15 @@ class MlflowAutologgingQueueingClient:
                  on via `RunOperations.await_completion()`.
         """
         logging_futures = []
+        pending_creations_by_experiment_id = defaultdict(list)
         for pending_operations in self._pending_ops_by_run_id.values():
+            run_spec = self._pop_initial_run_spec(pending_operations)
+            if run_spec is not None:
+                experiment_id = pending_operations.create_run.experiment_id
+                pending_creations_by_experiment_id[experiment_id].append(
+                    (pending_operations, run_spec)
+                )
+                continue
             future = _AUTOLOGGING_QUEUEING_CLIENT_THREAD_POOL.submit(
                 self._flush_pending_operations,
                 pending_operations=pending_operations,
@@ -234,6 +245,17 @@ class MlflowAutologgingQueueingClient:
             logging_futures.append(future)
         self._pending_ops_by_run_id = {}
 
+        # Runs are created in bulk, along with their initial metrics, params and tags, with as few
+        # CreateRuns operations as the limits of the operation allow
+        for experiment_id, pending_creations in pending_creations_by_experiment_id.items():
+            for pending_creations_batch in _chunk_pending_creations(pending_creations):
+                future = _AUTOLOGGING_QUEUEING_CLIENT_THREAD_POOL.submit(
+                    self._flush_pending_creations,
+                    experiment_id=experiment_id,
+                    pending_creations=pending_creations_batch,
+                )
+                logging_futures.append(future)
+
         logging_operations = RunOperations(logging_futures)
         if synchronous:
             logging_operations.await_completion()
@@ -259,6 +281,91 @@ class MlflowAutologgingQueueingClient:
         except Exception as e:
             return e
 
+    @staticmethod
+    def _pop_initial_run_spec(pending_operations):
+        """
+        Remove the first batch of metrics, params and tags of a pending run from its queues, in
+        order to log them when the run is created.
+
+        :return: A `RunSpec` describing the run to create, or `None` if the operations do not
+                 create a run or if the run cannot be created with a CreateRuns operation.
+        """
+        create_run = pending_operations.create_run
+        if not create_run or len(create_run.tags) > MAX_PARAMS_TAGS_PER_BATCH:
+            return None
+
+        tags_queue = create_run.tags + pending_operations.tags_queue
+        tags = tags_queue[:MAX_PARAMS_TAGS_PER_BATCH]
+        pending_operations.tags_queue = tags_queue[MAX_PARAMS_TAGS_PER_BATCH:]
+        params = pending_operations.params_queue[:MAX_PARAMS_TAGS_PER_BATCH]
+        pending_operations.params_queue = pending_operations.params_queue[
+            MAX_PARAMS_TAGS_PER_BATCH:
+        ]
+        metrics_batch_size = min(
+            MAX_ENTITIES_PER_BATCH - len(params) - len(tags),
+            MAX_METRICS_PER_BATCH,
+        )
+        metrics = pending_operations.metrics_queue[:metrics_batch_size]
+        pending_operations.metrics_queue = pending_operations.metrics_queue[metrics_batch_size:]
+
+        status = None
+        end_time = None
+        set_terminated = pending_operations.set_terminated
+        has_pending_data = (
+            pending_operations.tags_queue
+            or pending_operations.params_queue
+            or pending_operations.metrics_queue
+        )
+        # The run is only created in a terminal state if no data remains to be logged to it
+        if set_terminated and not has_pending_data:
+            status = RunStatus.from_string(
+                set_terminated.status or RunStatus.to_string(RunStatus.FINISHED)
+            )
+            end_time = set_terminated.end_time or int(time.time() * 1000)
+            pending_operations.set_terminated = None
+
+        return RunSpec(
+            user_id=None,
+            start_time=create_run.start_time,
+            end_time=end_time,
+            status=status,
+            tags=tags,
+            params=params,
+            metrics=metrics,
+        )
+
+    def _flush_pending_creations(self, experiment_id, pending_creations):
+        """
+        Creates the specified pending runs with a single CreateRuns operation, then synchronously
+        and sequentially flushes the remaining pending operations of each run.
+
+        :param pending_creations: A list of (`_PendingRunOperations`, `RunSpec`) pairs, as
+                                  returned by `_pop_initial_run_spec`.
+        """
+        runs = self._client.create_runs(
+            experiment_id=experiment_id,
+            runs=[run_spec for _, run_spec in pending_creations],
+        )
+
+        failures = []
+        for (pending_operations, _), run in zip(pending_creations, runs):
+            pending_operations.create_run = None
+            pending_operations.run_id = run.info.run_id
+            try:
+                self._flush_pending_operations(pending_operations)
+            except Exception as e:
+                failures.append(e)
+
+        if len(failures) > 0:
+            raise MlflowException(
+                message=(
+                    "Failed to perform one or more operations on runs created in experiment with"
+                    " ID {experiment_id}. Failures: {failures}".format(
+                        experiment_id=experiment_id, failures=failures
+                    )
+                )
+            )
+
     def _flush_pending_operations(self, pending_operations):
         """
         Synchronously and sequentially flushes the specified list of pending run operations.
@@ -348,6 +455,29 @@ class MlflowAutologgingQueueingClient:
             )
 
 
+def _chunk_pending_creations(pending_creations):
+    """
+    Split (`_PendingRunOperations`, `RunSpec`) pairs into chunks that are within the limits of a
+    single CreateRuns operation.
+    """
+    chunk = []
+    num_entities = 0
+    for pending_creation in pending_creations:
+        _, run_spec = pending_creation
+        run_num_entities = len(run_spec.tags) + len(run_spec.params) + len(run_spec.metrics)
+        if chunk and (
+            len(chunk) >= MAX_RUNS_PER_BATCH
+            or num_entities + run_num_entities > MAX_ENTITIES_PER_RUNS_BATCH
+        ):
+            yield chunk
+            chunk = []
+            num_entities = 0
+        chunk.append(pending_creation)
+        num_entities += run_num_entities
+    if chunk:
+        yield chunk
+
+
 class _PendingRunOperations:
     """
     Represents a collection of queued / pending MLflow Run operations.
@@ -81,6 +81,38 @@ WORKERS = click.option(
     help="Number of gunicorn worker processes to handle requests (default: 4).",
 )
 
+MAX_BATCH_SIZE = click.option(
+    "--max-batch-size",
+    type=click.INT,
+    default=None,
+    help=(
+        "Enable dynamic batching: the inputs of concurrent requests are merged into batches of up"
+        " to this many rows, which are passed to the model at once. Each worker then handles up"
+        " to this many requests, and at most 32, concurrently. Disabled by default."
+    ),
+)
+
+MAX_BATCH_DELAY = click.option(
+    "--max-batch-delay",
+    "max_batch_delay_ms",
+    type=click.FLOAT,
+    default=None,
+    help=(
+        "Maximum number of milliseconds to wait for additional requests before passing a batch to"
+        " the model when dynamic batching is enabled (default: 10)."
+    ),
+)
+
+PRELOAD_MODEL = click.option(
+    "--preload-model",
+    is_flag=True,
+    default=False,
+    help=(
+        "Load the model once in the gunicorn master process before forking the workers, which"
+        " then share its memory instead of each loading their own copy."
+    ),
+)
+
 ENABLE_MLSERVER = click.option(
     "--enable-mlserver",
     is_flag=True,
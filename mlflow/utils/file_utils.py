@@ -11,6 +11,7 @@ import stat
 
 import urllib.parse
 import urllib.request
+from contextlib import contextmanager
 from urllib.parse import unquote
 from urllib.request import pathname2url
 
@@ -380,6 +381,24 @@ def _get_local_file_size(file):
     return round(os.path.getsize(file) / 1024.0, 1)
 
 
+@contextmanager
+def exclusive_lock(lock_path):
+    """Hold an exclusive lock on ``lock_path`` across processes. Yields ``False`` without locking
+    anything on platforms that do not support file locks.
+    """
+    try:
+        import fcntl
+    except ImportError:
+        yield False
+        return
+    with open(lock_path, "a") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield True
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
 def get_parent_dir(path):
     return os.path.abspath(os.path.join(path, os.pardir))
 
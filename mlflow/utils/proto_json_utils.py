@@ -3,6 +3,7 @@ import datetime
 
 import json
 from json import JSONEncoder
+from json.encoder import encode_basestring_ascii
 
 from google.protobuf.json_format import MessageToJson, ParseDict
 from google.protobuf.descriptor import FieldDescriptor
@@ -262,6 +263,146 @@ def _get_jsonable_obj(data, pandas_orient="records"):
         return data
 
 
+def _import_orjson():
+    try:
+        import orjson
+
+        return orjson
+    except ImportError:
+        return None
+
+
+def _dumps_int_or_bool_array(data, orjson=None):
+    """
+    Serialize an integer or boolean numpy array of any shape, same as ``json.dumps(data.tolist())``.
+    If ``orjson`` is installed, the array is serialized straight from its buffer.
+    """
+    if orjson is not None:
+        try:
+            # Integers and booleans do not contain any comma, so adding the space the standard
+            # library puts after each separator gives the exact same output
+            serialized = orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
+            return serialized.decode("ascii").replace(",", ", ")
+        except TypeError:
+            # Raised for unsupported arrays, e.g. arrays that are not C-contiguous
+            pass
+    return json.dumps(data.tolist())
+
+
+def _dumps_column_values(values, encoder, orjson=None):
+    """
+    :return: A list with the JSON serialization of each value of a 1-D numpy array, or ``None`` if
+             the values may need conversions that are only applied by ``DataFrame.to_dict``.
+    """
+    import numpy as np
+
+    kind = values.dtype.kind
+    if kind in "biu":
+        if len(values) == 0:
+            return []
+        return _dumps_int_or_bool_array(values, orjson)[1:-1].split(", ")
+    elif kind == "f" and values.dtype.itemsize <= 8:
+        if np.isfinite(values).all():
+            return list(map(float.__repr__, values.tolist()))
+        return list(map(encoder.encode, values.tolist()))
+    elif kind == "O":
+        objects = values.tolist()
+        types = set(map(type, objects))
+        if types <= {str}:
+            return list(map(encode_basestring_ascii, objects))
+        if types <= {str, bytes, bytearray, int, float, bool, type(None)}:
+            return list(map(encoder.encode, objects))
+    return None
+
+
+def _dumps_dataframe(data, pandas_orient, encoder, orjson=None):
+    import numpy as np
+
+    columns = data.columns.tolist()
+    if not columns or not data.columns.is_unique:
+        return None
+    if not all(type(c) in (str, int) for c in columns):
+        return None
+    serialized_columns = []
+    for _, series in data.items():
+        if not isinstance(series.dtype, np.dtype):
+            return None
+        serialized_values = _dumps_column_values(series.to_numpy(), encoder, orjson)
+        if serialized_values is None:
+            return None
+        serialized_columns.append(serialized_values)
+
+    if pandas_orient == "records":
+        # Each row is formatted by a single call, with the keys of the columns baked in
+        row_format = (
+            "{{"
+            + ", ".join(
+                encode_basestring_ascii(str(c)).replace("{", "{{").replace("}", "}}") + ": {}"
+                for c in columns
+            )
+            + "}}"
+        )
+        return "[" + ", ".join(map(row_format.format, *serialized_columns)) + "]"
+    elif pandas_orient == "split":
+        rows = map(("[" + ", ".join(["{}"] * len(columns)) + "]").format, *serialized_columns)
+        return '{{"index": {}, "columns": {}, "data": [{}]}}'.format(
+            encoder.encode(data.index.tolist()), encoder.encode(columns), ", ".join(rows)
+        )
+    return None
+
+
+def _dumps_ndarray(data, encoder, orjson=None):
+    import numpy as np
+
+    kind = data.dtype.kind
+    if kind in "biu":
+        return _dumps_int_or_bool_array(data, orjson)
+    elif kind == "S":
+        encoded = [base64.encodebytes(x).decode("ascii") for x in data.ravel().tolist()]
+        return json.dumps(np.array(encoded, dtype=object).reshape(data.shape).tolist())
+    return encoder.encode(data.tolist())
+
+
+def _dumps_jsonable_obj(data, pandas_orient="records"):
+    """Serialize data to JSON, same as ``json.dumps(_get_jsonable_obj(data, pandas_orient),
+    cls=NumpyEncoder)`` would.
+
+    DataFrames are serialized column by column straight from their numpy arrays, without building
+    the Python dictionaries of ``DataFrame.to_dict``. If the ``orjson`` package is installed, it is
+    used to serialize integer and boolean arrays. Data that is not supported by the fast path is
+    serialized with ``NumpyEncoder``.
+
+    :param data: data to be serialized, works with pandas and numpy, rest will be serialized as is.
+    :param pandas_orient: If `data` is a Pandas DataFrame, it will be serialized using this Pandas
+                          serialization orientation. This is either 'records' or 'split'.
+    """
+    import numpy as np
+    import pandas as pd
+
+    encoder = NumpyEncoder()
+    orjson = _import_orjson()
+    serialized = None
+    if isinstance(data, pd.Series):
+        data = pd.DataFrame(data)
+    if isinstance(data, pd.DataFrame):
+        serialized = _dumps_dataframe(data, pandas_orient, encoder, orjson)
+    elif isinstance(data, np.ndarray):
+        serialized = _dumps_ndarray(data, encoder, orjson)
+    elif isinstance(data, dict) and all(type(k) is str for k in data):
+        # Dictionaries of tensors, as returned by models with multiple outputs
+        items = []
+        for k, v in data.items():
+            if isinstance(v, np.ndarray):
+                serialized_value = _dumps_ndarray(v, encoder, orjson)
+            else:
+                serialized_value = encoder.encode(v)
+            items.append(encode_basestring_ascii(k) + ": " + serialized_value)
+        serialized = "{" + ", ".join(items) + "}"
+    if serialized is None:
+        serialized = encoder.encode(_get_jsonable_obj(data, pandas_orient=pandas_orient))
+    return serialized
+
+
 def parse_tf_serving_input(inp_dict, schema=None):
     """
     :param inp_dict: A dict deserialized from a JSON string formatted as described in TF's
@@ -3,15 +3,20 @@ This module provides a set of utilities for interpreting and creating requiremen
 (e.g. pip's `requirements.txt`), which is useful for managing ML software environments.
 """
 
+import functools
+import hashlib
 import json
 import sys
 import subprocess
 import tempfile
+import threading
 import os
 import pkg_resources
 import importlib_metadata
+import yaml
 from itertools import filterfalse, chain
-from collections import namedtuple
+from collections import namedtuple, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import logging
 import re
 
@@ -24,6 +29,10 @@ from packaging.version import Version, InvalidVersion
 
 _logger = logging.getLogger(__name__)
 
+# If set to "true", the modules imported while loading a model are captured in child processes
+# forked from a persistent server process, instead of in a new python interpreter process
+MLFLOW_CAPTURE_MODULES_FORK_SERVER = "MLFLOW_CAPTURE_MODULES_FORK_SERVER"
+
 
 def _is_comment(line):
     return line.startswith("#")
@@ -174,13 +183,21 @@ def _get_requires_recursive(pkg_name, top_pkg_name=None) -> set:
         yield from _get_requires_recursive(req.name, top_pkg_name)
 
 
+@functools.lru_cache(maxsize=None)
+def _get_requires(pkg_name):
+    """
+    Memoized version of `_get_requires_recursive`.
+    """
+    return frozenset(_get_requires_recursive(pkg_name))
+
+
 def _prune_packages(packages):
     """
     Prunes packages required by other packages. For example, `["scikit-learn", "numpy"]` is pruned
     to `["scikit-learn"]`.
     """
     packages = set(packages)
-    requires = set(_flatten(map(_get_requires_recursive, packages)))
+    requires = set(_flatten(map(_get_requires, packages)))
     return packages - requires
 
 
@@ -204,6 +221,7 @@ def _run_command(cmd):
         raise MlflowException(msg)
 
 
+@functools.lru_cache(maxsize=None)
 def _get_installed_version(package, module=None):
     """
     Obtains the installed package version using `importlib_metadata.version`. If it fails, use
@@ -232,41 +250,248 @@ def _get_installed_version(package, module=None):
     return version
 
 
-def _capture_imported_modules(model_uri, flavor):
+class _CaptureModulesForkServer:
+    """
+    Client of a `_capture_modules_server.py` process, which is started on first use and shared by
+    the threads of this process.
     """
-    Runs `_capture_modules.py` in a subprocess and captures modules imported during the model
-    loading procedure.
 
-    :param model_uri: The URI of the model.
-    :param: flavor: The flavor name of the model.
-    :return: A list of captured modules.
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._proc = None
+        self._pid = None
+
+    def _start(self):
+        # Lazily import `_capture_modules_server` here to avoid circular imports.
+        from mlflow.utils import _capture_modules_server
+
+        self._proc = subprocess.Popen(
+            [sys.executable, _capture_modules_server.__file__],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            universal_newlines=True,
+        )
+        self._pid = os.getpid()
+
+    def _request(self, request):
+        # The server of the parent process is not usable from forked processes
+        if self._proc is None or self._proc.poll() is not None or self._pid != os.getpid():
+            self._start()
+        self._proc.stdin.write(json.dumps(request) + "\n")
+        self._proc.stdin.flush()
+        response = self._proc.stdout.readline()
+        if not response:
+            raise MlflowException("The capture modules fork server exited unexpectedly")
+        return json.loads(response)
+
+    def capture(self, model_path, flavor, output_file):
+        """
+        Captures the modules imported while loading the specified model in a child process of the
+        server, and writes their names to `output_file`. If the child process exits with non-zero
+        status, `MlflowException` is raised.
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            error_file = os.path.join(tmpdir, "error.txt")
+            request = {
+                "model_path": model_path,
+                "flavor": flavor,
+                "output_file": output_file,
+                "error_file": error_file,
+                "env": dict(os.environ),
+                "cwd": os.getcwd(),
+                "sys_path": sys.path,
+            }
+            with self._lock:
+                try:
+                    response = self._request(request)
+                except (OSError, ValueError):
+                    # Restart the server if it is broken, e.g. because it was killed
+                    self._proc = None
+                    response = self._request(request)
+            if response["exit_code"] != 0:
+                with open(error_file) as f:
+                    output = f.read()
+                msg = "\n".join(
+                    [
+                        f"Encountered an unexpected error while capturing the modules imported by"
+                        f" {model_path}",
+                        f"exit status: {response['exit_code']}",
+                        f"output: {output}",
+                    ]
+                )
+                raise MlflowException(msg)
+
+
+_CAPTURE_MODULES_FORK_SERVER = _CaptureModulesForkServer()
+
+
+def _use_capture_modules_fork_server():
+    if not hasattr(os, "fork"):
+        return False
+    return os.environ.get(MLFLOW_CAPTURE_MODULES_FORK_SERVER, "false").lower() == "true"
+
+
+def _get_environment_fingerprint():
+    """
+    Returns a fingerprint of the python environment, which determines the modules that a model
+    imports when it is loaded along with the contents of the model.
+    """
+    installed_packages = sorted(
+        (dist.key, dist.version) for dist in pkg_resources.working_set  # pylint: disable=E1133
+    )
+    fingerprint = json.dumps([sys.executable, sys.version, sys.path, installed_packages])
+    return hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()
+
+
+# Attributes of MLmodel files that differ each time a model is saved or logged, and have no effect
+# on how the model is loaded
+_VOLATILE_MLMODEL_KEYS = ["artifact_path", "run_id", "utc_time_created", "model_uuid"]
+
+
+def _list_model_files(local_model_path):
+    """
+    Returns a list of ``(relative_path, path, size)`` tuples describing the files of the model,
+    sorted by relative path.
+    """
+    if os.path.isdir(local_model_path):
+        paths = [
+            os.path.join(root, name)
+            for root, _, names in os.walk(local_model_path)
+            for name in names
+        ]
+    else:
+        paths = [local_model_path]
+    return sorted(
+        (os.path.relpath(path, local_model_path), path, os.path.getsize(path)) for path in paths
+    )
+
+
+def _get_model_listing(model_files):
+    """
+    Returns the relative paths and sizes of the model files, which are the same for all the copies
+    of a model. The size of the MLmodel file is omitted since it varies with its volatile
+    attributes.
+    """
+    # Lazily import `Model` here to avoid circular imports.
+    from mlflow.models.model import MLMODEL_FILE_NAME
+
+    return tuple(
+        (relpath, None if relpath == MLMODEL_FILE_NAME else size)
+        for relpath, _, size in model_files
+    )
+
+
+def _get_model_digest(model_files):
+    """
+    Returns the SHA-256 digest of the relative paths and the contents of the model files,
+    excluding the volatile attributes of its MLmodel file.
+    """
+    # Lazily import `Model` here to avoid circular imports.
+    from mlflow.models.model import MLMODEL_FILE_NAME
+
+    sha256 = hashlib.sha256()
+    for relpath, path, _ in model_files:
+        sha256.update(relpath.encode("utf-8"))
+        if relpath == MLMODEL_FILE_NAME:
+            with open(path) as f:
+                mlmodel = yaml.safe_load(f) or {}
+            for key in _VOLATILE_MLMODEL_KEYS:
+                mlmodel.pop(key, None)
+            sha256.update(json.dumps(mlmodel, sort_keys=True, default=str).encode("utf-8"))
+            continue
+        with open(path, "rb") as f:
+            for chunk in iter(functools.partial(f.read, 1024 * 1024), b""):
+                sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+# Modules captured while loading recently inferred models, keyed by the flavor, the listing and
+# the digest of the model, and the fingerprint of the python environment
+_CAPTURED_MODULES_CACHE = OrderedDict()
+_CAPTURED_MODULES_CACHE_SIZE = 64
+_CAPTURED_MODULES_CACHE_LOCK = threading.Lock()
+
+
+def _run_capture_modules(local_model_path, flavor):
+    """
+    Loads the model in a child process and returns the modules imported while loading it.
     """
     # Lazily import `_capture_module` here to avoid circular imports.
     from mlflow.utils import _capture_modules
 
-    local_model_path = _download_artifact_from_uri(model_uri)
-
     # Run `_capture_modules.py` to capture modules imported during the loading procedure
     with tempfile.TemporaryDirectory() as tmpdir:
         output_file = os.path.join(tmpdir, "imported_modules.txt")
-        _run_command(
-            [
-                sys.executable,
-                _capture_modules.__file__,
-                "--model-path",
-                local_model_path,
-                "--flavor",
-                flavor,
-                "--output-file",
-                output_file,
-                "--sys-path",
-                json.dumps(sys.path),
-            ],
-        )
+        if _use_capture_modules_fork_server():
+            _CAPTURE_MODULES_FORK_SERVER.capture(local_model_path, flavor, output_file)
+        else:
+            _run_command(
+                [
+                    sys.executable,
+                    _capture_modules.__file__,
+                    "--model-path",
+                    local_model_path,
+                    "--flavor",
+                    flavor,
+                    "--output-file",
+                    output_file,
+                    "--sys-path",
+                    json.dumps(sys.path),
+                ],
+            )
         with open(output_file) as f:
             return f.read().splitlines()
 
 
+def _capture_imported_modules(model_uri, flavor):
+    """
+    Runs `_capture_modules.py` in a subprocess and captures modules imported during the model
+    loading procedure. Models that were already inferred in the same python environment are not
+    loaded again.
+
+    :param model_uri: The URI of the model.
+    :param: flavor: The flavor name of the model.
+    :return: A list of captured modules.
+    """
+    # Models on the local filesystem, e.g. models being saved, are not copied
+    if os.path.exists(model_uri):
+        local_model_path = model_uri
+    else:
+        local_model_path = _download_artifact_from_uri(model_uri)
+
+    model_files = _list_model_files(local_model_path)
+    model_listing = _get_model_listing(model_files)
+    environment_fingerprint = _get_environment_fingerprint()
+    with _CAPTURED_MODULES_CACHE_LOCK:
+        might_be_cached = any(
+            key[:2] == (flavor, model_listing) and key[3] == environment_fingerprint
+            for key in _CAPTURED_MODULES_CACHE
+        )
+
+    # NB: Hashing large models takes seconds. It is only done before capturing the modules if a
+    # cached model has the same files, and otherwise while the model is loaded by the capture
+    if might_be_cached:
+        model_digest = _get_model_digest(model_files)
+        cache_key = (flavor, model_listing, model_digest, environment_fingerprint)
+        with _CAPTURED_MODULES_CACHE_LOCK:
+            if cache_key in _CAPTURED_MODULES_CACHE:
+                _CAPTURED_MODULES_CACHE.move_to_end(cache_key)
+                return list(_CAPTURED_MODULES_CACHE[cache_key])
+        modules = _run_capture_modules(local_model_path, flavor)
+    else:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            model_digest_future = executor.submit(_get_model_digest, model_files)
+            modules = _run_capture_modules(local_model_path, flavor)
+            model_digest = model_digest_future.result()
+        cache_key = (flavor, model_listing, model_digest, environment_fingerprint)
+
+    with _CAPTURED_MODULES_CACHE_LOCK:
+        _CAPTURED_MODULES_CACHE[cache_key] = modules
+        while len(_CAPTURED_MODULES_CACHE) > _CAPTURED_MODULES_CACHE_SIZE:
+            _CAPTURED_MODULES_CACHE.popitem(last=False)
+    return list(modules)
+
+
 _MODULES_TO_PACKAGES = None
 
 # Represents the PyPI package index at a particular date
@@ -1,6 +1,9 @@
 import base64
 import json
+import os
+import threading
 import requests
+from http.cookiejar import DefaultCookiePolicy
 import urllib3
 from contextlib import contextmanager
 from packaging.version import Version
@@ -10,7 +13,12 @@ from requests.exceptions import HTTPError
 
 from mlflow import __version__
 from mlflow.protos import databricks_pb2
-from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE, ENDPOINT_NOT_FOUND, ErrorCode
+from mlflow.protos.databricks_pb2 import (
+    INVALID_PARAMETER_VALUE,
+    INTERNAL_ERROR,
+    ENDPOINT_NOT_FOUND,
+    ErrorCode,
+)
 from mlflow.utils.proto_json_utils import parse_dict
 from mlflow.utils.string_utils import strip_suffix
 from mlflow.exceptions import MlflowException, RestException
@@ -31,13 +39,117 @@ _TRANSIENT_FAILURE_RESPONSE_CODES = frozenset(
         504,  # Gateway Timeout
     ]
 )
+# Environment variables controlling the size of the HTTP connection pools shared by all requests
+# made with ``http_request`` and ``cloud_storage_http_request`` in the current process
+_HTTP_POOL_CONNECTIONS_ENV_VAR = "MLFLOW_HTTP_POOL_CONNECTIONS"
+_HTTP_POOL_MAXSIZE_ENV_VAR = "MLFLOW_HTTP_POOL_MAXSIZE"
+_DEFAULT_HTTP_POOL_CONNECTIONS = 10
+_DEFAULT_HTTP_POOL_MAXSIZE = 10
+
+_request_sessions = {}
+_request_sessions_lock = threading.Lock()
+_request_sessions_pid = os.getpid()
+
+
+def _get_retry_policy(max_retries, backoff_factor, retry_codes):
+    retry_kwargs = {
+        "total": max_retries,
+        "connect": max_retries,
+        "read": max_retries,
+        "redirect": max_retries,
+        "status": max_retries,
+        "status_forcelist": retry_codes,
+        "backoff_factor": backoff_factor,
+    }
+    if Version(urllib3.__version__) >= Version("1.26.0"):
+        retry_kwargs["allowed_methods"] = None
+    else:
+        retry_kwargs["method_whitelist"] = None
+
+    return Retry(**retry_kwargs)
+
+
+def _get_request_session(max_retries, backoff_factor, retry_codes, verify=True, cert=None):
+    """
+    Returns a ``requests.Session`` with the specified retry policy whose keep-alive connections are
+    pooled per host and reused across requests made by the current process. Sessions are never
+    shared with forked child processes, which create their own on first use. Since a session is
+    shared by requests made to different hosts with different credentials, it never persists the
+    cookies set by responses.
+
+    :param verify: The TLS verification setting of the requests made with the session. Sessions
+                   are not shared across TLS settings so that pooled connections established with
+                   one setting are never reused by requests made with another.
+    :param cert: The TLS client certificate of the requests made with the session.
+    """
+    global _request_sessions, _request_sessions_lock, _request_sessions_pid
+
+    if _request_sessions_pid != os.getpid():
+        # Connections inherited from the parent process share its sockets and must not be reused
+        _request_sessions = {}
+        _request_sessions_lock = threading.Lock()
+        _request_sessions_pid = os.getpid()
+
+    key = (max_retries, backoff_factor, frozenset(retry_codes), verify, cert)
+    with _request_sessions_lock:
+        session = _request_sessions.get(key)
+        if session is None:
+            adapter = HTTPAdapter(
+                pool_connections=int(
+                    os.environ.get(_HTTP_POOL_CONNECTIONS_ENV_VAR, _DEFAULT_HTTP_POOL_CONNECTIONS)
+                ),
+                pool_maxsize=int(
+                    os.environ.get(_HTTP_POOL_MAXSIZE_ENV_VAR, _DEFAULT_HTTP_POOL_MAXSIZE)
+                ),
+                max_retries=_get_retry_policy(max_retries, backoff_factor, retry_codes),
+            )
+            session = requests.Session()
+            # NB: A cookie policy without allowed domains rejects all cookies
+            session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _request_sessions[key] = session
+        return session
+
+
+def get_http_connection_pool_stats():
+    """
+    Returns statistics about the reuse of the pooled HTTP connections of the current process.
+
+    :return: A dictionary mapping each ``scheme://host:port`` contacted by the current process to
+             a dictionary containing the number of connections that were opened to it
+             (``num_connections``) and the number of requests that were sent to it
+             (``num_requests``). A ratio of requests to connections greater than one indicates
+             that connections are being reused.
+    """
+    stats = {}
+    if _request_sessions_pid != os.getpid():
+        return stats
+
+    with _request_sessions_lock:
+        sessions = list(_request_sessions.values())
+    adapters = {
+        id(adapter): adapter for session in sessions for adapter in session.adapters.values()
+    }
+    for adapter in adapters.values():
+        pools = adapter.poolmanager.pools
+        for pool_key in pools.keys():
+            pool = pools.get(pool_key)
+            if pool is None:
+                continue
+            host = "%s://%s:%s" % (pool.scheme, pool.host, pool.port)
+            host_stats = stats.setdefault(host, {"num_connections": 0, "num_requests": 0})
+            host_stats["num_connections"] += pool.num_connections
+            host_stats["num_requests"] += pool.num_requests
+    return stats
 
 
 def _get_http_response_with_retries(
     method, url, max_retries, backoff_factor, retry_codes, **kwargs
 ):
     """
-    Performs an HTTP request using Python's `requests` module with an automatic retry policy.
+    Performs an HTTP request using Python's `requests` module with an automatic retry policy,
+    reusing the pooled connections of the current process.
 
     :param method: a string indicating the method to use, e.g. "GET", "POST", "PUT".
     :param url: the target URL address for the HTTP request.
@@ -53,27 +165,14 @@ def _get_http_response_with_retries(
     assert 0 <= max_retries < 10
     assert 0 <= backoff_factor < 120
 
-    retry_kwargs = {
-        "total": max_retries,
-        "connect": max_retries,
-        "read": max_retries,
-        "redirect": max_retries,
-        "status": max_retries,
-        "status_forcelist": retry_codes,
-        "backoff_factor": backoff_factor,
-    }
-    if Version(urllib3.__version__) >= Version("1.26.0"):
-        retry_kwargs["allowed_methods"] = None
-    else:
-        retry_kwargs["method_whitelist"] = None
-
-    retry = Retry(**retry_kwargs)
-    adapter = HTTPAdapter(max_retries=retry)
-    with requests.Session() as http:
-        http.mount("https://", adapter)
-        http.mount("http://", adapter)
-        response = http.request(method, url, **kwargs)
-        return response
+    session = _get_request_session(
+        max_retries,
+        backoff_factor,
+        retry_codes,
+        verify=kwargs.get("verify", True),
+        cert=kwargs.get("cert"),
+    )
+    return session.request(method, url, **kwargs)
 
 
 def http_request(
@@ -172,7 +271,11 @@ def verify_rest_response(response, endpoint):
                 endpoint,
                 response.status_code,
             )
-            raise MlflowException("%s. Response body: '%s'" % (base_msg, response.text))
+            # NB: Servers that do not implement an endpoint respond with a non-JSON 404 error
+            error_code = ENDPOINT_NOT_FOUND if response.status_code == 404 else INTERNAL_ERROR
+            raise MlflowException(
+                "%s. Response body: '%s'" % (base_msg, response.text), error_code=error_code
+            )
 
     # Skip validation for endpoints (e.g. DBFS file-download API) which may return a non-JSON
     # response
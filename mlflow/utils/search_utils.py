@@ -1,4 +1,6 @@
 import base64
+import bisect
+import functools
 import json
 import operator
 import re
@@ -24,6 +26,23 @@ from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
 import math
 
 
+@functools.total_ordering
+class _Reversed:
+    """
+    Wrapper that inverts the ordering of the wrapped value, used to compare sort keys that
+    contain descending components.
+    """
+
+    def __init__(self, value):
+        self.value = value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+    def __lt__(self, other):
+        return other.value < self.value
+
+
 class SearchUtils(object):
     LIKE_OPERATOR = "LIKE"
     ILIKE_OPERATOR = "ILIKE"
@@ -549,13 +568,7 @@ class SearchUtils(object):
         return runs
 
     @classmethod
-    def parse_start_offset_from_page_token(cls, page_token):
-        # Note: the page_token is expected to be a base64-encoded JSON that looks like
-        # { "offset": xxx }. However, this format is not stable, so it should not be
-        # relied upon outside of this method.
-        if not page_token:
-            return 0
-
+    def _decode_page_token(cls, page_token):
         try:
             decoded_token = base64.b64decode(page_token)
         except TypeError:
@@ -574,7 +587,15 @@ class SearchUtils(object):
                 "Invalid page token, decoded value=%s" % decoded_token,
                 error_code=INVALID_PARAMETER_VALUE,
             )
+        if not isinstance(parsed_token, dict):
+            raise MlflowException(
+                "Invalid page token, parsed value=%s" % parsed_token,
+                error_code=INVALID_PARAMETER_VALUE,
+            )
+        return parsed_token
 
+    @classmethod
+    def _parse_offset_from_parsed_page_token(cls, parsed_token):
         offset_str = parsed_token.get("offset")
         if not offset_str:
             raise MlflowException(
@@ -592,10 +613,86 @@ class SearchUtils(object):
 
         return offset
 
+    @classmethod
+    def parse_start_offset_from_page_token(cls, page_token):
+        # Note: the page_token is expected to be a base64-encoded JSON that looks like
+        # { "offset": xxx }. However, this format is not stable, so it should not be
+        # relied upon outside of this method.
+        if not page_token:
+            return 0
+
+        return cls._parse_offset_from_parsed_page_token(cls._decode_page_token(page_token))
+
+    @classmethod
+    def parse_page_token_for_search_runs(cls, page_token):
+        """
+        Parse a page token produced by either :py:meth:`create_page_token` or
+        :py:meth:`create_keyset_page_token`.
+
+        :return: A pair ``(offset, keyset)``. ``keyset`` is the sort key of the last run on the
+                 previous page for keyset tokens and ``None`` for offset-based tokens.
+        """
+        # Note: the page_token is expected to be a base64-encoded JSON that looks like
+        # { "offset": xxx } or { "keyset": [...] }. However, this format is not stable, so it
+        # should not be relied upon outside of this class.
+        if not page_token:
+            return 0, None
+
+        parsed_token = cls._decode_page_token(page_token)
+        if "keyset" in parsed_token:
+            keyset = parsed_token["keyset"]
+            if not isinstance(keyset, list) or len(keyset) == 0:
+                raise MlflowException(
+                    "Invalid page token, parsed value=%s" % parsed_token,
+                    error_code=INVALID_PARAMETER_VALUE,
+                )
+            return 0, keyset
+        return cls._parse_offset_from_parsed_page_token(parsed_token), None
+
     @classmethod
     def create_page_token(cls, offset):
         return base64.b64encode(json.dumps({"offset": offset}).encode("utf-8"))
 
+    @classmethod
+    def create_keyset_page_token(cls, keyset):
+        """
+        Create a page token that resumes a search right after the run whose sort key is
+        ``keyset``, rather than at a fixed offset. The sort key must be JSON-serializable and
+        end with the run ID, so that it identifies a unique position in the result set.
+        """
+        return base64.b64encode(json.dumps({"keyset": keyset}).encode("utf-8"))
+
+    @classmethod
+    def _get_sort_key(cls, run, order_by_list):
+        """
+        :return: A JSON-serializable sort key for the specified run that is consistent with the
+                 ordering produced by :py:meth:`sort`. Use :py:meth:`_get_comparable_sort_key`
+                 to compare sort keys with each other.
+        """
+        sort_key = []
+        for order_by_clause in order_by_list or []:
+            (key_type, key, ascending) = cls.parse_order_by_for_search_runs(order_by_clause)
+            sort_key.append(list(cls._get_value_for_sort(run, key_type, key, ascending)))
+        sort_key.append([-run.info.start_time, run.info.run_uuid])
+        return sort_key
+
+    @classmethod
+    def _get_comparable_sort_key(cls, sort_key, order_by_list):
+        order_by_list = order_by_list or []
+        if len(sort_key) != len(order_by_list) + 1:
+            raise MlflowException(
+                "Invalid page token, it does not match the specified order_by clauses {}".format(
+                    order_by_list
+                ),
+                error_code=INVALID_PARAMETER_VALUE,
+            )
+        comparable_key = []
+        for order_by_clause, component in zip(order_by_list, sort_key):
+            (_, _, ascending) = cls.parse_order_by_for_search_runs(order_by_clause)
+            comparable_key.append(tuple(component) if ascending else _Reversed(tuple(component)))
+        comparable_key.append(tuple(sort_key[-1]))
+        return tuple(comparable_key)
+
     @classmethod
     def paginate(cls, runs, page_token, max_results):
         """Paginates a set of runs based on an offset encoded into the page_token and a max
@@ -611,6 +708,34 @@ class SearchUtils(object):
             next_page_token = cls.create_page_token(final_offset)
         return (paginated_runs, next_page_token)
 
+    @classmethod
+    def paginate_runs(cls, runs, page_token, max_results, order_by_list):
+        """Paginates a set of runs sorted with :py:meth:`sort` according to ``order_by_list``.
+        Unlike :py:meth:`paginate`, the returned next_page_token encodes the sort key of the last
+        returned run, so that the next page starts right after that run even if runs were
+        created or deleted in the meantime. Offset-based page tokens are still accepted.
+        """
+        start_offset, keyset = cls.parse_page_token_for_search_runs(page_token)
+        if keyset is not None:
+            last_key = cls._get_comparable_sort_key(keyset, order_by_list)
+            run_keys = [
+                cls._get_comparable_sort_key(cls._get_sort_key(run, order_by_list), order_by_list)
+                for run in runs
+            ]
+            start_offset = bisect.bisect_right(run_keys, last_key)
+        final_offset = start_offset + max_results
+
+        paginated_runs = runs[start_offset:final_offset]
+        next_page_token = None
+        if final_offset < len(runs):
+            if paginated_runs:
+                next_page_token = cls.create_keyset_page_token(
+                    cls._get_sort_key(paginated_runs[-1], order_by_list)
+                )
+            else:
+                next_page_token = cls.create_page_token(final_offset)
+        return (paginated_runs, next_page_token)
+
     # Model Registry specific parser
     # TODO: Tech debt. Refactor search code into common utils, tracking server, and model
     #       registry specific code.
@@ -26,6 +26,8 @@ MAX_PARAMS_TAGS_PER_BATCH = 100
 MAX_METRICS_PER_BATCH = 1000
 MAX_ENTITIES_PER_BATCH = 1000
 MAX_BATCH_LOG_REQUEST_SIZE = int(1e6)
+MAX_RUNS_PER_BATCH = 1000
+MAX_ENTITIES_PER_RUNS_BATCH = 10000
 MAX_PARAM_VAL_LENGTH = 250
 MAX_TAG_VAL_LENGTH = 5000
 MAX_EXPERIMENT_TAG_KEY_LENGTH = 250
@@ -290,6 +292,22 @@ def _validate_batch_log_limits(metrics, params, tags):
     )
 
 
+def _validate_create_runs_limits(runs):
+    """
+    Validate that the provided runs to create in a single batch, and the metrics, params and tags
+    of each run, are within expected limits.
+    """
+    _validate_batch_limit(entity_name="runs", limit=MAX_RUNS_PER_BATCH, length=len(runs))
+    for run in runs:
+        _validate_batch_log_limits(run.metrics, run.params, run.tags)
+    total_length = sum(len(run.metrics) + len(run.params) + len(run.tags) for run in runs)
+    _validate_batch_limit(
+        entity_name="metrics, params, and tags",
+        limit=MAX_ENTITIES_PER_RUNS_BATCH,
+        length=total_length,
+    )
+
+
 def _validate_batch_log_data(metrics, params, tags):
     for metric in metrics:
         _validate_metric(metric.key, metric.value, metric.timestamp, metric.step)
@@ -30,7 +30,7 @@ from mlflow.models import Model, ModelInputExample, infer_signature
 from mlflow.models.model import MLMODEL_FILE_NAME
 from mlflow.models.signature import ModelSignature
 from mlflow.models.utils import _save_example
-from mlflow.tracking.artifact_utils import _download_artifact_from_uri
+from mlflow.tracking.artifact_utils import _download_model_from_uri
 from mlflow.utils import _get_fully_qualified_class_name
 from mlflow.utils.environment import (
     _mlflow_conda_env,
@@ -309,7 +309,7 @@ def load_model(model_uri, dst_path=None):
     :return: An XGBoost model. An instance of either `xgboost.Booster`_ or XGBoost scikit-learn
              models, depending on the saved model class specification.
     """
-    local_model_path = _download_artifact_from_uri(artifact_uri=model_uri, output_path=dst_path)
+    local_model_path = _download_model_from_uri(model_uri, output_path=dst_path)
     return _load_model(path=local_model_path)
 
 
@@ -204,9 +204,9 @@ def test_flush_clears_pending_operations():
         client.flush()
 
         logging_call_count_1 = len(mlflow_client_mock.method_calls)
-        # Verify that at least 3 calls have been made to MLflow logging APIs as a result
-        # of the flush (i.e. log_batch, create_run, and set_terminated)
-        assert logging_call_count_1 >= 3
+        # Verify that at least 1 call has been made to MLflow logging APIs as a result of the
+        # flush (i.e. create_runs, which creates the run along with its data and status)
+        assert logging_call_count_1 >= 1
 
         client.flush()
 
@@ -259,10 +259,10 @@ def test_logging_failures_are_handled_as_expected():
     ) as log_batch_mock:
         log_batch_mock.side_effect = Exception("Batch logging failed!")
 
+        run_id = MlflowClient().create_run(experiment_id=experiment_id).info.run_id
         client = MlflowAutologgingQueueingClient()
-        pending_run_id = client.create_run(experiment_id=experiment_id)
-        client.log_metrics(run_id=pending_run_id, metrics={"a": 1})
-        client.set_terminated(run_id=pending_run_id, status="KILLED")
+        client.log_metrics(run_id=run_id, metrics={"a": 1})
+        client.set_terminated(run_id=run_id, status="KILLED")
 
         with pytest.raises(MlflowException, match="Batch logging failed!") as exc:
             client.flush()
@@ -279,3 +279,60 @@ def test_logging_failures_are_handled_as_expected():
             run_id=run.info.run_id
         ) in str(exc.value)
         assert "Batch logging failed!" in str(exc.value)
+
+
+def test_client_creates_runs_in_bulk_with_their_data():
+    experiment_id = MlflowClient().create_experiment("test_bulk_run_creation")
+
+    with mock.patch(
+        "mlflow.utils.autologging_utils.client.MlflowClient.create_run"
+    ) as create_run_mock, mock.patch(
+        "mlflow.utils.autologging_utils.client.MlflowClient.log_batch"
+    ) as log_batch_mock, mock.patch(
+        "mlflow.utils.autologging_utils.client.MlflowClient.set_terminated"
+    ) as set_terminated_mock:
+        client = MlflowAutologgingQueueingClient()
+        for i in range(3):
+            pending_run_id = client.create_run(
+                experiment_id=experiment_id, start_time=5, tags={"index": i}
+            )
+            client.log_params(run_id=pending_run_id, params={"a": i})
+            client.log_metrics(run_id=pending_run_id, metrics={"b": i})
+            client.set_tags(run_id=pending_run_id, tags={"c": i})
+            client.set_terminated(run_id=pending_run_id, end_time=6)
+        client.flush()
+
+        create_run_mock.assert_not_called()
+        log_batch_mock.assert_not_called()
+        set_terminated_mock.assert_not_called()
+
+    runs = mlflow.search_runs(experiment_ids=[experiment_id], output_format="list")
+    runs = sorted(runs, key=lambda run: run.data.tags["index"])
+    assert len(runs) == 3
+    for i, run in enumerate(runs):
+        assert run.info.start_time == 5
+        assert run.info.end_time == 6
+        assert run.info.status == "FINISHED"
+        assert run.data.params == {"a": str(i)}
+        assert run.data.metrics == {"b": i}
+        assert {"index": str(i), "c": str(i)}.items() <= run.data.tags.items()
+
+
+def test_client_logs_data_exceeding_bulk_creation_limits_after_creating_runs():
+    experiment_id = MlflowClient().create_experiment("test_bulk_run_creation_limits")
+    params_to_log = {"param_{}".format(i): i for i in range(MAX_PARAMS_TAGS_PER_BATCH * 2 + 1)}
+    metrics_to_log = {"metric_{}".format(i): i for i in range(MAX_METRICS_PER_BATCH + 1)}
+
+    client = MlflowAutologgingQueueingClient()
+    pending_run_id = client.create_run(experiment_id=experiment_id)
+    client.log_params(run_id=pending_run_id, params=params_to_log)
+    client.log_metrics(run_id=pending_run_id, metrics=metrics_to_log)
+    client.set_terminated(run_id=pending_run_id, status="KILLED")
+    client.flush()
+
+    runs = mlflow.search_runs(experiment_ids=[experiment_id], output_format="list")
+    assert len(runs) == 1
+    params, metrics, _ = get_run_data(runs[0].info.run_id)
+    assert params == {key: str(value) for key, value in params_to_log.items()}
+    assert metrics == metrics_to_log
+    assert runs[0].info.status == "KILLED"
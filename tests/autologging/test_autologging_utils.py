@@ -1,6 +1,7 @@
 # pylint: disable=unused-argument
 
 import inspect
+import threading
 import time
 import pytest
 from collections import namedtuple
@@ -304,6 +305,7 @@ def test_batch_metrics_logger_runs_training_and_logging_in_correct_ratio(start_r
 
             # first metrics should be logged immediately to record a previous timestamp and
             #   batch log time
+            metrics_logger._wait_for_log_batch_thread()
             log_batch_mock.assert_called_once()
 
             metrics_logger.total_log_batch_time = 1
@@ -322,6 +324,7 @@ def test_batch_metrics_logger_runs_training_and_logging_in_correct_ratio(start_r
             # at this point, average log batch time is 1, and total training time is 9
             # thus the next record_metrics call should send the batch.
             metrics_logger.record_metrics({"x": 1}, step=0)
+            metrics_logger._wait_for_log_batch_thread()
             log_batch_mock.assert_called_once()
 
             # update log_batch time to reflect the 'mocked' training time
@@ -335,6 +338,7 @@ def test_batch_metrics_logger_runs_training_and_logging_in_correct_ratio(start_r
                 metrics_logger.total_training_time = i
 
             metrics_logger.record_metrics({"x": 1}, step=0)
+            metrics_logger._wait_for_log_batch_thread()
             log_batch_mock.assert_called_once()
 
 
@@ -343,8 +347,10 @@ def test_batch_metrics_logger_chunks_metrics_when_batch_logging(start_run):
         run_id = mlflow.active_run().info.run_id
         with batch_metrics_logger(run_id) as metrics_logger:
             metrics_logger.record_metrics({hex(x): x for x in range(5000)}, step=0)
+            metrics_logger._wait_for_log_batch_thread()
             run_id = mlflow.active_run().info.run_id
 
+            assert len(log_batch_mock.call_args_list) == 5
             for call_idx, call in enumerate(log_batch_mock.call_args_list):
                 _, kwargs = call
 
@@ -361,6 +367,7 @@ def test_batch_metrics_logger_records_time_correctly(start_run):
         run_id = mlflow.active_run().info.run_id
         with batch_metrics_logger(run_id) as metrics_logger:
             metrics_logger.record_metrics({"x": 1}, step=0)
+            metrics_logger._wait_for_log_batch_thread()
 
             assert metrics_logger.total_log_batch_time >= 1
 
@@ -386,6 +393,127 @@ def test_batch_metrics_logger_logs_timestamps_as_int_milliseconds(start_run):
         assert logged_metric.timestamp == 123456
 
 
+def test_batch_metrics_logger_logs_batches_in_background(start_run):
+    log_batch_started = threading.Event()
+    log_batch_unblocked = threading.Event()
+
+    def log_batch(*args, **kwargs):
+        log_batch_started.set()
+        log_batch_unblocked.wait()
+
+    with mock.patch.object(MlflowClient, "log_batch", side_effect=log_batch) as log_batch_mock:
+        metrics_logger = BatchMetricsLogger(mlflow.active_run().info.run_id)
+        metrics_logger.record_metrics({"x": 1}, step=0)
+        log_batch_started.wait()
+        # Metrics recorded while the first batch is being logged are buffered
+        metrics_logger.record_metrics({"y": 2}, step=1)
+        assert [metric.key for metric in metrics_logger.data] == ["y"]
+
+        log_batch_unblocked.set()
+        metrics_logger.flush()
+        assert metrics_logger.data == []
+        assert [call[1]["metrics"][0].key for call in log_batch_mock.call_args_list] == ["x", "y"]
+
+
+def test_batch_metrics_logger_reraises_log_batch_exceptions(start_run):
+    with mock.patch.object(MlflowClient, "log_batch", side_effect=Exception("failure")):
+        metrics_logger = BatchMetricsLogger(mlflow.active_run().info.run_id)
+        metrics_logger.record_metrics({"x": 1}, step=0)
+        with pytest.raises(Exception, match="failure"):
+            metrics_logger.flush()
+    # The exception is only raised once
+    metrics_logger.flush()
+
+
+def test_batch_metrics_logger_logs_metrics_of_failed_batches_again(start_run):
+    with mock.patch.object(
+        MlflowClient, "log_batch", side_effect=[Exception("failure"), None]
+    ) as log_batch_mock:
+        metrics_logger = BatchMetricsLogger(mlflow.active_run().info.run_id)
+        metrics_logger.record_metrics({"x": 1}, step=0)
+        with pytest.raises(Exception, match="failure"):
+            metrics_logger.flush()
+        assert [metric.key for metric in metrics_logger.data] == ["x"]
+
+        metrics_logger.record_metrics({"y": 2}, step=1)
+        metrics_logger.flush()
+        assert metrics_logger.data == []
+        assert [metric.key for metric in log_batch_mock.call_args[1]["metrics"]] == ["x", "y"]
+
+
+def test_batch_metrics_logger_with_zero_target_overhead_only_logs_when_flushed(start_run):
+    with mock.patch.object(MlflowClient, "log_batch") as log_batch_mock:
+        metrics_logger = BatchMetricsLogger(
+            mlflow.active_run().info.run_id, target_overhead_percent=0
+        )
+        for step in range(3):
+            metrics_logger.record_metrics({"x": 1}, step=step)
+        log_batch_mock.assert_not_called()
+        metrics_logger.flush()
+        log_batch_mock.assert_called_once()
+        assert len(log_batch_mock.call_args[1]["metrics"]) == 3
+
+
+def test_batch_metrics_logger_respects_max_buffered_metrics(start_run):
+    with mock.patch.object(MlflowClient, "log_batch") as log_batch_mock:
+        metrics_logger = BatchMetricsLogger(
+            mlflow.active_run().info.run_id, max_buffered_metrics=3, target_overhead_percent=1
+        )
+        metrics_logger.record_metrics({"x": 1}, step=0)
+        metrics_logger._wait_for_log_batch_thread()
+        # Logging is slow compared to training, so metrics are only logged once 3 are buffered
+        metrics_logger.total_log_batch_time = 1000
+        log_batch_mock.reset_mock()
+        metrics_logger.record_metrics({"x": 1, "y": 2}, step=1)
+        metrics_logger._wait_for_log_batch_thread()
+        log_batch_mock.assert_not_called()
+        metrics_logger.record_metrics({"z": 3}, step=2)
+        metrics_logger._wait_for_log_batch_thread()
+        log_batch_mock.assert_called_once()
+        assert len(log_batch_mock.call_args[1]["metrics"]) == 3
+
+
+def test_batch_metrics_logger_respects_max_latency(start_run):
+    with mock.patch.object(MlflowClient, "log_batch") as log_batch_mock:
+        metrics_logger = BatchMetricsLogger(
+            mlflow.active_run().info.run_id, max_latency_seconds=0.5
+        )
+        metrics_logger.record_metrics({"x": 1}, step=0)
+        metrics_logger._wait_for_log_batch_thread()
+        metrics_logger.total_log_batch_time = 1000
+        log_batch_mock.reset_mock()
+        metrics_logger.record_metrics({"x": 1}, step=1)
+        metrics_logger._wait_for_log_batch_thread()
+        log_batch_mock.assert_not_called()
+        time.sleep(0.5)
+        metrics_logger.record_metrics({"x": 1}, step=2)
+        metrics_logger._wait_for_log_batch_thread()
+        log_batch_mock.assert_called_once()
+
+
+def test_batch_metrics_logger_is_configurable_with_environment_variables(monkeypatch):
+    monkeypatch.setenv("MLFLOW_AUTOLOGGING_METRICS_MAX_LATENCY_SECONDS", "1.5")
+    monkeypatch.setenv("MLFLOW_AUTOLOGGING_METRICS_MAX_BUFFERED", "100")
+    monkeypatch.setenv("MLFLOW_AUTOLOGGING_METRICS_TARGET_OVERHEAD_PERCENT", "1")
+    metrics_logger = BatchMetricsLogger("1234")
+    assert metrics_logger.max_latency_seconds == 1.5
+    assert metrics_logger.max_buffered_metrics == 100
+    assert metrics_logger.target_overhead_percent == 1
+    assert BatchMetricsLogger("1234", max_buffered_metrics=10).max_buffered_metrics == 10
+
+
+def test_batch_metrics_logger_records_its_overhead(start_run):
+    with mock.patch.object(MlflowClient, "log_batch", wraps=lambda *args, **kwargs: time.sleep(1)):
+        with batch_metrics_logger(mlflow.active_run().info.run_id) as metrics_logger:
+            for step in range(3):
+                metrics_logger.record_metrics({"x": 1}, step=step)
+                time.sleep(0.5)
+            metrics_logger.record_metrics({"x": 1}, step=3)
+            # Logging batches in the background does not slow down training
+            assert metrics_logger.total_training_time >= 1.5
+            assert metrics_logger.overhead_percent < 10
+
+
 def test_autologging_integration_calls_underlying_function_correctly():
     @autologging_integration("test_integration")
     def autolog(foo=7, disable=False, silent=False):
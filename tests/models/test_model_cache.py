@@ -0,0 +1,151 @@
+import os
+import threading
+from unittest import mock
+
+import pytest
+from click.testing import CliRunner
+
+import mlflow
+from mlflow.models import model_cache
+from mlflow.models.cli import warm_cache
+from mlflow.models.model_cache import LocalModelCache, MODEL_CACHE_DIR_ENV_VAR, resolve_model_uri
+from mlflow.tracking import artifact_utils
+from mlflow.tracking.artifact_utils import _download_model_from_uri
+
+
+def _write_model(path, content="model"):
+    os.makedirs(path, exist_ok=True)
+    with open(os.path.join(path, "MLmodel"), "w") as f:
+        f.write(content)
+    return path
+
+
+def _read_model(path):
+    with open(os.path.join(path, "MLmodel")) as f:
+        return f.read()
+
+
+@pytest.fixture
+def cache_local_models():
+    # Models on the local filesystem are not cached, so pretend that they are remote
+    with mock.patch.object(model_cache, "get_local_path_or_none", return_value=None):
+        yield
+
+
+@pytest.fixture
+def download_artifact_from_uri():
+    with mock.patch.object(
+        artifact_utils,
+        "_download_artifact_from_uri",
+        wraps=artifact_utils._download_artifact_from_uri,
+    ) as download_mock:
+        yield download_mock
+
+
+@pytest.mark.usefixtures("cache_local_models")
+def test_download_caches_models(tmpdir, download_artifact_from_uri):
+    model_path = _write_model(tmpdir.join("model").strpath)
+    cache = LocalModelCache(tmpdir.join("cache").strpath)
+
+    local_path = cache.download(model_path)
+    assert local_path.startswith(tmpdir.join("cache").strpath)
+    assert _read_model(local_path) == "model"
+    assert cache.download(model_path) == local_path
+    download_artifact_from_uri.assert_called_once()
+
+
+@pytest.mark.usefixtures("cache_local_models")
+def test_download_downloads_models_again_if_their_files_change(tmpdir):
+    model_path = _write_model(tmpdir.join("model").strpath)
+    cache = LocalModelCache(tmpdir.join("cache").strpath)
+    local_path = cache.download(model_path)
+
+    _write_model(model_path, content="new model")
+    new_local_path = cache.download(model_path)
+    assert new_local_path != local_path
+    assert _read_model(new_local_path) == "new model"
+
+
+@pytest.mark.usefixtures("cache_local_models")
+def test_download_downloads_models_once_across_concurrent_callers(
+    tmpdir, download_artifact_from_uri
+):
+    model_path = _write_model(tmpdir.join("model").strpath)
+    local_paths = []
+
+    def download():
+        cache = LocalModelCache(tmpdir.join("cache").strpath)
+        local_paths.append(cache.download(model_path))
+
+    threads = [threading.Thread(target=download) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(set(local_paths)) == 1
+    download_artifact_from_uri.assert_called_once()
+
+
+@pytest.mark.usefixtures("cache_local_models")
+def test_download_evicts_least_recently_used_models(tmpdir, monkeypatch):
+    monkeypatch.setattr(model_cache, "_MIN_EVICTION_AGE_SECONDS", 0)
+    model_paths = [_write_model(tmpdir.join(name).strpath, content="x" * 10) for name in "abc"]
+    cache = LocalModelCache(tmpdir.join("cache").strpath, max_bytes=25)
+
+    path_a = cache.download(model_paths[0])
+    path_b = cache.download(model_paths[1])
+    os.utime(os.path.dirname(os.path.dirname(path_a)), (0, 0))
+    os.utime(os.path.dirname(os.path.dirname(path_b)), (0, 0))
+    # Using the first model makes the second one the least recently used
+    cache.download(model_paths[0])
+    path_c = cache.download(model_paths[2])
+
+    assert os.path.exists(path_a)
+    assert not os.path.exists(path_b)
+    assert os.path.exists(path_c)
+
+
+def test_download_does_not_cache_local_models(tmpdir):
+    model_path = _write_model(tmpdir.join("model").strpath)
+    cache = LocalModelCache(tmpdir.join("cache").strpath)
+    assert cache.download(model_path) == model_path
+    assert os.listdir(tmpdir.join("cache").strpath) == []
+
+
+@pytest.mark.usefixtures("cache_local_models")
+def test_download_resolves_runs_uris(tmpdir):
+    model_path = _write_model(tmpdir.join("model").strpath)
+    with mlflow.start_run() as run:
+        mlflow.log_artifacts(model_path, artifact_path="model")
+    model_uri = "runs:/{}/model".format(run.info.run_id)
+    assert resolve_model_uri(model_uri) == artifact_utils.get_artifact_uri(run.info.run_id, "model")
+
+    cache = LocalModelCache(tmpdir.join("cache").strpath)
+    local_path = cache.download(model_uri)
+    assert local_path.startswith(tmpdir.join("cache").strpath)
+    assert _read_model(local_path) == "model"
+
+
+@pytest.mark.usefixtures("cache_local_models")
+def test_download_model_from_uri_uses_cache_if_enabled(tmpdir, monkeypatch):
+    model_path = _write_model(tmpdir.join("model").strpath)
+    assert not _download_model_from_uri(model_path).startswith(tmpdir.join("cache").strpath)
+
+    monkeypatch.setenv(MODEL_CACHE_DIR_ENV_VAR, tmpdir.join("cache").strpath)
+    local_path = _download_model_from_uri(model_path)
+    assert local_path.startswith(tmpdir.join("cache").strpath)
+    # Models are downloaded to the output path if specified
+    output_path = tmpdir.mkdir("output").strpath
+    assert _download_model_from_uri(model_path, output_path=output_path).startswith(output_path)
+
+
+@pytest.mark.usefixtures("cache_local_models")
+def test_warm_cache_cli(tmpdir):
+    model_path = _write_model(tmpdir.join("model").strpath)
+    cache_dir = tmpdir.join("cache").strpath
+    result = CliRunner().invoke(warm_cache, ["-m", model_path, "--cache-dir", cache_dir])
+    assert result.exit_code == 0, result.output
+    local_path = result.output.strip()
+    assert local_path.startswith(cache_dir)
+    assert LocalModelCache(cache_dir).download(model_path) == local_path
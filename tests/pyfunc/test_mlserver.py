@@ -24,6 +24,10 @@ from mlflow.pyfunc.mlserver import get_cmd, MLServerMLflowRuntime, MLServerDefau
             {"MLSERVER_HTTP_PORT": "5000", "MLSERVER_MODEL_PARALLEL_WORKERS": "4"},
         ),
         ({"port": 5000}, {"MLSERVER_HTTP_PORT": "5000"}),
+        (
+            {"max_batch_size": 32, "max_batch_delay_ms": 5},
+            {"MLSERVER_MODEL_MAX_BATCH_SIZE": "32", "MLSERVER_MODEL_MAX_BATCH_TIME": "0.005"},
+        ),
         ({}, {}),
     ],
 )
@@ -2,6 +2,7 @@ import os
 import pickle
 import yaml
 import re
+from unittest import mock
 
 import numpy as np
 import pandas as pd
@@ -519,6 +520,89 @@ def test_missing_value_hint_is_displayed_when_it_should():
     assert hint not in str(ex.value.message)
 
 
+def test_column_schema_enforcement_does_not_convert_conforming_input():
+    m = Model()
+    input_schema = Schema([ColSpec("long", "a"), ColSpec("double", "b"), ColSpec("string", "c")])
+    m.signature = ModelSignature(inputs=input_schema)
+    pyfunc_model = PyFuncModel(model_meta=m, model_impl=TestModel())
+    pdf = pd.DataFrame({"a": [1, 2], "b": [1.5, 2.5], "c": ["x", "y"]})
+    res = pyfunc_model.predict(pdf)
+    pd.testing.assert_frame_equal(res, pdf)
+    assert res is not pdf
+    # Adding columns to the enforced input does not modify the caller's DataFrame
+    res["d"] = 0
+    assert list(pdf.columns) == ["a", "b", "c"]
+
+    # Extra columns are dropped and the columns are reordered without converting them
+    pdf_extra = pd.DataFrame({"c": ["x", "y"], "d": [0, 0], "b": [1.5, 2.5], "a": [1, 2]})
+    pd.testing.assert_frame_equal(pyfunc_model.predict(pdf_extra), pdf)
+
+    # Only the columns that do not conform to the schema are converted
+    pdf_int32 = pdf.astype({"a": np.int32})
+    res = pyfunc_model.predict(pdf_int32)
+    pd.testing.assert_frame_equal(res, pdf)
+    assert res is not pdf_int32
+    assert pdf_int32["a"].dtype == np.int32
+
+
+def test_column_schema_enforcement_plan_is_compiled_once_per_input_signature():
+    m = Model()
+    m.signature = ModelSignature(inputs=Schema([ColSpec("long", "a"), ColSpec("double", "b")]))
+    pyfunc_model = PyFuncModel(model_meta=m, model_impl=TestModel())
+    plan = pyfunc_model._get_col_schema_plan(m.get_input_schema())
+    pdf = pd.DataFrame({"a": np.array([1, 2], np.int32), "b": np.array([1, 2], np.int32)})
+
+    with mock.patch(
+        "mlflow.pyfunc._enforce_mlflow_datatype", wraps=mlflow.pyfunc._enforce_mlflow_datatype
+    ) as enforce_mock:
+        expected = pd.DataFrame({"a": [1, 2], "b": [1.0, 2.0]})
+        for _ in range(3):
+            pd.testing.assert_frame_equal(pyfunc_model.predict(pdf), expected)
+        assert enforce_mock.call_count == 2
+        pyfunc_model.predict(pdf.astype({"b": np.float64}))
+        assert enforce_mock.call_count == 4
+    assert pyfunc_model._get_col_schema_plan(m.get_input_schema()) is plan
+
+    # The plan is compiled again if the signature of the model changes
+    m.signature = ModelSignature(inputs=Schema([ColSpec("double", "a")]))
+    pd.testing.assert_frame_equal(pyfunc_model.predict(pdf), pd.DataFrame({"a": [1.0, 2.0]}))
+    assert pyfunc_model._get_col_schema_plan(m.get_input_schema()) is not plan
+
+
+def test_column_schema_enforcement_plan_matches_enforcement_without_plan():
+    input_schema = Schema(
+        [
+            ColSpec("integer", "a"),
+            ColSpec("long", "b"),
+            ColSpec("float", "c"),
+            ColSpec("double", "d"),
+            ColSpec("boolean", "e"),
+            ColSpec("string", "f"),
+            ColSpec("binary", "g"),
+            ColSpec("datetime", "h"),
+        ]
+    )
+    pdf = pd.DataFrame(
+        {
+            "a": np.array([1, 2], np.int16),
+            "b": np.array([1, 2], np.uint32),
+            "c": np.array([1.5, 2.5], np.float32),
+            "d": np.array([1, 2], np.uint16),
+            "e": np.array([True, False], np.object),
+            "f": ["x", None],
+            "g": [b"x", b"y"],
+            "h": np.array(["2021-01-01", "2021-01-02"], np.object),
+        }
+    )
+    plan = mlflow.pyfunc._ColSchemaEnforcementPlan(input_schema)
+    expected = mlflow.pyfunc._enforce_col_schema(pdf, input_schema)
+    pd.testing.assert_frame_equal(plan.enforce(pdf), expected)
+    pd.testing.assert_frame_equal(plan.enforce(pdf), expected)
+
+    with pytest.raises(MlflowException, match="Can not safely convert float64 to int32"):
+        plan.enforce(pdf.astype({"a": np.float64}))
+
+
 def test_column_schema_enforcement_no_col_names():
     m = Model()
     input_schema = Schema([ColSpec("double"), ColSpec("double"), ColSpec("double")])
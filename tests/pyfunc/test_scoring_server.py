@@ -1,3 +1,4 @@
+import io
 import json
 import math
 import numpy as np
@@ -5,6 +6,7 @@ import os
 import pandas as pd
 from collections import namedtuple, OrderedDict
 from packaging.version import Version
+from unittest import mock
 
 import pytest
 import random
@@ -564,7 +566,7 @@ def test_split_oriented_json_to_numpy_array():
 
 
 def test_get_jsonnable_obj():
-    from mlflow.pyfunc.scoring_server import _get_jsonable_obj
+    from mlflow.utils.proto_json_utils import _get_jsonable_obj
 
     py_ary = [["a", "b", "c"], ["e", "f", "g"]]
     np_ary = _get_jsonable_obj(np.array(py_ary))
@@ -605,6 +607,9 @@ def test_parse_json_input_including_path():
         ({"port": 5000, "nworkers": 4}, "--timeout=60 -w 4"),
         ({"nworkers": 4}, "--timeout=60 -w 4"),
         ({}, "--timeout=60"),
+        ({"nworkers": 4, "max_batch_size": 8}, "--timeout=60 -w 4 --threads 8"),
+        ({"nworkers": 4, "max_batch_size": 1000}, "--timeout=60 -w 4 --threads 32"),
+        ({"nworkers": 4, "preload_model": True}, "--timeout=60 -w 4 --preload"),
     ],
 )
 def test_get_cmd(args: dict, expected: str):
@@ -613,3 +618,165 @@ def test_get_cmd(args: dict, expected: str):
     assert cmd == (
         f"gunicorn {expected} ${{GUNICORN_CMD_ARGS}} -- mlflow.pyfunc.scoring_server.wsgi:app"
     )
+
+
+def test_get_cmd_passes_batching_config_to_server():
+    _, env = get_cmd(model_uri="foo", max_batch_size=32, max_batch_delay_ms=5)
+    assert env["MLFLOW_SCORING_SERVER_MAX_BATCH_SIZE"] == "32"
+    assert env["MLFLOW_SCORING_SERVER_MAX_BATCH_DELAY_MS"] == "5"
+
+
+def test_get_cmd_passes_preload_config_to_server():
+    _, env = get_cmd(model_uri="foo", preload_model=True)
+    assert env["MLFLOW_SCORING_SERVER_PRELOAD_MODEL"] == "true"
+
+
+def _init_server_with_mock_model(predict_fn):
+    model = mock.Mock()
+    model.metadata.get_input_schema.return_value = None
+    model.predict.side_effect = predict_fn
+    return model, pyfunc_scoring_server.init(model)
+
+
+def test_scoring_server_accepts_and_returns_arrow_and_parquet():
+    import pyarrow
+    import pyarrow.parquet
+
+    model, app = _init_server_with_mock_model(lambda data: data[["a"]] + 1)
+    df = pd.DataFrame({"a": [1, 2], "b": ["x", "y"]})
+    table = pyarrow.Table.from_pandas(df, preserve_index=False)
+    arrow_stream = io.BytesIO()
+    with pyarrow.ipc.new_stream(arrow_stream, table.schema) as writer:
+        writer.write_table(table)
+    parquet_file = io.BytesIO()
+    pyarrow.parquet.write_table(table, parquet_file)
+
+    with app.test_client() as client:
+        response = client.post(
+            "/invocations",
+            data=arrow_stream.getvalue(),
+            headers={
+                "Content-Type": pyfunc_scoring_server.CONTENT_TYPE_ARROW_STREAM,
+                "Accept": pyfunc_scoring_server.CONTENT_TYPE_ARROW_STREAM,
+            },
+        )
+        assert response.status_code == 200
+        assert response.mimetype == pyfunc_scoring_server.CONTENT_TYPE_ARROW_STREAM
+        predictions = pyarrow.ipc.open_stream(response.data).read_pandas()
+        pd.testing.assert_frame_equal(predictions, pd.DataFrame({"a": [2, 3]}))
+
+        response = client.post(
+            "/invocations",
+            data=parquet_file.getvalue(),
+            headers={
+                "Content-Type": pyfunc_scoring_server.CONTENT_TYPE_PARQUET,
+                "Accept": pyfunc_scoring_server.CONTENT_TYPE_PARQUET,
+            },
+        )
+        assert response.status_code == 200
+        predictions = pd.read_parquet(io.BytesIO(response.data))
+        pd.testing.assert_frame_equal(predictions, pd.DataFrame({"a": [2, 3]}))
+
+    pd.testing.assert_frame_equal(model.predict.call_args_list[0][0][0], df)
+    pd.testing.assert_frame_equal(model.predict.call_args_list[1][0][0], df)
+
+
+def test_scoring_server_passes_numpy_inputs_to_model_without_dataframe():
+    model, app = _init_server_with_mock_model(lambda data: data)
+    arr = np.arange(24, dtype=np.float32).reshape(2, 3, 4)
+    npy_input = io.BytesIO()
+    np.save(npy_input, arr)
+    npz_input = io.BytesIO()
+    np.savez(npz_input, x=arr, y=arr[:, 0])
+
+    with app.test_client() as client:
+        response = client.post(
+            "/invocations",
+            data=npy_input.getvalue(),
+            headers={
+                "Content-Type": pyfunc_scoring_server.CONTENT_TYPE_NPY,
+                "Accept": pyfunc_scoring_server.CONTENT_TYPE_NPY,
+            },
+        )
+        assert response.status_code == 200
+        predictions = np.load(io.BytesIO(response.data))
+        assert predictions.dtype == np.float32
+        np.testing.assert_array_equal(predictions, arr)
+        assert isinstance(model.predict.call_args[0][0], np.ndarray)
+
+        response = client.post(
+            "/invocations",
+            data=npz_input.getvalue(),
+            headers={
+                "Content-Type": pyfunc_scoring_server.CONTENT_TYPE_NPZ,
+                "Accept": pyfunc_scoring_server.CONTENT_TYPE_NPZ,
+            },
+        )
+        assert response.status_code == 200
+        with np.load(io.BytesIO(response.data)) as predictions:
+            np.testing.assert_array_equal(predictions["x"], arr)
+            np.testing.assert_array_equal(predictions["y"], arr[:, 0])
+
+        # Multiple outputs cannot be returned as a single array
+        response = client.post(
+            "/invocations",
+            data=npz_input.getvalue(),
+            headers={
+                "Content-Type": pyfunc_scoring_server.CONTENT_TYPE_NPZ,
+                "Accept": pyfunc_scoring_server.CONTENT_TYPE_NPY,
+            },
+        )
+        assert response.status_code == 400
+        assert pyfunc_scoring_server.CONTENT_TYPE_NPZ in json.loads(response.data)["message"]
+
+
+def test_scoring_server_negotiates_response_content_type():
+    _, app = _init_server_with_mock_model(lambda data: (data["a"] + 1).to_numpy())
+    data = pd.DataFrame({"a": [1, 2]}).to_json(orient="split")
+
+    with app.test_client() as client:
+        for accept in [None, "", "*/*", "application/json", "text/html, application/json;q=0.5"]:
+            headers = {"Content-Type": pyfunc_scoring_server.CONTENT_TYPE_JSON}
+            if accept is not None:
+                headers["Accept"] = accept
+            response = client.post("/invocations", data=data, headers=headers)
+            assert response.status_code == 200
+            assert response.mimetype == pyfunc_scoring_server.CONTENT_TYPE_JSON
+            assert response.json == [2, 3]
+
+        response = client.post(
+            "/invocations",
+            data=data,
+            headers={
+                "Content-Type": pyfunc_scoring_server.CONTENT_TYPE_JSON,
+                "Accept": "application/x-npy;q=0.5, application/json;q=0.1",
+            },
+        )
+        assert response.status_code == 200
+        assert np.load(io.BytesIO(response.data)).tolist() == [2, 3]
+
+        response = client.post(
+            "/invocations",
+            data=data,
+            headers={
+                "Content-Type": pyfunc_scoring_server.CONTENT_TYPE_JSON,
+                "Accept": "text/html",
+            },
+        )
+        assert response.status_code == 406
+
+
+def test_scoring_server_responds_to_invalid_npy_input_with_error_code():
+    _, app = _init_server_with_mock_model(lambda data: data)
+    object_array = io.BytesIO()
+    np.save(object_array, np.array([{"a": 1}], dtype=object))
+
+    with app.test_client() as client:
+        for data in [b"not a numpy array", object_array.getvalue()]:
+            response = client.post(
+                "/invocations",
+                data=data,
+                headers={"Content-Type": pyfunc_scoring_server.CONTENT_TYPE_NPY},
+            )
+            assert response.status_code == 400
+            assert json.loads(response.data)["error_code"] == ErrorCode.Name(BAD_REQUEST)
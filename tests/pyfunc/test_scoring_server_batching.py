@@ -0,0 +1,156 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import mlflow.pyfunc.scoring_server as pyfunc_scoring_server
+from mlflow.pyfunc.scoring_server.batching import (
+    BatchSizeHistogram,
+    PredictionBatcher,
+    get_batching_config_from_env,
+)
+
+
+class _RecordingModel:
+    def __init__(self, predict_fn=None):
+        self.inputs = []
+        self._predict_fn = predict_fn or (lambda data: data.sum(axis=1))
+        self._lock = threading.Lock()
+
+    def predict(self, data):
+        with self._lock:
+            self.inputs.append(data)
+        return self._predict_fn(data)
+
+
+def _predict_concurrently(batcher, inputs):
+    with ThreadPoolExecutor(max_workers=len(inputs)) as executor:
+        futures = [executor.submit(batcher.predict, data) for data in inputs]
+        return [future.result() for future in futures]
+
+
+def test_prediction_batcher_merges_concurrent_dataframe_inputs():
+    model = _RecordingModel()
+    batcher = PredictionBatcher(model.predict, max_batch_size=8, max_batch_delay_ms=1000)
+    inputs = [pd.DataFrame({"a": [i, i + 1], "b": [10 * i, 10 * i]}) for i in range(4)]
+
+    predictions = _predict_concurrently(batcher, inputs)
+
+    # All inputs are merged into a single batch since it fills up before the delay expires
+    assert len(model.inputs) == 1
+    assert len(model.inputs[0]) == 8
+    for data, prediction in zip(inputs, predictions):
+        pd.testing.assert_series_equal(prediction, data.sum(axis=1))
+
+
+def test_prediction_batcher_limits_batch_size_and_merges_numpy_inputs():
+    model = _RecordingModel()
+    batcher = PredictionBatcher(model.predict, max_batch_size=4, max_batch_delay_ms=50)
+    inputs = [np.full((2, 3), i) for i in range(6)]
+
+    predictions = _predict_concurrently(batcher, inputs)
+
+    assert all(len(data) <= 4 for data in model.inputs)
+    assert sum(len(data) for data in model.inputs) == 12
+    for data, prediction in zip(inputs, predictions):
+        np.testing.assert_array_equal(prediction, data.sum(axis=1))
+
+
+def test_prediction_batcher_does_not_merge_incompatible_inputs():
+    model = _RecordingModel(lambda data: np.zeros(len(data)))
+    batcher = PredictionBatcher(model.predict, max_batch_size=8, max_batch_delay_ms=50)
+    inputs = [pd.DataFrame({"a": [1]}), pd.DataFrame({"b": [1]}), pd.DataFrame({"a": [1.5]})]
+
+    _predict_concurrently(batcher, inputs)
+
+    assert sorted(len(data) for data in model.inputs) == [1, 1, 1]
+
+
+def test_prediction_batcher_predicts_inputs_separately_if_batch_fails():
+    def predict(data):
+        if (data["a"] < 0).any():
+            raise ValueError("Negative input")
+        return data["a"] * 2
+
+    batcher = PredictionBatcher(predict, max_batch_size=3, max_batch_delay_ms=1000)
+    inputs = [pd.DataFrame({"a": [1]}), pd.DataFrame({"a": [-1]}), pd.DataFrame({"a": [2]})]
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [executor.submit(batcher.predict, data) for data in inputs]
+        assert futures[0].result().tolist() == [2]
+        with pytest.raises(ValueError, match="Negative input"):
+            futures[1].result()
+        assert futures[2].result().tolist() == [4]
+
+
+def test_prediction_batcher_predicts_inputs_separately_if_predictions_cannot_be_split():
+    model = _RecordingModel(lambda data: "summary of %d rows" % len(data))
+    batcher = PredictionBatcher(model.predict, max_batch_size=2, max_batch_delay_ms=1000)
+
+    predictions = _predict_concurrently(batcher, [pd.DataFrame({"a": [1]})] * 2)
+
+    assert predictions == ["summary of 1 rows"] * 2
+    assert [len(data) for data in model.inputs] == [2, 1, 1]
+
+
+def test_scoring_server_batches_requests_and_exposes_batch_size_metrics(monkeypatch):
+    monkeypatch.setenv("MLFLOW_SCORING_SERVER_MAX_BATCH_SIZE", "4")
+    model = mock.Mock()
+    model.metadata.get_input_schema.return_value = None
+    model.predict.side_effect = lambda data: data["a"] + 1
+    app = pyfunc_scoring_server.init(model)
+
+    with app.test_client() as client:
+        response = client.post(
+            "/invocations",
+            data=pd.DataFrame({"a": [1, 2]}).to_json(orient="split"),
+            headers={"Content-Type": "application/json; format=pandas-split"},
+        )
+        assert response.status_code == 200
+        assert response.json == [{"a": 2}, {"a": 3}]
+
+        response = client.get("/metrics")
+        assert response.status_code == 200
+        assert "mlflow_scoring_server_batch_size_count 1" in response.get_data(as_text=True)
+
+
+def test_batch_size_histogram_to_prometheus():
+    histogram = BatchSizeHistogram(max_batch_size=6)
+    for batch_size in [1, 3, 6]:
+        histogram.observe(batch_size)
+
+    assert histogram.to_prometheus("batch_size") == (
+        "# TYPE batch_size histogram\n"
+        'batch_size_bucket{le="1"} 1\n'
+        'batch_size_bucket{le="2"} 1\n'
+        'batch_size_bucket{le="4"} 2\n'
+        'batch_size_bucket{le="6"} 3\n'
+        'batch_size_bucket{le="+Inf"} 3\n'
+        "batch_size_sum 10\n"
+        "batch_size_count 3\n"
+    )
+
+
+@pytest.mark.parametrize(
+    ("env", "expected"),
+    [
+        ({}, (None, None)),
+        ({"MLFLOW_SCORING_SERVER_MAX_BATCH_SIZE": "1"}, (None, None)),
+        ({"MLFLOW_SCORING_SERVER_MAX_BATCH_SIZE": "32"}, (32, 10.0)),
+        (
+            {
+                "MLFLOW_SCORING_SERVER_MAX_BATCH_SIZE": "32",
+                "MLFLOW_SCORING_SERVER_MAX_BATCH_DELAY_MS": "2.5",
+            },
+            (32, 2.5),
+        ),
+    ],
+)
+def test_get_batching_config_from_env(monkeypatch, env, expected):
+    monkeypatch.delenv("MLFLOW_SCORING_SERVER_MAX_BATCH_SIZE", raising=False)
+    monkeypatch.delenv("MLFLOW_SCORING_SERVER_MAX_BATCH_DELAY_MS", raising=False)
+    for key, value in env.items():
+        monkeypatch.setenv(key, value)
+    assert get_batching_config_from_env() == expected
@@ -0,0 +1,181 @@
+import base64
+import json
+import math
+import os
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import mlflow.pyfunc.scoring_server as pyfunc_scoring_server
+from mlflow.pyfunc.scoring_server.parsing import (
+    decode_base64_column,
+    dataframe_from_decoded_json,
+    decode_json,
+)
+from mlflow.types import ColSpec, Schema, TensorSpec
+from mlflow.utils.proto_json_utils import NumpyEncoder, _dataframe_from_json
+
+
+@pytest.fixture
+def pandas_df_with_all_types():
+    pdf = pd.DataFrame(
+        {
+            "boolean": [True, False, True],
+            "integer": np.array([1, 2, 3], np.int32),
+            "long": np.array([1, 2, 3], np.int64),
+            "float": np.array([math.pi, 2 * math.pi, 3 * math.pi], np.float32),
+            "double": [math.pi, 2 * math.pi, 3 * math.pi],
+            "binary": [os.urandom(100), b"", os.urandom(5)],
+            "string": ["a", "b", "c"],
+        }
+    )
+    return pdf
+
+
+@pytest.mark.parametrize("encode", [base64.encodebytes, base64.b64encode])
+def test_decode_base64_column_matches_base64_module(encode):
+    values = [os.urandom(n) for n in range(200)]
+    encoded = [encode(v).decode("ascii") for v in values]
+    assert decode_base64_column(encoded) == values
+    assert decode_base64_column([]) == []
+
+
+def test_decode_base64_column_falls_back_to_base64_module_for_irregular_values():
+    values = ["YWI=", "YWJj\x00", "YW\tJj", "YWJjZA=\n="]
+    assert decode_base64_column(values) == [base64.decodebytes(bytes(v, "utf8")) for v in values]
+    with pytest.raises(TypeError, match="encoding without a string argument"):
+        decode_base64_column(["YWI=", None])
+
+
+@pytest.mark.parametrize("orient", ["split", "records"])
+def test_dataframe_from_decoded_json_matches_pandas_parsing(pandas_df_with_all_types, orient):
+    schema = Schema([ColSpec(c, c) for c in pandas_df_with_all_types.columns])
+    json_str = json.dumps(pandas_df_with_all_types.to_dict(orient=orient), cls=NumpyEncoder)
+
+    for s in [schema, None]:
+        df = dataframe_from_decoded_json(decode_json(json_str), orient=orient, schema=s)
+        expected = _dataframe_from_json(json_str, pandas_orient=orient, schema=s)
+        pd.testing.assert_frame_equal(df, expected, check_index_type=False, check_exact=True)
+
+    df = dataframe_from_decoded_json(decode_json(json_str), orient=orient, schema=schema)
+    assert list(df["binary"]) == list(pandas_df_with_all_types["binary"])
+
+
+def test_dataframe_from_decoded_json_matches_pandas_float_parsing():
+    values = np.random.RandomState(0).standard_normal(1000) * 10.0 ** np.tile(
+        np.arange(-100, 100), 5
+    )
+    json_str = json.dumps({"columns": ["a"], "data": [[x] for x in values.tolist()]})
+    schema = Schema([ColSpec("double", "a")])
+
+    for s in [schema, None]:
+        df = dataframe_from_decoded_json(decode_json(json_str), orient="split", schema=s)
+        expected = _dataframe_from_json(json_str, pandas_orient="split", schema=s)
+        pd.testing.assert_frame_equal(df, expected, check_index_type=False, check_exact=True)
+
+
+def test_decode_json_returns_none_for_invalid_json():
+    assert decode_json('{"a": 1') is None
+    assert decode_json("/path/to/file.json") is None
+
+
+def test_decode_json_returns_none_if_pandas_decoder_is_unavailable():
+    json_str = json.dumps({"columns": ["a"], "data": [[1], [2]]})
+    with mock.patch("mlflow.pyfunc.scoring_server.parsing._pandas_json_loads", None):
+        assert decode_json(json_str) is None
+        df = pyfunc_scoring_server.infer_and_parse_json_input(json_str)
+    pd.testing.assert_frame_equal(df, pd.DataFrame({"a": [1, 2]}))
+
+
+@pytest.mark.parametrize("applies_extension_dtypes", [True, False])
+def test_dataframe_from_decoded_json_matches_pandas_string_column_parsing(
+    applies_extension_dtypes,
+):
+    schema = Schema([ColSpec("string", "a"), ColSpec("string", "b")])
+    json_str = json.dumps({"columns": ["a", "b"], "data": [[1, "x"], [2, None]]})
+    with mock.patch(
+        "mlflow.pyfunc.scoring_server.parsing._read_json_applies_extension_dtypes",
+        return_value=applies_extension_dtypes,
+    ):
+        df = dataframe_from_decoded_json(decode_json(json_str), orient="split", schema=schema)
+    if applies_extension_dtypes:
+        assert list(df["a"]) == ["1", "2"]
+    else:
+        # String columns are left as they are inferred, so that schema enforcement rejects the
+        # integer values
+        assert df["a"].dtype == np.int64
+        assert df["b"].dtype == object
+        assert list(df["b"]) == ["x", None]
+
+    df = dataframe_from_decoded_json(decode_json(json_str), orient="split", schema=schema)
+    expected = _dataframe_from_json(json_str, pandas_orient="split", schema=schema)
+    pd.testing.assert_frame_equal(df, expected, check_index_type=False)
+
+
+def test_dataframe_from_decoded_json_matches_pandas_type_coercion():
+    json_str = json.dumps(
+        {
+            "columns": ["a", "b", "c", "d"],
+            "index": [5, 6],
+            "data": [[1.5, 1, "x", 1], [2.0, None, None, "y"]],
+        }
+    )
+    schema = Schema([ColSpec("integer", "a"), ColSpec("long", "b"), ColSpec("boolean", "d")])
+    df = dataframe_from_decoded_json(decode_json(json_str), orient="split", schema=schema)
+    assert df is None
+
+    schema = Schema(schema.inputs + [ColSpec("string", "c")])
+    df = dataframe_from_decoded_json(decode_json(json_str), orient="split", schema=schema)
+    expected = _dataframe_from_json(json_str, pandas_orient="split", schema=schema)
+    pd.testing.assert_frame_equal(df, expected, check_index_type=False)
+
+    schema = Schema([TensorSpec(np.dtype(np.float32), (-1,))])
+    json_str = json.dumps({"columns": ["a", "b"], "data": [[1, 2], [3, 4]]})
+    df = dataframe_from_decoded_json(decode_json(json_str), orient="split", schema=schema)
+    expected = _dataframe_from_json(json_str, pandas_orient="split", schema=schema)
+    pd.testing.assert_frame_equal(df, expected, check_index_type=False)
+
+
+@pytest.mark.parametrize(
+    ("decoded_input", "orient"),
+    [
+        ({"columns": ["created_at"], "data": [[1]]}, "split"),
+        ({"columns": ["0", "1"], "data": [[1, 2]]}, "split"),
+        ({"columns": ["a"], "index": ["x"], "data": [[1]]}, "split"),
+        ({"columns": ["a"], "index": [1600000000], "data": [[1]]}, "split"),
+        ({"columns": ["a", "a"], "data": [[1, 2]]}, "split"),
+        ({"columns": ["a"], "data": [[1, 2]]}, "split"),
+        ({"columns": ["a"], "data": [[1]], "dtypes": ["int"]}, "split"),
+        ([{"a": 1}, {"b": 2}], "records"),
+        ([{"a": 1}, 2], "records"),
+        ([], "records"),
+    ],
+)
+def test_dataframe_from_decoded_json_defers_unsupported_payloads_to_pandas(decoded_input, orient):
+    assert dataframe_from_decoded_json(decoded_input, orient=orient) is None
+
+
+def test_infer_and_parse_json_input_decodes_payload_once(pandas_df_with_all_types):
+    schema = Schema([ColSpec(c, c) for c in pandas_df_with_all_types.columns])
+    json_str = json.dumps(pandas_df_with_all_types.to_dict(orient="split"), cls=NumpyEncoder)
+
+    with mock.patch("pandas.read_json") as read_json_mock:
+        df = pyfunc_scoring_server.infer_and_parse_json_input(json_str, schema)
+        read_json_mock.assert_not_called()
+    assert list(df.columns) == list(pandas_df_with_all_types.columns)
+    assert df["integer"].dtype == np.int32
+    assert list(df["binary"]) == list(pandas_df_with_all_types["binary"])
+
+    # TF serving inputs are parsed from the same decoded payload
+    json_str = json.dumps({"instances": [{"a": 1.5}, {"a": 2.5}]})
+    with mock.patch("json.loads") as loads_mock:
+        data = pyfunc_scoring_server.infer_and_parse_json_input(json_str)
+        loads_mock.assert_not_called()
+    np.testing.assert_array_equal(data["a"], np.array([1.5, 2.5]))
+
+    # Payloads that are not handled by the fast path are still parsed with pandas
+    json_str = json.dumps({"columns": ["timestamp"], "data": [[1600000000]]})
+    df = pyfunc_scoring_server.parse_json_input(json_str, orient="split")
+    assert df["timestamp"].dtype.kind == "M"
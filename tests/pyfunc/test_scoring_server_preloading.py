@@ -0,0 +1,88 @@
+import gc
+import sys
+from unittest import mock
+
+import pytest
+
+import mlflow.pyfunc.scoring_server as pyfunc_scoring_server
+from mlflow.pyfunc.scoring_server import preloading
+
+
+@pytest.fixture(autouse=True)
+def reset_model_load_stats():
+    yield
+    preloading._model_load_stats.clear()
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="Requires procfs")
+def test_get_memory_usage():
+    memory_usage = preloading.get_memory_usage()
+    assert memory_usage["rss"] > 0
+    assert memory_usage["shared"] <= memory_usage["rss"]
+
+
+def test_load_server_model_in_worker(monkeypatch):
+    monkeypatch.delenv(preloading.PRELOAD_MODEL_ENV_KEY, raising=False)
+    model = mock.Mock()
+    with mock.patch("mlflow.pyfunc.load_model", return_value=model) as load_model_mock, mock.patch(
+        "gc.freeze"
+    ) as freeze_mock, mock.patch("os.register_at_fork") as register_at_fork_mock:
+        assert preloading.load_server_model("model_uri") is model
+
+    load_model_mock.assert_called_once_with("model_uri")
+    freeze_mock.assert_not_called()
+    register_at_fork_mock.assert_not_called()
+    assert preloading._model_load_stats["preloaded"] is False
+
+
+def test_load_server_model_preloads_model_and_freezes_gc(monkeypatch):
+    monkeypatch.setenv(preloading.PRELOAD_MODEL_ENV_KEY, "true")
+    freeze_mock = mock.Mock()
+    register_at_fork_mock = mock.Mock()
+    monkeypatch.setattr("gc.freeze", freeze_mock, raising=False)
+    monkeypatch.setattr("os.register_at_fork", register_at_fork_mock, raising=False)
+    with mock.patch("mlflow.pyfunc.load_model"):
+        preloading.load_server_model("model_uri")
+
+    freeze_mock.assert_called_once_with()
+    register_at_fork_mock.assert_called_once_with(after_in_child=preloading._log_worker_stats)
+    assert preloading._model_load_stats["preloaded"] is True
+    assert gc.isenabled()
+
+
+def test_load_server_model_preloads_model_without_gc_freeze(monkeypatch):
+    # `gc.freeze()` and `os.register_at_fork()` are not available in Python 3.6
+    monkeypatch.setenv(preloading.PRELOAD_MODEL_ENV_KEY, "true")
+    monkeypatch.delattr("gc.freeze", raising=False)
+    monkeypatch.delattr("os.register_at_fork", raising=False)
+    with mock.patch("mlflow.pyfunc.load_model"):
+        preloading.load_server_model("model_uri")
+
+    assert preloading._model_load_stats["preloaded"] is True
+    assert gc.isenabled()
+
+
+def test_load_server_model_reenables_gc_if_loading_fails(monkeypatch):
+    monkeypatch.setenv(preloading.PRELOAD_MODEL_ENV_KEY, "true")
+    with mock.patch("mlflow.pyfunc.load_model", side_effect=Exception("Failed to load")):
+        with pytest.raises(Exception, match="Failed to load"):
+            preloading.load_server_model("model_uri")
+
+    assert gc.isenabled()
+
+
+def test_scoring_server_exposes_worker_stats_metrics(monkeypatch):
+    monkeypatch.delenv(preloading.PRELOAD_MODEL_ENV_KEY, raising=False)
+    with mock.patch("mlflow.pyfunc.load_model"):
+        model = preloading.load_server_model("model_uri")
+    model.metadata.get_input_schema.return_value = None
+    app = pyfunc_scoring_server.init(model)
+
+    with app.test_client() as client:
+        response = client.get("/metrics")
+        assert response.status_code == 200
+        metrics = response.get_data(as_text=True)
+        assert 'mlflow_scoring_server_model_load_seconds{process="worker"}' in metrics
+        assert "mlflow_scoring_server_batch_size" not in metrics
+        if sys.platform.startswith("linux"):
+            assert 'mlflow_scoring_server_worker_memory_bytes{type="rss"}' in metrics
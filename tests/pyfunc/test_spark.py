@@ -268,3 +268,76 @@ def test_model_cache(spark, model_path):
     # Running again should see no newly-loaded models.
     results2 = spark.sparkContext.parallelize(range(100), 30).map(get_model).collect()
     assert min(results2) > 0
+
+
+@pytest.mark.large
+def test_model_cache_extracts_model_once_per_executor(spark, model_path):
+    mlflow.pyfunc.save_model(
+        path=model_path,
+        loader_module=__name__,
+        code_path=[os.path.dirname(tests.__file__)],
+    )
+
+    archive_path = SparkModelCache.add_local_model(spark, model_path)
+    local_path = SparkModelCache._get_or_extract(archive_path)
+    assert os.path.exists(os.path.join(local_path, "MLmodel"))
+    assert SparkModelCache._get_or_extract(archive_path) == local_path
+
+    def get_extracted_model_path(_):
+        return SparkModelCache._get_or_extract(archive_path)
+
+    # The Python workers of each of the 2 executors share a single copy of the model files
+    results = spark.sparkContext.parallelize(range(100), 30).map(get_extracted_model_path).collect()
+    assert len(set(results)) <= 2
+
+
+@pytest.mark.large
+def test_model_cache_extracts_identical_archives_once(spark, model_path):
+    mlflow.pyfunc.save_model(
+        path=model_path,
+        loader_module=__name__,
+        code_path=[os.path.dirname(tests.__file__)],
+    )
+
+    archive_path1 = SparkModelCache.add_local_model(spark, model_path)
+    archive_path2 = SparkModelCache.add_local_model(spark, model_path)
+    assert archive_path1 != archive_path2
+    assert SparkModelCache._get_or_extract(archive_path1) == SparkModelCache._get_or_extract(
+        archive_path2
+    )
+
+
+@pytest.mark.large
+def test_model_cache_evicts_least_recently_used_models(spark, tmpdir, monkeypatch):
+    archive_paths = []
+    for i in range(3):
+        model_path = os.path.join(str(tmpdir), "model{}".format(i))
+        mlflow.pyfunc.save_model(
+            path=model_path,
+            loader_module=__name__,
+            code_path=[os.path.dirname(tests.__file__)],
+        )
+        # Make the archives of the models differ
+        with open(os.path.join(model_path, "model_id"), "w") as f:
+            f.write(str(i))
+        archive_paths.append(SparkModelCache.add_local_model(spark, model_path))
+
+    monkeypatch.setenv("MLFLOW_SPARK_MODEL_CACHE_SIZE", "2")
+    stats = SparkModelCache.get_stats()
+    SparkModelCache.get_or_load(archive_paths[0])
+    SparkModelCache.get_or_load(archive_paths[1])
+    SparkModelCache.get_or_load(archive_paths[0])
+    SparkModelCache.get_or_load(archive_paths[2])
+    extracted_path1 = os.path.join(
+        SparkModelCache._get_extracted_models_dir(), SparkModelCache._get_digest(archive_paths[1])
+    )
+
+    new_stats = SparkModelCache.get_stats()
+    assert new_stats["hits"] - stats["hits"] == 1
+    assert new_stats["misses"] - stats["misses"] == 3
+    assert new_stats["evictions"] - stats["evictions"] >= 1
+    assert new_stats["models"] <= 2
+    assert archive_paths[0] in SparkModelCache._models
+    assert archive_paths[1] not in SparkModelCache._models
+    # The files of the evicted model are deleted once no Python worker uses them anymore
+    assert not os.path.exists(extracted_path1)
@@ -0,0 +1,25 @@
+import pytest
+
+from mlflow.exceptions import MlflowException
+from mlflow.pyfunc.utils import (
+    INFERENCE_BATCH_SIZE_ENV_VAR,
+    _get_batch_slices,
+    _get_inference_batch_size,
+)
+
+
+def test_get_batch_slices():
+    assert _get_batch_slices(5, None) == [slice(0, 5)]
+    assert _get_batch_slices(5, 5) == [slice(0, 5)]
+    assert _get_batch_slices(5, 2) == [slice(0, 2), slice(2, 4), slice(4, 6)]
+    assert _get_batch_slices(0, 2) == [slice(0, 0)]
+
+
+def test_get_inference_batch_size(monkeypatch):
+    assert _get_inference_batch_size() is None
+    monkeypatch.setenv(INFERENCE_BATCH_SIZE_ENV_VAR, "100")
+    assert _get_inference_batch_size() == 100
+    for value in ["0", "-1", "abc"]:
+        monkeypatch.setenv(INFERENCE_BATCH_SIZE_ENV_VAR, value)
+        with pytest.raises(MlflowException, match="must be a positive integer"):
+            _get_inference_batch_size()
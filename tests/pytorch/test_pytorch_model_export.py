@@ -22,6 +22,7 @@ from mlflow.pytorch import get_default_conda_env
 from mlflow.exceptions import MlflowException
 from mlflow.models import Model, infer_signature
 from mlflow.models.utils import _read_example
+from mlflow.pyfunc.utils import INFERENCE_BATCH_SIZE_ENV_VAR, INFERENCE_INTRA_OP_THREADS_ENV_VAR
 from mlflow.pytorch import pickle_module as mlflow_pytorch_pickle_module
 from mlflow.store.artifact.s3_artifact_repo import S3ArtifactRepository
 from mlflow.tracking.artifact_utils import _download_artifact_from_uri
@@ -336,6 +337,32 @@ def test_pyfunc_model_works_with_np_input_type(
         pyfunc_loaded.predict(4)
 
 
+@pytest.mark.large
+@pytest.mark.parametrize("scripted_model", [False])
+def test_pyfunc_model_predicts_in_batches_if_batch_size_is_set(
+    sequential_model, model_path, data, sequential_predicted, monkeypatch
+):
+    mlflow.pytorch.save_model(sequential_model, model_path)
+    monkeypatch.setenv(INFERENCE_BATCH_SIZE_ENV_VAR, "16")
+    monkeypatch.setenv(INFERENCE_INTRA_OP_THREADS_ENV_VAR, "1")
+    num_threads = torch.get_num_threads()
+    try:
+        pyfunc_loaded = mlflow.pyfunc.load_pyfunc(model_path)
+        assert torch.get_num_threads() == 1
+    finally:
+        torch.set_num_threads(num_threads)
+
+    with mock.patch.object(
+        nn.Sequential, "forward", autospec=True, side_effect=nn.Sequential.forward
+    ) as forward_mock:
+        df_result = pyfunc_loaded.predict(data[0])
+        assert forward_mock.call_count == -(-len(data[0]) // 16)
+    assert df_result.index.equals(data[0].index)
+    np.testing.assert_array_almost_equal(df_result.values[:, 0], sequential_predicted, decimal=4)
+    np_result = pyfunc_loaded.predict(data[0].values.astype(np.float32))
+    np.testing.assert_array_almost_equal(np_result[:, 0], sequential_predicted, decimal=4)
+
+
 @pytest.mark.large
 @pytest.mark.parametrize("scripted_model", [True, False])
 def test_load_model_from_remote_uri_succeeds(
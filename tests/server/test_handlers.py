@@ -1,4 +1,6 @@
+import io
 import json
+import tempfile
 import uuid
 
 import pytest
@@ -6,7 +8,7 @@ from unittest import mock
 
 import os
 import mlflow
-from mlflow.entities import ViewType
+from mlflow.entities import Metric, Param, Run, RunData, RunInfo, RunStatus, RunTag, ViewType
 from mlflow.entities.model_registry import (
     RegisteredModel,
     ModelVersion,
@@ -20,6 +22,10 @@ from mlflow.server.handlers import (
     _create_experiment,
     _get_request_message,
     _search_runs,
+    _create_runs,
+    _get_run,
+    _set_tag,
+    _get_experiment_id_of_run,
     _log_batch,
     catch_mlflow_exception,
     _create_registered_model,
@@ -41,10 +47,18 @@ from mlflow.server.handlers import (
     _delete_registered_model_tag,
     _set_model_version_tag,
     _delete_model_version_tag,
+    _upload_artifact,
 )
-from mlflow.server import BACKEND_STORE_URI_ENV_VAR, app
+from mlflow.server import (
+    BACKEND_STORE_URI_ENV_VAR,
+    SERVE_ARTIFACTS_ENV_VAR,
+    RESPONSE_CACHE_TTL_SECONDS_ENV_VAR,
+    WRITE_BEHIND_INTERVAL_MS_ENV_VAR,
+    app,
+)
+from mlflow.store.artifact.artifact_repo import _TemporaryFile
 from mlflow.store.entities.paged_list import PagedList
-from mlflow.protos.service_pb2 import CreateExperiment, SearchRuns
+from mlflow.protos.service_pb2 import CreateExperiment, CreateRuns, GetRun, SearchRuns, SetTag
 from mlflow.protos.model_registry_pb2 import (
     CreateRegisteredModel,
     UpdateRegisteredModel,
@@ -98,6 +112,23 @@ def mock_model_registry_store():
         yield mock_store
 
 
+@pytest.fixture()
+def mock_artifact_repo(monkeypatch):
+    monkeypatch.setenv(SERVE_ARTIFACTS_ENV_VAR, "true")
+    with mock.patch("mlflow.server.handlers._get_artifact_repo_mlflow_artifacts") as m:
+        mock_repo = mock.MagicMock()
+        m.return_value = mock_repo
+        yield mock_repo
+
+
+@pytest.fixture()
+def enable_response_cache(monkeypatch):
+    monkeypatch.setenv(RESPONSE_CACHE_TTL_SECONDS_ENV_VAR, "60")
+    monkeypatch.setattr(mlflow.server.handlers, "_response_cache", None)
+    yield
+    _get_experiment_id_of_run.cache_clear()
+
+
 def test_health():
     with app.test_client() as c:
         response = c.get("/health")
@@ -189,6 +220,93 @@ def test_search_runs_default_view_type(mock_get_request_message, mock_tracking_s
     assert args[2] == ViewType.ACTIVE_ONLY
 
 
+def test_create_runs(mock_get_request_message, mock_tracking_store):
+    run_spec = CreateRuns.RunSpec(
+        user_id="user",
+        start_time=1,
+        end_time=2,
+        status=RunStatus.FINISHED,
+        tags=[RunTag("t", "a").to_proto()],
+        params=[Param("p", "b").to_proto()],
+        metrics=[Metric("m", 1.0, 1, 0).to_proto()],
+    )
+    mock_get_request_message.return_value = CreateRuns(
+        experiment_id="0", runs=[run_spec, CreateRuns.RunSpec(user_id="user", start_time=3)]
+    )
+    run_info = RunInfo(
+        run_uuid="run1",
+        run_id="run1",
+        experiment_id="0",
+        user_id="user",
+        status=RunStatus.to_string(RunStatus.FINISHED),
+        start_time=1,
+        end_time=2,
+        lifecycle_stage="active",
+    )
+    mock_tracking_store.create_runs.return_value = [Run(run_info, RunData())]
+    resp = _create_runs()
+
+    _, args = mock_tracking_store.create_runs.call_args
+    assert args["experiment_id"] == "0"
+    first_run, second_run = args["runs"]
+    assert (first_run.user_id, first_run.start_time, first_run.end_time) == ("user", 1, 2)
+    assert first_run.status == RunStatus.FINISHED
+    assert [(tag.key, tag.value) for tag in first_run.tags] == [("t", "a")]
+    assert [(param.key, param.value) for param in first_run.params] == [("p", "b")]
+    assert [(metric.key, metric.value) for metric in first_run.metrics] == [("m", 1.0)]
+    assert (second_run.start_time, second_run.end_time, second_run.status) == (3, None, None)
+    assert json.loads(resp.get_data())["runs"][0]["info"]["run_id"] == "run1"
+
+
+@pytest.mark.parametrize("write_behind", [False, True])
+@pytest.mark.usefixtures("enable_response_cache")
+def test_cached_responses_are_invalidated_by_writes(
+    mock_get_request_message, mock_tracking_store, monkeypatch, write_behind
+):
+    if write_behind:
+        monkeypatch.setenv(WRITE_BEHIND_INTERVAL_MS_ENV_VAR, "0")
+        monkeypatch.setattr(mlflow.server.handlers, "_write_behind_queue", None)
+    run_info = RunInfo(
+        run_uuid="run1",
+        run_id="run1",
+        experiment_id="0",
+        user_id="user",
+        status=RunStatus.to_string(RunStatus.RUNNING),
+        start_time=1,
+        end_time=None,
+        lifecycle_stage="active",
+    )
+    mock_tracking_store.get_run.return_value = Run(run_info, RunData())
+    mock_tracking_store.search_runs.return_value = PagedList([], None)
+
+    def get_run():
+        mock_get_request_message.return_value = GetRun(run_id="run1")
+        return json.loads(_get_run().get_data())
+
+    def search_runs(experiment_id):
+        mock_get_request_message.return_value = SearchRuns(experiment_ids=[experiment_id])
+        _search_runs()
+
+    assert get_run()["run"]["info"]["run_id"] == "run1"
+    assert get_run()["run"]["info"]["run_id"] == "run1"
+    search_runs("0")
+    search_runs("0")
+    search_runs("1")
+    assert mock_tracking_store.get_run.call_count == 1
+    assert mock_tracking_store.search_runs.call_count == 2
+
+    mock_get_request_message.return_value = SetTag(run_id="run1", key="k", value="v")
+    _set_tag()
+    # The experiment of the run is read to invalidate the responses of searches of its runs
+    assert mock_tracking_store.get_run.call_count == 2
+
+    get_run()
+    search_runs("0")
+    search_runs("1")
+    assert mock_tracking_store.get_run.call_count == 3
+    assert mock_tracking_store.search_runs.call_count == 3
+
+
 def test_log_batch_api_req(mock_get_request_json):
     mock_get_request_json.return_value = "a" * (MAX_BATCH_LOG_REQUEST_SIZE + 1)
     response = _log_batch()
@@ -670,3 +788,90 @@ def test_delete_model_version_tag(mock_get_request_message, mock_model_registry_
     _delete_model_version_tag()
     _, args = mock_model_registry_store.delete_model_version_tag.call_args
     assert args == {"name": name, "version": version, "key": key}
+
+
+def test_download_artifact_streams_file_without_temporary_copy(mock_artifact_repo):
+    file_handle = io.BytesIO(b"chunk1chunk2")
+    mock_artifact_repo._open_file.return_value = file_handle
+
+    with app.test_client() as c:
+        response = c.get("/api/2.0/mlflow-artifacts/artifacts/dir/model.pkl")
+        assert response.status_code == 200
+        assert response.get_data() == b"chunk1chunk2"
+        assert response.headers["Content-Length"] == "12"
+        assert response.headers["Accept-Ranges"] == "bytes"
+        response.close()
+
+    mock_artifact_repo._open_file.assert_called_once_with("dir/model.pkl")
+    mock_artifact_repo._download_file.assert_not_called()
+    assert file_handle.closed
+
+
+def test_download_artifact_serves_range_and_conditional_requests(mock_artifact_repo, tmpdir):
+    path = tmpdir.join("model.pkl")
+    path.write_binary(b"0123456789")
+    mock_artifact_repo._open_file.side_effect = lambda _: open(path.strpath, "rb")
+    url = "/api/2.0/mlflow-artifacts/artifacts/model.pkl"
+
+    with app.test_client() as c:
+        response = c.get(url)
+        etag = response.headers["ETag"]
+        assert response.get_data() == b"0123456789"
+
+        response = c.get(url, headers={"Range": "bytes=2-5"})
+        assert response.status_code == 206
+        assert response.get_data() == b"2345"
+        assert response.headers["Content-Range"] == "bytes 2-5/10"
+        assert response.headers["Content-Length"] == "4"
+
+        response = c.get(url, headers={"Range": "bytes=7-", "If-Range": etag})
+        assert response.status_code == 206
+        assert response.get_data() == b"789"
+
+        # The full artifact is returned if it was modified since the ETag was obtained
+        response = c.get(url, headers={"Range": "bytes=7-", "If-Range": '"other"'})
+        assert response.status_code == 200
+        assert response.get_data() == b"0123456789"
+
+        response = c.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 304
+
+        response = c.get(url, headers={"Range": "bytes=20-"})
+        assert response.status_code == 416
+
+
+def test_download_artifact_does_not_serve_ranges_of_temporary_copies(mock_artifact_repo, tmpdir):
+    def open_file(remote_file_path):
+        tmp_dir = tempfile.TemporaryDirectory(dir=tmpdir.strpath)
+        path = os.path.join(tmp_dir.name, remote_file_path)
+        with open(path, "wb") as f:
+            f.write(b"0123456789")
+        return _TemporaryFile(path, tmp_dir)
+
+    mock_artifact_repo._open_file.side_effect = open_file
+    url = "/api/2.0/mlflow-artifacts/artifacts/model.pkl"
+
+    with app.test_client() as c:
+        response = c.get(url)
+        assert response.status_code == 200
+        assert "Accept-Ranges" not in response.headers
+
+        response = c.get(url, headers={"Range": "bytes=2-5"})
+        assert response.status_code == 200
+        assert response.get_data() == b"0123456789"
+        assert "Accept-Ranges" not in response.headers
+
+
+def test_upload_artifact_streams_request_body(mock_artifact_repo):
+    uploaded = {}
+
+    def upload_stream(stream, remote_file_path):
+        uploaded[remote_file_path] = stream.read()
+
+    mock_artifact_repo._upload_stream.side_effect = upload_stream
+    with app.test_request_context(method="PUT", data=b"contents"):
+        response = _upload_artifact("dir/model.pkl")
+        assert response.status_code == 200
+
+    assert uploaded == {"dir/model.pkl": b"contents"}
+    mock_artifact_repo.log_artifact.assert_not_called()
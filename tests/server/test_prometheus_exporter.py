@@ -2,21 +2,46 @@ import os
 from unittest import mock
 
 import pytest
+from flask import Flask
+from prometheus_client import values
 
 
+from mlflow.entities import Metric
+from mlflow.server import response_cache, write_behind
 from mlflow.server.prometheus_exporter import activate_prometheus_exporter
 
 
 @pytest.fixture(autouse=True)
 def mock_settings_env_vars(tmpdir):
     with mock.patch.dict(os.environ, {"PROMETHEUS_MULTIPROC_DIR": tmpdir.strpath}):
-        yield
+        # NB: Metric values are only written to the multiprocess directory if it is set when
+        # `prometheus_client` is imported, which may happen before this fixture runs
+        with mock.patch.object(values, "ValueClass", values.MultiProcessValue()):
+            yield
+
+
+@pytest.fixture(autouse=True)
+def reset_stats_listeners():
+    yield
+    write_behind.set_stats_listener(None)
+    response_cache.set_stats_listener(None)
 
 
 @pytest.fixture()
 def app():
-    from mlflow.server import app
-
+    from mlflow.server import app as mlflow_app
+
+    # NB: The exporter cannot be activated on the shared app after it has handled requests, e.g. in
+    # other tests, so the routes of the shared app are registered on a fresh app
+    app = Flask(__name__)
+    for rule in mlflow_app.url_map.iter_rules():
+        if rule.endpoint != "static":
+            app.add_url_rule(
+                rule.rule,
+                rule.endpoint,
+                mlflow_app.view_functions[rule.endpoint],
+                methods=rule.methods,
+            )
     with app.app_context():
         yield app
 
@@ -67,3 +92,29 @@ def test_metrics(app, test_client):
     assert (
         metrics.registry.get_sample_value("mlflow_http_request_total", labels=failure_labels) == 1
     )
+
+
+def test_write_behind_metrics(app):
+    metrics = activate_prometheus_exporter(app)
+    queue = write_behind.WriteBehindQueue(store=mock.MagicMock(), interval_seconds=0)
+    queue.log_batch("run_id", metrics=[Metric("m", 1.0, 0, 0)])
+    queue.log_batch("run_id", metrics=[Metric("m", 2.0, 1, 0)])
+
+    get_sample_value = metrics.registry.get_sample_value
+    assert get_sample_value("mlflow_write_behind_commit_writes_count") == 2
+    assert get_sample_value("mlflow_write_behind_commit_writes_sum") == 2
+    assert get_sample_value("mlflow_write_behind_commit_latency_seconds_count") == 2
+    assert get_sample_value("mlflow_write_behind_queue_depth") == 0
+
+
+def test_response_cache_metrics(app):
+    metrics = activate_prometheus_exporter(app)
+    cache = response_cache.InMemoryResponseCache(ttl_seconds=60, max_entries=10)
+    for _ in range(3):
+        cache.get("GetRun", b"request", ["run:run_id"], lambda: "response")
+
+    get_sample_value = metrics.registry.get_sample_value
+    hit_labels = {"endpoint": "GetRun", "result": "hit"}
+    miss_labels = {"endpoint": "GetRun", "result": "miss"}
+    assert get_sample_value("mlflow_response_cache_lookups_total", labels=hit_labels) == 2
+    assert get_sample_value("mlflow_response_cache_lookups_total", labels=miss_labels) == 1
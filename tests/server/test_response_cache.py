@@ -0,0 +1,143 @@
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+from mlflow.server import response_cache
+from mlflow.server.response_cache import InMemoryResponseCache, SharedMemoryResponseCache
+
+
+@pytest.fixture(autouse=True)
+def reset_stats_listener():
+    yield
+    response_cache.set_stats_listener(None)
+
+
+@pytest.fixture(params=["memory", "shared-memory"])
+def create_cache(request, tmpdir):
+    def create(ttl_seconds=60, max_entries=100):
+        if request.param == "memory":
+            return InMemoryResponseCache(ttl_seconds, max_entries)
+        return SharedMemoryResponseCache(ttl_seconds, max_entries, tmpdir.strpath)
+
+    return create
+
+
+def _read_response(value):
+    return mock.MagicMock(return_value=value)
+
+
+def test_responses_are_cached(create_cache):
+    cache = create_cache()
+    read_response = _read_response("response")
+    assert cache.get("GetRun", b"request", ["run:1"], read_response) == "response"
+    assert cache.get("GetRun", b"request", ["run:1"], read_response) == "response"
+    read_response.assert_called_once()
+
+    # Responses are cached by endpoint and request
+    assert cache.get("GetRun", b"other", ["run:1"], _read_response("other")) == "other"
+    assert cache.get("GetExperiment", b"request", [], _read_response("exp")) == "exp"
+
+
+def test_responses_expire(create_cache):
+    cache = create_cache(ttl_seconds=1)
+    read_response = _read_response("response")
+    cache.get("GetRun", b"request", ["run:1"], read_response)
+    time.sleep(1.1)
+    cache.get("GetRun", b"request", ["run:1"], read_response)
+    assert read_response.call_count == 2
+
+
+def test_responses_are_invalidated_by_their_dependencies(create_cache):
+    cache = create_cache()
+    read_run_1 = _read_response("run 1")
+    read_runs = _read_response("runs")
+    cache.get("GetRun", b"1", ["run:1"], read_run_1)
+    cache.get("SearchRuns", b"0", ["experiment-runs:0"], read_runs)
+
+    cache.invalidate(["run:1"])
+    cache.get("GetRun", b"1", ["run:1"], read_run_1)
+    cache.get("SearchRuns", b"0", ["experiment-runs:0"], read_runs)
+    assert read_run_1.call_count == 2
+    assert read_runs.call_count == 1
+
+    cache.invalidate(["run:1", "experiment-runs:0"])
+    cache.get("GetRun", b"1", ["run:1"], read_run_1)
+    cache.get("SearchRuns", b"0", ["experiment-runs:0"], read_runs)
+    assert read_run_1.call_count == 3
+    assert read_runs.call_count == 2
+
+
+def test_responses_read_concurrently_with_an_invalidation_are_not_served(create_cache):
+    cache = create_cache()
+    reading = threading.Event()
+    invalidated = threading.Event()
+
+    def read_stale_response():
+        reading.set()
+        invalidated.wait()
+        return "stale"
+
+    thread = threading.Thread(
+        target=cache.get, args=("GetRun", b"1", ["run:1"], read_stale_response)
+    )
+    thread.start()
+    reading.wait()
+    cache.invalidate(["run:1"])
+    invalidated.set()
+    thread.join()
+
+    assert cache.get("GetRun", b"1", ["run:1"], _read_response("fresh")) == "fresh"
+
+
+def test_exceptions_are_not_cached(create_cache):
+    cache = create_cache()
+    read_response = mock.MagicMock(side_effect=[ValueError("failure"), "response"])
+    with pytest.raises(ValueError, match="failure"):
+        cache.get("GetRun", b"1", ["run:1"], read_response)
+    assert cache.get("GetRun", b"1", ["run:1"], read_response) == "response"
+
+
+def test_in_memory_response_cache_evicts_least_recently_used_responses():
+    cache = InMemoryResponseCache(ttl_seconds=60, max_entries=2)
+    read_responses = {request: _read_response(request) for request in [b"1", b"2", b"3"]}
+    for request in [b"1", b"2", b"1", b"3", b"1", b"2"]:
+        cache.get("GetRun", request, [], read_responses[request])
+
+    assert read_responses[b"1"].call_count == 1
+    assert read_responses[b"2"].call_count == 2
+    assert read_responses[b"3"].call_count == 1
+
+
+def test_shared_memory_response_cache_is_shared_by_instances_on_the_same_directory(tmpdir):
+    cache_1 = SharedMemoryResponseCache(60, 100, tmpdir.strpath)
+    cache_2 = SharedMemoryResponseCache(60, 100, tmpdir.strpath)
+    read_response = _read_response("response")
+    cache_1.get("GetRun", b"1", ["run:1"], read_response)
+    cache_2.get("GetRun", b"1", ["run:1"], read_response)
+    assert read_response.call_count == 1
+
+    cache_2.invalidate(["run:1"])
+    cache_1.get("GetRun", b"1", ["run:1"], read_response)
+    assert read_response.call_count == 2
+
+
+def test_shared_memory_response_cache_evicts_responses(tmpdir, monkeypatch):
+    monkeypatch.setattr(SharedMemoryResponseCache, "_EVICTION_INTERVAL", 5)
+    cache = SharedMemoryResponseCache(60, 3, tmpdir.strpath)
+    for i in range(5):
+        cache.get("GetRun", str(i).encode(), [], _read_response(i))
+    assert len(tmpdir.join("entries").listdir()) == 3
+
+
+def test_response_cache_reports_lookups(create_cache):
+    listener = mock.MagicMock()
+    response_cache.set_stats_listener(listener)
+    cache = create_cache()
+    cache.get("GetRun", b"1", ["run:1"], _read_response("response"))
+    cache.get("GetRun", b"1", ["run:1"], _read_response("response"))
+    assert listener.on_lookup.call_args_list == [
+        mock.call("GetRun", False),
+        mock.call("GetRun", True),
+    ]
@@ -0,0 +1,182 @@
+import threading
+from unittest import mock
+
+import pytest
+
+from mlflow.entities import Metric, Param, RunTag
+from mlflow.exceptions import MlflowException
+from mlflow.server import _run_server, write_behind
+from mlflow.server.write_behind import WriteBehindQueue
+
+
+class _RecordingStore:
+    def __init__(self, fail_batches=False):
+        self.fail_batches = fail_batches
+        self.batches = []
+        self.individual_writes = []
+
+    def log_batches(self, batches):
+        if self.fail_batches:
+            raise MlflowException("Group commit failed")
+        self.batches.append(batches)
+
+    def log_batch(self, run_id, metrics, params, tags):
+        if any(param.value == "invalid" for param in params):
+            raise MlflowException("Invalid param")
+        self.individual_writes.append((run_id, metrics, params, tags))
+
+
+@pytest.fixture(autouse=True)
+def reset_stats_listener():
+    yield
+    write_behind.set_stats_listener(None)
+
+
+def _log_concurrently(queue, writes):
+    errors = {}
+
+    def log(i, kwargs):
+        try:
+            queue.log_batch(**kwargs)
+        except Exception as e:
+            errors[i] = e
+
+    threads = [threading.Thread(target=log, args=(i, kwargs)) for i, kwargs in enumerate(writes)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return errors
+
+
+def test_write_behind_queue_commits_concurrent_writes_together():
+    store = _RecordingStore()
+    queue = WriteBehindQueue(store, interval_seconds=0.5)
+    metric_1 = Metric("m", 1.0, 0, 0)
+    metric_2 = Metric("m", 2.0, 1, 1)
+    param = Param("p", "a")
+    tag = RunTag("t", "b")
+    errors = _log_concurrently(
+        queue,
+        [
+            dict(run_id="run_b", metrics=[metric_1]),
+            dict(run_id="run_a", params=[param]),
+            dict(run_id="run_b", metrics=[metric_2], tags=[tag]),
+        ],
+    )
+
+    assert not errors
+    assert len(store.batches) == 1
+    [
+        (run_id_a, metrics_a, params_a, tags_a),
+        (run_id_b, metrics_b, params_b, tags_b),
+    ] = store.batches[0]
+    # Batches are sorted by run ID, and the data of each run is kept in the order it was logged
+    assert (run_id_a, metrics_a, params_a, tags_a) == ("run_a", [], [param], [])
+    assert run_id_b == "run_b"
+    assert sorted(metrics_b, key=lambda m: m.value) == [metric_1, metric_2]
+    assert (params_b, tags_b) == ([], [tag])
+    assert not store.individual_writes
+
+
+def test_write_behind_queue_commits_writes_one_at_a_time_if_group_commit_fails():
+    store = _RecordingStore(fail_batches=True)
+    queue = WriteBehindQueue(store, interval_seconds=0.5)
+    errors = _log_concurrently(
+        queue,
+        [
+            dict(run_id="run", params=[Param("p1", "valid")]),
+            dict(run_id="run", params=[Param("p2", "invalid")]),
+            dict(run_id="run", tags=[RunTag("t", "valid")]),
+        ],
+    )
+
+    # Only the request with the invalid write fails
+    assert list(errors) == [1]
+    assert "Invalid param" in str(errors[1])
+    assert len(store.individual_writes) == 2
+
+
+def test_write_behind_queue_notifies_commits_before_unblocking_requests():
+    store = _RecordingStore()
+    committed_run_ids = []
+
+    def on_commit(run_ids):
+        assert len(store.batches) == 1
+        committed_run_ids.append(run_ids)
+
+    queue = WriteBehindQueue(store, interval_seconds=0.5, on_commit=on_commit)
+    errors = _log_concurrently(
+        queue,
+        [
+            dict(run_id="run_b", params=[Param("p", "a")]),
+            dict(run_id="run_a", params=[Param("p", "b")]),
+        ],
+    )
+
+    assert not errors
+    assert committed_run_ids == [["run_a", "run_b"]]
+
+
+def test_write_behind_queue_fails_requests_if_commit_notification_fails():
+    store = _RecordingStore(fail_batches=True)
+    queue = WriteBehindQueue(
+        store, interval_seconds=0, on_commit=mock.Mock(side_effect=Exception("Failed to notify"))
+    )
+    with pytest.raises(Exception, match="Failed to notify"):
+        queue.log_batch("run", params=[Param("p", "a")])
+    assert len(store.individual_writes) == 1
+
+
+def test_write_behind_queue_reports_stats():
+    listener = mock.MagicMock()
+    write_behind.set_stats_listener(listener)
+    queue = WriteBehindQueue(_RecordingStore(), interval_seconds=0)
+    queue.log_batch("run", metrics=[Metric("m", 1.0, 0, 0)])
+
+    listener.on_queue_depth.assert_any_call(1)
+    assert listener.on_queue_depth.call_args_list[-1] == mock.call(0)
+    listener.on_commit.assert_called_once()
+    num_writes, seconds = listener.on_commit.call_args[0]
+    assert num_writes == 1
+    assert seconds >= 0
+
+
+@pytest.mark.parametrize(
+    ("gunicorn_opts", "expected_opts"),
+    [
+        (None, ["--threads", "16"]),
+        ("--timeout 60", ["--timeout", "60", "--threads", "16"]),
+        ("--threads 4", ["--threads", "4"]),
+        ("--worker-class=gevent", ["--worker-class=gevent"]),
+        ("-k gevent", ["-k", "gevent"]),
+    ],
+)
+def test_server_runs_threaded_gunicorn_workers_in_write_behind_mode(gunicorn_opts, expected_opts):
+    with mock.patch("sys.platform", "linux"), mock.patch("mlflow.server.exec_cmd") as exec_cmd_mock:
+        _run_server(
+            "sqlite:///mlflow.db",
+            "./mlruns",
+            False,
+            False,
+            None,
+            "127.0.0.1",
+            5000,
+            gunicorn_opts=gunicorn_opts,
+            write_behind_interval_ms=10,
+        )
+        command = exec_cmd_mock.call_args[0][0]
+        assert command[1 : 1 + len(expected_opts)] == expected_opts
+        assert command[1 + len(expected_opts)] == "-b"
+
+        _run_server(
+            "sqlite:///mlflow.db",
+            "./mlruns",
+            False,
+            False,
+            None,
+            "127.0.0.1",
+            5000,
+            gunicorn_opts="--timeout 60",
+        )
+        assert "--threads" not in exec_cmd_mock.call_args[0][0]
@@ -1,8 +1,12 @@
+import io
+import os
 import posixpath
+import threading
 from unittest import mock
 import pytest
 
 from mlflow.entities import FileInfo
+from mlflow.exceptions import MlflowException
 from mlflow.store.artifact.artifact_repo import ArtifactRepository
 from mlflow.utils.file_utils import TempDir
 
@@ -11,9 +15,6 @@ class ArtifactRepositoryImpl(ArtifactRepository):
     def log_artifact(self, local_file, artifact_path=None):
         raise NotImplementedError()
 
-    def log_artifacts(self, local_dir, artifact_path=None):
-        raise NotImplementedError()
-
     def list_artifacts(self, path):
         raise NotImplementedError()
 
@@ -67,3 +68,131 @@ def test_download_artifacts_handles_empty_dir(base_uri, download_arg, list_retur
         repo = ArtifactRepositoryImpl(base_uri)
         with TempDir() as tmp:
             repo.download_artifacts(download_arg, dst_path=tmp.path())
+
+
+def test_open_file_downloads_to_temporary_directory_removed_on_close():
+    def download_file(remote_file_path, local_path):
+        with open(local_path, "wb") as f:
+            f.write(remote_file_path.encode("utf-8"))
+
+    repo = ArtifactRepositoryImpl("base_uri")
+    with mock.patch.object(repo, "_download_file", side_effect=download_file):
+        f = repo._open_file("dir/modelfile")
+        local_path = f.name
+        assert f.read() == b"dir/modelfile"
+        f.close()
+    assert not os.path.exists(os.path.dirname(local_path))
+
+
+def test_upload_stream_logs_temporary_file():
+    logged = {}
+
+    def log_artifact(local_file, artifact_path=None):
+        with open(local_file, "rb") as f:
+            logged[(os.path.basename(local_file), artifact_path)] = f.read()
+
+    repo = ArtifactRepositoryImpl("base_uri")
+    with mock.patch.object(repo, "log_artifact", side_effect=log_artifact):
+        repo._upload_stream(io.BytesIO(b"contents"), "dir/modelfile")
+        repo._upload_stream(io.BytesIO(b"other contents"), "otherfile")
+    assert logged == {("modelfile", "dir"): b"contents", ("otherfile", None): b"other contents"}
+
+
+def test_download_artifacts_downloads_files_concurrently(monkeypatch, tmpdir):
+    monkeypatch.setenv("MLFLOW_ARTIFACT_MAX_WORKERS", "4")
+    files = ["a.txt", "b.txt", "dir/c.txt", "dir/d.txt"]
+    # Every download blocks until all files are being downloaded at the same time
+    barrier = threading.Barrier(len(files), timeout=10)
+
+    def list_artifacts(path):
+        if path == "":
+            return [
+                FileInfo("a.txt", False, 1),
+                FileInfo("b.txt", False, 1),
+                FileInfo("dir", True, 0),
+            ]
+        elif path == "dir":
+            return [FileInfo("dir/c.txt", False, 1), FileInfo("dir/d.txt", False, 1)]
+        else:
+            return []
+
+    def download_file(remote_file_path, local_path):
+        barrier.wait()
+        with open(local_path, "w") as f:
+            f.write(remote_file_path)
+
+    repo = ArtifactRepositoryImpl("base_uri")
+    with mock.patch.object(repo, "list_artifacts", side_effect=list_artifacts), mock.patch.object(
+        repo, "_download_file", side_effect=download_file
+    ):
+        repo.download_artifacts("", dst_path=tmpdir.strpath)
+
+    for path in files:
+        assert tmpdir.join(path).read() == path
+
+
+def test_download_artifacts_reports_all_failed_downloads(tmpdir):
+    def list_artifacts(path):
+        if path == "":
+            return [FileInfo(name, False, 1) for name in ["a.txt", "b.txt", "c.txt"]]
+        return []
+
+    def download_file(remote_file_path, local_path):
+        if remote_file_path != "b.txt":
+            raise Exception("Failed to download %s" % remote_file_path)
+        with open(local_path, "w") as f:
+            f.write(remote_file_path)
+
+    repo = ArtifactRepositoryImpl("base_uri")
+    with mock.patch.object(repo, "list_artifacts", side_effect=list_artifacts), mock.patch.object(
+        repo, "_download_file", side_effect=download_file
+    ):
+        with pytest.raises(
+            MlflowException, match="Failed to download a.txt.+Failed to download c.txt"
+        ):
+            repo.download_artifacts("", dst_path=tmpdir.strpath)
+
+
+def test_download_artifacts_downloads_files_sequentially_if_concurrency_is_unsupported(tmpdir):
+    def list_artifacts(path):
+        if path == "":
+            return [FileInfo(name, False, 1) for name in ["a.txt", "b.txt", "c.txt"]]
+        return []
+
+    download_threads = []
+
+    def download_file(remote_file_path, local_path):
+        download_threads.append(threading.current_thread())
+        with open(local_path, "w") as f:
+            f.write(remote_file_path)
+
+    repo = ArtifactRepositoryImpl("base_uri")
+    repo._supports_concurrent_transfers = False
+    with mock.patch.object(repo, "list_artifacts", side_effect=list_artifacts), mock.patch.object(
+        repo, "_download_file", side_effect=download_file
+    ):
+        repo.download_artifacts("", dst_path=tmpdir.strpath)
+
+    assert download_threads == [threading.current_thread()] * 3
+    for path in ["a.txt", "b.txt", "c.txt"]:
+        assert tmpdir.join(path).read() == path
+
+
+def test_log_artifacts_uploads_files_concurrently(monkeypatch, tmpdir):
+    monkeypatch.setenv("MLFLOW_ARTIFACT_MAX_WORKERS", "3")
+    local_dir = tmpdir.mkdir("local")
+    local_dir.join("a.txt").write("a")
+    local_dir.join("b.txt").write("b")
+    local_dir.mkdir("subdir").join("c.txt").write("c")
+    barrier = threading.Barrier(3, timeout=10)
+    uploads = []
+
+    def log_artifact(local_file, artifact_path=None):
+        barrier.wait()
+        uploads.append((os.path.basename(local_file), artifact_path))
+
+    repo = ArtifactRepositoryImpl("base_uri")
+    with mock.patch.object(repo, "log_artifact", side_effect=log_artifact):
+        repo.log_artifacts(local_dir.strpath, "dir")
+
+    assert sorted(uploads) == [("a.txt", "dir"), ("b.txt", "dir"), ("c.txt", "dir/subdir")]
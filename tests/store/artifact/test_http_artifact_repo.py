@@ -3,7 +3,9 @@ import posixpath
 from unittest import mock
 
 import pytest
+import requests
 
+from mlflow.exceptions import MlflowException
 from mlflow.store.artifact.artifact_repository_registry import get_artifact_repository
 from mlflow.store.artifact.http_artifact_repo import HttpArtifactRepository
 
@@ -15,9 +17,10 @@ def test_artifact_uri_factory(scheme):
 
 
 class MockResponse:
-    def __init__(self, data, status_code):
+    def __init__(self, data, status_code, headers=None):
         self.data = data
         self.status_code = status_code
+        self.headers = headers or {}
 
     def json(self):
         return self.data
@@ -86,7 +89,11 @@ def test_log_artifacts(http_artifact_repo, tmpdir, artifact_path):
         expected_url_2 = posixpath.join(
             http_artifact_repo.artifact_uri, *paths, "dir", tmp_path_b.basename
         )
-        calls = [(args[0], kwargs["data"]) for args, kwargs in mock_put.call_args_list]
+        # Files are uploaded concurrently, so the order of the calls does not matter
+        calls = sorted(
+            ((args[0], kwargs["data"]) for args, kwargs in mock_put.call_args_list),
+            key=lambda call: call[0],
+        )
         assert calls == [
             (expected_url_1, FileObjectMatcher(tmp_path_a, "rb")),
             (expected_url_2, FileObjectMatcher(tmp_path_b, "rb")),
@@ -208,3 +215,80 @@ def test_download_artifacts(http_artifact_repo, tmpdir):
         ]
         assert read_file(paths[0]) == "data_a"
         assert read_file(paths[1]) == "data_b"
+
+
+class MockRangeServer:
+    """
+    Serves the specified data with support for ``Range`` requests. The first response body for
+    each range is truncated to ``fail_after`` bytes by raising a ``ChunkedEncodingError``.
+    """
+
+    def __init__(self, data, etag='"etag"', fail_after=None):
+        self.data = data
+        self.etag = etag
+        self.fail_after = fail_after
+        self.requested_ranges = []
+
+    def get(self, url, headers=None, **kwargs):  # pylint: disable=unused-argument
+        headers = headers or {}
+        response_headers = {"Accept-Ranges": "bytes", "ETag": self.etag}
+        if "Range" not in headers or headers.get("If-Range", self.etag) != self.etag:
+            response_headers["Content-Length"] = str(len(self.data))
+            return MockRangedStreamResponse(self.data, 200, response_headers, self.fail_after)
+        start, end = headers["Range"][len("bytes=") :].split("-")
+        self.requested_ranges.append((int(start), int(end)))
+        body = self.data[int(start) : int(end) + 1]
+        response_headers["Content-Length"] = str(len(body))
+        return MockRangedStreamResponse(body, 206, response_headers)
+
+
+class MockRangedStreamResponse(MockStreamResponse):
+    def __init__(self, data, status_code, headers, fail_after=None):
+        super().__init__(data, status_code, headers)
+        self.fail_after = fail_after
+
+    def iter_content(self, chunk_size):
+        data = self.data if self.fail_after is None else self.data[: self.fail_after]
+        for i in range(0, len(data), chunk_size):
+            yield data[i : i + chunk_size]
+        if self.fail_after is not None:
+            raise requests.exceptions.ChunkedEncodingError("Connection broken")
+
+
+def test_download_file_in_parts(http_artifact_repo, tmpdir):
+    data = os.urandom(1000)
+    server = MockRangeServer(data)
+    tmp_path = tmpdir.join("a.bin")
+    with mock.patch(
+        "mlflow.store.artifact.http_artifact_repo._DOWNLOAD_PART_SIZE", 300
+    ), mock.patch("requests.Session.get", side_effect=server.get):
+        http_artifact_repo._download_file("a.bin", tmp_path)
+
+    assert tmp_path.read_binary() == data
+    assert sorted(server.requested_ranges) == [(0, 299), (300, 599), (600, 899), (900, 999)]
+
+
+def test_download_file_resumes_interrupted_download(http_artifact_repo, tmpdir):
+    data = os.urandom(1000)
+    server = MockRangeServer(data, fail_after=400)
+    tmp_path = tmpdir.join("a.bin")
+    with mock.patch("requests.Session.get", side_effect=server.get):
+        http_artifact_repo._download_file("a.bin", tmp_path)
+
+    assert tmp_path.read_binary() == data
+    assert server.requested_ranges == [(400, 999)]
+
+
+def test_download_file_fails_if_artifact_is_modified_during_download(http_artifact_repo, tmpdir):
+    server = MockRangeServer(os.urandom(1000), fail_after=400)
+    tmp_path = tmpdir.join("a.bin")
+
+    def get(url, headers=None, **kwargs):
+        response = server.get(url, headers=headers, **kwargs)
+        # The artifact is overwritten after the initial request
+        server.etag = '"modified"'
+        return response
+
+    with mock.patch("requests.Session.get", side_effect=get):
+        with pytest.raises(MlflowException, match="modified during the download"):
+            http_artifact_repo._download_file("a.bin", tmp_path)
@@ -1,3 +1,4 @@
+import io
 import os
 import pytest
 import posixpath
@@ -186,3 +187,20 @@ def test_delete_artifacts(local_artifact_repo):
         assert os.path.exists(os.path.join(local_artifact_repo._artifact_dir, "b.txt"))
         local_artifact_repo.delete_artifacts()
         assert not os.path.exists(os.path.join(local_artifact_repo._artifact_dir))
+
+
+def test_open_file_and_upload_stream(local_artifact_repo, local_artifact_root):
+    local_artifact_repo._upload_stream(io.BytesIO(b"contents" * 1000), "a/b/file.txt")
+    assert os.listdir(os.path.join(local_artifact_root, "a", "b")) == ["file.txt"]
+    with local_artifact_repo._open_file("a/b/file.txt") as f:
+        assert f.read() == b"contents" * 1000
+
+
+def test_upload_stream_does_not_leave_partial_files(local_artifact_repo, local_artifact_root):
+    class FailingStream(io.BytesIO):
+        def read(self, *args):
+            raise IOError("Connection reset")
+
+    with pytest.raises(IOError, match="Connection reset"):
+        local_artifact_repo._upload_stream(FailingStream(), "file.txt")
+    assert os.listdir(local_artifact_root) == []
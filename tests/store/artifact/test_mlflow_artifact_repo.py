@@ -65,9 +65,10 @@ def test_mlflow_artifact_uri_raises_with_invalid_tracking_uri():
 
 
 class MockResponse:
-    def __init__(self, data, status_code):
+    def __init__(self, data, status_code, headers=None):
         self.data = data
         self.status_code = status_code
+        self.headers = headers or {}
 
     def json(self):
         return self.data
@@ -1,3 +1,4 @@
+import io
 import os
 import posixpath
 import tarfile
@@ -11,6 +12,7 @@ from mlflow.store.artifact.s3_artifact_repo import (
     S3ArtifactRepository,
     _cached_get_s3_client,
     _MAX_CACHE_SECONDS,
+    _S3ObjectReader,
 )
 
 from tests.helper_functions import set_boto_credentials  # pylint: disable=unused-import
@@ -308,3 +310,44 @@ def test_delete_artifacts(s3_artifact_root, tmpdir):
     repo.delete_artifacts()
     tmpdir_objects = repo.list_artifacts()
     assert not tmpdir_objects
+
+
+def test_open_file_and_upload_stream(s3_artifact_root):
+    repo = get_artifact_repository(posixpath.join(s3_artifact_root, "some/path"))
+    repo._upload_stream(io.BytesIO(b"Hello world!"), "subdir/test.txt")
+
+    assert [f.path for f in repo.list_artifacts("subdir")] == ["subdir/test.txt"]
+    s3_client = repo._get_s3_client()
+    head = s3_client.head_object(
+        Bucket=s3_artifact_root[len("s3://") :], Key="some/path/subdir/test.txt"
+    )
+    assert head["ContentType"] == "text/plain"
+
+    f = repo._open_file("subdir/test.txt")
+    assert f.read() == b"Hello world!"
+    f.close()
+
+
+def test_s3_object_reader_issues_ranged_requests_from_current_position():
+    data = b"0123456789"
+    s3_client = mock.Mock()
+    s3_client.head_object.return_value = {"ContentLength": len(data), "ETag": '"etag"'}
+    s3_client.get_object.side_effect = lambda Range, **kwargs: {
+        "Body": io.BytesIO(data[int(Range[len("bytes=") : -1]) :])
+    }
+
+    with _S3ObjectReader(s3_client, "bucket", "key") as f:
+        assert f.etag == '"etag"'
+        assert f.seek(0, io.SEEK_END) == 10
+        assert f.seek(0) == 0
+        s3_client.get_object.assert_not_called()
+        assert f.read(4) == b"0123"
+        assert f.read(2) == b"45"
+        f.seek(8)
+        assert f.read() == b"89"
+        assert f.read() == b""
+
+    assert s3_client.get_object.call_args_list == [
+        mock.call(Bucket="bucket", Key="key", Range="bytes=0-", IfMatch='"etag"'),
+        mock.call(Bucket="bucket", Key="key", Range="bytes=8-", IfMatch='"etag"'),
+    ]
@@ -1,8 +1,14 @@
 import json
 
-from mlflow.entities import RunTag
+import pytest
+
+from mlflow.entities import Metric, Param, RunStatus, RunTag, ViewType
+from mlflow.exceptions import MlflowException
 from mlflow.models import Model
+from mlflow.store.tracking import RunSpec
 from mlflow.utils.mlflow_tags import MLFLOW_LOGGED_MODELS
+from mlflow.utils.search_utils import SearchUtils
+from mlflow.utils.validation import MAX_ENTITIES_PER_RUNS_BATCH, MAX_RUNS_PER_BATCH
 
 
 class AbstractStoreTest(object):
@@ -51,6 +57,136 @@ class AbstractStoreTest(object):
         with self.assertRaises(TypeError):
             store.record_logged_model(run_id, m.to_dict())
 
+    def _search_all_pages(self, store, experiment_id, order_by, max_results, page_token=None):
+        run_ids = []
+        while True:
+            result = store.search_runs(
+                [experiment_id],
+                None,
+                ViewType.ALL,
+                max_results=max_results,
+                order_by=order_by,
+                page_token=page_token,
+            )
+            run_ids.extend(run.info.run_id for run in result)
+            page_token = result.token
+            if not page_token:
+                return run_ids
+
+    def test_search_runs_keyset_pagination(self):
+        store = self.get_store()
+        experiment_id = store.create_experiment("test_search_runs_keyset_pagination")
+        values = ["nan", None, "inf", "-inf", "-1000", "0", "0", "1000", "1000"]
+        for i, value in enumerate(values):
+            run_id = store.create_run(experiment_id, "user", i % 3, []).info.run_id
+            if value is not None:
+                store.log_metric(run_id, Metric("x", float(value), 1, 0))
+                store.log_param(run_id, Param("p", value))
+            store.set_tag(run_id, RunTag("t", str(i % 2)))
+
+        for order_by in [
+            None,
+            ["metrics.x"],
+            ["metrics.x DESC"],
+            ["params.p DESC", "tags.t"],
+            ["tags.t DESC", "metrics.x ASC"],
+            ["attributes.start_time ASC", "metrics.x DESC"],
+        ]:
+            expected = [
+                run.info.run_id
+                for run in store.search_runs(
+                    [experiment_id], None, ViewType.ALL, max_results=100, order_by=order_by
+                )
+            ]
+            for max_results in [1, 2, 4]:
+                assert self._search_all_pages(store, experiment_id, order_by, max_results) == (
+                    expected
+                )
+            # Offset-based page tokens are still supported
+            offset_token = SearchUtils.create_page_token(4)
+            assert (
+                self._search_all_pages(store, experiment_id, order_by, 2, offset_token)
+                == expected[4:]
+            )
+
+        # Keyset page tokens resume after the last returned run, even if earlier runs are deleted
+        expected = [
+            run.info.run_id
+            for run in store.search_runs([experiment_id], None, ViewType.ACTIVE_ONLY, 100)
+        ]
+        first_page = store.search_runs([experiment_id], None, ViewType.ACTIVE_ONLY, 3)
+        store.delete_run(expected[0])
+        second_page = store.search_runs(
+            [experiment_id], None, ViewType.ACTIVE_ONLY, 3, page_token=first_page.token
+        )
+        assert [run.info.run_id for run in second_page] == expected[3:6]
+
+    def test_create_runs(self):
+        store = self.get_store()
+        experiment_id = store.create_experiment("test_create_runs")
+        run_specs = [
+            RunSpec(
+                user_id="user",
+                start_time=1,
+                end_time=None,
+                status=None,
+                tags=[RunTag("t", "a")],
+                params=[Param("p1", "a"), Param("p2", "b")],
+                metrics=[Metric("m", 1.0, 1, 0), Metric("m", 2.0, 2, 1), Metric("m", 0.5, 3, 1)],
+            ),
+            RunSpec(
+                user_id="user",
+                start_time=2,
+                end_time=3,
+                status=RunStatus.FAILED,
+                tags=[],
+                params=[],
+                metrics=[Metric("m", 3.0, 1, 0)],
+            ),
+        ]
+        runs = store.create_runs(experiment_id, run_specs)
+
+        assert len(runs) == 2
+        assert len({run.info.run_id for run in runs}) == 2
+        for run, run_spec in zip(runs, run_specs):
+            assert run.info.experiment_id == experiment_id
+            assert run.info.start_time == run_spec.start_time
+            assert run.info.end_time == run_spec.end_time
+            assert run.data.params == {param.key: param.value for param in run_spec.params}
+            self._verify_logged(
+                store, run.info.run_id, run_spec.metrics, run_spec.params, run_spec.tags
+            )
+        assert runs[0].info.status == RunStatus.to_string(RunStatus.RUNNING)
+        assert runs[0].data.metrics == {"m": 0.5}
+        assert runs[1].info.status == RunStatus.to_string(RunStatus.FAILED)
+
+        run_ids = {
+            run.info.run_id for run in store.search_runs([experiment_id], None, ViewType.ALL)
+        }
+        assert run_ids == {run.info.run_id for run in runs}
+
+        store.delete_experiment(experiment_id)
+        with pytest.raises(MlflowException, match="active"):
+            store.create_runs(experiment_id, run_specs)
+
+    def test_create_runs_validates_limits(self):
+        store = self.get_store()
+        experiment_id = store.create_experiment("test_create_runs_validates_limits")
+        run_spec = RunSpec(
+            user_id="user",
+            start_time=0,
+            end_time=None,
+            status=None,
+            tags=[],
+            params=[Param("p{}".format(i), "a") for i in range(20)],
+            metrics=[],
+        )
+        with pytest.raises(MlflowException, match="at most {} runs".format(MAX_RUNS_PER_BATCH)):
+            store.create_runs(experiment_id, [run_spec] * (MAX_RUNS_PER_BATCH + 1))
+        with pytest.raises(MlflowException, match="at most {}".format(MAX_ENTITIES_PER_RUNS_BATCH)):
+            store.create_runs(experiment_id, [run_spec] * (MAX_ENTITIES_PER_RUNS_BATCH // 20 + 1))
+        assert len(store.search_runs([experiment_id], None, ViewType.ALL)) == 0
+
     @staticmethod
     def _verify_logged(store, run_id, metrics, params, tags):
         run = store.get_run(run_id)
@@ -1,4 +1,5 @@
 #!/usr/bin/env python
+import json
 import os
 import posixpath
 import random
@@ -23,6 +24,7 @@ from mlflow.entities import (
 )
 from mlflow.exceptions import MlflowException, MissingConfigException
 from mlflow.store.tracking import SEARCH_MAX_RESULTS_DEFAULT
+from mlflow.store.tracking import file_store_index
 from mlflow.store.tracking.file_store import FileStore
 from mlflow.utils.file_utils import write_yaml, read_yaml, path_to_local_file_uri, TempDir
 from mlflow.protos.databricks_pb2 import (
@@ -1097,3 +1099,63 @@ class TestFileStore(unittest.TestCase, AbstractStoreTest):
             )
         assert e.exception.error_code == ErrorCode.Name(INVALID_PARAMETER_VALUE)
         self._verify_logged(fs, run.info.run_id, metrics=[], params=[], tags=[])
+
+    def test_search_runs_reuses_run_index(self):
+        fs = FileStore(self.test_root)
+        exp_id = self.experiments[0]
+        expected_runs = {
+            run.info.run_id: run for run in fs.search_runs([exp_id], None, ViewType.ALL)
+        }
+        index_path = os.path.join(self.test_root, exp_id, file_store_index.INDEX_FILE_NAME)
+        assert os.path.exists(index_path)
+
+        with mock.patch.object(file_store_index, "_RACY_WINDOW_NS", 0), mock.patch.object(
+            fs, "_get_run_from_info", wraps=fs._get_run_from_info
+        ) as get_run_mock:
+            runs = fs.search_runs([exp_id], None, ViewType.ALL)
+            get_run_mock.assert_not_called()
+        assert {run.info.run_id: run for run in runs}.keys() == expected_runs.keys()
+        for run in runs:
+            expected = expected_runs[run.info.run_id]
+            assert run.info == expected.info
+            assert run.data.metrics == expected.data.metrics
+            assert run.data.params == expected.data.params
+            assert run.data.tags == expected.data.tags
+
+    def test_search_runs_run_index_reflects_writes(self):
+        fs = FileStore(self.test_root)
+        exp_id = fs.create_experiment("test_search_runs_run_index_reflects_writes")
+        run_id = fs.create_run(exp_id, "user", 0, [RunTag("t", "a")]).info.run_id
+        fs.log_metric(run_id, Metric("m", 1.0, 1, 0))
+
+        def search_run():
+            with mock.patch.object(file_store_index, "_RACY_WINDOW_NS", 0):
+                (run,) = fs.search_runs([exp_id], None, ViewType.ALL)
+            return run
+
+        assert search_run().data.metrics == {"m": 1.0}
+        fs.log_metric(run_id, Metric("m", 2.0, 2, 1))
+        assert search_run().data.metrics == {"m": 2.0}
+        fs.set_tag(run_id, RunTag("t", "b"))
+        assert search_run().data.tags["t"] == "b"
+        fs.log_param(run_id, Param("nested/param", "x"))
+        assert search_run().data.params == {"nested/param": "x"}
+        fs.delete_tag(run_id, "t")
+        assert "t" not in search_run().data.tags
+        fs.update_run_info(run_id, RunStatus.FINISHED, 10)
+        assert search_run().info.status == RunStatus.to_string(RunStatus.FINISHED)
+        fs.delete_run(run_id)
+        assert search_run().info.lifecycle_stage == LifecycleStage.DELETED
+        fs._hard_delete_run(run_id)
+        with mock.patch.object(file_store_index, "_RACY_WINDOW_NS", 0):
+            assert fs.search_runs([exp_id], None, ViewType.ALL) == []
+
+    def test_search_runs_ignores_malformed_run_index(self):
+        fs = FileStore(self.test_root)
+        exp_id = self.experiments[0]
+        index_path = os.path.join(self.test_root, exp_id, file_store_index.INDEX_FILE_NAME)
+        with open(index_path, "w") as f:
+            f.write("not json")
+        assert len(self._search(fs, exp_id)) == 2
+        with open(index_path, "r") as f:
+            assert json.load(f)["version"] == file_store_index._INDEX_FORMAT_VERSION
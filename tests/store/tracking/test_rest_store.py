@@ -8,6 +8,7 @@ import mlflow
 from mlflow.entities import (
     Param,
     Metric,
+    RunStatus,
     RunTag,
     SourceType,
     ViewType,
@@ -19,6 +20,7 @@ from mlflow.exceptions import MlflowException
 from mlflow.models import Model
 from mlflow.protos.service_pb2 import (
     CreateRun,
+    CreateRuns,
     DeleteExperiment,
     DeleteRun,
     LogBatch,
@@ -42,6 +44,8 @@ from mlflow.protos.databricks_pb2 import (
     INTERNAL_ERROR,
     ErrorCode,
 )
+from mlflow.store.tracking import RunSpec
+from mlflow.store.tracking.abstract_store import AbstractStore
 from mlflow.store.tracking.rest_store import (
     RestStore,
     DatabricksRestStore,
@@ -133,6 +137,75 @@ class TestRestStore(object):
         assert len(experiments) == 1
         assert experiments[0].name == "My experiment"
 
+    def test_create_runs(self):
+        creds = MlflowHostCreds("https://hello")
+        store = RestStore(lambda: creds)
+        run_specs = [
+            RunSpec(
+                user_id="user",
+                start_time=1,
+                end_time=2,
+                status=RunStatus.FINISHED,
+                tags=[RunTag("t", "a")],
+                params=[Param("p", "b")],
+                metrics=[Metric("m", 1.0, 1, 0)],
+            ),
+            RunSpec(
+                user_id="user",
+                start_time=3,
+                end_time=None,
+                status=None,
+                tags=[],
+                params=[],
+                metrics=[],
+            ),
+        ]
+        response = CreateRuns.Response()
+        response.runs.add().info.run_id = "run1"
+        response.runs.add().info.run_id = "run2"
+        with mock.patch(
+            "mlflow.utils.rest_utils.http_request",
+            return_value=mock.MagicMock(status_code=200, text=message_to_json(response)),
+        ) as mock_http:
+            runs = store.create_runs("0", run_specs)
+            body = message_to_json(
+                CreateRuns(
+                    experiment_id="0",
+                    runs=[
+                        CreateRuns.RunSpec(
+                            user_id="user",
+                            start_time=1,
+                            end_time=2,
+                            status=RunStatus.FINISHED,
+                            tags=[ProtoRunTag(key="t", value="a")],
+                            params=[Param("p", "b").to_proto()],
+                            metrics=[Metric("m", 1.0, 1, 0).to_proto()],
+                        ),
+                        CreateRuns.RunSpec(user_id="user", start_time=3),
+                    ],
+                )
+            )
+            assert mock_http.call_count == 1
+            self._verify_requests(mock_http, creds, "runs/create-batch", "POST", body)
+        assert [run.info.run_id for run in runs] == ["run1", "run2"]
+
+    @mock.patch("requests.Session.request")
+    def test_create_runs_falls_back_to_creating_runs_one_by_one(self, request):
+        store = RestStore(lambda: MlflowHostCreds("https://hello"))
+        run_spec = RunSpec(
+            user_id="user", start_time=1, end_time=None, status=None, tags=[], params=[], metrics=[]
+        )
+        request.return_value = mock.MagicMock(status_code=404, text="<html>Not Found</html>")
+        with mock.patch.object(
+            AbstractStore, "create_runs", return_value=["run"]
+        ) as create_runs_mock:
+            assert store.create_runs("0", [run_spec]) == ["run"]
+            create_runs_mock.assert_called_once_with("0", [run_spec])
+
+        request.return_value = mock.MagicMock(status_code=500, text="<html>Error</html>")
+        with pytest.raises(MlflowException, match="API request to endpoint"):
+            store.create_runs("0", [run_spec])
+
     def _args(self, host_creds, endpoint, method, json_body):
         res = {
             "host_creds": host_creds,
@@ -42,7 +42,11 @@ from mlflow.store.tracking.dbmodels import models
 from mlflow.store.db.db_types import MYSQL, MSSQL
 from mlflow import entities
 from mlflow.exceptions import MlflowException
-from mlflow.store.tracking.sqlalchemy_store import SqlAlchemyStore, _get_orderby_clauses
+from mlflow.store.tracking.sqlalchemy_store import (
+    SqlAlchemyStore,
+    _get_orderby_clauses,
+    _get_keyset_filtering_clause,
+)
 from mlflow.utils import mlflow_tags
 from mlflow.utils.file_utils import TempDir
 from mlflow.utils.uri import extract_db_type_from_uri
@@ -1613,7 +1617,8 @@ class TestSqlAlchemyStoreSqlite(unittest.TestCase, AbstractStoreTest):
         self._verify_logged(self.store, run.info.run_id, metrics=[], params=[param], tags=[])
 
     def test_log_batch_param_overwrite_disallowed_single_req(self):
-        # Test that attempting to overwrite a param via log_batch results in an exception
+        # Test that attempting to overwrite a param via log_batch results in an exception and that
+        # no partial data is logged
         run = self._run_factory()
         pkey = "common-key"
         param0 = entities.Param(pkey, "orig-val")
@@ -1626,13 +1631,54 @@ class TestSqlAlchemyStoreSqlite(unittest.TestCase, AbstractStoreTest):
             )
         self.assertIn("Changing param values is not allowed. Param with key=", e.exception.message)
         assert e.exception.error_code == ErrorCode.Name(INVALID_PARAMETER_VALUE)
-        self._verify_logged(self.store, run.info.run_id, metrics=[], params=[param0], tags=[])
+        self._verify_logged(self.store, run.info.run_id, metrics=[], params=[], tags=[])
 
     def test_log_batch_accepts_empty_payload(self):
         run = self._run_factory()
         self.store.log_batch(run.info.run_id, metrics=[], params=[], tags=[])
         self._verify_logged(self.store, run.info.run_id, metrics=[], params=[], tags=[])
 
+    def test_log_batches(self):
+        run_1 = self._run_factory()
+        run_2 = self._run_factory(
+            config=self._get_run_configs(experiment_id=run_1.info.experiment_id)
+        )
+        metric = entities.Metric("metric-key", 3.0, 12345, 0)
+        param = entities.Param("param-key", "param-val")
+        tag = entities.RunTag("tag-key", "tag-val")
+        self.store.log_batches(
+            [
+                (run_1.info.run_id, [metric], [param], []),
+                (run_2.info.run_id, [], [], [tag]),
+                (run_1.info.run_id, [], [], [tag]),
+            ]
+        )
+        self._verify_logged(
+            self.store, run_1.info.run_id, metrics=[metric], params=[param], tags=[tag]
+        )
+        self._verify_logged(self.store, run_2.info.run_id, metrics=[], params=[], tags=[tag])
+
+    def test_log_batches_logs_nothing_if_a_batch_fails(self):
+        run_1 = self._run_factory()
+        run_2 = self._run_factory(
+            config=self._get_run_configs(experiment_id=run_1.info.experiment_id)
+        )
+        param = entities.Param("param-key", "orig-val")
+        self.store.log_param(run_2.info.run_id, param)
+
+        tag = entities.RunTag("tag-key", "tag-val")
+        overwrite_param = entities.Param("param-key", "newval")
+        with self.assertRaises(MlflowException) as e:
+            self.store.log_batches(
+                [
+                    (run_1.info.run_id, [], [], [tag]),
+                    (run_2.info.run_id, [], [overwrite_param], []),
+                ]
+            )
+        assert e.exception.error_code == ErrorCode.Name(INVALID_PARAMETER_VALUE)
+        assert "tag-key" not in self.store.get_run(run_1.info.run_id).data.tags
+        self._verify_logged(self.store, run_2.info.run_id, metrics=[], params=[param], tags=[])
+
     def test_log_batch_internal_error(self):
         # Verify that internal errors during the DB save step for log_batch result in
         # MlflowExceptions
@@ -1642,9 +1688,9 @@ class TestSqlAlchemyStoreSqlite(unittest.TestCase, AbstractStoreTest):
             raise Exception("Some internal error")
 
         package = "mlflow.store.tracking.sqlalchemy_store.SqlAlchemyStore"
-        with mock.patch(package + ".log_metric") as metric_mock, mock.patch(
-            package + ".log_param"
-        ) as param_mock, mock.patch(package + ".set_tag") as tags_mock:
+        with mock.patch(package + "._log_metrics") as metric_mock, mock.patch(
+            package + "._log_params"
+        ) as param_mock, mock.patch(package + "._set_tags") as tags_mock:
             metric_mock.side_effect = _raise_exception_fn
             param_mock.side_effect = _raise_exception_fn
             tags_mock.side_effect = _raise_exception_fn
@@ -1721,6 +1767,88 @@ class TestSqlAlchemyStoreSqlite(unittest.TestCase, AbstractStoreTest):
             self.store, run.info.run_id, params=[], metrics=[metric0, metric1], tags=[]
         )
 
+    def test_log_batch_metrics_idempotency(self):
+        run = self._run_factory()
+        metrics = [Metric("m", 1.0, 1, 0), Metric("m", 1.0, 1, 0), Metric("m", float("nan"), 2, 1)]
+        self.store.log_batch(run.info.run_id, metrics=metrics, params=[], tags=[])
+        self.store.log_batch(run.info.run_id, metrics=metrics, params=[], tags=[])
+        history = self.store.get_metric_history(run.info.run_id, "m")
+        assert len(history) == 2
+        latest = self.store.get_run(run.info.run_id).data.metrics["m"]
+        assert math.isnan(latest)
+
+    def test_log_batch_updates_latest_metrics(self):
+        run = self._run_factory()
+        run_id = run.info.run_id
+        self.store.log_metric(run_id, Metric("a", 1.0, 10, 5))
+        self.store.log_metric(run_id, Metric("b", 1.0, 10, 5))
+        self.store.log_batch(
+            run_id,
+            metrics=[
+                # Older than the existing latest value of "a", which must be preserved
+                Metric("a", 2.0, 20, 4),
+                # More recent than the existing latest value of "b"
+                Metric("b", 3.0, 5, 6),
+                Metric("b", 4.0, 30, 5),
+                Metric("c", float("inf"), 1, 0),
+                Metric("c", -1.0, 2, 0),
+            ],
+            params=[],
+            tags=[],
+        )
+        assert self.store.get_run(run_id).data.metrics == {"a": 1.0, "b": 3.0, "c": -1.0}
+
+    def test_log_batch_without_dialect_upsert_support(self):
+        run = self._run_factory()
+        run_id = run.info.run_id
+        with mock.patch(
+            "mlflow.store.tracking.sqlalchemy_store._get_dialect_insert", return_value=None
+        ):
+            self.store.log_batch(
+                run_id, metrics=[Metric("m", 1.0, 1, 0)], params=[], tags=[RunTag("t", "a")]
+            )
+            self.store.log_batch(
+                run_id, metrics=[Metric("m", 2.0, 2, 1)], params=[], tags=[RunTag("t", "b")]
+            )
+        run = self.store.get_run(run_id)
+        assert run.data.metrics == {"m": 2.0}
+        assert run.data.tags["t"] == "b"
+
+    def test_log_batch_bounds_bind_parameters_per_statement(self):
+        run = self._run_factory()
+        metrics = [Metric("m%d" % i, i, i, i) for i in range(900)]
+        params = [Param("p%d" % i, str(i)) for i in range(100)]
+        num_parameters = []
+
+        def record_num_parameters(_conn, _cursor, _statement, parameters, _context, _executemany):
+            num_parameters.append(len(parameters))
+
+        sqlalchemy.event.listen(self.store.engine, "before_cursor_execute", record_num_parameters)
+        try:
+            for _ in range(2):
+                self.store.log_batch(run.info.run_id, metrics=metrics, params=params, tags=[])
+        finally:
+            sqlalchemy.event.remove(
+                self.store.engine, "before_cursor_execute", record_num_parameters
+            )
+        assert max(num_parameters) <= 999
+        assert len(self.store.get_metric_history(run.info.run_id, "m0")) == 1
+        self._verify_logged(self.store, run.info.run_id, metrics=metrics, params=params, tags=[])
+
+    def test_log_batch_executes_bulk_queries(self):
+        run = self._run_factory()
+        metrics = [Metric("m%d" % i, i, 12345, i) for i in range(250)]
+        params = [Param("p%d" % i, str(i)) for i in range(100)]
+        tags = [RunTag("t%d" % i, str(i)) for i in range(100)]
+        with mock.patch.object(self.store, "log_metric") as log_metric_mock, mock.patch.object(
+            self.store, "log_param"
+        ) as log_param_mock, mock.patch.object(self.store, "set_tag") as set_tag_mock:
+            self.store.log_batch(run.info.run_id, metrics=metrics, params=params, tags=tags)
+            log_metric_mock.assert_not_called()
+            log_param_mock.assert_not_called()
+            set_tag_mock.assert_not_called()
+        self._verify_logged(self.store, run.info.run_id, metrics=metrics, params=params, tags=tags)
+
     def test_upgrade_cli_idempotence(self):
         # Repeatedly run `mlflow db upgrade` against our database, verifying that the command
         # succeeds and that the DB has the latest schema
@@ -2034,3 +2162,25 @@ def test_get_orderby_clauses():
         parsed = [str(x) for x in _get_orderby_clauses(["metric.a"], session)[0]]
         assert "is_nan = true" in parsed[0]
         assert "value IS NULL" in parsed[0]
+
+
+def test_get_keyset_filtering_clause_handles_nulls():
+    column = sqlalchemy.column("c")
+    sort_keys = [(column, True), (models.SqlRun.run_uuid, True)]
+
+    def compile_clause(keyset, nulls_first):
+        clause = _get_keyset_filtering_clause(sort_keys, keyset, nulls_first)
+        return str(clause.compile(compile_kwargs={"literal_binds": True}))
+
+    # NULLs sort first (e.g. SQLite): runs after a NULL value are the non-NULL ones
+    assert compile_clause([None, "a"], nulls_first=True) == (
+        "c IS NOT NULL OR c IS NULL AND runs.run_uuid > 'a'"
+    )
+    assert compile_clause([1, "a"], nulls_first=True) == "c > 1 OR c = 1 AND runs.run_uuid > 'a'"
+    # NULLs sort last (e.g. PostgreSQL): NULL values come after any non-NULL value
+    assert compile_clause([None, "a"], nulls_first=False) == (
+        "c IS NULL AND (runs.run_uuid > 'a' OR runs.run_uuid IS NULL)"
+    )
+    assert compile_clause([1, "a"], nulls_first=False) == (
+        "c > 1 OR c IS NULL OR c = 1 AND (runs.run_uuid > 'a' OR runs.run_uuid IS NULL)"
+    )
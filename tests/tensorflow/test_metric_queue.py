@@ -0,0 +1,73 @@
+import threading
+from unittest import mock
+
+from mlflow.entities import Metric
+from mlflow.tensorflow._bounded_queue import _MetricQueue
+from mlflow.utils.validation import MAX_METRICS_PER_BATCH
+
+
+def _metric(i):
+    return Metric("m", float(i), i, i)
+
+
+def test_flush_groups_metrics_by_run_and_chunks_them():
+    queue = _MetricQueue(capacity=10000)
+    metrics = [_metric(i) for i in range(MAX_METRICS_PER_BATCH + 1)]
+    for metric in metrics:
+        queue.add("run1", metric)
+        queue.add("run2", metric)
+
+    log_batch = mock.MagicMock()
+    queue.flush(log_batch)
+    assert len(queue) == 0
+    assert [(call[1]["run_id"], len(call[1]["metrics"])) for call in log_batch.call_args_list] == [
+        ("run1", MAX_METRICS_PER_BATCH),
+        ("run1", 1),
+        ("run2", MAX_METRICS_PER_BATCH),
+        ("run2", 1),
+    ]
+    logged_metrics = [
+        metric
+        for call in log_batch.call_args_list
+        if call[1]["run_id"] == "run1"
+        for metric in call[1]["metrics"]
+    ]
+    # NB: Metrics are compared by identity, since `Metric` does not define equality
+    assert logged_metrics == metrics
+
+
+def test_add_drops_metrics_when_queue_is_full_and_flush_reports_them():
+    queue = _MetricQueue(capacity=2)
+    metrics = [_metric(i) for i in range(3)]
+    assert queue.add("run", metrics[0])
+    assert queue.add("run", metrics[1])
+    assert not queue.add("run", metrics[2])
+    assert len(queue) == 2
+
+    log_batch = mock.MagicMock()
+    with mock.patch("mlflow.tensorflow._bounded_queue._logger.warning") as warning_mock:
+        queue.flush(log_batch)
+        warning_mock.assert_called_once()
+        assert warning_mock.call_args[0][1] == 1
+    log_batch.assert_called_once_with(run_id="run", metrics=metrics[:2])
+    assert queue.num_dropped_total == 1
+
+    # Metrics can be added again after a flush
+    assert queue.add("run", _metric(3))
+
+
+def test_metrics_added_concurrently_with_flushes_are_all_logged():
+    queue = _MetricQueue(capacity=100000)
+    logged_metrics = []
+
+    def add_metrics(run_id):
+        for i in range(1000):
+            queue.add(run_id, _metric(i))
+
+    threads = [threading.Thread(target=add_metrics, args=(str(i),)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    while any(thread.is_alive() for thread in threads):
+        queue.flush(lambda run_id, metrics: logged_metrics.extend(metrics))
+    queue.flush(lambda run_id, metrics: logged_metrics.extend(metrics))
+    assert len(logged_metrics) == 4000
@@ -747,7 +747,7 @@ def test_flush_queue_is_thread_safe():
     client = mlflow.tracking.MlflowClient()
     run = client.create_run(experiment_id="0")
     metric_queue_item = (run.info.run_id, Metric("foo", 0.1, 100, 1))
-    mlflow.tensorflow._metric_queue.append(metric_queue_item)
+    mlflow.tensorflow._metric_queue.add(*metric_queue_item)
 
     # Verify that, if another thread holds a lock on the metric queue leveraged by
     # _flush_queue, _flush_queue terminates and does not modify the queue
@@ -756,7 +756,6 @@ def test_flush_queue_is_thread_safe():
     flush_thread1.start()
     flush_thread1.join()
     assert len(mlflow.tensorflow._metric_queue) == 1
-    assert mlflow.tensorflow._metric_queue[0] == metric_queue_item
     _metric_queue_lock.release()
 
     # Verify that, if no other thread holds a lock on the metric queue leveraged by
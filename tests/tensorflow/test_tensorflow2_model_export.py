@@ -23,6 +23,7 @@ from mlflow.exceptions import MlflowException
 from mlflow import pyfunc
 from mlflow.models import infer_signature, Model
 from mlflow.models.utils import _read_example
+from mlflow.pyfunc.utils import INFERENCE_BATCH_SIZE_ENV_VAR
 from mlflow.store.artifact.s3_artifact_repo import S3ArtifactRepository
 from mlflow.tracking.artifact_utils import _download_artifact_from_uri
 from mlflow.utils.environment import _mlflow_conda_env
@@ -694,6 +695,35 @@ def test_iris_data_model_can_be_loaded_and_evaluated_as_pyfunc(saved_tf_iris_mod
         results = pyfunc_wrapper.predict(inp_list)
 
 
+@pytest.mark.large
+def test_iris_data_model_predicts_in_batches_if_batch_size_is_set(
+    saved_tf_iris_model, model_path, monkeypatch
+):
+    mlflow.tensorflow.save_model(
+        tf_saved_model_dir=saved_tf_iris_model.path,
+        tf_meta_graph_tags=saved_tf_iris_model.meta_graph_tags,
+        tf_signature_def_key=saved_tf_iris_model.signature_def_key,
+        path=model_path,
+    )
+    expected_results_df = pyfunc.load_model(model_path).predict(saved_tf_iris_model.inference_df)
+
+    monkeypatch.setenv(INFERENCE_BATCH_SIZE_ENV_VAR, "1")
+    pyfunc_wrapper = pyfunc.load_model(model_path)
+    with mock.patch.object(
+        pyfunc_wrapper._model_impl, "infer", wraps=pyfunc_wrapper._model_impl.infer
+    ) as infer_mock:
+        results_df = pyfunc_wrapper.predict(saved_tf_iris_model.inference_df)
+        assert infer_mock.call_count == len(saved_tf_iris_model.inference_df)
+    pandas.testing.assert_frame_equal(results_df, expected_results_df)
+
+
+def test_reshape_output():
+    np.testing.assert_array_equal(mlflow.tensorflow._reshape_output(np.array([[1], [2]])), [1, 2])
+    np.testing.assert_array_equal(mlflow.tensorflow._reshape_output(np.array([1, 2])), [1, 2])
+    assert mlflow.tensorflow._reshape_output(np.array([[1, 2], [3, 4]])) == [[1, 2], [3, 4]]
+    assert len(mlflow.tensorflow._reshape_output(np.zeros((0, 2)))) == 0
+
+
 @pytest.mark.large
 def test_categorical_model_can_be_loaded_and_evaluated_as_pyfunc(
     saved_tf_categorical_model, model_path
@@ -0,0 +1,128 @@
+import threading
+from unittest import mock
+
+import pytest
+
+from mlflow.entities import Metric, Param, RunTag
+from mlflow.exceptions import MlflowException
+from mlflow.tracking._tracking_service.async_logging_queue import (
+    AsyncLoggingQueue,
+    is_async_logging_enabled,
+)
+from mlflow.utils.validation import (
+    MAX_ENTITIES_PER_BATCH,
+    MAX_METRICS_PER_BATCH,
+    MAX_PARAMS_TAGS_PER_BATCH,
+)
+
+
+class _RecordingLoggingFunc:
+    def __init__(self):
+        self.batches = []
+
+    def __call__(self, run_id, metrics, params, tags):
+        assert len(metrics) <= MAX_METRICS_PER_BATCH
+        assert len(params) <= MAX_PARAMS_TAGS_PER_BATCH
+        assert len(tags) <= MAX_PARAMS_TAGS_PER_BATCH
+        assert len(metrics) + len(params) + len(tags) <= MAX_ENTITIES_PER_BATCH
+        self.batches.append((run_id, list(metrics), list(params), list(tags)))
+
+    def logged(self, run_id):
+        metrics, params, tags = [], [], []
+        for batch_run_id, batch_metrics, batch_params, batch_tags in self.batches:
+            if batch_run_id == run_id:
+                metrics.extend(batch_metrics)
+                params.extend(batch_params)
+                tags.extend(batch_tags)
+        return metrics, params, tags
+
+
+def test_async_logging_queue_logs_all_enqueued_data_in_batches():
+    logging_func = _RecordingLoggingFunc()
+    queue = AsyncLoggingQueue(logging_func)
+
+    metrics = [Metric("m", float(i), 0, i) for i in range(2500)]
+    params = [Param("p%d" % i, str(i)) for i in range(250)]
+    tags = [RunTag("t%d" % i, str(i)) for i in range(150)]
+    for metric in metrics:
+        queue.enqueue("run1", metrics=[metric])
+    queue.enqueue("run1", params=params, tags=tags)
+    queue.enqueue("run2", metrics=metrics[:10])
+    queue.flush()
+
+    logged_metrics, logged_params, logged_tags = logging_func.logged("run1")
+    assert sorted(logged_metrics, key=lambda m: m.step) == metrics
+    assert [(p.key, p.value) for p in logged_params] == [(p.key, p.value) for p in params]
+    assert [(t.key, t.value) for t in logged_tags] == [(t.key, t.value) for t in tags]
+    assert logging_func.logged("run2")[0] == metrics[:10]
+    # Metrics logged one at a time are coalesced into far fewer requests
+    assert len(logging_func.batches) < 100
+
+
+def test_async_logging_queue_coalesces_params_and_tags():
+    logging_func = _RecordingLoggingFunc()
+    blocked = threading.Event()
+    release = threading.Event()
+
+    def blocking_logging_func(**kwargs):
+        blocked.set()
+        release.wait()
+        logging_func(**kwargs)
+
+    queue = AsyncLoggingQueue(blocking_logging_func)
+    queue.enqueue("run", metrics=[Metric("m", 0.0, 0, 0)])
+    blocked.wait()
+    # Data enqueued while a request is inflight is coalesced into the next request
+    queue.enqueue("run", params=[Param("p", "a")], tags=[RunTag("t", "a")])
+    queue.enqueue("run", params=[Param("p", "a")], tags=[RunTag("t", "b")])
+    release.set()
+    queue.flush()
+
+    assert len(logging_func.batches) == 2
+    run_id, metrics, params, tags = logging_func.batches[1]
+    assert run_id == "run"
+    assert metrics == []
+    assert [(p.key, p.value) for p in params] == [("p", "a")]
+    assert [(t.key, t.value) for t in tags] == [("t", "b")]
+
+
+def test_async_logging_queue_raises_failures_on_flush():
+    logging_func = mock.Mock(side_effect=[MlflowException("Failed to log"), None])
+    queue = AsyncLoggingQueue(logging_func)
+
+    queue.enqueue("run", metrics=[Metric("m", 0.0, 0, 0)])
+    with pytest.raises(MlflowException, match="Failed to log"):
+        queue.flush()
+
+    # Failures are only reported once
+    queue.enqueue("run", metrics=[Metric("m", 1.0, 0, 1)])
+    queue.flush()
+    assert logging_func.call_count == 2
+
+
+def test_async_logging_queue_does_not_share_pending_data_with_forked_processes():
+    logging_func = _RecordingLoggingFunc()
+    queue = AsyncLoggingQueue(logging_func)
+    queue.flush()
+    # Simulate a fork while the parent process is logging, which leaves the background thread and
+    # its inflight request behind
+    queue._is_logging = True
+    queue._pending_data_by_run_id["run"] = mock.Mock()
+
+    with mock.patch("os.getpid", return_value=-1):
+        queue.flush()
+        queue.enqueue("child_run", metrics=[Metric("m", 0.0, 0, 0)])
+        queue.flush()
+
+    assert [batch[0] for batch in logging_func.batches] == ["child_run"]
+
+
+@pytest.mark.parametrize(
+    ("env_value", "expected"), [(None, False), ("false", False), ("true", True), ("TRUE", True)]
+)
+def test_is_async_logging_enabled(monkeypatch, env_value, expected):
+    if env_value is None:
+        monkeypatch.delenv("MLFLOW_ENABLE_ASYNC_LOGGING", raising=False)
+    else:
+        monkeypatch.setenv("MLFLOW_ENABLE_ASYNC_LOGGING", env_value)
+    assert is_async_logging_enabled() == expected
@@ -645,9 +645,7 @@ def get_search_runs_timestamp(output_format):
     if output_format == "list":
         return time.time()
     elif output_format == "pandas":
-        import pandas as pd
-
-        return pd.to_datetime(0, utc=True)
+        return 0
     else:
         raise Exception("Invalid output format %s" % output_format)
 
@@ -690,6 +688,11 @@ def test_search_runs_attributes(search_runs_output_format):
             "start_time": start_times,
             "end_time": end_times,
         }
+        if search_runs_output_format == "pandas":
+            import pandas as pd
+
+            data["start_time"] = pd.to_datetime(start_times, unit="ms", utc=True)
+            data["end_time"] = pd.to_datetime(end_times, unit="ms", utc=True)
         validate_search_runs(pdf, data, search_runs_output_format)
 
 
@@ -743,6 +746,59 @@ def test_search_runs_data():
         validate_search_runs(pdf, data, "pandas")
 
 
+@pytest.mark.skipif(
+    "MLFLOW_SKINNY" in os.environ,
+    reason="Skinny client does not support the np or pandas dependencies",
+)
+def test_search_runs_data_with_sparse_keys():
+    import numpy as np
+    import pandas as pd
+
+    num_runs = 50
+    runs = [
+        create_run(
+            metrics=[Metric("metric_%d" % i, float(i), 0, 0)],
+            params=[Param("param_%d" % (i % 5), str(i))],
+            tags=[RunTag("tag", str(i))] if i % 2 == 0 else [],
+            start=i,
+            end=None,
+        )
+        for i in range(num_runs)
+    ]
+    with mock.patch("mlflow.tracking.fluent._paginate", return_value=runs):
+        pdf = search_runs()
+
+    assert len(pdf) == num_runs
+    for i in range(num_runs):
+        metrics = pdf["metrics.metric_%d" % i]
+        assert metrics.dtype == np.float64
+        assert metrics[i] == float(i)
+        assert metrics.drop(i).isna().all()
+        params = pdf["params.param_%d" % (i % 5)]
+        assert params[i] == str(i)
+    assert pdf["params.param_0"].tolist() == [
+        str(i) if i % 5 == 0 else None for i in range(num_runs)
+    ]
+    assert pdf["tags.tag"].tolist() == [str(i) if i % 2 == 0 else None for i in range(num_runs)]
+    assert pdf["start_time"].tolist() == [
+        pd.to_datetime(i, unit="ms", utc=True) for i in range(num_runs)
+    ]
+    assert pdf["end_time"].isna().all()
+
+
+@pytest.mark.skipif(
+    "MLFLOW_SKINNY" in os.environ,
+    reason="Skinny client does not support the np or pandas dependencies",
+)
+def test_search_runs_with_no_results_returns_columns_of_the_same_dtype():
+    with mock.patch("mlflow.tracking.fluent._paginate", return_value=[]):
+        pdf = search_runs()
+
+    assert len(pdf) == 0
+    # Time columns of empty results are not converted to datetimes
+    assert (pdf.dtypes == pdf.dtypes["run_id"]).all()
+
+
 def test_search_runs_no_arguments(search_runs_output_format):
     """
     When no experiment ID is specified, it should try to get the implicit one.
@@ -447,6 +447,51 @@ def test_set_tags():
             assert str(exact_expected_tags[tag_key]) == tag_val
 
 
+def test_async_logging_is_flushed_on_end_run():
+    with start_run() as active_run:
+        run_id = active_run.info.run_id
+        for step in range(50):
+            mlflow.log_metric("loss", float(step), step=step, synchronous=False)
+        mlflow.log_params({"lr": 0.1}, synchronous=False)
+        mlflow.set_tag("t", "v", synchronous=False)
+
+    client = tracking.MlflowClient()
+    finished_run = client.get_run(run_id)
+    assert finished_run.info.status == RunStatus.to_string(RunStatus.FINISHED)
+    assert finished_run.data.metrics == {"loss": 49.0}
+    assert finished_run.data.params == {"lr": "0.1"}
+    assert finished_run.data.tags["t"] == "v"
+    assert len(client.get_metric_history(run_id, "loss")) == 50
+
+
+def test_async_logging_enabled_by_environment_variable(monkeypatch):
+    monkeypatch.setenv("MLFLOW_ENABLE_ASYNC_LOGGING", "true")
+    with start_run() as active_run:
+        run_id = active_run.info.run_id
+        with mock.patch(
+            "mlflow.tracking._tracking_service.client.TrackingServiceClient.log_batch",
+            autospec=True,
+        ) as log_batch_mock:
+            mlflow.log_metric("m", 1.0)
+            mlflow.set_tag("t", "v")
+            mlflow.log_param("p", "v", synchronous=True)
+            mlflow.flush_async_logging()
+        log_batch_mock.assert_called_once()
+        assert [m.key for m in log_batch_mock.call_args[1]["metrics"]] == ["m"]
+        assert [t.key for t in log_batch_mock.call_args[1]["tags"]] == ["t"]
+        assert log_batch_mock.call_args[1]["params"] == []
+    assert tracking.MlflowClient().get_run(run_id).data.params == {"p": "v"}
+
+
+def test_async_logging_failures_are_raised_on_flush():
+    with start_run() as active_run:
+        mlflow.log_param("p", "a")
+        mlflow.log_param("p", "b", synchronous=False)
+        with pytest.raises(MlflowException, match="Changing param values is not allowed"):
+            mlflow.flush_async_logging()
+    assert tracking.MlflowClient().get_run(active_run.info.run_id).data.params == {"p": "a"}
+
+
 def test_log_metric_validation():
     with start_run() as active_run:
         run_id = active_run.info.run_id
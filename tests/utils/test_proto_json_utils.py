@@ -1,5 +1,6 @@
 import base64
 import json
+from unittest import mock
 import numpy as np
 import pandas as pd
 import pytest
@@ -20,6 +21,9 @@ from mlflow.utils.proto_json_utils import (
     _stringify_all_experiment_ids,
     parse_tf_serving_input,
     _dataframe_from_json,
+    _dumps_jsonable_obj,
+    _get_jsonable_obj,
+    NumpyEncoder,
 )
 
 # Prevent pytest from trying to collect TestMessage as a test class:
@@ -490,3 +494,52 @@ def test_dataframe_from_json():
             source.to_json(orient="records"), pandas_orient="records", schema=tensor_schema
         )
     )
+
+
+def _dataframe_with_all_types():
+    return pd.DataFrame(
+        {
+            "int": np.array([1, -2, 3], dtype=np.int32),
+            "uint": np.array([1, 2, 2 ** 63], dtype=np.uint64),
+            "bool": [True, False, True],
+            "float": np.array([0.1, 1e16, 1e-05], dtype=np.float32),
+            "double": [np.pi, np.nan, -np.inf],
+            "string": ["a", 'quote " and \\ backslash', "unicode \u00e9\U0001f600 {}"],
+            "bytes": [b"abc", bytearray(b"\x00\xff"), b""],
+            "mixed": [1, None, "x"],
+            "datetime": pd.to_datetime(["2021-01-01", "2021-02-02 12:00", None]),
+            "category": pd.Categorical(["a", "b", "a"]),
+            '{weird} "column"': [1.5, 2.5, 3.5],
+        }
+    )
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+@pytest.mark.parametrize("pandas_orient", ["records", "split"])
+def test_dumps_jsonable_obj_matches_numpy_encoder(use_orjson, pandas_orient):
+    df = _dataframe_with_all_types()
+    numeric_df = df[["int", "uint", "bool", "float", "double", "string", "bytes", "mixed"]]
+    predictions = [
+        df,
+        numeric_df,
+        numeric_df.iloc[:0],
+        pd.DataFrame(index=range(2)),
+        pd.DataFrame(np.arange(12).reshape(4, 3)),
+        pd.DataFrame({"a": [1, 2]}, index=["x", "y"]),
+        pd.Series([0.5, 1.5]),
+        pd.Series(["a", "b"], name="label"),
+        np.arange(24).reshape(2, 3, 4),
+        np.arange(12).reshape(3, 4).T,
+        np.array([True, False]),
+        np.random.rand(3, 2).astype(np.float32),
+        np.array([b"abc", b"\x00\xff"]),
+        np.array([["a", 1], [None, b"x"]], dtype=object),
+        {"a": np.arange(3), "b": np.array([[0.5]]), "c": "scalar"},
+        [1, 2.5, "x"],
+        "summary",
+    ]
+    # Setting a module to None in sys.modules makes importing it raise an ImportError
+    with mock.patch.dict("sys.modules", {} if use_orjson else {"orjson": None}):
+        for data in predictions:
+            expected = json.dumps(_get_jsonable_obj(data, pandas_orient), cls=NumpyEncoder)
+            assert _dumps_jsonable_obj(data, pandas_orient) == expected
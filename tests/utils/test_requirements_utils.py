@@ -1,4 +1,5 @@
 import os
+import threading
 import sys
 import importlib
 from unittest import mock
@@ -7,6 +8,9 @@ import importlib_metadata
 import pytest
 
 import mlflow
+import mlflow.sklearn
+from mlflow.exceptions import MlflowException
+from mlflow.utils import requirements_utils
 from mlflow.utils.requirements_utils import (
     _is_comment,
     _is_empty,
@@ -17,6 +21,7 @@ from mlflow.utils.requirements_utils import (
     _prune_packages,
     _strip_local_version_label,
     _get_installed_version,
+    _capture_imported_modules,
     _get_pinned_requirement,
     _infer_requirements,
     _normalize_package_name,
@@ -315,3 +320,87 @@ def test_infer_requirements_does_not_print_warning_for_recognized_packages():
     ) as mock_warning:
         _infer_requirements("path/to/model", "sklearn")
         mock_warning.assert_not_called()
+
+
+@pytest.fixture
+def clear_captured_modules_cache():
+    requirements_utils._CAPTURED_MODULES_CACHE.clear()
+    yield
+    requirements_utils._CAPTURED_MODULES_CACHE.clear()
+
+
+def _save_sklearn_model(path):
+    from sklearn.linear_model import LogisticRegression
+
+    model = LogisticRegression().fit([[0], [1]], [0, 1])
+    mlflow.sklearn.save_model(model, path, pip_requirements=[])
+
+
+@pytest.mark.usefixtures("clear_captured_modules_cache")
+def test_capture_imported_modules_caches_captures(tmpdir):
+    model_path = tmpdir.join("model").strpath
+    _save_sklearn_model(model_path)
+    with mock.patch.object(
+        requirements_utils, "_run_command", wraps=requirements_utils._run_command
+    ) as run_command_mock:
+        modules = _capture_imported_modules(model_path, "sklearn")
+        assert "sklearn" in modules
+        assert _capture_imported_modules(model_path, "sklearn") == modules
+        run_command_mock.assert_called_once()
+
+        # Saving the same model again only changes volatile MLmodel attributes
+        other_model_path = tmpdir.join("other_model").strpath
+        _save_sklearn_model(other_model_path)
+        assert _capture_imported_modules(other_model_path, "sklearn") == modules
+        run_command_mock.assert_called_once()
+
+        # Captures are invalidated when the files of the model change
+        with open(os.path.join(model_path, "conda.yaml"), "a") as f:
+            f.write("# comment\n")
+        assert _capture_imported_modules(model_path, "sklearn") == modules
+        assert run_command_mock.call_count == 2
+
+
+@pytest.mark.usefixtures("clear_captured_modules_cache")
+def test_capture_imported_modules_only_hashes_models_whose_files_may_be_cached(tmpdir):
+    model_path = tmpdir.join("model").strpath
+    _save_sklearn_model(model_path)
+    digest_threads = []
+
+    def get_model_digest(_):
+        digest_threads.append(threading.current_thread())
+        return "digest"
+
+    with mock.patch.object(
+        requirements_utils, "_get_model_digest", side_effect=get_model_digest
+    ), mock.patch.object(
+        requirements_utils, "_run_capture_modules", return_value=["sklearn"]
+    ) as run_capture_modules_mock:
+        # The digest of a model that is not cached is computed while its modules are captured
+        assert _capture_imported_modules(model_path, "sklearn") == ["sklearn"]
+        assert len(digest_threads) == 1
+        assert digest_threads[0] is not threading.current_thread()
+
+        assert _capture_imported_modules(model_path, "sklearn") == ["sklearn"]
+        assert digest_threads[1] is threading.current_thread()
+        run_capture_modules_mock.assert_called_once()
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="Requires os.fork")
+@pytest.mark.usefixtures("clear_captured_modules_cache")
+def test_capture_imported_modules_with_fork_server(tmpdir, monkeypatch):
+    model_path = tmpdir.join("model").strpath
+    _save_sklearn_model(model_path)
+    modules = _capture_imported_modules(model_path, "sklearn")
+
+    requirements_utils._CAPTURED_MODULES_CACHE.clear()
+    monkeypatch.setenv(requirements_utils.MLFLOW_CAPTURE_MODULES_FORK_SERVER, "true")
+    with mock.patch.object(requirements_utils, "_run_command") as run_command_mock:
+        assert _capture_imported_modules(model_path, "sklearn") == modules
+        run_command_mock.assert_not_called()
+
+        # Errors in the forked process are reported, and the server keeps serving requests
+        with pytest.raises(MlflowException, match="Encountered an unexpected error"):
+            _capture_imported_modules(tmpdir.mkdir("empty").strpath, "sklearn")
+        requirements_utils._CAPTURED_MODULES_CACHE.clear()
+        assert _capture_imported_modules(model_path, "sklearn") == modules
@@ -1,11 +1,14 @@
 #!/usr/bin/env python
 
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest import mock
 import numpy
 import pytest
 
 from mlflow.exceptions import MlflowException, RestException
-from mlflow.pyfunc.scoring_server import NumpyEncoder
+from mlflow.utils.proto_json_utils import NumpyEncoder
 from mlflow.utils.rest_utils import (
     http_request,
     http_request_safe,
@@ -14,6 +17,8 @@ from mlflow.utils.rest_utils import (
     call_endpoint,
     call_endpoints,
     _can_parse_as_json_object,
+    _get_request_session,
+    get_http_connection_pool_stats,
 )
 from mlflow.protos.service_pb2 import GetRun
 from mlflow.protos.databricks_pb2 import ENDPOINT_NOT_FOUND, ErrorCode
@@ -322,3 +327,82 @@ def test_can_parse_as_json_object():
     assert not _can_parse_as_json_object("[0, 1, 2]")
     assert not _can_parse_as_json_object('"abc"')
     assert not _can_parse_as_json_object("123")
+
+
+def test_request_sessions_are_reused_per_retry_policy_and_tls_settings():
+    session = _get_request_session(3, 1, [500])
+    assert _get_request_session(3, 1, [500]) is session
+    assert _get_request_session(3, 1, [503]) is not session
+    assert _get_request_session(3, 1, [500], verify=False) is not session
+    assert _get_request_session(3, 1, [500], cert="/path/to/cert.pem") is not session
+
+
+def test_request_sessions_are_not_shared_with_forked_processes():
+    session = _get_request_session(3, 1, [500])
+    with mock.patch("os.getpid", return_value=os.getpid() + 1):
+        child_session = _get_request_session(3, 1, [500])
+        assert child_session is not session
+        assert _get_request_session(3, 1, [500]) is child_session
+
+
+def test_http_request_does_not_persist_cookies():
+    request_cookies = []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            request_cookies.append(self.headers.get("Cookie"))
+            body = b"{}"
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("Set-Cookie", "session=secret; Path=/")
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        host = "http://127.0.0.1:%d" % server.server_port
+        for _ in range(2):
+            http_request(MlflowHostCreds(host), "/api/2.0/endpoint", "GET", max_retries=0)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert request_cookies == [None, None]
+
+
+def test_http_request_reuses_connections():
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            body = b"{}"
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        host = "http://127.0.0.1:%d" % server.server_port
+        for _ in range(5):
+            http_request(MlflowHostCreds(host), "/api/2.0/endpoint", "GET", max_retries=0)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    stats = get_http_connection_pool_stats()[host]
+    assert stats == {"num_connections": 1, "num_requests": 5}
@@ -577,3 +577,67 @@ def test_pagination(page_token, max_results, matching_runs, expected_next_page_t
 def test_invalid_page_tokens(page_token, error_message):
     with pytest.raises(MlflowException, match=error_message):
         SearchUtils.paginate([], page_token, 1)
+
+
+def _create_run(run_id, start_time, metrics=None):
+    return Run(
+        run_info=RunInfo(
+            run_uuid=run_id,
+            run_id=run_id,
+            experiment_id=0,
+            user_id="user-id",
+            status=RunStatus.to_string(RunStatus.FAILED),
+            start_time=start_time,
+            end_time=1,
+            lifecycle_stage=LifecycleStage.ACTIVE,
+        ),
+        run_data=RunData(metrics or [], [], []),
+    )
+
+
+@pytest.mark.parametrize(
+    "order_by", [None, ["metrics.m"], ["metrics.m DESC", "attributes.start_time ASC"]]
+)
+def test_paginate_runs_with_keyset_page_tokens(order_by):
+    runs = [
+        _create_run(str(i), i % 2, [Metric("m", value, 0, 0)] if value is not None else [])
+        for i, value in enumerate([1.0, float("nan"), None, -1.0, 1.0, 0.5])
+    ]
+    sorted_runs = SearchUtils.sort(runs, order_by)
+
+    paginated_runs, token = SearchUtils.paginate_runs(sorted_runs, None, 4, order_by)
+    assert paginated_runs == sorted_runs[:4]
+    _, keyset = SearchUtils.parse_page_token_for_search_runs(token)
+    assert keyset[-1][-1] == sorted_runs[3].info.run_id
+
+    paginated_runs, token = SearchUtils.paginate_runs(sorted_runs, token, 4, order_by)
+    assert paginated_runs == sorted_runs[4:]
+    assert token is None
+
+    # The next page starts after the last returned run even if earlier runs were removed
+    _, token = SearchUtils.paginate_runs(sorted_runs, None, 2, order_by)
+    paginated_runs, _ = SearchUtils.paginate_runs(sorted_runs[1:], token, 2, order_by)
+    assert paginated_runs == sorted_runs[2:4]
+
+
+def test_paginate_runs_accepts_offset_page_tokens():
+    runs = [_create_run(str(i), 0) for i in range(3)]
+    paginated_runs, token = SearchUtils.paginate_runs(
+        runs, SearchUtils.create_page_token(1), 1, None
+    )
+    assert paginated_runs == runs[1:2]
+    assert SearchUtils.parse_page_token_for_search_runs(token) == (0, [[0, "1"]])
+
+
+@pytest.mark.parametrize(
+    "page_token",
+    [
+        base64.b64encode(json.dumps({"keyset": []}).encode("utf-8")),
+        base64.b64encode(json.dumps({"keyset": "a"}).encode("utf-8")),
+        base64.b64encode(json.dumps([1]).encode("utf-8")),
+        SearchUtils.create_keyset_page_token([[False, 1.0], [0, "1"]]),
+    ],
+)
+def test_paginate_runs_invalid_keyset_page_tokens(page_token):
+    with pytest.raises(MlflowException, match="Invalid page token"):
+        SearchUtils.paginate_runs([_create_run("0", 0)], page_token, 1, None)